@@ -1,6 +1,7 @@
 
 
 from value_objects import IndexingStats
+from readiness import Readiness
 
 class CoreServices:
     """Core service dependencies
@@ -55,6 +56,7 @@ class QueryServices:
         self.cache = None
         self.reranker = None
         self.query_expander = None  # LLM-based query expansion via Ollama
+        self.graph_rank_job = None  # Periodic PageRank refresh for graph boost
 
 class IndexingComponents:
     """Indexing queue and worker infrastructure
@@ -77,6 +79,7 @@ class RuntimeState:
         self.watcher = None
         self.indexing_in_progress = False
         self.stats = IndexingStats()
+        self.readiness = Readiness()
 
 class AppState:
     """Application state container
@@ -157,6 +160,14 @@ class AppState:
         """Get current indexing statistics"""
         return self.runtime.stats
 
+    def get_readiness(self) -> dict:
+        """Get per-capability startup readiness report"""
+        return self.runtime.readiness.snapshot()
+
+    def is_ready(self, capability: str) -> bool:
+        """Check if a capability (e.g. 'query') has finished starting up"""
+        return self.runtime.readiness.is_ready(capability)
+
     # === Lifecycle Management Delegation ===
 
     def stop_watcher(self):
@@ -169,6 +180,11 @@ class AppState:
         if self.indexing.worker:
             self.indexing.worker.stop()
 
+    def stop_graph_rank(self):
+        """Stop periodic graph rank refresh"""
+        if self.query.graph_rank_job:
+            self.query.graph_rank_job.stop()
+
     async def close_vector_store(self):
         """Close vector store connection.
 
@@ -184,10 +200,22 @@ class AppState:
         if self.core.progress_tracker:
             self.core.progress_tracker.close()
 
+    async def close_query_expander(self):
+        """Close query expander's pooled HTTP connections"""
+        if self.query.query_expander:
+            await self.query.query_expander.close()
+
+    def close_indexing_queue(self):
+        """Close indexing queue (stops durable queue lease heartbeat)"""
+        if self.indexing.queue:
+            self.indexing.queue.close()
+
     async def close_all_resources(self):
         """Close all resource connections (async for AsyncVectorStore)"""
+        self.close_indexing_queue()
         await self.close_vector_store()
         self.close_progress_tracker()
+        await self.close_query_expander()
 
     async def get_vector_store_stats(self):
         """Get vector store statistics (async, non-blocking for API routes)"""
@@ -280,3 +308,9 @@ class AppState:
         if self.indexing.pipeline_coordinator:
             return self.indexing.pipeline_coordinator.get_stats()
         return {'queue_sizes': {}, 'active_jobs': {}, 'workers_running': {}}
+
+    def get_autoscaler_status(self) -> dict:
+        """Get worker autoscaler status from the pipeline coordinator."""
+        if self.indexing.pipeline_coordinator:
+            return self.indexing.pipeline_coordinator.get_autoscaler_status()
+        return {'enabled': False}
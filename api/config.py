@@ -24,6 +24,8 @@ class ChunkConfig:
     min_size: int = 50
     semantic: bool = True  # Use semantic chunking with Docling (HybridChunker)
     max_tokens: int = 512  # Token limit for semantic chunks
+    code_parse_cache_size: int = 256  # Code files whose parse tree is kept for incremental re-chunking
+    notebook_output_max_bytes: int = 2048  # Largest notebook text output indexed (0 drops outputs)
 
 @dataclass
 class DatabaseConfig:
@@ -109,6 +111,7 @@ class WatcherConfig:
     enabled: bool = True
     debounce_seconds: float = 10.0
     batch_size: int = 50
+    max_enqueue_rate: float = 200.0  # Files/second queued from the watcher (0 = unlimited)
 
 @dataclass
 class CacheConfig:
@@ -129,6 +132,15 @@ class DoclingConfig:
     generate_page_images: bool = True  # Generate page images (set False for ~20-30% memory savings)
     generate_picture_images: bool = True  # Generate picture images (set False for ~10-20% memory savings)
     pdf_backend: str = "dlparse_v4"  # PDF backend: dlparse_v4 (default) or pypdfium2 (~80% less memory)
+    force_full_pipeline: bool = False  # Skip text-layer check: OCR + page images for every PDF
+    text_layer_coverage: float = 0.9  # Sampled pages with text needed for the no-OCR fast path
+    text_layer_samples: int = 8  # Pages sampled to classify a PDF
+    fast_path_tables: bool = True  # Run the table structure model on text-native PDFs
+    cache_enabled: bool = True  # Cache converted documents so re-chunking skips conversion
+    cache_dir: str = "/app/data/docling_cache"
+    cache_max_mb: int = 2048  # Oldest entries evicted beyond this size
+    cache_max_age_days: int = 30  # Entries unused for this long are evicted
+    epub_convert_to_pdf: bool = False  # Pandoc EPUB->PDF conversion instead of chapter extraction
 
 @dataclass
 class ProcessingConfig:
@@ -154,10 +166,16 @@ class MalwareDetectionConfig:
     """
     clamav_enabled: bool = True  # Enabled by default (standalone in container)
     clamav_socket: str = "/var/run/clamav/clamd.ctl"
+    clamav_timeout: float = 10.0  # Seconds before clamd counts as slow (circuit breaker)
+    clamav_max_concurrency: int = 0  # Concurrent scans, 0 = clamd's MaxThreads
+    clamav_stream_max_bytes: int = 25 * 1024 * 1024  # clamd's StreamMaxLength (larger files not streamed)
     hash_blacklist_enabled: bool = True  # Enabled by default with curated list
     hash_blacklist_path: str = "/app/data/malware_hashes.txt"
     yara_enabled: bool = True  # Enabled by default with document-focused rules
     yara_rules_path: str = "/app/yara_config/yara_rules.yar"
+    yara_compiled_dir: str = "/app/data/yara_compiled"  # Compiled rules, keyed by rules hash
+    yara_timeout: int = 10  # Seconds per file before YARA matching is abandoned
+    yara_max_bytes: int = 32 * 1024 * 1024  # Bytes of each file matched (0 = whole file)
     # Allowlist for known-safe files (skip all security checks)
     allowlist_path: str = "/app/data/security_allowlist.txt"
     # YARA rules produce warnings by default (not blocks)
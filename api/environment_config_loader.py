@@ -55,7 +55,8 @@ class EnvironmentConfigLoader:
         return WatcherConfig(
             enabled=self._get_bool("WATCH_ENABLED", True),
             debounce_seconds=self._get_float("WATCH_DEBOUNCE_SECONDS", 10.0),
-            batch_size=self._get_int("WATCH_BATCH_SIZE", 50)
+            batch_size=self._get_int("WATCH_BATCH_SIZE", 50),
+            max_enqueue_rate=self._get_float("WATCH_MAX_ENQUEUE_RATE", 200.0)
         )
 
     def _load_cache_config(self) -> CacheConfig:
@@ -78,7 +79,16 @@ class EnvironmentConfigLoader:
             enabled=self._get_bool("USE_DOCLING", True),
             generate_page_images=self._get_bool("DOCLING_GENERATE_PAGE_IMAGES", True),
             generate_picture_images=self._get_bool("DOCLING_GENERATE_PICTURE_IMAGES", True),
-            pdf_backend=self._get_optional("DOCLING_PDF_BACKEND", "dlparse_v4")
+            pdf_backend=self._get_optional("DOCLING_PDF_BACKEND", "dlparse_v4"),
+            force_full_pipeline=self._get_bool("DOCLING_FORCE_FULL_PIPELINE", False),
+            text_layer_coverage=self._get_float("DOCLING_TEXT_LAYER_COVERAGE", 0.9),
+            text_layer_samples=self._get_int("DOCLING_TEXT_LAYER_SAMPLES", 8),
+            fast_path_tables=self._get_bool("DOCLING_FAST_PATH_TABLES", True),
+            cache_enabled=self._get_bool("DOCLING_CACHE_ENABLED", True),
+            cache_dir=self._get_optional("DOCLING_CACHE_DIR", "/app/data/docling_cache"),
+            cache_max_mb=self._get_int("DOCLING_CACHE_MAX_MB", 2048),
+            cache_max_age_days=self._get_int("DOCLING_CACHE_MAX_AGE_DAYS", 30),
+            epub_convert_to_pdf=self._get_bool("EPUB_CONVERT_TO_PDF", False)
         )
 
     def _load_processing_config(self) -> ProcessingConfig:
@@ -95,7 +105,9 @@ class EnvironmentConfigLoader:
         """Load chunking configuration from environment"""
         return ChunkConfig(
             semantic=self._get_bool("SEMANTIC_CHUNKING", True),
-            max_tokens=self._get_int("CHUNK_MAX_TOKENS", 512)
+            max_tokens=self._get_int("CHUNK_MAX_TOKENS", 512),
+            code_parse_cache_size=self._get_int("CODE_PARSE_CACHE_SIZE", 256),
+            notebook_output_max_bytes=self._get_int("NOTEBOOK_OUTPUT_MAX_BYTES", 2048)
         )
 
     def _load_database_config(self, embedding_dim: int):
@@ -126,10 +138,16 @@ class EnvironmentConfigLoader:
         return MalwareDetectionConfig(
             clamav_enabled=self._get_bool("CLAMAV_ENABLED", True),  # Enabled by default
             clamav_socket=self._get_optional("CLAMAV_SOCKET", "/var/run/clamav/clamd.ctl"),
+            clamav_timeout=self._get_float("CLAMAV_TIMEOUT", 10.0),
+            clamav_max_concurrency=self._get_int("CLAMAV_MAX_CONCURRENCY", 0),
+            clamav_stream_max_bytes=self._get_int("CLAMAV_STREAM_MAX_BYTES", 25 * 1024 * 1024),
             hash_blacklist_enabled=self._get_bool("HASH_BLACKLIST_ENABLED", True),  # Enabled by default
             hash_blacklist_path=self._get_optional("HASH_BLACKLIST_PATH", "/app/data/malware_hashes.txt"),
             yara_enabled=self._get_bool("YARA_ENABLED", True),  # Enabled by default
-            yara_rules_path=self._get_optional("YARA_RULES_PATH", "/app/yara_config/yara_rules.yar")
+            yara_rules_path=self._get_optional("YARA_RULES_PATH", "/app/yara_config/yara_rules.yar"),
+            yara_compiled_dir=self._get_optional("YARA_COMPILED_DIR", "/app/data/yara_compiled"),
+            yara_timeout=self._get_int("YARA_TIMEOUT", 10),
+            yara_max_bytes=self._get_int("YARA_MAX_BYTES", 32 * 1024 * 1024)
         )
 
     def _get_optional(self, key: str, default: str) -> str:
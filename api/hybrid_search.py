@@ -6,11 +6,13 @@ FTS5 uses boolean MATCH (implicit AND) which returns nothing when any
 term is missing. BM25Okapi scores ALL documents probabilistically,
 matching how LangChain/LlamaIndex implement keyword search.
 """
+import os
 import sqlite3
 import re
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
 
+import numpy as np
 from rank_bm25 import BM25Okapi
 
 
@@ -219,6 +221,7 @@ class RankFusion:
         """Convert DB row to result dict"""
         from pathlib import Path
         return {
+            'chunk_id': row[0],
             'content': row[1],
             'source': Path(row[2]).name,
             'page': row[3],
@@ -235,6 +238,57 @@ class RankFusion:
             results.append(result)
         return results
 
+class GraphBoost:
+    """Graph-aware re-scoring of fused results (PostgreSQL)
+
+    Reads a GraphRankIndex precomputed by ingestion.graph_rank.GraphRankJob:
+    each result's score is multiplied by 1 + weight * centrality of its note,
+    and results whose note is a one-hop wikilink neighbour of one of the top
+    `seeds` results' notes get a further neighbor_boost. Query cost is array
+    lookups over the candidates; no graph traversal or database access.
+
+    Enabled via GRAPH_BOOST_ENABLED=true (for permutation testing). Until
+    the first index is loaded, results pass through unchanged.
+    """
+
+    def __init__(self, weight: float = 0.3, neighbor_boost: float = 0.15,
+                 seeds: int = 3):
+        self.weight = weight
+        self.neighbor_boost = neighbor_boost
+        self.seeds = seeds
+        self.index = None  # Swapped in whole by GraphRankJob
+
+    @classmethod
+    def from_env(cls) -> Optional['GraphBoost']:
+        """GraphBoost configured from env, None when disabled"""
+        if os.getenv("GRAPH_BOOST_ENABLED", "false").lower() != "true":
+            return None
+        return cls(
+            weight=float(os.getenv("GRAPH_BOOST_WEIGHT", "0.3")),
+            neighbor_boost=float(os.getenv("GRAPH_NEIGHBOR_BOOST", "0.15")),
+        )
+
+    def apply(self, results: List[Dict]) -> List[Dict]:
+        """Re-score and re-sort results (input order is kept on ties)"""
+        index = self.index
+        if index is None or not len(index) or not results:
+            return results
+
+        nodes = index.nodes_of([r.get('chunk_id') for r in results])
+        if not (nodes >= 0).any():
+            return results
+        related = np.isin(nodes, index.neighbors_of(nodes[:self.seeds])) & (nodes >= 0)
+        factors = 1.0 + self.weight * index.centrality(nodes) + self.neighbor_boost * related
+
+        boosted = []
+        for result, factor in zip(results, factors):
+            result = result.copy()
+            result['score'] = float(result['score'] * factor)
+            boosted.append(result)
+        boosted.sort(key=lambda r: r['score'], reverse=True)
+        return boosted
+
+
 class HybridSearcher:
     """Combines vector and keyword search using BM25 for keyword scoring."""
 
@@ -368,6 +422,7 @@ class PostgresHybridSearcher:
         self.conn = conn
         self.keyword = PostgresBM25Searcher(conn)
         self.fusion = RankFusion()
+        self.graph_boost = GraphBoost.from_env()
 
     def refresh_keyword_index(self) -> None:
         """Refresh BM25 index after documents are added/removed."""
@@ -379,6 +434,9 @@ class PostgresHybridSearcher:
         try:
             keyword_results = self.keyword.search(query, top_k * 4)
             fused = self.fusion.fuse(vector_results, keyword_results)
+            if self.graph_boost:
+                # Whole candidate pool, so graph neighbours can enter the top_k
+                fused = self.graph_boost.apply(fused)
             return fused[:top_k]
         except Exception:
             return vector_results
@@ -14,71 +14,86 @@ Database Backend Support:
 Use DatabaseFactory for runtime backend selection:
     from ingestion import DatabaseFactory
     store = DatabaseFactory.create_vector_store(config)
+
+Exports are resolved lazily on first attribute access (PEP 562), so
+importing one submodule (e.g. ingestion.database_factory for query-only
+serving) does not import the extraction stack or asyncpg.
 """
+import importlib
 
-# Helpers
-from .helpers import FileHasher, GhostscriptHelper
+# Exported name -> (submodule, attribute in submodule)
+_EXPORTS = {
+    # Helpers
+    'FileHasher': ('.helpers', 'FileHasher'),
+    'GhostscriptHelper': ('.helpers', 'GhostscriptHelper'),
+    # Extractors
+    'DoclingExtractor': ('.extractors', 'DoclingExtractor'),
+    'MarkdownExtractor': ('.extractors', 'MarkdownExtractor'),
+    'EpubExtractor': ('.extractors', 'EpubExtractor'),
+    'ExtractionRouter': ('.extractors', 'ExtractionRouter'),
+    # Processing
+    'MetadataEnricher': ('.processing', 'MetadataEnricher'),
+    'DocumentProcessor': ('.processing', 'DocumentProcessor'),
+    # Progress tracking
+    'ProcessingProgress': ('.progress', 'ProcessingProgress'),
 
-# Extractors
-from .extractors import (
-    DoclingExtractor,
-    MarkdownExtractor,
-    EpubExtractor,
-    ExtractionRouter
-)
+    # ============================================================
+    # Database Abstraction Layer (NEW)
+    # ============================================================
+    # Interfaces - abstract contracts for database implementations
+    'DatabaseConnectionInterface': ('.interfaces', 'DatabaseConnection'),
+    'SchemaManagerInterface': ('.interfaces', 'SchemaManager'),
+    'VectorStoreInterface': ('.interfaces', 'VectorStore'),
+    'DocumentRepository': ('.interfaces', 'DocumentRepository'),
+    'ChunkRepository': ('.interfaces', 'ChunkRepository'),
+    'VectorChunkRepository': ('.interfaces', 'VectorChunkRepository'),
+    'FTSChunkRepository': ('.interfaces', 'FTSChunkRepository'),
+    'SearchRepository': ('.interfaces', 'SearchRepository'),
+    'GraphRepository': ('.interfaces', 'GraphRepository'),
+    'ProgressTracker': ('.interfaces', 'ProgressTracker'),
+    'SearchResult': ('.interfaces', 'SearchResult'),
+    # Factory - runtime backend selection
+    'DatabaseFactory': ('.database_factory', 'DatabaseFactory'),
+    'get_vector_store': ('.database_factory', 'get_vector_store'),
+    'get_backend': ('.database_factory', 'get_backend'),
 
-# Processing
-from .processing import (
-    MetadataEnricher,
-    DocumentProcessor
-)
+    # ============================================================
+    # Concrete Implementations (explicit names - no aliases)
+    # ============================================================
+    # PostgreSQL (production)
+    'PostgresConnection': ('.postgres_connection', 'PostgresConnection'),
+    'PostgresSchemaManager': ('.postgres_connection', 'PostgresSchemaManager'),
+    'PostgresVectorRepository': ('.postgres_database', 'PostgresVectorRepository'),
+    'PostgresVectorStore': ('.postgres_database', 'PostgresVectorStore'),
+    'PostgresProgressTracker': ('.postgres_progress', 'PostgresProgressTracker'),
 
-# Progress tracking
-from .progress import ProcessingProgress
+    # SQLite (legacy/testing) - import from submodules directly:
+    #   from ingestion.database import DatabaseConnection, SchemaManager, VectorStore
+    #   from ingestion.progress import ProcessingProgressTracker
 
-# ============================================================
-# Database Abstraction Layer (NEW)
-# ============================================================
-# Interfaces - abstract contracts for database implementations
-from .interfaces import (
-    DatabaseConnection as DatabaseConnectionInterface,
-    SchemaManager as SchemaManagerInterface,
-    VectorStore as VectorStoreInterface,
-    DocumentRepository,
-    ChunkRepository,
-    VectorChunkRepository,
-    FTSChunkRepository,
-    SearchRepository,
-    GraphRepository,
-    ProgressTracker,
-    SearchResult,
-)
+    # Database (asynchronous) - PostgreSQL + asyncpg
+    'AsyncDatabaseConnection': ('.async_postgres', 'AsyncPostgresConnection'),
+    'AsyncSchemaManager': ('.async_postgres', 'AsyncPostgresSchemaManager'),
+    'AsyncVectorRepository': ('.async_postgres', 'AsyncPostgresVectorRepository'),
+    'AsyncVectorStore': ('.async_postgres', 'AsyncPostgresVectorStore'),
+    # Async adapter for unified architecture
+    'AsyncVectorStoreAdapter': ('.async_adapter', 'AsyncVectorStoreAdapter'),
+}
 
-# Factory - runtime backend selection
-from .database_factory import DatabaseFactory, get_vector_store, get_backend
 
-# ============================================================
-# Concrete Implementations (explicit names - no aliases)
-# ============================================================
-# PostgreSQL (production)
-from .postgres_connection import PostgresConnection, PostgresSchemaManager
-from .postgres_database import PostgresVectorRepository, PostgresVectorStore
-from .postgres_progress import PostgresProgressTracker
+def __getattr__(name):
+    """Import the submodule providing an exported name on first access"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _EXPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
 
-# SQLite (legacy/testing) - import from submodules directly:
-#   from ingestion.database import DatabaseConnection, SchemaManager, VectorStore
-#   from ingestion.progress import ProcessingProgressTracker
 
-# Database (asynchronous) - PostgreSQL + asyncpg
-from .async_postgres import (
-    AsyncPostgresConnection as AsyncDatabaseConnection,
-    AsyncPostgresSchemaManager as AsyncSchemaManager,
-    AsyncPostgresVectorRepository as AsyncVectorRepository,
-    AsyncPostgresVectorStore as AsyncVectorStore,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
-# Async adapter for unified architecture
-from .async_adapter import AsyncVectorStoreAdapter
 
 __all__ = [
     # Helpers
@@ -0,0 +1,290 @@
+"""
+Pooled clamd client with streamed INSTREAM scanning
+
+ClamAVStrategy used to open a connection per thread and ask clamd to scan
+a path, so clamd read every file from disk a second time. This client:
+- Keeps a pool of IDSESSION connections (no connect/handshake per file)
+- Streams file content with INSTREAM, in chunks sliced from the shared
+  FileProbe buffer (no second disk read)
+- Bounds concurrent scans by clamd's thread count (STATS "max")
+- Trips a circuit breaker when clamd times out or fails repeatedly, so
+  callers can fall back to the hash blacklist instead of waiting
+
+Addresses are a Unix socket path or "host:port" for TCP.
+"""
+import logging
+import re
+import socket
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# clamd's default MaxThreads, used when STATS is unavailable
+DEFAULT_MAX_THREADS = 10
+
+
+class ClamdError(Exception):
+    """clamd answered with an ERROR (e.g. INSTREAM size limit exceeded)"""
+
+
+class CircuitBreaker:
+    """Stops calling clamd after repeated failures, retries after a pause
+
+    closed: calls allowed. After failure_threshold consecutive failures the
+    breaker opens: calls are refused for reset_seconds, then one trial call
+    is let through (half-open) and its outcome closes or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._trial or time.monotonic() - self._opened_at >= self.reset_seconds:
+                return 'half_open'
+            return 'open'
+
+    def allow(self) -> bool:
+        """Whether a call may proceed (claims the trial call when half-open)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("clamd recovered, ClamAV scanning resumed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or (self._opened_at is None
+                               and self._failures >= self.failure_threshold):
+                if not self._trial:
+                    logger.warning(
+                        "clamd failed %d times, skipping ClamAV for %.0fs",
+                        self._failures, self.reset_seconds
+                    )
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+
+class ClamdPool:
+    """Pool of clamd IDSESSION connections"""
+
+    CHUNK_SIZE = 1 << 20  # INSTREAM chunk (clamd's StreamMaxLength is checked per total)
+
+    _registry: Dict[Tuple, "ClamdPool"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, address: str, timeout: float = 10.0, max_concurrency: int = 0):
+        """
+        Args:
+            address: Unix socket path or host:port
+            timeout: Seconds per socket operation; a scan exceeding it is a failure
+            max_concurrency: Concurrent scans (0 = clamd's thread count)
+        """
+        self.address = address
+        self.timeout = timeout
+        self.breaker = CircuitBreaker()
+        self._max_concurrency = max_concurrency
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self._idle: List["_Session"] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_address(cls, address: str, timeout: float = 10.0,
+                    max_concurrency: int = 0) -> "ClamdPool":
+        """Shared pool per clamd address (all validators share connections)"""
+        key = (address, timeout, max_concurrency)
+        with cls._registry_lock:
+            if key not in cls._registry:
+                cls._registry[key] = cls(address, timeout, max_concurrency)
+            return cls._registry[key]
+
+    def _open_socket(self) -> socket.socket:
+        host, sep, port = self.address.rpartition(':')
+        if sep and not self.address.startswith('/') and port.isdigit():
+            sock = socket.create_connection((host, int(port)), timeout=self.timeout)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+        return sock
+
+    def _command(self, command: bytes) -> str:
+        """Run a one-off command on a fresh connection (no session)"""
+        sock = self._open_socket()
+        try:
+            sock.sendall(b'n' + command + b'\n')
+            return _read_reply(sock, until_close=True)
+        finally:
+            sock.close()
+
+    def ping(self) -> bool:
+        return self._command(b'PING').strip() == 'PONG'
+
+    def version(self) -> Optional[str]:
+        """clamd's engine and signature database version, None if unreachable
+
+        e.g. "ClamAV 1.0.5/27301/Tue Jun  4 08:35:41 2024" (engine/daily
+        signature version/signature date); changes when freshclam updates.
+        """
+        try:
+            return self._command(b'VERSION').strip() or None
+        except OSError as e:
+            logger.debug("clamd VERSION failed: %s", e)
+            return None
+
+    def max_threads(self) -> int:
+        """clamd's MaxThreads, from STATS ("THREADS: live 1 idle 0 max 10")"""
+        try:
+            match = re.search(r'THREADS:.*?\bmax\s+(\d+)', self._command(b'STATS'))
+            if match:
+                return int(match.group(1))
+        except OSError as e:
+            logger.debug("clamd STATS failed: %s", e)
+        return DEFAULT_MAX_THREADS
+
+    def _get_slots(self) -> threading.BoundedSemaphore:
+        if self._slots is None:
+            size = self._max_concurrency or self.max_threads()
+            with self._lock:
+                if self._slots is None:
+                    self._slots = threading.BoundedSemaphore(size)
+        return self._slots
+
+    def _acquire(self) -> Tuple["_Session", bool]:
+        """(session, reused) - an idle session or a new one"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return _Session(self._open_socket()), False
+
+    def _release(self, session: "_Session"):
+        with self._lock:
+            self._idle.append(session)
+
+    def instream(self, data) -> Optional[str]:
+        """Scan a buffer; returns the signature name if infected, None if clean
+
+        Raises:
+            ClamdError: clamd refused the stream (size limit, etc.)
+            OSError: connection failure or timeout
+        """
+        slots = self._get_slots()
+        if not slots.acquire(timeout=self.timeout):
+            raise socket.timeout("All clamd scan slots busy")
+        try:
+            return self._instream(data)
+        finally:
+            slots.release()
+
+    def _instream(self, data) -> Optional[str]:
+        session, reused = self._acquire()
+        try:
+            reply = session.instream(data, self.CHUNK_SIZE)
+        except (OSError, EOFError):
+            session.close()
+            if not reused:
+                raise
+            # clamd closes idle sessions (IdleTimeout): retry on a fresh one
+            session = _Session(self._open_socket())
+            try:
+                reply = session.instream(data, self.CHUNK_SIZE)
+            except (OSError, EOFError):
+                session.close()
+                raise
+        try:
+            virus_name = _parse_stream_reply(reply)
+        except ClamdError:
+            session.close()  # clamd ends the session after an ERROR reply
+            raise
+        self._release(session)
+        return virus_name
+
+    def close(self):
+        """Close idle sessions"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for session in idle:
+            session.close()
+
+
+class _Session:
+    """One IDSESSION connection; commands are sent one at a time"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.sock.sendall(b'nIDSESSION\n')
+
+    def instream(self, data, chunk_size: int) -> str:
+        view = memoryview(data)
+        self.sock.sendall(b'nINSTREAM\n')
+        try:
+            for start in range(0, len(view), chunk_size):
+                chunk = view[start:start + chunk_size]
+                self.sock.sendall(struct.pack('!L', len(chunk)))
+                self.sock.sendall(chunk)
+            self.sock.sendall(struct.pack('!L', 0))
+        except BrokenPipeError:
+            # clamd rejected the stream early (size limit): its reply explains why
+            pass
+        finally:
+            view.release()
+        reply = _read_reply(self.sock)
+        # Session replies are prefixed with the request id ("1: stream: OK")
+        return reply.split(': ', 1)[1] if re.match(r'^\d+: ', reply) else reply
+
+    def close(self):
+        try:
+            self.sock.sendall(b'nEND\n')
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def _read_reply(sock: socket.socket, until_close: bool = False) -> str:
+    """Read one newline-terminated reply (or everything until close)"""
+    buf = bytearray()
+    while True:
+        data = sock.recv(4096)
+        if not data:
+            if until_close or buf:
+                break
+            raise EOFError("clamd closed the connection")
+        buf += data
+        if not until_close and buf.endswith(b'\n'):
+            break
+    return buf.decode('utf-8', 'replace').strip('\n\0')
+
+
+def _parse_stream_reply(reply: str) -> Optional[str]:
+    """'stream: OK' -> None, 'stream: <name> FOUND' -> name, ERROR -> ClamdError"""
+    if reply.endswith(' FOUND'):
+        return reply[:-len(' FOUND')].split(': ', 1)[-1]
+    if reply.endswith('ERROR'):
+        raise ClamdError(reply)
+    return None
@@ -6,8 +6,6 @@ import logging
 import sys
 import warnings
 
-import numpy as np
-
 from config import default_config
 from hybrid_search import HybridSearcher
 from domain_models import ChunkData, DocumentFile, ExtractionResult
@@ -18,23 +16,11 @@ from ingestion.search_repository import SearchRepository
 # Centralized logging configuration - import triggers suppression
 import ingestion.logging_config  # noqa: F401
 
-try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_AVAILABLE = False
-    print(f"Warning: Docling not available ({e})")
-
-# Try to import chunking separately (may not be available in all versions)
-try:
-    from docling_core.transforms.chunker import HybridChunker
-    from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
-    from transformers import AutoTokenizer
-    DOCLING_CHUNKING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_CHUNKING_AVAILABLE = False
-    if DOCLING_AVAILABLE:
-        print(f"Warning: Docling HybridChunker not available ({e}), using fixed-size chunking")
+# Docling availability flags (re-exported for backward compatibility)
+from ingestion.extractors._docling_availability import (  # noqa: F401
+    DOCLING_AVAILABLE,
+    DOCLING_CHUNKING_AVAILABLE
+)
 
 
 class DatabaseConnection:
@@ -672,6 +658,96 @@ class VectorStore:
             self.conn.commit()
             return self._deletion_success_result(doc_id, chunk_count)
 
+    def move_document(self, old_path: str, new_path: str) -> bool:
+        """Move a document to a new path, keeping chunks and embeddings.
+
+        Any document already at new_path was overwritten on disk and is
+        removed first. Returns False if old_path is not indexed.
+        """
+        from ingestion.graph_repository import GraphRepository
+        with self._lock:
+            if not self._find_document_id(old_path):
+                return False
+            existing_id = self._find_document_id(new_path)
+            if existing_id:
+                self._delete_document_data(existing_id)
+            graph_repo = GraphRepository(self.conn)
+            graph_repo.delete_note_nodes(new_path)
+            self.repo.documents.update_path(old_path, new_path)
+            self.conn.execute("DELETE FROM processing_progress WHERE file_path = ?", (new_path,))
+            self.conn.execute(
+                "UPDATE processing_progress SET file_path = ? WHERE file_path = ?",
+                (new_path, old_path)
+            )
+            graph_repo.update_note_path(old_path, new_path)
+            self.conn.commit()
+            return True
+
+    def delete_documents(self, file_paths: List[str]) -> Dict[str, int]:
+        """Delete many documents in one transaction.
+
+        Returns:
+            {path: chunks deleted} for each document that was indexed
+        """
+        from ingestion.graph_repository import GraphRepository
+        removed = {}
+        with self._lock:
+            graph_repo = GraphRepository(self.conn)
+            for file_path in file_paths:
+                doc_id = self._find_document_id(file_path)
+                if doc_id:
+                    removed[file_path] = self._count_document_chunks(doc_id)
+                    self._delete_document_data(doc_id)
+                graph_repo.delete_note_nodes(file_path)
+            self.conn.executemany(
+                "DELETE FROM processing_progress WHERE file_path = ?",
+                [(file_path,) for file_path in file_paths]
+            )
+            self.conn.commit()
+        return removed
+
+    def document_paths_under(self, directory: str) -> List[str]:
+        """Paths of indexed documents below directory (any depth)"""
+        prefix = directory.rstrip('/') + '/'
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT file_path FROM documents WHERE substr(file_path, 1, ?) = ?",
+                (len(prefix), prefix)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def refresh_keyword_index(self) -> None:
+        """Rebuild the BM25 index (after bulk deletes)."""
+        with self._lock:
+            self.hybrid.refresh_keyword_index()
+
+    def sync_graph(self, notes_export: Dict) -> Dict[str, int]:
+        """Persist the graph of changed notes (replaces their nodes and edges)
+
+        Edges owned by the notes (sourced at a note or its headers, plus
+        backlinks to the note) are deleted explicitly: SQLite does not
+        enforce the ON DELETE CASCADE without PRAGMA foreign_keys, so they
+        would otherwise be duplicated.
+        """
+        from ingestion.graph_repository import GraphRepository
+        note_ids = notes_export.get('notes', [])
+        edges_removed = 0
+        with self._lock:
+            graph_repo = GraphRepository(self.conn)
+            for note_id in note_ids:
+                cursor = self.conn.execute("""
+                    DELETE FROM graph_edges
+                    WHERE source_id = ? OR substr(source_id, 1, ?) = ?
+                       OR (edge_type = 'backlink' AND target_id = ?)
+                """, (note_id, len(note_id) + 2, f"{note_id}:h", note_id))
+                edges_removed += cursor.rowcount
+                graph_repo.delete_note_nodes(note_id[len('note:'):])
+            graph_repo.persist_graph(notes_export)
+            self.conn.commit()
+        return {'nodes': len(notes_export.get('nodes', [])),
+                'edges_added': len(notes_export.get('edges', [])),
+                'edges_removed': edges_removed}
+
     def _find_document_id(self, file_path: str):
         """Find document ID by file path"""
         cursor = self.conn.execute("SELECT id FROM documents WHERE file_path = ?", (file_path,))
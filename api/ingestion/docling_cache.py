@@ -0,0 +1,174 @@
+"""Converted DoclingDocument cache
+
+Docling conversion (layout, OCR, tables) is the slow part of ingesting a
+PDF; chunking the converted document is cheap. The converted document is
+kept on disk as compressed JSON, keyed by
+
+    (file content hash, docling versions, pipeline options, page range)
+
+so re-indexing after a chunking or tokenizer change (CHUNK_MAX_TOKENS,
+MODEL_NAME, reindex-path) re-chunks without re-parsing. A changed file,
+Docling upgrade or pipeline option is a different key.
+
+Page and picture images are stored as placeholders: chunking reads text
+and structure only. Entries are evicted by age and, oldest first, by
+total size; a cache hit refreshes an entry's age.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import default_config
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = '.json.gz'
+
+
+def _versions() -> Dict[str, str]:
+    """Installed docling package versions (part of every key)"""
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {}
+    for package in ('docling', 'docling-core', 'docling-parse'):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = ''
+    return versions
+
+
+def file_sha256(path: Path) -> str:
+    """Content hash of a file (streamed)"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+class DoclingDocumentCache:
+    """Disk cache of converted DoclingDocuments"""
+
+    def __init__(self, directory: Path, max_bytes: int, max_age_seconds: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._versions = None
+        self._evict_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config=None) -> Optional['DoclingDocumentCache']:
+        """Cache from DoclingConfig, None when disabled"""
+        config = config or default_config.docling
+        if not config.cache_enabled:
+            return None
+        return cls(
+            Path(config.cache_dir),
+            max_bytes=config.cache_max_mb * 1024 * 1024,
+            max_age_seconds=config.cache_max_age_days * 86400,
+        )
+
+    def key(self, path: Path, pipeline: Dict, page_range=None) -> str:
+        """Cache key for converting path with the given pipeline options"""
+        if self._versions is None:
+            self._versions = _versions()
+        material = json.dumps(
+            [file_sha256(path), self._versions, pipeline, page_range], sort_keys=True
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, key: str):
+        """Cached DoclingDocument for key, None on a miss or unreadable entry"""
+        entry = self._entry(key)
+        try:
+            data = gzip.decompress(entry.read_bytes())
+            document = self._load(data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Dropping unreadable Docling cache entry %s: %s", entry.name, e)
+            entry.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(entry)  # Recently used entries are evicted last
+        except OSError:
+            pass
+        return document
+
+    def put(self, key: str, document) -> None:
+        """Store a converted document (failures are logged, never raised)"""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            data = gzip.compress(self._dump(document), compresslevel=6)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, self._entry(key))
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except Exception as e:
+            logger.warning("Could not cache Docling document: %s", e)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then oldest entries beyond max_bytes"""
+        with self._evict_lock:
+            entries = []
+            for entry in self.directory.glob(f'*{SUFFIX}'):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry))
+            entries.sort()
+
+            cutoff = time.time() - self.max_age_seconds
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for mtime, size, entry in entries:
+                if mtime >= cutoff and total <= self.max_bytes:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
+
+    @staticmethod
+    def _dump(document) -> bytes:
+        """Serialize a DoclingDocument to JSON with image placeholders"""
+        from docling_core.types.doc import ImageRefMode
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'document.json'
+            document.save_as_json(path, image_mode=ImageRefMode.PLACEHOLDER)
+            return path.read_bytes()
+
+    @staticmethod
+    def _load(data: bytes):
+        from docling_core.types.doc import DoclingDocument
+
+        return DoclingDocument.model_validate_json(data)
+
+
+# Global singleton
+_cache = None
+_cache_loaded = False
+
+def get_docling_cache() -> Optional[DoclingDocumentCache]:
+    """Get or create the configured cache (None when disabled)"""
+    global _cache, _cache_loaded
+    if not _cache_loaded:
+        _cache = DoclingDocumentCache.from_config()
+        _cache_loaded = True
+    return _cache
@@ -0,0 +1,90 @@
+"""EPUB spine reading
+
+An EPUB is a zip of XHTML documents; the OPF package file lists them in
+reading order (the spine). Documents are read one at a time from the zip,
+so a book is never unpacked to disk or held in memory whole.
+
+    META-INF/container.xml  -> path of the OPF package file
+    OPF <manifest>          -> id -> href, media-type
+    OPF <spine>             -> reading order of manifest ids
+"""
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List
+from urllib.parse import unquote
+
+CONTAINER = 'META-INF/container.xml'
+HTML_MEDIA_TYPES = {'application/xhtml+xml', 'text/html'}
+
+
+@dataclass
+class SpineDocument:
+    """One content document of the spine"""
+    chapter: int  # 1-based position among the spine's content documents
+    name: str  # Path inside the zip
+    content: bytes
+
+
+def spine_entries(epub: zipfile.ZipFile) -> List[str]:
+    """Zip paths of the spine's XHTML documents, in reading order
+
+    Raises:
+        ValueError: If the container or package file is missing or malformed
+    """
+    opf_path = _package_path(epub)
+    try:
+        package = ET.fromstring(epub.read(opf_path))
+    except (KeyError, ET.ParseError) as e:
+        raise ValueError(f"Unreadable EPUB package file {opf_path}: {e}") from e
+
+    manifest = {
+        item.get('id'): item for item in package.iterfind('{*}manifest/{*}item')
+    }
+    base = posixpath.dirname(opf_path)
+    entries = []
+    for itemref in package.iterfind('{*}spine/{*}itemref'):
+        item = manifest.get(itemref.get('idref'))
+        if item is None or item.get('media-type') not in HTML_MEDIA_TYPES:
+            continue
+        href = unquote(item.get('href', '').split('#')[0])
+        entries.append(posixpath.normpath(posixpath.join(base, href)))
+    return entries
+
+
+def iter_spine(path: Path) -> Iterator[SpineDocument]:
+    """Spine documents of an EPUB, read lazily in reading order
+
+    The package is parsed up front, so a malformed EPUB raises ValueError
+    here rather than mid-iteration. Spine entries missing from the archive
+    are skipped.
+    """
+    epub = zipfile.ZipFile(path)
+    try:
+        entries = spine_entries(epub)
+    except Exception:
+        epub.close()
+        raise
+    return _read_documents(epub, entries)
+
+
+def _read_documents(epub: zipfile.ZipFile, entries: List[str]) -> Iterator[SpineDocument]:
+    with epub:
+        names = set(epub.namelist())
+        for chapter, name in enumerate(entries, 1):
+            if name in names:
+                yield SpineDocument(chapter, name, epub.read(name))
+
+
+def _package_path(epub: zipfile.ZipFile) -> str:
+    """Path of the OPF package file named by META-INF/container.xml"""
+    try:
+        container = ET.fromstring(epub.read(CONTAINER))
+    except (KeyError, ET.ParseError) as e:
+        raise ValueError(f"Unreadable EPUB container ({CONTAINER}): {e}") from e
+    rootfile = container.find('{*}rootfiles/{*}rootfile')
+    if rootfile is None or not rootfile.get('full-path'):
+        raise ValueError(f"EPUB container lists no package file ({CONTAINER})")
+    return rootfile.get('full-path')
@@ -2,25 +2,30 @@
 Docling availability flags
 
 Shared module for checking Docling library availability across extractors.
+
+Availability is detected with importlib.util.find_spec so that importing
+extractors does not load Docling, docling_core or transformers (seconds of
+import time). Extractors import them on first use.
 """
+from importlib.util import find_spec
 
 # Centralized logging configuration - import triggers suppression
 import ingestion.logging_config  # noqa: F401
 
-try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_AVAILABLE = False
-    print(f"Warning: Docling not available ({e})")
-
-# Try to import chunking separately (may not be available in all versions)
-try:
-    from docling_core.transforms.chunker import HybridChunker
-    from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
-    from transformers import AutoTokenizer
-    DOCLING_CHUNKING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_CHUNKING_AVAILABLE = False
-    if DOCLING_AVAILABLE:
-        print(f"Warning: Docling HybridChunker not available ({e}), using fixed-size chunking")
+
+def _installed(*modules: str) -> bool:
+    """Check modules are installed without importing them"""
+    try:
+        return all(find_spec(name) is not None for name in modules)
+    except (ImportError, ValueError):
+        return False
+
+
+DOCLING_AVAILABLE = _installed('docling')
+if not DOCLING_AVAILABLE:
+    print("Warning: Docling not available (No module named 'docling')")
+
+# Chunking is checked separately (may not be available in all versions)
+DOCLING_CHUNKING_AVAILABLE = _installed('docling_core', 'transformers')
+if DOCLING_AVAILABLE and not DOCLING_CHUNKING_AVAILABLE:
+    print("Warning: Docling HybridChunker not available, using fixed-size chunking")
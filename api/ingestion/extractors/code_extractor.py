@@ -46,6 +46,9 @@ class CodeExtractor(ExtractorInterface):
     # Languages that need TreeSitterChunker (astchunk doesn't support them)
     TREE_SITTER_LANGUAGES = {'go', 'javascript', 'tsx'}
 
+    # TreeSitterChunker languages: re-extraction reuses the file's last parse
+    INCREMENTAL_LANGUAGES = {'javascript', 'tsx'}
+
     @staticmethod
     def _get_chunker(language: str):
         """Get or create AST chunker for language
@@ -119,7 +122,10 @@ class CodeExtractor(ExtractorInterface):
 
         # Chunk with AST - NO try-except, let errors propagate
         # Note: language is already set in chunker, but chunkify may still need it
-        result = chunker.chunkify(source_code)
+        if language in CodeExtractor.INCREMENTAL_LANGUAGES:
+            result = chunker.chunkify(source_code, filepath=str(path))
+        else:
+            result = chunker.chunkify(source_code)
 
         # Extract content from astchunk result format
         # astchunk returns list of dicts with 'content' and 'metadata' keys
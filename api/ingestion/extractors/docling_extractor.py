@@ -3,7 +3,21 @@ Docling document extractor
 
 Extracts text from PDF and DOCX files using Docling library with advanced parsing.
 Extracted from extractors.py during modularization refactoring.
+
+Born-digital PDFs (text layer on nearly every sampled page) skip OCR and
+page images; see ingestion.pdf_text_layer.
+
+Markdown (notes, notebooks) skips DocumentConverter: convert_markdown parses
+in-memory text with Docling's markdown backend, the same backend the
+converter would pick, so chunks are unchanged. EPUB chapters take the same
+path with the HTML backend (convert_html).
+
+Converted PDF/DOCX documents are cached by file hash and pipeline options
+(ingestion.docling_cache), so re-chunking does not re-run conversion.
 """
+import logging
+import time
+from io import BytesIO
 from pathlib import Path
 from typing import ClassVar, List, Set, Tuple
 
@@ -17,6 +31,8 @@ from ingestion.extractors._docling_availability import (
 )
 from pipeline.interfaces import ExtractorInterface
 
+logger = logging.getLogger(__name__)
+
 
 class DoclingExtractor(ExtractorInterface):
     """Extracts text from documents using Docling (advanced parsing)"""
@@ -24,6 +40,7 @@ class DoclingExtractor(ExtractorInterface):
     SUPPORTED_EXTENSIONS: ClassVar[Set[str]] = {'.pdf', '.docx'}
 
     _converter = None
+    _text_converter = None
     _chunker = None
 
     @property
@@ -50,8 +67,6 @@ class DoclingExtractor(ExtractorInterface):
         normal when OCR checks images/pages and finds no text.
         """
         if cls._converter is None and DOCLING_AVAILABLE:
-            from docling.document_converter import DocumentConverter, PdfFormatOption
-            from docling.datamodel.base_models import InputFormat
             from docling.datamodel.pipeline_options import PdfPipelineOptions
 
             # Configure PDF pipeline options from config
@@ -59,25 +74,51 @@ class DoclingExtractor(ExtractorInterface):
                 generate_page_images=default_config.docling.generate_page_images,
                 generate_picture_images=default_config.docling.generate_picture_images,
             )
+            cls._converter = cls._build_converter(pipeline_options)
+        return cls._converter
 
-            # Select PDF backend based on config
-            if default_config.docling.pdf_backend == "pypdfium2":
-                from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-                pdf_backend = PyPdfiumDocumentBackend
-            else:
-                # Default to dlparse_v4
-                from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
-                pdf_backend = DoclingParseV4DocumentBackend
-
-            cls._converter = DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(
-                        pipeline_options=pipeline_options,
-                        backend=pdf_backend
-                    )
-                }
+    @classmethod
+    def get_text_converter(cls):
+        """Lazy load converter for born-digital PDFs (singleton pattern)
+
+        Reads the existing text layer: no OCR and no page or picture images.
+        The table structure model runs unless DOCLING_FAST_PATH_TABLES=false.
+        """
+        if cls._text_converter is None and DOCLING_AVAILABLE:
+            from docling.datamodel.pipeline_options import PdfPipelineOptions
+
+            pipeline_options = PdfPipelineOptions(
+                do_ocr=False,
+                do_table_structure=default_config.docling.fast_path_tables,
+                generate_page_images=False,
+                generate_picture_images=False,
             )
-        return cls._converter
+            cls._text_converter = cls._build_converter(pipeline_options)
+        return cls._text_converter
+
+    @staticmethod
+    def _build_converter(pipeline_options):
+        """DocumentConverter for PDFs with the configured backend"""
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+        from docling.datamodel.base_models import InputFormat
+
+        # Select PDF backend based on config
+        if default_config.docling.pdf_backend == "pypdfium2":
+            from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+            pdf_backend = PyPdfiumDocumentBackend
+        else:
+            # Default to dlparse_v4
+            from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+            pdf_backend = DoclingParseV4DocumentBackend
+
+        return DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=pipeline_options,
+                    backend=pdf_backend
+                )
+            }
+        )
 
     @classmethod
     def get_chunker(cls, max_tokens: int = 512):
@@ -93,6 +134,71 @@ class DoclingExtractor(ExtractorInterface):
             cls._chunker = HybridChunker(tokenizer=hf_tokenizer, merge_peers=True)
         return cls._chunker
 
+    @classmethod
+    def convert_markdown(cls, text: str, name: str = 'document.md'):
+        """Parse markdown text into a DoclingDocument without DocumentConverter
+
+        No temp file, format detection or conversion pipeline: the markdown
+        backend runs directly on an in-memory stream. Falls back to the
+        converter (still in memory) if the backend API is unavailable.
+
+        Args:
+            text: Markdown source
+            name: File name recorded as the document origin
+
+        Returns:
+            DoclingDocument, ready for the HybridChunker
+        """
+        return cls._convert_in_memory(text.encode('utf-8'), name, 'MD')
+
+    @classmethod
+    def convert_html(cls, html: bytes, name: str = 'document.html'):
+        """Parse HTML/XHTML bytes (e.g. an EPUB chapter) into a DoclingDocument
+
+        Same in-memory path as convert_markdown, with Docling's HTML backend.
+        """
+        return cls._convert_in_memory(html, name, 'HTML')
+
+    @classmethod
+    def _convert_in_memory(cls, data: bytes, name: str, input_format: str):
+        """Run the simple-pipeline backend for input_format ('MD' or 'HTML')"""
+        from docling.datamodel.base_models import InputFormat
+
+        try:
+            from docling.datamodel.document import InputDocument
+
+            in_doc = InputDocument(
+                path_or_stream=BytesIO(data), format=InputFormat[input_format],
+                backend=cls._in_memory_backend(input_format), filename=name
+            )
+            # InputDocument instantiates the backend; Docling's SimplePipeline
+            # converts markdown and HTML with this same call
+            return in_doc._backend.convert()
+        except (ImportError, TypeError, AttributeError) as e:
+            logger.debug("%s backend unavailable, using converter: %s", input_format, e)
+
+        from docling.datamodel.base_models import DocumentStream
+        result = cls.get_converter().convert(DocumentStream(name=name, stream=BytesIO(data)))
+        return result.document
+
+    @staticmethod
+    def _in_memory_backend(input_format: str):
+        if input_format == 'HTML':
+            from docling.backend.html_backend import HTMLDocumentBackend
+            return HTMLDocumentBackend
+        from docling.backend.md_backend import MarkdownDocumentBackend
+        return MarkdownDocumentBackend
+
+    @classmethod
+    def chunk_markdown(cls, text: str, name: str = 'document.md') -> List[Tuple[str, int]]:
+        """HybridChunker chunks of in-memory markdown text"""
+        return cls._extract_hybrid_chunks(cls.convert_markdown(text, name))
+
+    @classmethod
+    def chunk_html(cls, html: bytes, name: str = 'document.html') -> List[Tuple[str, int]]:
+        """HybridChunker chunks of in-memory HTML"""
+        return cls._extract_hybrid_chunks(cls.convert_html(html, name))
+
     def extract(self, path: Path, retry_with_ghostscript: bool = True) -> ExtractionResult:
         """Extract text from PDF/DOCX using Docling with HybridChunker
 
@@ -132,24 +238,123 @@ class DoclingExtractor(ExtractorInterface):
 
     @staticmethod
     def _convert_with_docling(path: Path) -> ExtractionResult:
-        """Convert document using Docling"""
-        import gc
+        """Convert document using Docling
 
-        converter = DoclingExtractor.get_converter()
-        result = converter.convert(str(path))
+        Born-digital PDFs take the text-layer pipeline; image-only pages
+        among them are OCR'd separately with the full pipeline and merged
+        back in page order. Scanned or
+        unreadable PDFs, DOCX and DOCLING_FORCE_FULL_PIPELINE use the full
+        pipeline throughout.
+        """
+        profile = DoclingExtractor._text_layer_profile(path)
+        if profile is None:
+            return DoclingExtractor._convert(path, DoclingExtractor.get_converter(), 'docling')
+
+        result = DoclingExtractor._convert(
+            path, DoclingExtractor.get_text_converter(), 'docling_text'
+        )
+        for start, end in profile.image_only_runs():
+            ocr = DoclingExtractor._convert(
+                path, DoclingExtractor.get_converter(), 'docling', page_range=(start, end)
+            )
+            DoclingExtractor._insert_pages(result.pages, ocr.pages, end)
+            result.method = 'docling_text_ocr'
+        return result
 
-        DoclingExtractor._check_for_conversion_failure(result, path)
+    @staticmethod
+    def _insert_pages(pages: List[Tuple[str, int]], run: List[Tuple[str, int]], last_page: int):
+        """Insert a page run's chunks before the first chunk from a later page
 
-        document = result.document
+        Chunks without a page number (0) keep their place.
+        """
+        at = next((i for i, (_, page) in enumerate(pages) if page and page > last_page),
+                  len(pages))
+        pages[at:at] = run
+
+    @staticmethod
+    def _text_layer_profile(path: Path):
+        """Text-layer profile of a born-digital PDF, None for the full pipeline"""
+        docling = default_config.docling
+        if path.suffix.lower() != '.pdf' or docling.force_full_pipeline:
+            return None
+
+        from ingestion.pdf_text_layer import classify_pdf
+
+        started = time.perf_counter()
+        profile = classify_pdf(path, docling.text_layer_samples, docling.text_layer_coverage)
+        elapsed = time.perf_counter() - started
+        if profile is None or not profile.is_text_native(docling.text_layer_coverage):
+            coverage = f"{profile.coverage:.0%}" if profile else "unreadable"
+            logger.info("%s: text layer %s, full pipeline (checked in %.2fs)",
+                        path.name, coverage, elapsed)
+            return None
+        logger.info("%s: text layer %.0f%%, %d image-only of %d pages (checked in %.2fs)",
+                    path.name, profile.coverage * 100, len(profile.image_only_pages),
+                    profile.page_count, elapsed)
+        return profile
+
+    @staticmethod
+    def _convert(path: Path, converter, method: str, page_range=None) -> ExtractionResult:
+        """Run one converter over the document (or an inclusive page range)"""
+        import gc
+
+        started = time.perf_counter()
+        document = DoclingExtractor._converted_document(path, converter, method, page_range)
         pages = DoclingExtractor._extract_hybrid_chunks(document)
 
         # Explicitly release large objects to reduce memory pressure
         # Critical for Mac Docker where memory limits are tight
         del document
-        del result
         gc.collect()
 
-        return ExtractionResult(pages=pages, method='docling')
+        scope = f" pages {page_range[0]}-{page_range[1]}" if page_range else ""
+        logger.info("%s%s: %s in %.1fs, %d chunks", path.name, scope, method,
+                    time.perf_counter() - started, len(pages))
+        return ExtractionResult(pages=pages, method=method)
+
+    @staticmethod
+    def _converted_document(path: Path, converter, method: str, page_range=None):
+        """DoclingDocument from the conversion cache, or converted and cached
+
+        Chunking settings are not part of the cache key: re-indexing after a
+        CHUNK_MAX_TOKENS or MODEL_NAME change re-chunks the cached document.
+        """
+        from ingestion.docling_cache import get_docling_cache
+
+        cache = get_docling_cache()
+        key = None
+        if cache is not None:
+            try:
+                key = cache.key(path, DoclingExtractor._pipeline_options(method), page_range)
+            except OSError as e:
+                logger.debug("Docling cache skipped for %s: %s", path.name, e)
+            else:
+                document = cache.get(key)
+                if document is not None:
+                    logger.info("%s: converted document from cache", path.name)
+                    return document
+
+        if page_range:
+            result = converter.convert(str(path), page_range=page_range)
+        else:
+            result = converter.convert(str(path))
+        DoclingExtractor._check_for_conversion_failure(result, path)
+
+        if key is not None:
+            cache.put(key, result.document)
+        return result.document
+
+    @staticmethod
+    def _pipeline_options(method: str) -> dict:
+        """Pipeline settings that shape the converted document (cache key)"""
+        docling = default_config.docling
+        options = {'method': method, 'pdf_backend': docling.pdf_backend}
+        if method == 'docling_text':
+            options['tables'] = docling.fast_path_tables
+        else:
+            options['page_images'] = docling.generate_page_images
+            options['picture_images'] = docling.generate_picture_images
+        return options
 
     @staticmethod
     def _check_for_conversion_failure(result, path: Path):
@@ -83,14 +83,23 @@ class ExtractionRouter:
 
         Obsidian uses composition pattern (different signature: extract(path, graph_builder))
         rather than implementing ExtractorInterface. See design decision in state.json.
+
+        The note is read once: detection and either extractor share the text.
         """
-        if self.obsidian_detector.is_obsidian_note(file_path):
+        content = self._read_markdown(file_path)
+        if self.obsidian_detector.is_obsidian_note(file_path, content):
             self.last_method = 'obsidian_graph_rag'
-            return ObsidianExtractor.extract(file_path, self.obsidian_graph)
+            return ObsidianExtractor.extract(file_path, self.obsidian_graph, content)
         else:
             extractor = self._get_extractor('.md')
             self.last_method = extractor.name
-            return extractor.extract(file_path)
+            return extractor.extract(file_path, content=content)
+
+    @staticmethod
+    def _read_markdown(file_path: Path) -> str:
+        """Read markdown text (same decoding as both markdown extractors)"""
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
 
     def get_last_method(self) -> str:
         """Get the last extraction method used."""
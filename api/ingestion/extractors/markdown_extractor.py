@@ -4,7 +4,7 @@ Markdown file extractor.
 Extracts text from Markdown files using Docling HybridChunker.
 """
 from pathlib import Path
-from typing import ClassVar, Set
+from typing import ClassVar, Optional, Set
 
 from domain_models import ExtractionResult
 from ingestion.extractors._docling_availability import (
@@ -26,11 +26,15 @@ class MarkdownExtractor(ExtractorInterface):
     def name(self) -> str:
         return "markdown_docling"
 
-    def extract(self, path: Path) -> ExtractionResult:
+    def extract(self, path: Path, content: Optional[str] = None) -> ExtractionResult:
         """Extract markdown using Docling converter + HybridChunker
 
         NO FALLBACKS: Raises exceptions if Docling is unavailable or fails.
 
+        Args:
+            path: Path to .md file
+            content: Note text if already read (file is not read again)
+
         Returns:
             ExtractionResult with Docling HybridChunker pages
 
@@ -54,9 +58,7 @@ class MarkdownExtractor(ExtractorInterface):
         from ingestion.extractors.docling_extractor import DoclingExtractor
 
         # NO try-except: Let conversion errors propagate
-        converter = DoclingExtractor.get_converter()
-        result = converter.convert(str(path))
-
-        document = result.document
-        pages = DoclingExtractor._extract_hybrid_chunks(document)
+        if content is None:
+            content = path.read_text(encoding='utf-8', errors='ignore')
+        pages = DoclingExtractor.chunk_markdown(content, path.name)
         return ExtractionResult(pages=pages, method='docling_markdown')
@@ -0,0 +1,163 @@
+"""
+Single-read file probe for validation and security strategies
+
+FileTypeValidator runs up to nine strategies per file, and the pipeline
+validates each file twice (pre-queue and in DocumentProcessor). A FileProbe
+is created once per file version and passed to every strategy so the file
+is stat'ed once and each part of it is read at most once.
+
+Principles:
+- One os.stat() result shared by all checks
+- The header is a bounded read and SHA256 is streamed, so type checks and
+  the hash blacklist never buffer the file
+- Content is read into memory only for scanners that need the whole buffer
+  (ClamAV INSTREAM, YARA, archive inspection); FileSizeStrategy runs first,
+  so that read is bounded by the size limit
+- Every read matches the cached stat: a file truncated or replaced
+  mid-validation raises FileChangedError instead of being half-scanned
+  (and is never mmapped, where truncation would SIGBUS the process)
+- fingerprint identifies the file version (memoization key)
+- Strategies accept a Path or a FileProbe (FileProbe.of)
+"""
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+class FileChangedError(OSError):
+    """File no longer matches the version the probe stat'ed"""
+
+
+class FileProbe:
+    """One file version: stat, plus lazily read header, hash and content"""
+
+    HEADER_SIZE = 512
+
+    def __init__(self, path: Union[str, Path]):
+        """Stat the file (content is not read until needed)
+
+        Args:
+            path: Path to file
+        """
+        self.path = Path(path)
+        try:
+            self._stat: Optional[os.stat_result] = self.path.stat()
+        except OSError:
+            self._stat = None
+        self._content: Optional[bytes] = None
+        self._header: Optional[bytes] = None
+        self._sha256: Optional[str] = None
+        self.changed = False  # Set when a read found a different version
+
+    @classmethod
+    def of(cls, file: Union[str, Path, "FileProbe"]) -> "FileProbe":
+        """Reuse a probe, or create one for a plain path"""
+        return file if isinstance(file, FileProbe) else cls(file)
+
+    @property
+    def exists(self) -> bool:
+        return self._stat is not None
+
+    @property
+    def stat(self) -> os.stat_result:
+        """Cached stat result (raises FileNotFoundError if missing)"""
+        if self._stat is None:
+            raise FileNotFoundError(f'File does not exist: {self.path}')
+        return self._stat
+
+    @property
+    def size(self) -> int:
+        return self.stat.st_size
+
+    @property
+    def fingerprint(self) -> Optional[Tuple]:
+        """Identity of this file version, None if the file is missing
+
+        Includes mode and ctime so a chmod (e.g. +x remediation) is a new version.
+        """
+        if self._stat is None:
+            return None
+        st = self._stat
+        return (str(self.path), st.st_dev, st.st_ino, st.st_size,
+                st.st_mtime_ns, st.st_ctime_ns, st.st_mode)
+
+    @property
+    def content(self) -> bytes:
+        """Whole file as bytes (read once; raises FileChangedError if modified)"""
+        if self._content is None:
+            self._content = self._read()
+        return self._content
+
+    def _read(self) -> bytes:
+        """Read exactly the file version described by the cached stat"""
+        size = self.size
+        if size == 0:
+            return b''
+        with self._open() as f:
+            data = f.read(size)
+        if len(data) != size:
+            raise self._changed_error()
+        return data
+
+    @contextmanager
+    def _open(self):
+        """Open the file, raising FileChangedError unless it is the stat'ed version"""
+        if self.changed:
+            raise self._changed_error()
+        with open(self.path, 'rb') as f:
+            if not self._same_version(os.fstat(f.fileno())):
+                raise self._changed_error()
+            yield f
+
+    def _changed_error(self) -> FileChangedError:
+        self.changed = True
+        return FileChangedError(f'File changed during validation: {self.path}')
+
+    def _same_version(self, st: os.stat_result) -> bool:
+        """Whether an open file's stat matches the cached one"""
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns) == (
+            self._stat.st_dev, self._stat.st_ino, self._stat.st_size, self._stat.st_mtime_ns)
+
+    @property
+    def header(self) -> bytes:
+        """First HEADER_SIZE bytes (magic signatures, shebang, text sniffing)"""
+        if self._header is None:
+            if self._content is not None:
+                self._header = bytes(self._content[:self.HEADER_SIZE])
+            else:
+                size = min(self.size, self.HEADER_SIZE)
+                if size == 0:
+                    return b''
+                with self._open() as f:
+                    header = f.read(size)
+                if len(header) != size:
+                    raise self._changed_error()
+                self._header = header
+        return self._header
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA256 of the file (streamed unless content is loaded; computed once)"""
+        if self._sha256 is None:
+            if self._content is not None:
+                digest = hashlib.sha256(self._content)
+            else:
+                with self._open() as f:
+                    digest = hashlib.file_digest(f, 'sha256')
+                    # Appended or rewritten in place while hashing
+                    if not self._same_version(os.fstat(f.fileno())):
+                        raise self._changed_error()
+            self._sha256 = digest.hexdigest()
+        return self._sha256
+
+    def close(self):
+        """Release the content buffer"""
+        self._content = None
+
+    def __enter__(self) -> "FileProbe":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,8 +3,16 @@ File type validation for document security.
 
 Validates files before indexing to prevent malicious content from being processed.
 Uses magic byte verification to ensure file type matches extension.
+
+Each file version is read once: strategies share a FileProbe, and results
+are memoized by the probe's fingerprint so the pipeline's pre-queue check
+and DocumentProcessor's check cost one scan.
 """
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Union
+from ingestion.file_probe import FileChangedError, FileProbe
 from ingestion.validation_result import ValidationResult, ValidationAction
 from ingestion.validation_strategies import (
     FileExistenceStrategy,
@@ -53,6 +61,9 @@ class FileTypeValidator:
         'java', 'csharp', 'go', 'rust', 'ipynb', 'text'
     }
 
+    # Memoized results (one per file version)
+    MEMO_SIZE = 4096
+
     def __init__(self):
         """Initialize validation and security strategies"""
         # Core validation strategies
@@ -71,7 +82,53 @@ class FileTypeValidator:
         # Advanced malware detection
         self.malware_detector = AdvancedMalwareDetector(default_config.malware_detection)
 
-    def validate(self, file_path: Path) -> ValidationResult:
+        self._memo: "OrderedDict[tuple, ValidationResult]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def validate(self, file_path: Union[Path, FileProbe]) -> ValidationResult:
+        """Validate a file, reusing the result for an unchanged file version.
+
+        Args:
+            file_path: Path to file to validate (or an open FileProbe)
+
+        Returns:
+            ValidationResult with is_valid, file_type, and reason
+        """
+        probe = FileProbe.of(file_path)
+        try:
+            key = probe.fingerprint
+            if key is not None:
+                with self._memo_lock:
+                    cached = self._memo.get(key)
+                    if cached is not None:
+                        self._memo.move_to_end(key)
+                        return cached
+
+            try:
+                result = self._validate(probe)
+                if probe.changed:  # A strategy swallowed the FileChangedError
+                    raise FileChangedError(probe.path)
+            except FileChangedError:
+                # Half-written file: not a verdict on any version, so not memoized
+                return ValidationResult(
+                    is_valid=False,
+                    file_type='unknown',
+                    reason=f'File changed during validation: {probe.path}',
+                    validation_check='FileProbe'
+                )
+
+            # Incomplete results (a scanner was skipped) are re-validated next time
+            if key is not None and result.complete:
+                with self._memo_lock:
+                    self._memo[key] = result
+                    while len(self._memo) > self.MEMO_SIZE:
+                        self._memo.popitem(last=False)
+            return result
+        finally:
+            if probe is not file_path:
+                probe.close()
+
+    def _validate(self, file_path: FileProbe) -> ValidationResult:
         """Validate file type matches extension using strategy composition.
 
         Validation chain:
@@ -85,7 +142,7 @@ class FileTypeValidator:
         8. TextFileStrategy OR (ExecutableCheckStrategy + MagicSignatureStrategy)
 
         Args:
-            file_path: Path to file to validate
+            file_path: Probe of the file to validate (read at most once)
 
         Returns:
             ValidationResult with is_valid, file_type, and reason
@@ -126,8 +183,15 @@ class FileTypeValidator:
         result = self.malware_detector.validate(file_path, expected_type)
         if not result.is_valid:
             return result
+        complete = result.complete
 
         # Step 8: Type-specific validation
+        result = self._validate_type(file_path, expected_type)
+        result.complete = result.complete and complete
+        return result
+
+    def _validate_type(self, file_path: FileProbe, expected_type: str) -> ValidationResult:
+        """Type-specific validation (step 8)"""
         if expected_type in self.TEXT_TYPES:
             # Text files: validate they're actually text (not binary)
             return self.text_file.validate(file_path, expected_type)
@@ -10,6 +10,8 @@ since astchunk 0.1.0 doesn't support Go yet. Implements cAST algorithm principle
 from typing import List, Dict
 from pathlib import Path
 
+from ingestion.parser_pool import thread_parser
+
 
 class GoChunker:
     """AST-based chunker for Go code using tree-sitter
@@ -27,23 +29,25 @@ class GoChunker:
         """
         self.max_chunk_size = max_chunk_size
         self.metadata_template = metadata_template
-        self._parser = None
         self._language = None
 
     def _get_parser(self):
-        """Lazy load tree-sitter Go parser"""
-        if self._parser is None:
-            try:
-                # Try py-tree-sitter-languages first (newer, more maintained)
-                from tree_sitter_languages import get_language
-                import tree_sitter
-                lang = get_language('go')
-                self._parser = tree_sitter.Parser(lang)
-            except (ImportError, TypeError):
-                # Fallback to tree-sitter-language-pack
-                from tree_sitter_language_pack import get_parser
-                self._parser = get_parser('go')
-        return self._parser
+        """Tree-sitter Go parser (one per thread, lazily created)"""
+        return thread_parser('go', self._create_parser)
+
+    @staticmethod
+    def _create_parser():
+        """Load tree-sitter Go parser"""
+        try:
+            # Try py-tree-sitter-languages first (newer, more maintained)
+            from tree_sitter_languages import get_language
+            import tree_sitter
+            lang = get_language('go')
+            return tree_sitter.Parser(lang)
+        except (ImportError, TypeError):
+            # Fallback to tree-sitter-language-pack
+            from tree_sitter_language_pack import get_parser
+            return get_parser('go')
 
     def _get_language(self):
         """Lazy load tree-sitter Go language"""
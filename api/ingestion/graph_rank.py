@@ -0,0 +1,275 @@
+"""Precomputed graph centrality for Graph-RAG retrieval (PostgreSQL)
+
+A background job computes PageRank and degree over graph_nodes/graph_edges,
+stores them in graph_metadata, links chunks to their note's node in
+chunk_graph_links, and loads a compact GraphRankIndex:
+
+- chunk_ids / chunk_nodes: sorted chunk IDs and the node index of their note
+- scores: PageRank per node, scaled to 0-1
+- neighbor_ptr / neighbors: one-hop note neighbours as CSR adjacency
+
+Queries then boost by centrality with array lookups (see
+hybrid_search.GraphBoost) instead of walking the graph.
+
+Wikilinks point at note_ref placeholders ("note_ref:Title"); they are
+resolved to the note with that title so rank flows between notes.
+"""
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import default_config
+from ingestion.database_factory import DatabaseFactory
+
+logger = logging.getLogger(__name__)
+
+# Edges that express relatedness between notes; structural edges
+# (header_child) and reverse edges (backlink) would skew the ranking
+RANK_EDGE_TYPES = ['wikilink', 'tag']
+
+
+def pagerank(sources: np.ndarray, targets: np.ndarray, n: int,
+             damping: float = 0.85, max_iter: int = 100,
+             tol: float = 1e-6) -> np.ndarray:
+    """PageRank by power iteration over an edge list
+
+    Each iteration is one sparse matrix-vector product done with
+    np.bincount over the edges. Rank of dangling nodes (no out-edges)
+    is spread uniformly. Converges when the L1 change is below n * tol.
+    """
+    if n == 0:
+        return np.zeros(0)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    out_degree = np.bincount(sources, minlength=n).astype(np.float64)
+    edge_weight = 1.0 / out_degree[sources]
+    dangling = out_degree == 0
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        flow = np.bincount(targets, weights=rank[sources] * edge_weight, minlength=n)
+        updated = damping * (flow + rank[dangling].sum() / n) + (1.0 - damping) / n
+        converged = np.abs(updated - rank).sum() < n * tol
+        rank = updated
+        if converged:
+            break
+    return rank
+
+
+def _csr(rows: np.ndarray, cols: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Deduplicated CSR adjacency (indptr, indices) from (row, col) pairs"""
+    pairs = np.zeros((0, 2), dtype=np.int64)
+    if len(rows):
+        pairs = np.unique(np.stack([rows, cols], axis=1), axis=0)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=n), out=indptr[1:])
+    return indptr, pairs[:, 1].astype(np.int64)
+
+
+class GraphRankIndex:
+    """Read-only chunk -> graph score lookup arrays
+
+    Replaced as a whole on refresh, so readers never see a partial update.
+    """
+
+    def __init__(self, chunk_ids: np.ndarray, chunk_nodes: np.ndarray,
+                 scores: np.ndarray, neighbor_ptr: np.ndarray,
+                 neighbors: np.ndarray):
+        self.chunk_ids = chunk_ids
+        self.chunk_nodes = chunk_nodes
+        self.scores = scores
+        self.neighbor_ptr = neighbor_ptr
+        self.neighbors = neighbors
+
+    @classmethod
+    def empty(cls) -> 'GraphRankIndex':
+        none = np.zeros(0, dtype=np.int64)
+        return cls(none, none, np.zeros(0), np.zeros(1, dtype=np.int64), none)
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def nodes_of(self, chunk_ids: Sequence[Optional[int]]) -> np.ndarray:
+        """Node index of each chunk's note, -1 for unlinked chunks"""
+        ids = np.array([-1 if c is None else c for c in chunk_ids], dtype=np.int64)
+        if not len(self.chunk_ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.chunk_ids, ids), len(self.chunk_ids) - 1)
+        found = self.chunk_ids[pos] == ids
+        return np.where(found, self.chunk_nodes[pos], -1)
+
+    def centrality(self, nodes: np.ndarray) -> np.ndarray:
+        """Scaled PageRank of each node (0 for -1)"""
+        if not len(self.scores):
+            return np.zeros(len(nodes))
+        return np.where(nodes >= 0, self.scores[np.maximum(nodes, 0)], 0.0)
+
+    def neighbors_of(self, nodes: np.ndarray) -> np.ndarray:
+        """Union of the one-hop neighbours of nodes"""
+        nodes = nodes[nodes >= 0]
+        if not len(nodes):
+            return np.zeros(0, dtype=np.int64)
+        spans = [self.neighbors[self.neighbor_ptr[n]:self.neighbor_ptr[n + 1]] for n in nodes]
+        return np.unique(np.concatenate(spans))
+
+
+class GraphRanker:
+    """Computes, stores and loads graph centrality in one transaction"""
+
+    def __init__(self, config=default_config.database, damping: float = 0.85):
+        self.config = config
+        self.damping = damping
+
+    def refresh(self) -> GraphRankIndex:
+        """Recompute PageRank and degree, refresh chunk links, load the index
+
+        Uses a short-lived connection of its own so the query path's
+        connection is never held by the job.
+        """
+        db_conn = DatabaseFactory.create_connection(self.config)
+        conn = db_conn.connect()
+        try:
+            with conn.cursor() as cur:
+                index = self._refresh(cur)
+            conn.commit()
+            return index
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            db_conn.close()
+
+    def _refresh(self, cur) -> GraphRankIndex:
+        cur.execute("SELECT node_id, node_type, title FROM graph_nodes ORDER BY node_id")
+        position, node_ids = self._node_positions(cur.fetchall())
+
+        cur.execute(
+            "SELECT source_id, target_id, edge_type FROM graph_edges WHERE edge_type = ANY(%s)",
+            (RANK_EDGE_TYPES,)
+        )
+        edges = [(position[s], position[t], kind) for s, t, kind in cur.fetchall()
+                 if s in position and t in position]
+        sources = np.array([e[0] for e in edges], dtype=np.int64)
+        targets = np.array([e[1] for e in edges], dtype=np.int64)
+
+        n = len(node_ids)
+        rank = pagerank(sources, targets, n, self.damping)
+        in_degree = np.bincount(targets, minlength=n)
+        out_degree = np.bincount(sources, minlength=n)
+        self._store_metadata(cur, node_ids, rank, in_degree, out_degree)
+        self._link_chunks(cur)
+
+        links = [(s, t) for s, t, kind in edges if kind == 'wikilink' and s != t]
+        rows = np.array([p for s, t in links for p in (s, t)], dtype=np.int64)
+        cols = np.array([p for s, t in links for p in (t, s)], dtype=np.int64)
+        neighbor_ptr, neighbors = _csr(rows, cols, n)
+
+        top = rank.max() if n else 0.0
+        scores = rank / top if top > 0 else rank
+        chunk_ids, chunk_nodes = self._load_chunk_nodes(cur, position)
+        return GraphRankIndex(chunk_ids, chunk_nodes, scores, neighbor_ptr, neighbors)
+
+    @staticmethod
+    def _node_positions(nodes: List[Tuple]) -> Tuple[Dict[str, int], List[str]]:
+        """Index per node ID, with resolved note_ref placeholders sharing their note's
+
+        Returns the mapping and the node IDs ranked, in index order.
+        """
+        by_title = {}
+        for node_id, node_type, title in nodes:
+            if node_type == 'note' and title:
+                by_title.setdefault(title, node_id)
+
+        position, node_ids = {}, []
+        for node_id, node_type, title in nodes:
+            if node_type == 'note_ref' and title in by_title:
+                continue
+            position[node_id] = len(node_ids)
+            node_ids.append(node_id)
+        for node_id, node_type, title in nodes:
+            if node_type == 'note_ref' and title in by_title:
+                position[node_id] = position[by_title[title]]
+        return position, node_ids
+
+    @staticmethod
+    def _store_metadata(cur, node_ids, rank, in_degree, out_degree):
+        from psycopg2.extras import execute_values
+        rows = [(node_id, float(rank[i]), int(in_degree[i]), int(out_degree[i]))
+                for i, node_id in enumerate(node_ids)]
+        if not rows:
+            return
+        execute_values(cur, """
+            INSERT INTO graph_metadata (node_id, pagerank_score, in_degree, out_degree)
+            VALUES %s
+            ON CONFLICT (node_id) DO UPDATE SET
+                pagerank_score = EXCLUDED.pagerank_score,
+                in_degree = EXCLUDED.in_degree,
+                out_degree = EXCLUDED.out_degree,
+                last_computed = CURRENT_TIMESTAMP
+        """, rows, page_size=1000)
+
+    @staticmethod
+    def _link_chunks(cur):
+        """Link chunks of indexed notes to their note node (set-based)"""
+        cur.execute("""
+            INSERT INTO chunk_graph_links (chunk_id, node_id, link_type)
+            SELECT c.id, g.node_id, 'primary'
+            FROM chunks c
+            JOIN documents d ON d.id = c.document_id
+            JOIN graph_nodes g ON g.node_id = 'note:' || d.file_path
+            WHERE NOT EXISTS (
+                SELECT 1 FROM chunk_graph_links l
+                WHERE l.chunk_id = c.id AND l.link_type = 'primary'
+            )
+        """)
+
+    @staticmethod
+    def _load_chunk_nodes(cur, position) -> Tuple[np.ndarray, np.ndarray]:
+        cur.execute(
+            "SELECT chunk_id, node_id FROM chunk_graph_links "
+            "WHERE link_type = 'primary' ORDER BY chunk_id"
+        )
+        pairs = [(chunk_id, position[node_id]) for chunk_id, node_id in cur.fetchall()
+                 if node_id in position]
+        chunk_ids = np.array([p[0] for p in pairs], dtype=np.int64)
+        chunk_nodes = np.array([p[1] for p in pairs], dtype=np.int64)
+        return chunk_ids, chunk_nodes
+
+
+class GraphRankJob:
+    """Background thread that refreshes a GraphBoost's index periodically"""
+
+    def __init__(self, boost, ranker: Optional[GraphRanker] = None,
+                 interval: float = 900.0):
+        self.boost = boost
+        self.ranker = ranker or GraphRanker()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="GraphRank")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def run_once(self) -> bool:
+        """Refresh the index now; the previous index is kept on failure"""
+        try:
+            index = self.ranker.refresh()
+        except Exception as e:
+            logger.warning("Graph rank refresh failed: %s", e)
+            return False
+        self.boost.index = index
+        logger.info("Graph rank refreshed: %d linked chunks", len(index))
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval)
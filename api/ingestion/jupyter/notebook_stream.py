@@ -0,0 +1,169 @@
+"""Streaming notebook reader
+
+Notebooks with embedded plots or rendered dataframes are mostly output
+payload: base64 images and HTML tables that are never indexed. The .ipynb
+JSON is read as a stream of parse events (ijson) and only cell sources,
+small text outputs and the kernelspec are kept, so memory follows the
+retained text rather than the file size. Dropped outputs are counted.
+
+Kept per output (at most max_output_bytes characters, else dropped):
+- stream output text (stdout/stderr)
+- text/plain of execute_result and display_data
+- "ename: evalue" of errors (tracebacks are dropped)
+
+Images, HTML, JSON/widget payloads, attachments and other MIME types are
+always dropped. Without ijson the file is loaded with json and fed through
+the same filter (same result, no streaming).
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CELL = 'cells.item'
+OUTPUT = 'cells.item.outputs.item'
+TEXT_PATHS = {'.text', '.text.item', '.data.text/plain', '.data.text/plain.item'}
+
+
+@dataclass
+class NotebookCell:
+    """A cell's source and retained text outputs"""
+    cell_type: str = ''
+    source: str = ''
+    outputs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StreamedNotebook:
+    """Retained content of a notebook"""
+    kernel: str = 'unknown'
+    language: str = 'python'
+    cells: List[NotebookCell] = field(default_factory=list)
+    skipped_outputs: int = 0  # Outputs dropped entirely
+    skipped_bytes: int = 0  # Output/attachment characters not retained
+
+
+class _Output:
+    """Text retained from one output while it streams past"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.size = 0
+        self.error: List[str] = ['', '']
+        self.skipped = 0
+
+
+class NotebookFilter:
+    """Builds a StreamedNotebook from ijson-style (prefix, event, value) events"""
+
+    def __init__(self, max_output_bytes: int):
+        self.max_output_bytes = max_output_bytes
+        self.notebook = StreamedNotebook()
+        self._sources: List[str] = []
+        self._cell: Optional[NotebookCell] = None
+        self._output: Optional[_Output] = None
+
+    def feed(self, prefix: str, event: str, value) -> None:
+        if prefix.startswith(OUTPUT):
+            self._feed_output(prefix[len(OUTPUT):], event, value)
+        elif prefix == CELL:
+            if event == 'start_map':
+                self._cell, self._sources = NotebookCell(), []
+            elif event == 'end_map':
+                self._cell.source = ''.join(self._sources)
+                self.notebook.cells.append(self._cell)
+        elif event != 'string':
+            return
+        elif prefix in ('cells.item.source', 'cells.item.source.item'):
+            self._sources.append(value)
+        elif prefix == 'cells.item.cell_type':
+            self._cell.cell_type = value
+        elif prefix.startswith('cells.item.attachments'):
+            self.notebook.skipped_bytes += len(value)
+        elif prefix == 'metadata.kernelspec.name':
+            self.notebook.kernel = value
+        elif prefix == 'metadata.kernelspec.language':
+            self.notebook.language = value
+
+    def _feed_output(self, path: str, event: str, value) -> None:
+        output = self._output
+        if path == '':
+            if event == 'start_map':
+                self._output = _Output()
+            elif event == 'end_map':
+                self._finish_output(output)
+            return
+        if event != 'string':
+            return
+        if path in TEXT_PATHS:
+            self._retain(output, value)
+        elif path in ('.ename', '.evalue'):
+            output.error[path == '.evalue'] = value
+        elif path != '.output_type' and path != '.name':
+            output.skipped += len(value)
+
+    def _retain(self, output: _Output, text: str) -> None:
+        output.size += len(text)
+        if output.size <= self.max_output_bytes:
+            output.parts.append(text)
+        else:
+            output.parts.clear()  # Oversized: stop holding text
+
+    def _finish_output(self, output: _Output) -> None:
+        ename, evalue = output.error
+        if ename:
+            self._retain(output, f"{ename}: {evalue}")
+        text = ''.join(output.parts)
+        if output.size > self.max_output_bytes:
+            output.skipped += output.size
+            text = ''
+        if text.strip():
+            self._cell.outputs.append(text)
+        elif output.skipped:
+            self.notebook.skipped_outputs += 1
+        self.notebook.skipped_bytes += output.skipped
+        self._output = None
+
+
+def read_notebook(path: Path, max_output_bytes: int = 2048) -> StreamedNotebook:
+    """Cell sources and small text outputs of a notebook
+
+    Args:
+        path: Path to .ipynb file
+        max_output_bytes: Largest text output kept (0 drops all outputs)
+    """
+    notebook_filter = NotebookFilter(max_output_bytes)
+    with open(path, 'rb') as f:
+        for prefix, event, value in _parse_events(f):
+            notebook_filter.feed(prefix, event, value)
+    return notebook_filter.notebook
+
+
+def _parse_events(f) -> Iterator[Tuple[str, str, object]]:
+    """Parse events from ijson, or from a json.load walk if ijson is missing"""
+    try:
+        import ijson
+    except ImportError:
+        logger.debug("ijson not installed, loading notebook with json")
+        return _walk(json.load(f))
+    return ijson.parse(f)
+
+
+def _walk(value, prefix: str = '') -> Iterator[Tuple[str, str, object]]:
+    """ijson.parse-compatible events for an already loaded JSON value"""
+    if isinstance(value, dict):
+        yield prefix, 'start_map', None
+        for key, item in value.items():
+            yield prefix, 'map_key', key
+            yield from _walk(item, f'{prefix}.{key}' if prefix else key)
+        yield prefix, 'end_map', None
+    elif isinstance(value, list):
+        yield prefix, 'start_array', None
+        for item in value:
+            yield from _walk(item, f'{prefix}.item' if prefix else 'item')
+        yield prefix, 'end_array', None
+    else:
+        yield prefix, 'string' if isinstance(value, str) else 'number', value
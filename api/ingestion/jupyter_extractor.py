@@ -2,8 +2,10 @@
 Jupyter Notebook extraction using Docling HybridChunker.
 
 Processing strategy:
-1. Parse .ipynb file with nbformat
-2. Convert all cells to markdown (code cells wrapped in fenced blocks)
+1. Stream the .ipynb JSON, dropping image/HTML and oversized outputs
+   (see ingestion.jupyter.notebook_stream)
+2. Convert all cells to markdown (code cells wrapped in fenced blocks,
+   small text outputs in text blocks after them)
 3. Apply HybridChunker for semantic, token-aware chunking
 4. Return chunks with notebook metadata
 
@@ -13,10 +15,10 @@ fragmenting by cell boundaries, resulting in better chunk coherence.
 
 from pathlib import Path
 from typing import ClassVar, List, Set, Tuple
-import tempfile
-import os
 
+from config import default_config
 from domain_models import ExtractionResult
+from ingestion.jupyter.notebook_stream import read_notebook
 from pipeline.interfaces import ExtractorInterface
 
 
@@ -63,21 +65,21 @@ class JupyterExtractor(ExtractorInterface):
         Returns:
             Tuple of (metadata dict, markdown content)
         """
-        nbformat = self._import_nbformat()
-
-        with open(path, 'r', encoding='utf-8') as f:
-            notebook = nbformat.read(f, as_version=nbformat.NO_CONVERT)
+        notebook = read_notebook(path, default_config.chunks.notebook_output_max_bytes)
+        if notebook.skipped_bytes:
+            print(f"  → Notebook outputs dropped: {notebook.skipped_outputs} "
+                  f"({notebook.skipped_bytes / 1024:,.0f} KB)")
 
         metadata = {
-            'kernel': notebook.metadata.get('kernelspec', {}).get('name', 'unknown'),
-            'language': notebook.metadata.get('kernelspec', {}).get('language', 'python'),
+            'kernel': notebook.kernel,
+            'language': notebook.language,
         }
 
         language = metadata['language']
         md_parts = []
 
         for cell in notebook.cells:
-            source = cell.source if isinstance(cell.source, str) else ''.join(cell.source)
+            source = cell.source
             if not source.strip():
                 continue
 
@@ -87,12 +89,18 @@ class JupyterExtractor(ExtractorInterface):
                 md_parts.append(f'```{language}')
                 md_parts.append(source)
                 md_parts.append('```')
+                for output in cell.outputs:
+                    md_parts.append('```text')
+                    md_parts.append(output.rstrip('\n'))
+                    md_parts.append('```')
 
         return metadata, '\n\n'.join(md_parts)
 
     def _chunk_with_hybrid(self, markdown_content: str) -> List[str]:
         """Apply HybridChunker to markdown content
 
+        The markdown is parsed in memory (no temp file or DocumentConverter).
+
         Args:
             markdown_content: Markdown string to chunk
 
@@ -104,43 +112,9 @@ class JupyterExtractor(ExtractorInterface):
 
         try:
             from ingestion.extractors.docling_extractor import DoclingExtractor
-            from config import default_config
-
-            # Write to temp file for Docling conversion
-            with tempfile.NamedTemporaryFile(
-                mode='w', suffix='.md', delete=False, encoding='utf-8'
-            ) as f:
-                f.write(markdown_content)
-                temp_path = f.name
-
-            try:
-                converter = DoclingExtractor.get_converter()
-                result = converter.convert(temp_path)
-                document = result.document
 
-                chunker = DoclingExtractor.get_chunker(default_config.chunks.max_tokens)
-                chunks = []
-
-                for chunk in chunker.chunk(document):
-                    chunk_text = chunk.text if hasattr(chunk, 'text') else str(chunk)
-                    if chunk_text.strip():
-                        chunks.append(chunk_text)
-
-                return chunks
-            finally:
-                os.unlink(temp_path)
+            chunks = DoclingExtractor.chunk_markdown(markdown_content, 'notebook.md')
+            return [text for text, _ in chunks if text.strip()]
 
         except Exception:
             return []
-
-    @staticmethod
-    def _import_nbformat():
-        """Import nbformat with helpful error message"""
-        try:
-            import nbformat
-            return nbformat
-        except ImportError as e:
-            raise ImportError(
-                f"nbformat not available: {e}\n"
-                "Install with: pip install nbformat>=5.9.0"
-            )
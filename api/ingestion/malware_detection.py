@@ -13,21 +13,34 @@ Severity tiers:
 - INFO: Log only (informational, low-confidence)
 
 Performance optimization:
+- Strategies share one FileProbe: the file is hashed and read once
 - Scan results are cached by file hash (SHA256)
 - Unchanged files skip ClamAV/YARA scans on subsequent checks
 - Cache is invalidated when file content changes (new hash)
-- ClamAV uses thread-local connections to avoid socket contention
+- YARA rules are compiled once per process (and saved compiled to disk),
+  keyed by rules file hash; matching is capped in time and bytes (a timed
+  out match is not cached, so the file is matched again next time)
+- ClamAV streams content over pooled clamd connections; when clamd is
+  slow or down a circuit breaker skips it and the hash blacklist still runs
+  (such results are not cached, so ClamAV scans them once it recovers)
+- Files above clamd's StreamMaxLength are not streamed at all; that
+  outcome is final for the file version, so it is cached like a scan
 """
 from pathlib import Path
-from typing import Optional, List, Dict, Set
+from typing import Optional, List, Dict, Set, Tuple
 import hashlib
 import logging
+import os
 import threading
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+from ingestion.clamd_client import ClamdError, ClamdPool
+from ingestion.file_probe import FileProbe
 from ingestion.validation_result import ValidationResult, SecuritySeverity, SecurityMatch
+from ingestion.validation_strategies import FileArg
+from metrics import record_cache_lookup
 
 
 def _load_hash_list(file_path: Optional[Path], list_name: str) -> Set[str]:
@@ -64,15 +77,29 @@ def _parse_hash_file(file_path: Path) -> Set[str]:
     return hashes
 
 
+# Reason of a ClamAV result for a file that was not scanned (clamd down or slow)
+CLAMAV_SKIPPED = 'ClamAV scan skipped'
+CLAMAV_OVER_LIMIT = 'ClamAV scan skipped: file exceeds StreamMaxLength'
+# clamd's reply when a stream exceeds its StreamMaxLength
+CLAMD_SIZE_LIMIT_REPLY = 'INSTREAM size limit exceeded'
+YARA_SKIPPED = 'YARA scan skipped'
+
+
 @dataclass
 class MalwareDetectionConfig:
     """Configuration for malware detection features"""
     clamav_enabled: bool = False
     clamav_socket: str = "/var/run/clamav/clamd.ctl"
+    clamav_timeout: float = 10.0
+    clamav_max_concurrency: int = 0  # 0 = clamd's MaxThreads
+    clamav_stream_max_bytes: int = 25 * 1024 * 1024  # clamd's StreamMaxLength (0 = no limit)
     hash_blacklist_enabled: bool = False
     hash_blacklist_path: str = "/app/data/malware_hashes.txt"
     yara_enabled: bool = False
     yara_rules_path: str = "/app/config/yara_rules.yar"
+    yara_compiled_dir: Optional[str] = None  # Saved compiled rules (None = compile per process)
+    yara_timeout: int = 10  # Seconds per file
+    yara_max_bytes: int = 32 * 1024 * 1024  # Bytes matched per file (0 = whole file)
     # Allowlist for known-safe files (skip all security checks)
     allowlist_path: str = "/app/data/security_allowlist.txt"
     # YARA rules that should only produce warnings (not block)
@@ -85,98 +112,99 @@ class ClamAVStrategy:
     Requires ClamAV daemon (clamd) to be running.
     Install: apt-get install clamav-daemon
 
-    Uses thread-local connections to avoid socket contention when
-    multiple workers scan files in parallel.
+    Content is streamed to clamd (INSTREAM) from the shared FileProbe buffer
+    over pooled connections; see ingestion.clamd_client. When clamd is down
+    or slow the circuit breaker opens and scans are skipped (reason
+    CLAMAV_SKIPPED) so the detector can fall back to the hash blacklist.
+    Files clamd would refuse for size are not streamed (reason
+    CLAMAV_OVER_LIMIT); unlike a skip, that result is final.
     """
 
-    def __init__(self, socket_path: str = "/var/run/clamav/clamd.ctl"):
+    def __init__(self, socket_path: str = "/var/run/clamav/clamd.ctl",
+                 timeout: float = 10.0, max_concurrency: int = 0,
+                 stream_max_bytes: int = 25 * 1024 * 1024):
         """Initialize ClamAV scanner
 
         Args:
-            socket_path: Path to ClamAV unix socket
+            socket_path: Path to ClamAV unix socket, or host:port
+            timeout: Seconds before a clamd operation counts as failed
+            max_concurrency: Concurrent scans (0 = clamd's thread count)
+            stream_max_bytes: clamd's StreamMaxLength; larger files are not streamed
         """
         self.socket_path = socket_path
-        # Thread-local storage for per-thread connections
-        self._local = threading.local()
-
-    def _get_client(self):
-        """Get ClamAV client for current thread (thread-local)
-
-        Each thread gets its own connection to avoid socket contention
-        when multiple workers scan files in parallel.
-        """
-        # Check if this thread has a client
-        if not hasattr(self._local, 'clamd'):
-            try:
-                import clamd
-                self._local.clamd = clamd.ClamdUnixSocket(self.socket_path)
-                # Test connection
-                self._local.clamd.ping()
-            except ImportError:
-                raise RuntimeError(
-                    "ClamAV integration requires 'clamd' package. "
-                    "Install with: pip install clamd"
-                )
-            except Exception as e:
-                raise RuntimeError(
-                    f"Cannot connect to ClamAV daemon at {self.socket_path}. "
-                    f"Ensure clamd is running. Error: {e}"
-                )
-        return self._local.clamd
+        self.stream_max_bytes = stream_max_bytes
+        self.pool = (ClamdPool.for_address(socket_path, timeout, max_concurrency)
+                     if socket_path else None)
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Scan file for viruses using ClamAV
 
         Args:
-            file_path: Path to file to scan
+            file_path: Path (or FileProbe) of file to scan
             expected_type: Expected file type
 
         Returns:
-            ValidationResult with is_valid=False and CRITICAL severity if malware detected
+            ValidationResult with is_valid=False and CRITICAL severity if malware detected;
+            reason CLAMAV_SKIPPED (and is_valid=True) if the file was not scanned,
+            CLAMAV_OVER_LIMIT if it is too large for clamd to ever scan
         """
+        if self.pool is None or not self.pool.breaker.allow():
+            return self._skipped(expected_type)
+
+        probe = FileProbe.of(file_path)
+        if self.stream_max_bytes and probe.size > self.stream_max_bytes:
+            logger.warning("ClamAV scan skipped for %s: %d bytes exceeds StreamMaxLength",
+                           probe.path.name, probe.size)
+            return self._skipped(expected_type, CLAMAV_OVER_LIMIT)
         try:
-            client = self._get_client()
-            scan_result = client.scan(str(file_path))
-
-            # scan_result format: {'/path/to/file': ('FOUND', 'Virus.Name')}
-            if scan_result:
-                for path, (status, virus_name) in scan_result.items():
-                    if status == 'FOUND':
-                        return ValidationResult(
-                            is_valid=False,
-                            file_type='malware',
-                            reason=f'Virus detected: {virus_name}',
-                            validation_check='ClamAVStrategy',
-                            severity=SecuritySeverity.CRITICAL,
-                            matches=[SecurityMatch(
-                                rule_name=virus_name,
-                                severity=SecuritySeverity.CRITICAL,
-                                description=f'ClamAV signature match: {virus_name}'
-                            )]
-                        )
-
+            virus_name = self.pool.instream(probe.content)
+        except ClamdError as e:
+            logger.warning("ClamAV scan skipped for %s: %s", probe.path.name, e)
+            if CLAMD_SIZE_LIMIT_REPLY in str(e):
+                # clamd is healthy but refused this file (StreamMaxLength below the configured one)
+                self.pool.breaker.record_success()
+                return self._skipped(expected_type, CLAMAV_OVER_LIMIT)
+            # Any other ERROR (out of memory, database reload...) may pass on retry
+            self.pool.breaker.record_failure()
+            return self._skipped(expected_type)
+        except (OSError, EOFError) as e:
+            # Down or slow: count towards opening the breaker
+            self.pool.breaker.record_failure()
+            logger.debug("ClamAV scan failed for %s: %s", probe.path.name, e)
+            return self._skipped(expected_type)
+        finally:
+            if probe is not file_path:
+                probe.close()
+
+        self.pool.breaker.record_success()
+        if virus_name:
             return ValidationResult(
-                is_valid=True,
-                file_type=expected_type,
-                reason=''
+                is_valid=False,
+                file_type='malware',
+                reason=f'Virus detected: {virus_name}',
+                validation_check='ClamAVStrategy',
+                severity=SecuritySeverity.CRITICAL,
+                matches=[SecurityMatch(
+                    rule_name=virus_name,
+                    severity=SecuritySeverity.CRITICAL,
+                    description=f'ClamAV signature match: {virus_name}'
+                )]
             )
 
-        except RuntimeError as e:
-            # ClamAV not available - log warning but don't fail
-            print(f"  [WARNING]  ClamAV scan skipped: {e}")
-            return ValidationResult(
-                is_valid=True,
-                file_type=expected_type,
-                reason=''
-            )
-        except Exception as e:
-            # Unexpected error - log but don't fail validation
-            print(f"  [WARNING]  ClamAV scan error: {e}")
-            return ValidationResult(
-                is_valid=True,
-                file_type=expected_type,
-                reason=''
-            )
+        return ValidationResult(
+            is_valid=True,
+            file_type=expected_type,
+            reason=''
+        )
+
+    @staticmethod
+    def _skipped(expected_type: str, reason: str = CLAMAV_SKIPPED) -> ValidationResult:
+        """Fail open: the file was not scanned by ClamAV"""
+        return ValidationResult(
+            is_valid=True,
+            file_type=expected_type,
+            reason=reason
+        )
 
 
 class HashBlacklistStrategy:
@@ -212,11 +240,11 @@ class HashBlacklistStrategy:
             self._blacklist = _load_hash_list(self.blacklist_path, "blacklist")
         return self._blacklist
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check file hash against blacklist
 
         Args:
-            file_path: Path to file to check
+            file_path: Path (or FileProbe) of file to check
             expected_type: Expected file type
 
         Returns:
@@ -267,15 +295,18 @@ class HashBlacklistStrategy:
             )
 
     @staticmethod
-    def _calculate_sha256(file_path: Path) -> str:
+    def _calculate_sha256(file_path: FileArg) -> str:
         """Calculate SHA256 hash of file
 
         Args:
-            file_path: Path to file
+            file_path: Path to file, or FileProbe (hashed once, then reused)
 
         Returns:
             Hex-encoded SHA256 hash
         """
+        if isinstance(file_path, FileProbe):
+            return file_path.sha256
+
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
             # Read in chunks to handle large files
@@ -284,6 +315,53 @@ class HashBlacklistStrategy:
         return sha256_hash.hexdigest()
 
 
+# Compiled YARA rules of this process, keyed by rules version (see _compiled_rules)
+_compiled: Dict[str, object] = {}
+_compiled_lock = threading.Lock()
+
+
+def _compiled_rules(rules_path: Path, compiled_dir: Optional[Path] = None):
+    """Compiled rules for rules_path, compiled at most once per rules version
+
+    Looked up in this process first, then loaded from compiled_dir
+    (yara.load), then compiled and saved there for other processes and
+    restarts. The key is the SHA256 of the rules file and the yara version
+    (the compiled format is version specific).
+    """
+    import yara
+
+    version = str(getattr(yara, '__version__', ''))
+    key = hashlib.sha256(rules_path.read_bytes() + version.encode()).hexdigest()
+    with _compiled_lock:
+        rules = _compiled.get(key)
+        if rules is None:
+            rules = _load_or_compile(yara, rules_path, key, compiled_dir)
+            _compiled[key] = rules
+    return rules
+
+
+def _load_or_compile(yara, rules_path: Path, key: str, compiled_dir: Optional[Path]):
+    """Load saved compiled rules, or compile and save them"""
+    saved = compiled_dir / f"{key[:32]}.yarc" if compiled_dir else None
+    if saved is not None and saved.exists():
+        try:
+            return yara.load(str(saved))
+        except Exception as e:
+            logger.warning("Ignoring unreadable compiled YARA rules %s: %s", saved, e)
+
+    rules = yara.compile(filepath=str(rules_path))
+    print(f"  ✓ Compiled YARA rules from {rules_path}")
+    if saved is not None:
+        try:
+            saved.parent.mkdir(parents=True, exist_ok=True)
+            tmp = saved.with_suffix(f".{os.getpid()}.tmp")
+            rules.save(str(tmp))
+            os.replace(tmp, saved)
+        except Exception as e:
+            logger.debug("Could not save compiled YARA rules: %s", e)
+    return rules
+
+
 class YARAStrategy:
     """YARA rule-based pattern matching
 
@@ -310,13 +388,21 @@ class YARAStrategy:
         }
     """
 
-    def __init__(self, rules_path: Optional[str] = "/app/config/yara_rules.yar"):
-        """Initialize YARA scanner
+    def __init__(self, rules_path: Optional[str] = "/app/config/yara_rules.yar",
+                 compiled_dir: Optional[str] = None, timeout: int = 10,
+                 max_bytes: int = 32 * 1024 * 1024):
+        """Initialize YARA scanner (rules are loaded on first use)
 
         Args:
             rules_path: Path to YARA rules file (None to disable)
+            compiled_dir: Directory for saved compiled rules (None = memory only)
+            timeout: Seconds before matching a file is abandoned
+            max_bytes: Only the first max_bytes of a file are matched (0 = all)
         """
         self.rules_path = Path(rules_path) if rules_path else None
+        self.compiled_dir = Path(compiled_dir) if compiled_dir else None
+        self.timeout = timeout
+        self.max_bytes = max_bytes or None
         self._rules = None
 
     def _load_rules(self):
@@ -333,8 +419,7 @@ class YARAStrategy:
                     print(f"     Create .yar file with YARA rules")
                     return None
 
-                self._rules = yara.compile(filepath=str(self.rules_path))
-                print(f"  ✓ Loaded YARA rules from {self.rules_path}")
+                self._rules = _compiled_rules(self.rules_path, self.compiled_dir)
 
             except ImportError:
                 print("  [WARNING]  YARA integration requires 'yara-python' package.")
@@ -346,35 +431,48 @@ class YARAStrategy:
 
         return self._rules
 
-    def validate(self, file_path: Path, expected_type: str,
+    def validate(self, file_path: FileArg, expected_type: str,
                  warning_only: bool = True) -> ValidationResult:
         """Scan file with YARA rules
 
         Args:
-            file_path: Path to file to scan
+            file_path: Path (or FileProbe) of file to scan
             expected_type: Expected file type
             warning_only: If True, matches are WARNING severity (default)
                           If False, matches are CRITICAL severity
 
         Returns:
-            ValidationResult with WARNING/CRITICAL severity based on warning_only
+            ValidationResult with WARNING/CRITICAL severity based on warning_only;
+            reason YARA_SKIPPED (and is_valid=True) if matching did not finish
         """
         rules = self._load_rules()
 
         if rules is None:
             return self._no_rules_result(expected_type)
 
+        probe = FileProbe.of(file_path)
         try:
-            matches = rules.match(filepath=str(file_path))
+            # Views of the shared buffer: no copy, released before the probe closes
+            with memoryview(probe.content) as view, view[:self.max_bytes] as data:
+                matches = rules.match(data=data, timeout=self.timeout)
 
             if not matches:
                 return self._clean_result(expected_type)
 
-            return self._build_match_result(matches, file_path, expected_type, warning_only)
+            return self._build_match_result(matches, probe.path, expected_type, warning_only)
 
         except Exception as e:
-            print(f"  [WARNING]  YARA scan error: {e}")
-            return self._clean_result(expected_type)
+            # Includes yara.TimeoutError: a pathological file must not stall the worker.
+            # Fail open, but the file was not scanned, so this must not be cached
+            print(f"  [WARNING]  YARA scan error for {probe.path.name}: {e}")
+            return ValidationResult(
+                is_valid=True,
+                file_type=expected_type,
+                reason=YARA_SKIPPED
+            )
+        finally:
+            if probe is not file_path:
+                probe.close()
 
     def _no_rules_result(self, expected_type: str) -> ValidationResult:
         """Return result when YARA rules not available"""
@@ -520,15 +618,26 @@ class AdvancedMalwareDetector:
         self.hash_blacklist = None
         self.yara = None
         self._allowlist: Optional[Set[str]] = None
+        self._fallback_blacklist: Optional[HashBlacklistStrategy] = None
 
         if self.config.clamav_enabled:
-            self.clamav = ClamAVStrategy(self.config.clamav_socket)
+            self.clamav = ClamAVStrategy(
+                self.config.clamav_socket,
+                timeout=self.config.clamav_timeout,
+                max_concurrency=self.config.clamav_max_concurrency,
+                stream_max_bytes=self.config.clamav_stream_max_bytes
+            )
 
         if self.config.hash_blacklist_enabled:
             self.hash_blacklist = HashBlacklistStrategy(self.config.hash_blacklist_path)
 
         if self.config.yara_enabled:
-            self.yara = YARAStrategy(self.config.yara_rules_path)
+            self.yara = YARAStrategy(
+                self.config.yara_rules_path,
+                compiled_dir=self.config.yara_compiled_dir,
+                timeout=self.config.yara_timeout,
+                max_bytes=self.config.yara_max_bytes
+            )
 
     def _load_allowlist(self) -> Set[str]:
         """Load allowlist of known-safe file hashes
@@ -541,11 +650,11 @@ class AdvancedMalwareDetector:
             self._allowlist = _load_hash_list(allowlist_path, "allowlist")
         return self._allowlist
 
-    def is_allowlisted(self, file_path: Path) -> bool:
+    def is_allowlisted(self, file_path: FileArg) -> bool:
         """Check if file is in allowlist (skip all security checks)
 
         Args:
-            file_path: Path to file to check
+            file_path: Path (or FileProbe) of file to check
 
         Returns:
             True if file hash is in allowlist
@@ -560,19 +669,22 @@ class AdvancedMalwareDetector:
         except Exception:
             return False
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Run all enabled malware detection strategies
 
         Uses caching to skip expensive scans for unchanged files.
-        Cache key is the file's SHA256 hash.
+        Cache key is the file's SHA256 hash, computed once on the probe
+        and shared with the allowlist and blacklist checks.
 
         Args:
-            file_path: Path to file to scan
+            file_path: Path (or FileProbe) of file to scan
             expected_type: Expected file type
 
         Returns:
             ValidationResult with severity-based action hints
         """
+        file_path = FileProbe.of(file_path)
+
         # Check allowlist first - skip all checks if allowlisted
         if self.is_allowlisted(file_path):
             return ValidationResult(
@@ -594,10 +706,11 @@ class AdvancedMalwareDetector:
                 return cached
 
         # Run actual scans
-        result = self._run_scans(file_path, expected_type)
+        result, complete = self._run_scans(file_path, expected_type)
+        result.complete = complete
 
-        # Cache the result
-        if file_hash:
+        # Cache the result (not if ClamAV was skipped: rescan once it recovers)
+        if file_hash and complete:
             self._cache_result(file_hash, result)
 
         return result
@@ -617,6 +730,7 @@ class AdvancedMalwareDetector:
 
             cache = get_security_cache()
             cached = cache.get(file_hash)
+            record_cache_lookup("security_scan", cached is not None)
 
             if cached:
                 severity = SecuritySeverity(cached.severity) if cached.severity else None
@@ -655,40 +769,72 @@ class AdvancedMalwareDetector:
         except Exception as e:
             logger.debug("Cache write failed for %s: %s", file_hash[:16], e)
 
-    def _run_scans(self, file_path: Path, expected_type: str) -> ValidationResult:
-        """Run all enabled malware detection scans"""
-        result = self._run_critical_scans(file_path, expected_type)
+    def _run_scans(self, file_path: FileArg, expected_type: str) -> Tuple[ValidationResult, bool]:
+        """Run all enabled malware detection scans
+
+        Returns:
+            (result, complete) - complete is False if ClamAV or YARA was skipped
+        """
+        result, complete = self._run_critical_scans(file_path, expected_type)
         if not result.is_valid:
-            return result
+            return result, complete
 
-        warnings = self._run_yara_scan(file_path, expected_type)
+        warnings, yara_complete = self._run_yara_scan(file_path, expected_type)
+        complete = complete and yara_complete
         if isinstance(warnings, ValidationResult):
-            return warnings
+            return warnings, complete
 
-        return self._build_scan_result(expected_type, warnings)
+        return self._build_scan_result(expected_type, warnings), complete
 
-    def _run_critical_scans(self, file_path: Path, expected_type: str) -> ValidationResult:
-        """Run critical scans that block immediately (ClamAV, hash blacklist)"""
-        for scanner in [self.clamav, self.hash_blacklist]:
-            if scanner:
-                result = scanner.validate(file_path, expected_type)
-                if not result.is_valid:
-                    return result
-        return ValidationResult(is_valid=True, file_type=expected_type, reason='')
+    def _run_critical_scans(self, file_path: FileArg,
+                            expected_type: str) -> Tuple[ValidationResult, bool]:
+        """Run critical scans that block immediately (ClamAV, hash blacklist)
+
+        If ClamAV is skipped (clamd down or slow, or the file is over its
+        size limit) the hash blacklist is the fallback, and runs even when
+        not enabled on its own. Only a clamd outage makes the result
+        incomplete; an over-limit file would be skipped again.
+        """
+        complete = True
+        scanners = [self.clamav, self.hash_blacklist]
+        for scanner in scanners:
+            if not scanner:
+                continue
+            result = scanner.validate(file_path, expected_type)
+            if not result.is_valid:
+                return result, complete
+            if scanner is self.clamav and result.reason in (CLAMAV_SKIPPED, CLAMAV_OVER_LIMIT):
+                complete = result.reason == CLAMAV_OVER_LIMIT
+                if self.hash_blacklist is None:
+                    scanners.append(self._get_fallback_blacklist())
+        return ValidationResult(is_valid=True, file_type=expected_type, reason=''), complete
+
+    def _get_fallback_blacklist(self) -> HashBlacklistStrategy:
+        """Hash blacklist used while ClamAV is unavailable"""
+        if self._fallback_blacklist is None:
+            self._fallback_blacklist = HashBlacklistStrategy(self.config.hash_blacklist_path)
+        return self._fallback_blacklist
 
     def _run_yara_scan(
-        self, file_path: Path, expected_type: str
-    ) -> List[SecurityMatch] | ValidationResult:
-        """Run YARA scan, returns warnings list or blocking result"""
+        self, file_path: FileArg, expected_type: str
+    ) -> Tuple[List[SecurityMatch] | ValidationResult, bool]:
+        """Run YARA scan
+
+        Returns:
+            (warnings list or blocking result, complete) - complete is False
+            if matching timed out or failed
+        """
         if not self.yara:
-            return []
+            return [], True
 
         result = self.yara.validate(
             file_path, expected_type, warning_only=self.config.yara_warning_only
         )
         if not result.is_valid:
-            return result
-        return list(result.matches) if result.matches else []
+            return result, True
+        if result.reason == YARA_SKIPPED:
+            return [], False
+        return (list(result.matches) if result.matches else []), True
 
     def _build_scan_result(
         self, expected_type: str, warnings: List[SecurityMatch]
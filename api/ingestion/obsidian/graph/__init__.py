@@ -4,10 +4,12 @@ from ingestion.obsidian.graph.wikilink_extractor import WikilinkExtractor
 from ingestion.obsidian.graph.tag_extractor import TagExtractor
 from ingestion.obsidian.graph.header_extractor import HeaderExtractor
 from ingestion.obsidian.graph.graph_query import GraphQuery
+from ingestion.obsidian.graph.edge_index import EdgeTypeIndex
 
 __all__ = [
     'WikilinkExtractor',
     'TagExtractor',
     'HeaderExtractor',
     'GraphQuery',
+    'EdgeTypeIndex',
 ]
@@ -0,0 +1,50 @@
+
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+class EdgeTypeIndex:
+    """Per-edge-type predecessor index for the Obsidian knowledge graph
+
+    Single Responsibility: O(degree) "who points at this node" lookups
+
+    Maps (target, edge_type) -> Counter of source nodes, so backlink and
+    tag lookups read only the matching edges instead of scanning the graph.
+    Counts keep parallel edges (the same wikilink twice) distinct.
+
+    Maintained by ObsidianGraphBuilder as notes are added and replaced.
+    """
+
+    def __init__(self):
+        self._sources: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+
+    def add(self, edges: Iterable[Tuple]):
+        """Index edges as (source, target, ..., data) tuples"""
+        for source, target, *_, data in edges:
+            self._sources[(target, data.get('edge_type'))][source] += 1
+
+    def remove(self, edges: Iterable[Tuple]):
+        """Drop edges previously passed to add()"""
+        for source, target, *_, data in edges:
+            key = (target, data.get('edge_type'))
+            sources = self._sources.get(key)
+            if not sources:
+                continue
+            sources[source] -= 1
+            if sources[source] <= 0:
+                del sources[source]
+            if not sources:
+                del self._sources[key]
+
+    def sources(self, target: str, edge_type: str) -> List[str]:
+        """Source nodes of edge_type edges into target (one entry per edge)"""
+        sources = self._sources.get((target, edge_type))
+        return list(sources.elements()) if sources else []
+
+    def count(self, target: str, edge_type: str) -> int:
+        """Number of edge_type edges into target"""
+        sources = self._sources.get((target, edge_type))
+        return sum(sources.values()) if sources else 0
+
+    def clear(self):
+        self._sources.clear()
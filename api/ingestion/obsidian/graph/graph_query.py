@@ -1,7 +1,9 @@
 
 
 import networkx as nx
-from typing import List, Dict, Set, Optional
+from typing import Iterable, List, Dict, Set, Optional
+
+from ingestion.obsidian.graph.edge_index import EdgeTypeIndex
 
 class GraphQuery:
     """Query operations for Obsidian knowledge graph
@@ -13,8 +15,26 @@ class GraphQuery:
     - Backlink queries
     - Tag queries
     - Edge filtering by type
+    - Batch graph metadata for many notes
+
+    Lookups read only the queried node's edges (O(degree)): incoming edges
+    come from an EdgeTypeIndex when one is given, else from in_edges().
     """
 
+    def __init__(self, index: Optional[EdgeTypeIndex] = None):
+        """
+        Args:
+            index: Per-edge-type predecessor index kept in sync with the graph
+        """
+        self.index = index
+
+    def _sources(self, graph: nx.MultiDiGraph, target: str, edge_type: str) -> List[str]:
+        """Sources of edge_type edges into target"""
+        if self.index is not None:
+            return self.index.sources(target, edge_type)
+        return [source for source, _, edge_data in graph.in_edges(target, data=True)
+                if edge_data.get('edge_type') == edge_type]
+
     def get_connected_nodes(self, graph: nx.MultiDiGraph, node_id: str,
                            hops: int = 1,
                            edge_types: Optional[List[str]] = None) -> List[Dict]:
@@ -101,12 +121,7 @@ class GraphQuery:
         if not graph.has_node(node_id):
             return []
 
-        backlinks = []
-        for source, target, edge_data in graph.edges(data=True):
-            if target == node_id and edge_data.get('edge_type') == 'wikilink':
-                backlinks.append(source)
-
-        return backlinks
+        return self._sources(graph, node_id, 'wikilink')
 
     def get_tags_for_note(self, graph: nx.MultiDiGraph, node_id: str) -> List[str]:
         """Get all tags for a note
@@ -144,9 +159,37 @@ class GraphQuery:
         if not graph.has_node(tag_id):
             return []
 
-        notes = []
-        for source, target, edge_data in graph.edges(data=True):
-            if target == tag_id and edge_data.get('edge_type') == 'tag':
-                notes.append(source)
+        return self._sources(graph, tag_id, 'tag')
+
+    def get_note_metadata_many(self, graph: nx.MultiDiGraph,
+                               node_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Graph metadata for many notes in one pass over their edges
 
-        return notes
+        Args:
+            graph: NetworkX graph
+            node_ids: Note node IDs
+
+        Returns:
+            {node_id: {'backlinks_count', 'tags', 'connected_notes_count',
+            'connected_notes'}} for each note in the graph; connected notes
+            are 1-hop wikilink/backlink neighbours (titles, first 10)
+        """
+        metadata = {}
+        for node_id in node_ids:
+            if not graph.has_node(node_id):
+                continue
+            tags = []
+            connected = {}
+            for _, target, edge_data in graph.out_edges(node_id, data=True):
+                edge_type = edge_data.get('edge_type')
+                if edge_type == 'tag':
+                    tags.append(graph.nodes[target]['title'])
+                elif edge_type in ('wikilink', 'backlink') and target != node_id:
+                    connected.setdefault(target, graph.nodes[target])
+            metadata[node_id] = {
+                'backlinks_count': len(self._sources(graph, node_id, 'wikilink')),
+                'tags': tags,
+                'connected_notes_count': len(connected),
+                'connected_notes': [node['title'] for node in list(connected.values())[:10]]
+            }
+        return metadata
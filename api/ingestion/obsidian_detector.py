@@ -2,10 +2,25 @@
 
 Detects if a markdown file is part of an Obsidian vault.
 Uses heuristics: .obsidian folder, wikilinks, tags, frontmatter.
+
+Vault roots are memoized per directory, so routing a note costs a dict
+lookup once its folder has been seen; the file watcher invalidates the
+memo when .obsidian folders (or their parents) appear or disappear.
 """
 
 from pathlib import Path
+from typing import Dict, Optional
 import re
+import threading
+
+MARKDOWN_EXTENSIONS = ('.md', '.markdown')
+
+# Enough of a note to spot wikilinks, tags and frontmatter
+FEATURE_SCAN_CHARS = 1000
+
+# Memo miss (None is a memoized "not in a vault")
+_MISSING = object()
+
 
 class ObsidianDetector:
     """Detects Obsidian vaults and notes
@@ -17,6 +32,9 @@ class ObsidianDetector:
         self.wikilink_pattern = re.compile(r'\[\[([^\]]+)\]\]')
         self.tag_pattern = re.compile(r'#[\w/\-]+')
         self.frontmatter_pattern = re.compile(r'^---\n.+?\n---', re.DOTALL)
+        self._vault_roots: Dict[Path, Optional[Path]] = {}  # directory -> vault root
+        self._generation = 0  # Bumped on invalidation; stale walks are not memoized
+        self._lock = threading.Lock()
 
     def is_obsidian_vault(self, path: Path) -> bool:
         """Check if path is within an Obsidian vault
@@ -27,18 +45,53 @@ class ObsidianDetector:
         Returns:
             True if .obsidian folder exists in path hierarchy
         """
-        current = path if path.is_dir() else path.parent
+        return self.vault_root(path) is not None
+
+    def vault_root(self, path: Path) -> Optional[Path]:
+        """Nearest directory holding a .obsidian folder, None outside vaults
 
-        # Walk up directory tree looking for .obsidian
+        Walks up from the file's folder until a memoized directory or a
+        .obsidian folder is found, then memoizes every directory visited.
+        """
+        if path.suffix.lower() in MARKDOWN_EXTENSIONS:
+            current = path.parent  # Routed notes: no stat needed
+        else:
+            current = path if path.is_dir() else path.parent
+
+        generation = self._generation
+        visited = []
+        root = None
         while current != current.parent:
-            obsidian_dir = current / '.obsidian'
-            if obsidian_dir.exists() and obsidian_dir.is_dir():
-                return True
+            # One lookup: invalidate() may drop the entry between a check and a read
+            cached = self._vault_roots.get(current, _MISSING)
+            if cached is not _MISSING:
+                root = cached
+                break
+            visited.append(current)
+            if (current / '.obsidian').is_dir():
+                root = current
+                break
             current = current.parent
 
-        return False
+        with self._lock:
+            if generation == self._generation:
+                for directory in visited:
+                    self._vault_roots[directory] = root
+        return root
+
+    def invalidate(self, directory: Path):
+        """Forget memoized roots for directory and everything below it
+
+        Called when a .obsidian folder is created or removed in directory,
+        or when directory itself is moved or deleted.
+        """
+        with self._lock:
+            self._generation += 1
+            for cached in list(self._vault_roots):
+                if cached == directory or directory in cached.parents:
+                    del self._vault_roots[cached]
 
-    def is_obsidian_note(self, path: Path) -> bool:
+    def is_obsidian_note(self, path: Path, content: Optional[str] = None) -> bool:
         """Check if markdown file is an Obsidian note
 
         Uses multiple heuristics:
@@ -47,9 +100,12 @@ class ObsidianDetector:
         3. Contains tags #like-this
         4. Has YAML frontmatter
 
+        Pass content when the caller has already read the file, so it is
+        not opened again.
+
         Note: Even one indicator is enough to classify as Obsidian note
         """
-        if not path.suffix.lower() in ['.md', '.markdown']:
+        if not path.suffix.lower() in MARKDOWN_EXTENSIONS:
             return False
 
         # First check: In Obsidian vault?
@@ -57,32 +113,36 @@ class ObsidianDetector:
             return True
 
         # Second check: File content has Obsidian features?
-        return self._has_obsidian_features(path)
+        if content is None:
+            return self._has_obsidian_features(path)
+        return self.has_obsidian_features(content)
 
     def _has_obsidian_features(self, path: Path) -> bool:
         """Check file content for Obsidian features"""
         try:
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                # Read first 1000 chars (enough for detection)
-                content = f.read(1000)
+                return self.has_obsidian_features(f.read(FEATURE_SCAN_CHARS))
+        except Exception:
+            return False
 
-            # Check for wikilinks
-            if self.wikilink_pattern.search(content):
-                return True
+    def has_obsidian_features(self, content: str) -> bool:
+        """Check the start of a note's text for Obsidian features"""
+        content = content[:FEATURE_SCAN_CHARS]
 
-            # Check for tags (at least 2 to avoid false positives)
-            tags = self.tag_pattern.findall(content)
-            if len(tags) >= 2:
-                return True
+        # Check for wikilinks
+        if self.wikilink_pattern.search(content):
+            return True
 
-            # Check for frontmatter
-            if self.frontmatter_pattern.match(content):
-                return True
+        # Check for tags (at least 2 to avoid false positives)
+        tags = self.tag_pattern.findall(content)
+        if len(tags) >= 2:
+            return True
 
-            return False
+        # Check for frontmatter
+        if self.frontmatter_pattern.match(content):
+            return True
 
-        except Exception:
-            return False
+        return False
 
 # Global singleton
 _detector = None
@@ -41,26 +41,29 @@ class ObsidianExtractor:
         self.tag_pattern = re.compile(r'#([\w/\-]+)')
 
     @staticmethod
-    def extract(path: Path, graph_builder: Optional[ObsidianGraphBuilder] = None) -> ExtractionResult:
+    def extract(path: Path, graph_builder: Optional[ObsidianGraphBuilder] = None,
+                content: Optional[str] = None) -> ExtractionResult:
         """Extract Obsidian note with graph enrichment
 
         Args:
             path: Path to .md file
             graph_builder: Optional shared graph builder
+            content: Note text if already read (file is not read again)
 
         Returns:
             ExtractionResult with graph-enriched chunks
         """
         extractor = ObsidianExtractor(graph_builder)
-        return extractor._extract_note(path)
+        return extractor._extract_note(path, content)
 
-    def _extract_note(self, path: Path) -> ExtractionResult:
+    def _extract_note(self, path: Path, content: Optional[str] = None) -> ExtractionResult:
         """Main extraction pipeline
 
         Uses Docling HybridChunker for token-aware chunking, then enriches
         with graph metadata.
         """
-        content = self._read_file(path)
+        if content is None:
+            content = self._read_file(path)
         title = path.stem
         frontmatter = self.frontmatter_parser.extract_frontmatter(content)
         content_without_frontmatter = self.frontmatter_parser.remove_frontmatter(content)
@@ -72,24 +75,23 @@ class ObsidianExtractor:
         graph_meta = self._build_graph_metadata(node_id, content_without_frontmatter)
 
         # Use Docling HybridChunker for proper token-aware chunking
-        chunks = self._chunk_with_docling(path)
+        chunks = self._chunk_with_docling(path, content)
 
         # Enrich each chunk with graph metadata
         enriched_chunks = GraphEnricher.enrich_chunks(chunks, graph_meta, title, path)
 
         return ExtractionResult(pages=enriched_chunks, method='obsidian_graph_rag')
 
-    def _chunk_with_docling(self, path: Path) -> List[Tuple[str, Optional[int]]]:
+    def _chunk_with_docling(self, path: Path, content: str) -> List[Tuple[str, Optional[int]]]:
         """Chunk markdown using Docling HybridChunker
 
         This replaces SemanticChunker to properly handle:
         - Very long single lines (minified content, base64, etc.)
         - Token limits (512 target, 8192 max)
+
+        Parses the note text already in memory (no DocumentConverter run).
         """
-        converter = DoclingExtractor.get_converter()
-        result = converter.convert(str(path))
-        document = result.document
-        return DoclingExtractor._extract_hybrid_chunks(document)
+        return DoclingExtractor.chunk_markdown(content, path.name)
 
     def _read_file(self, path: Path) -> str:
         """Read file content"""
@@ -101,22 +103,14 @@ class ObsidianExtractor:
 
         Extracts but doesn't add to graph (already done in add_note)
         """
-        wikilinks_out = self._extract_wikilinks(content)
-        backlinks = self.graph_builder.get_backlinks(node_id)
-        tags = self.graph_builder.get_tags_for_note(node_id)
-
-        # Get connected notes (1-hop for context)
-        connected_nodes = self.graph_builder.get_connected_nodes(
-            node_id, hops=1, edge_types=['wikilink', 'backlink']
-        )
-
+        graph_meta = self.graph_builder.get_graph_metadata_many([node_id]).get(node_id, {})
         return {
             'node_id': node_id,
-            'wikilinks_out': wikilinks_out,
-            'backlinks_count': len(backlinks),
-            'tags': tags,
-            'connected_notes_count': len(connected_nodes),
-            'connected_notes': [node['title'] for node in connected_nodes[:10]]  # Limit to 10
+            'wikilinks_out': self._extract_wikilinks(content),
+            'backlinks_count': graph_meta.get('backlinks_count', 0),
+            'tags': graph_meta.get('tags', []),
+            'connected_notes_count': graph_meta.get('connected_notes_count', 0),
+            'connected_notes': graph_meta.get('connected_notes', [])  # First 10
         }
 
     def _extract_wikilinks(self, content: str) -> List[str]:
@@ -2,14 +2,16 @@
 
 import networkx as nx
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 import json
+import threading
 from dataclasses import dataclass, field, asdict
 
 from ingestion.obsidian.graph.wikilink_extractor import WikilinkExtractor
 from ingestion.obsidian.graph.tag_extractor import TagExtractor
 from ingestion.obsidian.graph.header_extractor import HeaderExtractor
 from ingestion.obsidian.graph.graph_query import GraphQuery
+from ingestion.obsidian.graph.edge_index import EdgeTypeIndex
 
 @dataclass
 class ObsidianNode:
@@ -47,7 +49,12 @@ class ObsidianGraphBuilder:
         self.wikilink_extractor = WikilinkExtractor()
         self.tag_extractor = TagExtractor()
         self.header_extractor = HeaderExtractor()
-        self.query = GraphQuery()
+        self.edge_index = EdgeTypeIndex()  # Incoming edges by type, for O(degree) lookups
+        self.query = GraphQuery(self.edge_index)
+
+        # Notes added since the last take_dirty_notes() (chunk workers share the builder)
+        self._lock = threading.RLock()
+        self._dirty_notes: Set[str] = set()
 
     def add_note(self, file_path: Path, title: str, content: str,
                  frontmatter: Optional[Dict] = None) -> str:
@@ -69,13 +76,17 @@ class ObsidianGraphBuilder:
             node_id: The unique node ID for this note
         """
         node_id = self._create_note_id(file_path)
-        self._add_note_node(node_id, title, content, frontmatter)
-        self._register_note_path(title, file_path)
-
-        # Delegate extraction to specialized components
-        self.wikilink_extractor.extract_and_add(self.graph, node_id, content)
-        self.tag_extractor.extract_and_add(self.graph, node_id, content)
-        self.header_extractor.extract_and_add(self.graph, node_id, content)
+        with self._lock:
+            self._remove_note_edges(node_id)  # Re-added note: replace, don't accumulate
+            self._add_note_node(node_id, title, content, frontmatter)
+            self._register_note_path(title, file_path)
+
+            # Delegate extraction to specialized components
+            self.wikilink_extractor.extract_and_add(self.graph, node_id, content)
+            self.tag_extractor.extract_and_add(self.graph, node_id, content)
+            self.header_extractor.extract_and_add(self.graph, node_id, content)
+            self.edge_index.add(self._owned_edges(node_id))
+            self._dirty_notes.add(node_id)
 
         return node_id
 
@@ -104,6 +115,37 @@ class ObsidianGraphBuilder:
         """Register note path for wikilink resolution"""
         self.note_paths[title] = file_path
 
+    def _note_subtree(self, note_id: str) -> Set[str]:
+        """The note and its header nodes (headers nest under headers)"""
+        if note_id not in self.graph:
+            return set()
+        prefix = f"{note_id}:h"
+        owned, frontier = {note_id}, [note_id]
+        while frontier:
+            frontier = [v for u in frontier for v in self.graph.successors(u)
+                        if v.startswith(prefix) and v not in owned]
+            owned.update(frontier)
+        return owned
+
+    def _owned_edges(self, note_id: str) -> List[tuple]:
+        """Edges extracted from a note: out-edges of the note and its headers,
+        plus the backlinks its wikilinks created"""
+        edges = [(u, v, k, d) for u in self._note_subtree(note_id)
+                 for _, v, k, d in self.graph.out_edges(u, keys=True, data=True)]
+        if note_id in self.graph:
+            edges += [(u, v, k, d) for u, v, k, d in
+                      self.graph.in_edges(note_id, keys=True, data=True)
+                      if d.get('edge_type') == 'backlink']
+        return edges
+
+    def _remove_note_edges(self, note_id: str):
+        """Drop what a previous add_note() of this note extracted"""
+        edges = self._owned_edges(note_id)
+        self.edge_index.remove(edges)
+        headers = {v for _, v, _, d in edges if d.get('edge_type') == 'header_child'}
+        self.graph.remove_edges_from((u, v, k) for u, v, k, _ in edges)
+        self.graph.remove_nodes_from(headers)
+
     # ============================================================
     # QUERY OPERATIONS (delegate to GraphQuery)
     # ============================================================
@@ -137,6 +179,14 @@ class ObsidianGraphBuilder:
         """
         return self.query.get_notes_with_tag(self.graph, tag)
 
+    def get_graph_metadata_many(self, node_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Backlink count, tags and connected notes for many notes
+
+        Delegates to GraphQuery; cost is linear in the notes' edges.
+        """
+        with self._lock:
+            return self.query.get_note_metadata_many(self.graph, node_ids)
+
     # ============================================================
     # GRAPH ANALYTICS
     # ============================================================
@@ -182,6 +232,44 @@ class ObsidianGraphBuilder:
             }
         }
 
+    def take_dirty_notes(self) -> Set[str]:
+        """Note IDs added since the last call (for incremental persistence)"""
+        with self._lock:
+            dirty, self._dirty_notes = self._dirty_notes, set()
+        return dirty
+
+    def mark_dirty(self, note_ids: Iterable[str]):
+        """Queue notes for the next incremental persistence (e.g. after a failed write)"""
+        with self._lock:
+            self._dirty_notes.update(note_ids)
+
+    def export_notes(self, note_ids: Iterable[str]) -> Dict:
+        """Export what the given notes contribute to the graph
+
+        Same node/edge format as export_graph(), restricted to the notes,
+        their headers, the nodes they link to and the edges they own
+        (see _owned_edges). 'notes' lists the exported note IDs.
+        """
+        with self._lock:
+            note_ids = [n for n in note_ids if n in self.graph]
+            edges = [e for note_id in note_ids for e in self._owned_edges(note_id)]
+            node_ids = set(note_ids)
+            for u, v, _, _ in edges:
+                node_ids.update((u, v))
+            return {
+                'notes': note_ids,
+                'nodes': [{**self.graph.nodes[node], 'id': node} for node in node_ids],
+                'edges': [
+                    {
+                        'source': u,
+                        'target': v,
+                        'type': data.get('edge_type'),
+                        **{k: v for k, v in data.items() if k != 'edge_type'}
+                    }
+                    for u, v, _, data in edges
+                ]
+            }
+
     def _count_node_types(self) -> Dict[str, int]:
         """Count nodes by type"""
         counts = {}
@@ -211,8 +299,12 @@ class ObsidianGraphBuilder:
         for edge_data in graph_data.get('edges', []):
             source = edge_data.pop('source')
             target = edge_data.pop('target')
+            edge_data.setdefault('edge_type', edge_data.pop('type', None))  # export_graph renames it
             self.graph.add_edge(source, target, **edge_data)
 
+        self.edge_index.clear()
+        self.edge_index.add(self.graph.edges(keys=True, data=True))
+
     def save_to_file(self, path: Path):
         """Save graph to JSON file"""
         graph_data = self.export_graph()
@@ -0,0 +1,137 @@
+"""Per-thread tree-sitter parsers and a bounded cache of parse trees
+
+Tree-sitter parsers are not thread-safe, while code chunkers are shared by
+the chunk worker pool (CodeExtractor caches one per language). Each thread
+gets its own parser per language, created once and reused.
+
+The last parse of each code file is kept (LRU, CODE_PARSE_CACHE_SIZE) so a
+re-extraction after an edit, typically watcher-triggered, is incremental:
+the changed byte range is found by a common prefix/suffix diff, applied to
+the old tree with Tree.edit(), and tree-sitter reuses unchanged subtrees
+when re-parsing. Chunkers also keep per top-level node chunks, so only the
+top-level nodes that changed are re-chunked.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+from config import default_config
+
+_local = threading.local()
+
+
+def thread_parser(language: str, create: Callable):
+    """This thread's parser for language, created with create() on first use"""
+    parsers = getattr(_local, 'parsers', None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+    parser = parsers.get(language)
+    if parser is None:
+        parser = parsers[language] = create()
+    return parser
+
+
+@dataclass
+class ParsedFile:
+    """Last parse of a file: its source, tree and per-node chunks"""
+    language: str
+    source: bytes
+    tree: object
+    segments: Dict = field(default_factory=dict)  # Chunker-defined top-level node key -> chunks
+
+
+class ParseTreeCache:
+    """Bounded LRU of ParsedFile by path
+
+    Entries are taken (removed) while a file is being re-parsed, since
+    Tree.edit() mutates the tree, and put back afterwards; a file is
+    never parsed incrementally by two threads from the same tree.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, ParsedFile]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, path: str) -> Optional[ParsedFile]:
+        with self._lock:
+            return self._entries.pop(path, None)
+
+    def put(self, path: str, parsed: ParsedFile) -> None:
+        with self._lock:
+            self._entries[path] = parsed
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def source_edit(old: bytes, new: bytes) -> Optional[Dict]:
+    """Tree.edit() arguments turning old into new, None if unchanged
+
+    The edit spans everything between the common prefix and common suffix,
+    which is exact for a single contiguous change and conservative (larger)
+    otherwise.
+    """
+    if old == new:
+        return None
+    prefix = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    old_end, new_end = len(old) - suffix, len(new) - suffix
+    return {
+        'start_byte': prefix,
+        'old_end_byte': old_end,
+        'new_end_byte': new_end,
+        'start_point': _point(old, prefix),
+        'old_end_point': _point(old, old_end),
+        'new_end_point': _point(new, new_end),
+    }
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    """Length of the common prefix (binary search over C-level comparisons)"""
+    a, b = memoryview(a), memoryview(b)
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix, at most limit bytes"""
+    a, b = memoryview(a), memoryview(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point(data: bytes, offset: int) -> Tuple[int, int]:
+    """(row, byte column) of offset, as tree-sitter points"""
+    row = data.count(b'\n', 0, offset)
+    return row, offset - (data.rfind(b'\n', 0, offset) + 1)
+
+
+# Global singleton
+_cache = None
+
+def get_parse_cache() -> Optional[ParseTreeCache]:
+    """Get or create the parse tree cache (None when CODE_PARSE_CACHE_SIZE=0)"""
+    global _cache
+    size = default_config.chunks.code_parse_cache_size
+    if size <= 0:
+        return None
+    if _cache is None:
+        _cache = ParseTreeCache(size)
+    return _cache
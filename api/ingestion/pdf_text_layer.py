@@ -0,0 +1,103 @@
+"""PDF text-layer classification
+
+Decides whether a PDF is born-digital before it reaches Docling. A sample
+of pages is read with pypdfium2 (native text layer, no rendering); if
+enough of them carry text, the PDF can skip OCR and page images.
+
+For text-native PDFs every page is then checked (character counts only,
+milliseconds per page) so that the few image-only pages, e.g. scanned
+figures or plates, can still be OCR'd on their own.
+"""
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Characters a page needs to count as having a text layer (page numbers
+# and running headers on scanned pages stay below this)
+MIN_PAGE_CHARS = 32
+
+
+@dataclass
+class TextLayerProfile:
+    """Text-layer coverage of a PDF"""
+    page_count: int
+    sampled: int
+    sampled_with_text: int
+    image_only_pages: List[int] = field(default_factory=list)  # 1-based, text-native PDFs only
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of sampled pages with a text layer"""
+        return self.sampled_with_text / self.sampled if self.sampled else 0.0
+
+    def is_text_native(self, min_coverage: float) -> bool:
+        return self.sampled > 0 and self.coverage >= min_coverage
+
+    def image_only_runs(self) -> List[Tuple[int, int]]:
+        """Consecutive image-only pages as inclusive (start, end) ranges"""
+        runs = []
+        for page in self.image_only_pages:
+            if runs and runs[-1][1] == page - 1:
+                runs[-1] = (runs[-1][0], page)
+            else:
+                runs.append((page, page))
+        return runs
+
+
+def sample_indices(page_count: int, samples: int) -> List[int]:
+    """Evenly spaced 0-based page indices (all pages if fewer than samples)"""
+    if page_count <= samples:
+        return list(range(page_count))
+    step = page_count / samples
+    return sorted({int(step * i + step / 2) for i in range(samples)})
+
+
+def classify_pdf(path: Path, samples: int = 8, min_coverage: float = 0.9,
+                 min_chars: int = MIN_PAGE_CHARS) -> Optional[TextLayerProfile]:
+    """Measure text-layer coverage of a PDF
+
+    Returns None if the PDF cannot be read with pypdfium2 (callers use the
+    full pipeline).
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return None
+
+    try:
+        pdf = pdfium.PdfDocument(str(path))
+    except Exception as e:
+        logger.debug("Text layer check failed for %s: %s", path.name, e)
+        return None
+    try:
+        page_count = len(pdf)
+        sampled = sample_indices(page_count, samples)
+        with_text = sum(_has_text(pdf, i, min_chars) for i in sampled)
+        profile = TextLayerProfile(page_count, len(sampled), with_text)
+        if profile.is_text_native(min_coverage):
+            profile.image_only_pages = [
+                i + 1 for i in range(page_count) if not _has_text(pdf, i, min_chars)
+            ]
+        return profile
+    except Exception as e:
+        logger.debug("Text layer check failed for %s: %s", path.name, e)
+        return None
+    finally:
+        pdf.close()
+
+
+def _has_text(pdf, index: int, min_chars: int) -> bool:
+    """Whether page index has at least min_chars non-whitespace characters"""
+    page = pdf[index]
+    try:
+        textpage = page.get_textpage()
+        try:
+            text = textpage.get_text_range()
+        finally:
+            textpage.close()
+    finally:
+        page.close()
+    return len(''.join(text.split())) >= min_chars
@@ -66,6 +66,8 @@ class PostgresSchemaManager(SchemaManager):
     - vec_chunks: Vector embeddings with HNSW index
     - fts_chunks: Full-text search with tsvector
     - graph_nodes, graph_edges, etc.: Knowledge graph
+    - indexing_queue: Durable indexing queue with leases
+    - security_scan_files: Stat signatures for incremental security scans
     """
 
     def __init__(self, conn: psycopg2.extensions.connection, config=default_config.database):
@@ -82,6 +84,8 @@ class PostgresSchemaManager(SchemaManager):
             self._create_processing_progress_table(cur)
             self._create_graph_tables(cur)
             self._create_security_scan_cache_table(cur)
+            self._create_indexing_queue_table(cur)
+            self._create_security_scan_files_table(cur)
         self.conn.commit()
         logger.info("PostgreSQL schema initialized")
 
@@ -238,3 +242,36 @@ class PostgresSchemaManager(SchemaManager):
             CREATE INDEX IF NOT EXISTS idx_security_scan_scanned_at
             ON security_scan_cache(scanned_at)
         """)
+
+    def _create_security_scan_files_table(self, cur):
+        """Create incremental security scan state table (see ScanStateStore)."""
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS security_scan_files (
+                path TEXT PRIMARY KEY,
+                size BIGINT NOT NULL,
+                mtime_ns BIGINT NOT NULL,
+                inode BIGINT NOT NULL,
+                ruleset TEXT NOT NULL,
+                scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def _create_indexing_queue_table(self, cur):
+        """Create durable indexing queue table (see PostgresIndexingQueue)."""
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS indexing_queue (
+                id BIGSERIAL PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                priority SMALLINT NOT NULL DEFAULT 2,
+                force BOOLEAN NOT NULL DEFAULT FALSE,
+                status TEXT NOT NULL DEFAULT 'pending',
+                lease_owner TEXT,
+                lease_expires_at TIMESTAMP WITH TIME ZONE,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                enqueued_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+            )
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_indexing_queue_claim
+            ON indexing_queue(status, priority, id)
+        """)
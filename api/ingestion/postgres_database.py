@@ -21,6 +21,7 @@ from typing import List, Dict, Optional
 from pathlib import Path
 
 from config import default_config
+from metrics import DB_COMMIT_DURATION
 from ingestion.interfaces import VectorStore as VectorStoreInterface
 from ingestion.postgres_connection import PostgresConnection, PostgresSchemaManager
 from ingestion.postgres_repositories import (
@@ -112,6 +113,46 @@ class PostgresVectorRepository:
         self.graph.update_note_path(old_path, new_path)
         self.conn.commit()
 
+    def move(self, old_path: str, new_path: str) -> bool:
+        """Rename document path in place (filesystem move, no re-hash).
+
+        A document already stored at new_path was overwritten on disk,
+        so its record is dropped before the rename.
+        """
+        if not self.documents.find_by_path(old_path):
+            return False
+        self._delete_old(new_path)
+        self.documents.update_path(old_path, new_path)
+        with self.conn.cursor() as cur:
+            cur.execute("DELETE FROM processing_progress WHERE file_path = %s", (new_path,))
+            cur.execute(
+                "UPDATE processing_progress SET file_path = %s WHERE file_path = %s",
+                (new_path, old_path)
+            )
+        self.graph.update_note_path(old_path, new_path)
+        self.conn.commit()
+        return True
+
+    def delete_many(self, paths: List[str]) -> Dict[str, int]:
+        """Remove documents and everything derived from them, set-based.
+
+        Chunks, vectors, FTS rows and chunk-graph links go by CASCADE;
+        note nodes and progress records are deleted by path, then orphaned
+        tags and placeholders once for the whole set. The caller commits,
+        so the set is one transaction.
+
+        Returns:
+            {path: chunk count} for each document that existed
+        """
+        paths = list(paths)
+        removed = self.documents.delete_many(paths)
+        self.graph.delete_note_nodes_many(paths)
+        self.graph.cleanup_orphan_tags()
+        self.graph.cleanup_orphan_placeholders()
+        with self.conn.cursor() as cur:
+            cur.execute("DELETE FROM processing_progress WHERE file_path = ANY(%s)", (paths,))
+        return removed
+
     def get_extraction_method(self, path: str) -> str:
         """Get extraction method used for a document"""
         return self.documents.get_extraction_method(path)
@@ -123,10 +164,12 @@ class PostgresVectorRepository:
         if chunks and '_extraction_method' in chunks[0]:
             extraction_method = chunks[0]['_extraction_method']
 
-        self._delete_old(path)
+        # Note nodes stay: sync_graph() diffs them against the re-extracted note
+        self.documents.delete(path)
         doc_id = self.documents.add(path, hash_val, extraction_method)
         self._insert_chunks_delegated(doc_id, chunks, embeddings)
-        self.conn.commit()
+        with DB_COMMIT_DURATION.time(operation="add_document"):
+            self.conn.commit()
         return doc_id
 
     def _delete_old(self, path: str):
@@ -249,7 +292,8 @@ class PostgresVectorStore(VectorStoreInterface):
 
             # CASCADE handles vec_chunks and fts_chunks
             self.repo.documents.delete_by_id(doc_id)
-            self.conn.commit()
+            with DB_COMMIT_DURATION.time(operation="delete_document"):
+                self.conn.commit()
 
             return {
                 'found': True,
@@ -258,6 +302,70 @@ class PostgresVectorStore(VectorStoreInterface):
                 'document_deleted': True
             }
 
+    def move_document(self, old_path: str, new_path: str) -> bool:
+        """Move a document to a new path, keeping chunks and embeddings.
+
+        Returns False if old_path is not indexed.
+        """
+        with self._lock:
+            try:
+                return self.repo.move(old_path, new_path)
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def delete_documents(self, file_paths: List[str]) -> Dict[str, int]:
+        """Delete many documents in one transaction.
+
+        Returns:
+            {path: chunks deleted} for each document that was indexed
+        """
+        if not file_paths:
+            return {}
+        with self._lock:
+            try:
+                removed = self.repo.delete_many(file_paths)
+                with DB_COMMIT_DURATION.time(operation="delete_documents"):
+                    self.conn.commit()
+                return removed
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def document_paths_under(self, directory: str) -> List[str]:
+        """Paths of indexed documents below directory (any depth)"""
+        prefix = directory.rstrip('/') + '/'
+        with self._lock:
+            with self.conn.cursor() as cur:
+                cur.execute("SELECT file_path FROM documents WHERE starts_with(file_path, %s)",
+                            (prefix,))
+                rows = cur.fetchall()
+        return [row[0] for row in rows]
+
+    def refresh_keyword_index(self) -> None:
+        """Rebuild the BM25 index (after bulk deletes)."""
+        with self._lock:
+            self.hybrid.refresh_keyword_index()
+
+    def sync_graph(self, notes_export: Dict) -> Dict[str, int]:
+        """Persist the graph of changed notes in one transaction.
+
+        Args:
+            notes_export: Dictionary from ObsidianGraphBuilder.export_notes()
+
+        Returns:
+            Counts from PostgresGraphRepository.sync_notes()
+        """
+        with self._lock:
+            try:
+                counts = self.repo.graph.sync_notes(notes_export)
+                with DB_COMMIT_DURATION.time(operation="sync_graph"):
+                    self.conn.commit()
+                return counts
+            except Exception:
+                self.conn.rollback()
+                raise
+
     def query_documents_with_chunks(self):
         """Query all documents with chunk counts."""
         with self._lock:
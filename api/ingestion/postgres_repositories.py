@@ -8,7 +8,10 @@ implementations. Key differences:
 - Vector embeddings stored as pgvector vector type
 - Full-text search uses tsvector instead of FTS5
 """
+import io
+import json
 import logging
+from collections import Counter
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 
@@ -133,6 +136,25 @@ class PostgresDocumentRepository(DocumentRepository):
         with self.conn.cursor() as cur:
             cur.execute("DELETE FROM documents WHERE id = %s", (doc_id,))
 
+    def delete_many(self, paths: List[str]) -> Dict[str, int]:
+        """Delete documents by path in one statement (CASCADE deletes chunks)
+
+        Returns:
+            {path: chunk count} for each document that existed
+        """
+        with self.conn.cursor() as cur:
+            # The join sees the snapshot before the delete, so chunks are counted
+            cur.execute("""
+                WITH deleted AS (
+                    DELETE FROM documents WHERE file_path = ANY(%s)
+                    RETURNING id, file_path
+                )
+                SELECT d.file_path, COUNT(c.id)
+                FROM deleted d LEFT JOIN chunks c ON c.document_id = d.id
+                GROUP BY d.file_path
+            """, (list(paths),))
+            return dict(cur.fetchall())
+
     def list_all(self) -> List[Dict]:
         """Get all documents"""
         with self.conn.cursor() as cur:
@@ -469,8 +491,59 @@ class PostgresSearchRepository(SearchRepository):
         return formatted
 
 
+_NODE_COLUMNS = ('node_id', 'node_type', 'title', 'content', 'metadata')
+_EDGE_COLUMNS = ('source_id', 'target_id', 'edge_type', 'metadata')
+
+
+def _copy_value(value) -> str:
+    """Encode a value for COPY text format"""
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _copy_rows(cur, table: str, columns: tuple, rows) -> None:
+    """Bulk load rows with COPY FROM STDIN"""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join(_copy_value(v) for v in row))
+        buf.write('\n')
+    buf.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+
+
+def _json_or_none(metadata: Dict) -> Optional[str]:
+    return json.dumps(metadata, sort_keys=True, default=str) if metadata else None
+
+
+def _node_row(node_data: Dict) -> tuple:
+    """graph_nodes row from an ObsidianGraphBuilder export node"""
+    excluded = {'id', 'node_type', 'title', 'content'}
+    metadata = {k: v for k, v in node_data.items() if k not in excluded}
+    return (node_data.get('id'), node_data.get('node_type', 'unknown'),
+            node_data.get('title', ''), node_data.get('content'), _json_or_none(metadata))
+
+
+def _edge_row(edge_data: Dict) -> tuple:
+    """graph_edges row from an ObsidianGraphBuilder export edge"""
+    excluded = {'source', 'target', 'type'}
+    metadata = {k: v for k, v in edge_data.items() if k not in excluded}
+    return (edge_data.get('source'), edge_data.get('target'),
+            edge_data.get('type', 'unknown'), _json_or_none(metadata))
+
+
+def _note_node_id(file_path: str) -> str:
+    """Node ID of a note (matches ObsidianGraphBuilder)"""
+    return f"note:{Path(file_path).as_posix()}"
+
+
 class PostgresGraphRepository(GraphRepository):
-    """Knowledge graph repository (PostgreSQL version)."""
+    """Knowledge graph repository (PostgreSQL version).
+
+    Graphs are written in bulk: persist_graph() loads a full export with
+    COPY, sync_notes() writes only what changed for a set of notes.
+    """
 
     def __init__(self, conn):
         self.conn = conn
@@ -559,20 +632,53 @@ class PostgresGraphRepository(GraphRepository):
 
     def delete_note_nodes(self, file_path: str) -> None:
         """Delete all nodes associated with a file path."""
-        # Node IDs for notes are typically based on file path
-        node_id = f"note:{Path(file_path).stem}"
-        with self.conn.cursor() as cur:
-            cur.execute("DELETE FROM graph_nodes WHERE node_id = %s", (node_id,))
+        self.delete_note_nodes_many([file_path])
+
+    def delete_note_nodes_many(self, file_paths: List[str]) -> None:
+        """Delete the note and header nodes of several file paths (CASCADE deletes edges)"""
+        node_ids = [_note_node_id(file_path) for file_path in file_paths]
+        with self.conn.cursor() as cur:
+            cur.execute("DELETE FROM graph_nodes WHERE node_id = ANY(%s)", (node_ids,))
+            self._delete_headers(cur, node_ids)
+
+    @staticmethod
+    def _delete_headers(cur, note_ids: List[str], keep: List[str] = ()) -> None:
+        """Delete header nodes of notes ("<note_id>:h<n>"), except keep"""
+        cur.execute("""
+            DELETE FROM graph_nodes g
+            USING unnest(%s::text[]) AS n(note_id)
+            WHERE g.node_type = 'header'
+            AND left(g.node_id, length(n.note_id) + 2) = n.note_id || ':h'
+            AND NOT (g.node_id = ANY(%s))
+        """, (list(note_ids), list(keep)))
 
     def update_note_path(self, old_path: str, new_path: str) -> None:
-        """Update node IDs when a file is moved."""
-        old_node_id = f"note:{Path(old_path).stem}"
-        new_node_id = f"note:{Path(new_path).stem}"
+        """Move a note's node and headers to the new path's node IDs.
+
+        Edges reference node IDs without ON UPDATE CASCADE, so new nodes
+        are inserted, references repointed, then the old nodes deleted.
+        """
+        old_id, new_id = _note_node_id(old_path), _note_node_id(new_path)
+        if old_id == new_id:
+            return
+        owned = "(node_id = %(old)s OR left(node_id, length(%(old)s) + 2) = %(old)s || ':h')"
+        params = {'old': old_id, 'new': new_id}
+        renamed = "%(new)s || substr({col}, length(%(old)s) + 1)"
         with self.conn.cursor() as cur:
-            cur.execute(
-                "UPDATE graph_nodes SET node_id = %s WHERE node_id = %s",
-                (new_node_id, old_node_id)
-            )
+            cur.execute(f"""
+                INSERT INTO graph_nodes (node_id, node_type, title, content, metadata, created_at)
+                SELECT {renamed.format(col='node_id')}, node_type, title, content, metadata, created_at
+                FROM graph_nodes WHERE {owned}
+                ON CONFLICT (node_id) DO NOTHING
+            """, params)
+            for table, col in (('graph_edges', 'source_id'), ('graph_edges', 'target_id'),
+                               ('graph_metadata', 'node_id'), ('chunk_graph_links', 'node_id')):
+                cur.execute(
+                    f"UPDATE {table} SET {col} = {renamed.format(col=col)} "
+                    f"WHERE {owned.replace('node_id', col)}",
+                    params
+                )
+            cur.execute(f"DELETE FROM graph_nodes WHERE {owned}", params)
 
     def link_chunk_to_node(self, chunk_id: int, node_id: str, link_type: str = 'primary') -> None:
         """Link a chunk to a graph node."""
@@ -594,6 +700,9 @@ class PostgresGraphRepository(GraphRepository):
     def persist_graph(self, graph_export: Dict) -> None:
         """Persist entire graph from ObsidianGraphBuilder export.
 
+        Nodes are upserted and the edges of every exported node replaced,
+        each with one COPY, so re-exporting does not duplicate edges.
+
         Args:
             graph_export: Dictionary from ObsidianGraphBuilder.export_graph()
                          with 'nodes' and 'edges' keys
@@ -601,28 +710,89 @@ class PostgresGraphRepository(GraphRepository):
         if not graph_export:
             return
 
-        nodes = graph_export.get('nodes', [])
-        edges = graph_export.get('edges', [])
-
-        for node_data in nodes:
-            node_id = node_data.get('id')
-            node_type = node_data.get('node_type', 'unknown')
-            title = node_data.get('title', '')
-            content = node_data.get('content')
-            # Extract metadata by excluding core fields
-            excluded = {'id', 'node_type', 'title', 'content'}
-            metadata = {k: v for k, v in node_data.items() if k not in excluded}
-            import json
-            self.add_node(node_id, node_type, title, content, json.dumps(metadata) if metadata else None)
-
-        for edge_data in edges:
-            source = edge_data.get('source')
-            target = edge_data.get('target')
-            edge_type = edge_data.get('type', 'unknown')
-            excluded = {'source', 'target', 'type'}
-            metadata = {k: v for k, v in edge_data.items() if k not in excluded}
-            import json
-            self.add_edge(source, target, edge_type, json.dumps(metadata) if metadata else None)
+        nodes = [_node_row(n) for n in graph_export.get('nodes', [])]
+        edges = [_edge_row(e) for e in graph_export.get('edges', [])]
+
+        with self.conn.cursor() as cur:
+            self._upsert_nodes(cur, nodes)
+            cur.execute(
+                "DELETE FROM graph_edges WHERE source_id = ANY(%s)",
+                ([row[0] for row in nodes],)
+            )
+            _copy_rows(cur, 'graph_edges', _EDGE_COLUMNS, edges)
+
+    def sync_notes(self, notes_export: Dict) -> Dict[str, int]:
+        """Write the graph of changed notes, diffing against stored edges.
+
+        Only edges that appeared or disappeared are written; headers the
+        notes no longer have are deleted, and orphaned tags/placeholders
+        are cleaned up if any edge was removed. The caller commits.
+
+        Args:
+            notes_export: Dictionary from ObsidianGraphBuilder.export_notes()
+                          with 'notes', 'nodes' and 'edges' keys
+
+        Returns:
+            {'nodes': upserted, 'edges_added': n, 'edges_removed': n}
+        """
+        note_ids = list(notes_export.get('notes', []))
+        if not note_ids:
+            return {'nodes': 0, 'edges_added': 0, 'edges_removed': 0}
+
+        nodes = [_node_row(n) for n in notes_export.get('nodes', [])]
+        wanted = Counter(_edge_row(e) for e in notes_export.get('edges', []))
+        headers = [row[0] for row in nodes if row[1] == 'header']
+
+        with self.conn.cursor() as cur:
+            self._delete_headers(cur, note_ids, keep=headers)
+            self._upsert_nodes(cur, nodes)
+
+            cur.execute("""
+                SELECT id, source_id, target_id, edge_type, metadata FROM graph_edges
+                WHERE source_id = ANY(%s) OR (edge_type = 'backlink' AND target_id = ANY(%s))
+            """, (note_ids + headers, note_ids))
+            stale = []
+            for edge_id, *edge in cur.fetchall():
+                edge = tuple(edge)
+                if wanted[edge] > 0:
+                    wanted[edge] -= 1
+                else:
+                    stale.append(edge_id)
+
+            if stale:
+                cur.execute("DELETE FROM graph_edges WHERE id = ANY(%s)", (stale,))
+            added = list(wanted.elements())
+            if added:
+                _copy_rows(cur, 'graph_edges', _EDGE_COLUMNS, added)
+
+        if stale:
+            self.cleanup_orphan_tags()
+            self.cleanup_orphan_placeholders()
+        return {'nodes': len(nodes), 'edges_added': len(added), 'edges_removed': len(stale)}
+
+    @staticmethod
+    def _upsert_nodes(cur, rows: List[tuple]) -> None:
+        """COPY nodes into a staging table, then upsert changed ones"""
+        if not rows:
+            return
+        cur.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS graph_nodes_stage (
+                node_id TEXT, node_type TEXT, title TEXT, content TEXT, metadata TEXT
+            ) ON COMMIT DELETE ROWS
+        """)
+        cur.execute("TRUNCATE graph_nodes_stage")
+        _copy_rows(cur, 'graph_nodes_stage', _NODE_COLUMNS, rows)
+        cur.execute("""
+            INSERT INTO graph_nodes (node_id, node_type, title, content, metadata)
+            SELECT DISTINCT ON (node_id) node_id, node_type, title, content, metadata
+            FROM graph_nodes_stage
+            ON CONFLICT (node_id) DO UPDATE SET
+                title = EXCLUDED.title,
+                content = EXCLUDED.content,
+                metadata = EXCLUDED.metadata
+            WHERE (graph_nodes.title, graph_nodes.content, graph_nodes.metadata)
+                IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.content, EXCLUDED.metadata)
+        """)
 
     def commit(self) -> None:
         """Commit transaction."""
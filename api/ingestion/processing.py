@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import hashlib
+import time
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -9,10 +10,6 @@ import logging
 import sys
 import warnings
 
-from docx import Document
-import markdown
-import numpy as np
-
 from config import default_config
 from hybrid_search import HybridSearcher
 from domain_models import ChunkData, DocumentFile, ExtractionResult
@@ -25,23 +22,11 @@ from .helpers import FileHasher
 # Centralized logging configuration - import triggers suppression
 from . import logging_config  # noqa: F401
 
-try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_AVAILABLE = False
-    print(f"Warning: Docling not available ({e})")
-
-# Try to import chunking separately (may not be available in all versions)
-try:
-    from docling_core.transforms.chunker import HybridChunker
-    from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
-    from transformers import AutoTokenizer
-    DOCLING_CHUNKING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_CHUNKING_AVAILABLE = False
-    if DOCLING_AVAILABLE:
-        print(f"Warning: Docling HybridChunker not available ({e})")
+# Docling availability flags (re-exported for backward compatibility)
+from ingestion.extractors._docling_availability import (  # noqa: F401
+    DOCLING_AVAILABLE,
+    DOCLING_CHUNKING_AVAILABLE
+)
 
 
 class MetadataEnricher:
@@ -87,6 +72,7 @@ class DocumentProcessor:
     PRE_CHUNKED_METHODS = {
         # Docling HybridChunker (structure + token-aware)
         'docling', 'docling_hybrid', 'docling_markdown', 'markdown_docling',
+        'docling_text', 'docling_text_ocr',
         # AST-based code chunking (per-function, per-class)
         'ast_python', 'ast_java', 'ast_typescript', 'ast_tsx',
         'ast_javascript', 'ast_jsx', 'ast_c_sharp', 'ast_go', 'code_ast',
@@ -94,8 +80,8 @@ class DocumentProcessor:
         'jupyter_ast', 'jupyter',
         # Obsidian Graph-RAG
         'obsidian_graph_rag',
-        # EPUB (converts to PDF then Docling)
-        'epub_pandoc_docling', 'epub_pandoc',
+        # EPUB (chapters via Docling HTML backend, or converts to PDF then Docling)
+        'epub_docling', 'epub_pandoc_docling', 'epub_pandoc',
     }
 
     def __init__(self, progress_tracker: Optional[ProcessingProgressTracker] = None):
@@ -245,9 +231,13 @@ class DocumentProcessor:
 
     def _extract_text(self, doc_file: DocumentFile):
         """Extract text from file"""
+        started = time.perf_counter()
         result = self.extractor.extract(doc_file.path)
+        elapsed = time.perf_counter() - started
         extraction_method = self.extractor.get_last_method()
-        print(f"Extraction complete ({extraction_method}): {doc_file.name} - "
+        if result.method and result.method != extraction_method:
+            extraction_method = f"{extraction_method}/{result.method}"
+        print(f"Extraction complete ({extraction_method}, {elapsed:.1f}s): {doc_file.name} - "
               f"{result.total_chars:,} chars extracted")
         return result
 
@@ -9,10 +9,6 @@ import logging
 import sys
 import warnings
 
-from docx import Document
-import markdown
-import numpy as np
-
 from config import default_config
 from hybrid_search import HybridSearcher
 from domain_models import ChunkData, DocumentFile, ExtractionResult
@@ -20,24 +16,6 @@ from domain_models import ChunkData, DocumentFile, ExtractionResult
 # Centralized logging configuration - import triggers suppression
 import ingestion.logging_config  # noqa: F401
 
-try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_AVAILABLE = False
-    print(f"Warning: Docling not available ({e})")
-
-# Try to import chunking separately (may not be available in all versions)
-try:
-    from docling_core.transforms.chunker import HybridChunker
-    from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
-    from transformers import AutoTokenizer
-    DOCLING_CHUNKING_AVAILABLE = True
-except ImportError as e:
-    DOCLING_CHUNKING_AVAILABLE = False
-    if DOCLING_AVAILABLE:
-        print(f"Warning: Docling HybridChunker not available ({e}), using fixed-size chunking")
-
 @dataclass
 
 class ProcessingProgress:
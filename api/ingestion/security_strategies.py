@@ -18,11 +18,14 @@ Principles:
 """
 from pathlib import Path
 from typing import Optional
+import io
 import os
 import zipfile
 import tarfile
 
+from ingestion.file_probe import FileProbe
 from ingestion.validation_result import ValidationResult
+from ingestion.validation_strategies import FileArg
 
 
 class FileSizeStrategy:
@@ -49,18 +52,19 @@ class FileSizeStrategy:
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.warn_size_bytes = warn_size_mb * 1024 * 1024
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check file size is within limits
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type
 
         Returns:
             ValidationResult with is_valid=False if file exceeds limits
         """
+        probe = FileProbe.of(file_path)
         try:
-            file_size = file_path.stat().st_size
+            file_size = probe.size
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
@@ -82,7 +86,7 @@ class FileSizeStrategy:
         # Soft limit - warn but allow
         if file_size > self.warn_size_bytes:
             size_mb = file_size / (1024 * 1024)
-            print(f"  [WARNING] Large file warning: {file_path.name} ({size_mb:.1f} MB)")
+            print(f"  [WARNING] Large file warning: {probe.path.name} ({size_mb:.1f} MB)")
 
         return ValidationResult(
             is_valid=True,
@@ -110,18 +114,20 @@ class ArchiveBombStrategy:
     MAX_UNCOMPRESSED_SIZE_MB = 1000  # 1 GB uncompressed max
     MAX_NESTING_DEPTH = 2  # Max 2 levels of nested archives
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check for archive bomb characteristics
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type
 
         Returns:
             ValidationResult with is_valid=False if archive appears malicious
         """
+        file_path = FileProbe.of(file_path)
+
         # Only check archive types
-        if not self._is_archive_type(file_path, expected_type):
+        if not self._is_archive_type(file_path.path, expected_type):
             return ValidationResult(
                 is_valid=True,
                 file_type=expected_type,
@@ -133,7 +139,7 @@ class ArchiveBombStrategy:
             return self._check_zip_bomb(file_path, expected_type)
 
         # Check tar-based formats
-        if self._is_tar_based(file_path):
+        if self._is_tar_based(file_path.path):
             return self._check_tar_bomb(file_path, expected_type)
 
         return ValidationResult(
@@ -150,12 +156,10 @@ class ArchiveBombStrategy:
         return (file_path.suffix.lower() in archive_extensions or
                 expected_type in archive_types)
 
-    def _is_zip_based(self, file_path: Path) -> bool:
+    def _is_zip_based(self, file_path: FileArg) -> bool:
         """Check if file is ZIP-based (ZIP, EPUB, DOCX)"""
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(4)
-                return header == b'PK\x03\x04'
+            return FileProbe.of(file_path).header[:4] == b'PK\x03\x04'
         except:
             return False
 
@@ -163,11 +167,12 @@ class ArchiveBombStrategy:
         """Check if file is TAR-based"""
         return file_path.suffix.lower() in {'.tar', '.gz', '.bz2', '.xz'}
 
-    def _check_zip_bomb(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def _check_zip_bomb(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check ZIP file for bomb characteristics"""
+        probe = FileProbe.of(file_path)
         try:
-            with zipfile.ZipFile(file_path, 'r') as zf:
-                compressed_size = file_path.stat().st_size
+            with zipfile.ZipFile(self._open(probe), 'r') as zf:
+                compressed_size = probe.size
                 uncompressed_size = sum(info.file_size for info in zf.infolist())
 
                 result = self._check_archive_sizes(
@@ -233,12 +238,13 @@ class ArchiveBombStrategy:
             validation_check='ArchiveBombStrategy'
         )
 
-    def _check_tar_bomb(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def _check_tar_bomb(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check TAR file for bomb characteristics"""
+        probe = FileProbe.of(file_path)
         try:
-            with tarfile.open(file_path, 'r:*') as tf:
+            with tarfile.open(fileobj=self._open(probe), mode='r:*') as tf:
                 uncompressed_size = sum(member.size for member in tf.getmembers())
-                compressed_size = file_path.stat().st_size
+                compressed_size = probe.size
 
                 return self._check_archive_sizes(
                     compressed_size, uncompressed_size, expected_type
@@ -251,6 +257,11 @@ class ArchiveBombStrategy:
 
         return ValidationResult(is_valid=True, file_type=expected_type, reason='')
 
+    @staticmethod
+    def _open(probe: FileProbe):
+        """Seekable file object over the probe's content"""
+        return io.BytesIO(probe.content)
+
 
 class ExtensionMismatchStrategy:
     """Detects suspicious file extension mismatches
@@ -262,11 +273,11 @@ class ExtensionMismatchStrategy:
     Common attack vector: malware.exe renamed to document.pdf
     """
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check for extension/content mismatch
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type based on extension
 
         Returns:
@@ -274,8 +285,7 @@ class ExtensionMismatchStrategy:
         """
         # Read magic bytes
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(512)
+            header = FileProbe.of(file_path).header
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
@@ -352,18 +362,19 @@ class ExecutablePermissionStrategy:
     so coordinator can reject them without remediation attempt.
     """
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check if file has executable permissions
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type
 
         Returns:
             ValidationResult with is_valid=False if file has any execute bit
         """
+        file_path = FileProbe.of(file_path)
         try:
-            mode = file_path.stat().st_mode
+            mode = file_path.stat.st_mode
             is_executable = bool(mode & 0o111)
 
             if is_executable:
@@ -393,10 +404,9 @@ class ExecutablePermissionStrategy:
             reason=''
         )
 
-    def _has_shebang(self, file_path: Path) -> bool:
+    def _has_shebang(self, file_path: FileArg) -> bool:
         """Check if file starts with shebang (#!)"""
         try:
-            with open(file_path, 'rb') as f:
-                return f.read(2) == b'#!'
+            return FileProbe.of(file_path).header[:2] == b'#!'
         except Exception:
             return False
@@ -10,12 +10,22 @@ Algorithm:
 3. Split large nodes if they exceed max_chunk_size
 4. Merge small adjacent siblings to fill chunks optimally
 5. Preserve metadata about node types and positions
+
+Parsers come from a per-thread pool. When chunkify() is given a filepath,
+the file's last parse is reused: the tree is re-parsed incrementally and
+only top-level nodes whose text changed are re-chunked (see parser_pool).
 """
 
+import hashlib
+import logging
 from typing import List, Dict, Optional
 from pathlib import Path
 from dataclasses import dataclass
 
+from ingestion.parser_pool import ParsedFile, get_parse_cache, source_edit, thread_parser
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class CodeChunk:
     """Represents a chunk of code with metadata"""
@@ -110,36 +120,36 @@ class TreeSitterChunker:
         self.chunk_overlap = chunk_overlap
         self.metadata_template = metadata_template
 
-        # Lazy load parser
-        self._parser = None
-        self._tree_sitter = None
-
     def _get_parser(self):
-        """Lazy load tree-sitter parser for language"""
-        if self._parser is None:
-            try:
-                from tree_sitter_language_pack import get_language, get_parser
-                # Get language and create parser
-                language = get_language(self.language)
-                self._parser = get_parser(self.language)
-            except ImportError as e:
-                raise ImportError(
-                    f"tree-sitter-language-pack not available: {e}\n"
-                    "Install with: pip install tree-sitter-language-pack>=0.10.0"
-                )
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to load parser for language '{self.language}': {e}\n"
-                    f"Supported languages: python, r, javascript, java, etc. (160+ languages)\n"
-                    f"See: https://pypi.org/project/tree-sitter-language-pack/"
-                )
-        return self._parser
-
-    def _parse_code(self, code: str):
-        """Parse code into AST tree"""
-        parser = self._get_parser()
-        tree = parser.parse(bytes(code, 'utf8'))
-        return tree
+        """Tree-sitter parser for language (one per thread, lazily created)"""
+        return thread_parser(self.language, self._create_parser)
+
+    def _create_parser(self):
+        """Load tree-sitter parser for language"""
+        try:
+            from tree_sitter_language_pack import get_parser
+            return get_parser(self.language)
+        except ImportError as e:
+            raise ImportError(
+                f"tree-sitter-language-pack not available: {e}\n"
+                "Install with: pip install tree-sitter-language-pack>=0.10.0"
+            )
+        except Exception as e:
+            raise ValueError(
+                f"Failed to load parser for language '{self.language}': {e}\n"
+                f"Supported languages: python, r, javascript, java, etc. (160+ languages)\n"
+                f"See: https://pypi.org/project/tree-sitter-language-pack/"
+            )
+
+    def _parse_code(self, code_bytes: bytes, previous: Optional[ParsedFile] = None):
+        """Parse code into AST tree, incrementally from a previous parse"""
+        if previous is None:
+            return self._get_parser().parse(code_bytes)
+        edit = source_edit(previous.source, code_bytes)
+        if edit is None:
+            return previous.tree
+        previous.tree.edit(**edit)
+        return self._get_parser().parse(code_bytes, previous.tree)
 
     def _walk_tree(self, node, code_bytes: bytes) -> List[CodeChunk]:
         """Walk AST tree and extract chunks
@@ -310,22 +320,85 @@ class TreeSitterChunker:
         return metadata
 
     def chunkify(self, code: str, filepath: Optional[str] = None) -> List[Dict]:
-        """Chunk code into AST-aware segments"""
+        """Chunk code into AST-aware segments
+
+        With a filepath, the previous parse of that file (if cached) makes
+        the parse incremental and unchanged top-level nodes keep their chunks.
+        """
         if not code or not code.strip():
             return []
 
-        tree = self._parse_code(code)
         code_bytes = bytes(code, 'utf8')
-        raw_chunks = self._extract_raw_chunks(tree, code_bytes, code)
+        cache = get_parse_cache() if filepath else None
+        previous = cache.take(filepath) if cache is not None else None
+        if previous is not None and previous.language != self.language:
+            previous = None
+
+        tree = self._parse_code(code_bytes, previous)
+        parsed = ParsedFile(self.language, code_bytes, tree)
+        raw_chunks = self._extract_raw_chunks(tree, code_bytes, code, previous, parsed.segments)
+        if cache is not None:
+            cache.put(filepath, parsed)
         merged_chunks = self._merge_small_chunks(raw_chunks, code)
 
         return self._format_chunks_as_dicts(merged_chunks, filepath)
 
-    def _extract_raw_chunks(self, tree, code_bytes: bytes, code: str) -> List[CodeChunk]:
-        """Extract initial chunks from AST"""
-        raw_chunks = self._walk_tree(tree.root_node, code_bytes)
+    def _extract_raw_chunks(self, tree, code_bytes: bytes, code: str,
+                            previous: Optional[ParsedFile] = None,
+                            segments: Optional[Dict] = None) -> List[CodeChunk]:
+        """Extract initial chunks from AST, one top-level node at a time
+
+        Top-level nodes identical to one in the previous parse (same type,
+        start column and text) reuse its chunks, shifted to the new position.
+        """
+        raw_chunks = []
+        reused = 0
+        for node in tree.root_node.children:
+            text = code_bytes[node.start_byte:node.end_byte]
+            key = (node.type, node.start_point[1], hashlib.blake2b(text, digest_size=16).digest())
+            segment = previous.segments.get(key) if previous else None
+            if segment is not None:
+                chunks = self._rebase_segment(segment, node)
+                reused += 1
+            else:
+                chunks = self._walk_tree(node, code_bytes)
+            if segments is not None:
+                segments[key] = (node.start_byte, node.start_point[0], chunks)
+            raw_chunks.extend(chunks)
+
+        if previous is not None:
+            logger.debug("Incremental %s parse: %d of %d top-level nodes reused",
+                         self.language, reused, tree.root_node.child_count)
         return raw_chunks if raw_chunks else self._create_fallback_chunk(code, code_bytes)
 
+    @staticmethod
+    def _rebase_segment(segment, node) -> List[CodeChunk]:
+        """Chunks of an unchanged top-level node, moved to its new position"""
+        start_byte, start_row, chunks = segment
+        byte_shift = node.start_byte - start_byte
+        line_shift = node.start_point[0] - start_row
+        if not byte_shift and not line_shift:
+            return chunks
+        return [
+            CodeChunk(
+                content=chunk.content,
+                start_byte=chunk.start_byte + byte_shift,
+                end_byte=chunk.end_byte + byte_shift,
+                start_line=chunk.start_line + line_shift,
+                end_line=chunk.end_line + line_shift,
+                node_type=chunk.node_type,
+                metadata=TreeSitterChunker._shift_lines(chunk.metadata, line_shift),
+            )
+            for chunk in chunks
+        ]
+
+    @staticmethod
+    def _shift_lines(metadata: Dict, line_shift: int) -> Dict:
+        if 'start_line' not in metadata:
+            return metadata
+        return {**metadata, 'start_line': metadata['start_line'] + line_shift,
+                'end_line': metadata['end_line'] + line_shift}
+
     def _create_fallback_chunk(self, code: str, code_bytes: bytes) -> List[CodeChunk]:
         """Create single chunk when no chunkable nodes found"""
         return [CodeChunk(
@@ -47,6 +47,8 @@ class ValidationResult:
     validation_check: str = ""  # Strategy that performed the check (e.g., "FileSizeStrategy")
     severity: Optional[SecuritySeverity] = None  # For security detections
     matches: List[SecurityMatch] = field(default_factory=list)  # Detailed match info
+    # False if a scanner was skipped (clamd down, YARA timeout): not final, never cached
+    complete: bool = True
 
     @property
     def should_quarantine(self) -> bool:
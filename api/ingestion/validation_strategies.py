@@ -5,9 +5,12 @@ Following Strategy pattern to reduce cyclomatic complexity.
 Each strategy handles one specific validation concern.
 """
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
+from ingestion.file_probe import FileProbe
 from ingestion.validation_result import ValidationResult
 
+FileArg = Union[Path, FileProbe]
+
 
 def matches_signature(data: bytes, signature: bytes, offset: int) -> bool:
     """Check if data matches signature at given offset.
@@ -37,28 +40,30 @@ class FileExistenceStrategy:
         '.keep'
     }
 
-    def validate(self, file_path: Path) -> ValidationResult:
+    def validate(self, file_path: FileArg) -> ValidationResult:
         """Check file exists and has content
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
 
         Returns:
             ValidationResult with is_valid=True if file exists and not empty
         """
+        probe = FileProbe.of(file_path)
+
         # Check file exists
-        if not file_path.exists():
+        if not probe.exists:
             return ValidationResult(
                 is_valid=False,
                 file_type='unknown',
-                reason=f'File does not exist: {file_path}',
+                reason=f'File does not exist: {probe.path}',
                 validation_check='FileExistenceStrategy'
             )
 
         # Check file is not empty (with whitelist exception)
-        if file_path.stat().st_size == 0:
+        if probe.size == 0:
             # Allow empty files if whitelisted
-            if file_path.name in self.EMPTY_FILE_WHITELIST:
+            if probe.path.name in self.EMPTY_FILE_WHITELIST:
                 return ValidationResult(
                     is_valid=True,
                     file_type='unknown',
@@ -105,16 +110,16 @@ class ExtensionStrategy:
         '.ipynb': 'ipynb',
     }
 
-    def validate(self, file_path: Path) -> ValidationResult:
+    def validate(self, file_path: FileArg) -> ValidationResult:
         """Check file extension is supported
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
 
         Returns:
             ValidationResult with is_valid=True and file_type if extension supported
         """
-        extension = file_path.suffix.lower()
+        extension = FileProbe.of(file_path).path.suffix.lower()
         expected_type = self.EXTENSION_MAP.get(extension)
 
         if expected_type is None:
@@ -143,20 +148,19 @@ class TextFileStrategy:
         'java', 'csharp', 'go', 'rust', 'ipynb', 'text'
     }
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Validate text-based file is actually text
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type (e.g., 'python', 'markdown')
 
         Returns:
             ValidationResult with is_valid=True if file is text-based
         """
-        # Read first 512 bytes for text detection
+        # First 512 bytes for text detection
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(512)
+            header = FileProbe.of(file_path).header
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
@@ -218,20 +222,19 @@ class ExecutableCheckStrategy:
         (b'#!', 0, 'Shell script'),
     ]
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Check file is not an executable
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type (e.g., 'pdf', 'docx')
 
         Returns:
             ValidationResult with is_valid=False if file is executable
         """
-        # Read first 512 bytes for magic byte check
+        # First 512 bytes for magic byte check
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(512)
+            header = FileProbe.of(file_path).header
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
@@ -287,11 +290,11 @@ class MagicSignatureStrategy:
         'ipynb': [],     # JSON-based, no magic bytes
     }
 
-    def validate(self, file_path: Path, expected_type: str) -> ValidationResult:
+    def validate(self, file_path: FileArg, expected_type: str) -> ValidationResult:
         """Validate file magic bytes match expected type
 
         Args:
-            file_path: Path to file to validate
+            file_path: Path (or FileProbe) of file to validate
             expected_type: Expected file type (e.g., 'pdf', 'docx')
 
         Returns:
@@ -311,11 +314,10 @@ class MagicSignatureStrategy:
 
         return self._validation_failure(expected_type)
 
-    def _read_file_header(self, file_path: Path):
+    def _read_file_header(self, file_path: FileArg):
         """Read file header for magic byte check"""
         try:
-            with open(file_path, 'rb') as f:
-                return f.read(512)
+            return FileProbe.of(file_path).header
         except Exception as e:
             return ValidationResult(
                 is_valid=False,
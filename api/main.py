@@ -1,8 +1,10 @@
+import asyncio
 import os
 import signal
 import time
+import traceback
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import List
 from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
@@ -11,18 +13,17 @@ from collections import defaultdict
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from sentence_transformers import SentenceTransformer
 
 # Models now imported in route modules
-from ingestion import DocumentProcessor, FileHasher
 from ingestion.database_factory import DatabaseFactory, get_backend
 from ingestion.file_filter import FileFilterPolicy
 from domain_models import DocumentFile
 from config import default_config
-from watcher import FileWatcherService
 from query_cache import QueryCache
+from metrics import metrics
 from value_objects import IndexingStats, ProcessingResult, DocumentIdentity
 from app_state import AppState
+from serving_mode import is_query_only
 
 # Signal handlers for debugging silent restarts
 def _handle_signal(signum, frame):
@@ -49,19 +50,40 @@ from routes.completeness import router as completeness_router
 from routes.security import router as security_router
 from routes.maintenance import router as maintenance_router
 from routes.mcp import router as mcp_router
+from routes.metrics import router as metrics_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan"""
+    """Application lifespan
+
+    The server accepts connections right away; initialization runs as a
+    background task that marks each component ready as it finishes, and
+    GET /ready returns 503 until queries can be served.
+    """
+    metrics.clear_process_files()
     manager = StartupManager(state)
-    await manager.initialize()  # Now async
+    startup = asyncio.create_task(manager.initialize())
+    startup.add_done_callback(_report_startup_failure)
     yield
+    if not startup.done():
+        startup.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await startup
     await _cleanup()  # Make cleanup async too
 
+def _report_startup_failure(task: asyncio.Task):
+    """Log an initialization failure (the failed component shows in GET /ready)"""
+    if task.cancelled() or task.exception() is None:
+        return
+    error = task.exception()
+    print(f"Startup failed: {error}")
+    traceback.print_exception(type(error), error, error.__traceback__)
+
 async def _cleanup():
     """Cleanup resources using Law of Demeter compliant delegation"""
     state.stop_watcher()
     state.stop_indexing()
+    state.stop_graph_rank()
     await state.close_all_resources()  # Now async for AsyncVectorStore
 
 app = FastAPI(
@@ -85,14 +107,18 @@ app.state.app_state = state
 # Include route modules
 app.include_router(health_router)
 app.include_router(query_router)
-app.include_router(indexing_router)
 app.include_router(database_router)
 app.include_router(documents_router)
-app.include_router(queue_router)
-app.include_router(completeness_router)
-app.include_router(security_router)
-app.include_router(maintenance_router)
 app.include_router(mcp_router)
+app.include_router(metrics_router)
+
+# Ingestion routes are not served in query-only mode (RAG_MODE=query)
+if not is_query_only():
+    app.include_router(indexing_router)
+    app.include_router(queue_router)
+    app.include_router(completeness_router)
+    app.include_router(security_router)
+    app.include_router(maintenance_router)
 
 # All routes extracted to routes/ modules for modular architecture
 # - routes/health.py: Health and info endpoints
@@ -101,6 +127,7 @@ app.include_router(mcp_router)
 # - routes/database.py: Database maintenance (3 endpoints)
 # - routes/documents.py: Document management (4 endpoints)
 # - routes/queue.py: Queue monitoring (1 endpoint)
+# - routes/metrics.py: Prometheus metrics (1 endpoint)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,433 @@
+"""
+Pipeline and query metrics in Prometheus text format
+
+Instrumentation is cheap enough to leave on in production:
+- Counters and histograms are sharded per thread, so the hot path is a
+  dict update on a thread-owned shard (no locks, no contention).
+- Gauges are computed lazily by callbacks when /metrics is scraped.
+- Worker processes (fork or spawn) write their shards to
+  METRICS_MULTIPROC_DIR; the serving process merges them at scrape time
+  and clears the directory when it starts.
+
+Usage:
+    from metrics import STAGE_DURATION
+    STAGE_DURATION.observe(1.25, stage="embed")
+
+    metrics.render()  # Prometheus exposition text
+"""
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class _Metric(ABC):
+    """Base for sharded metrics
+
+    Each thread gets its own shard dict; only that thread writes to it.
+    Readers copy shards (dict.copy is atomic under the GIL) and merge.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._registry: Optional['MetricsRegistry'] = None
+
+    def _after_update(self):
+        """Let worker processes flush their values periodically"""
+        registry = self._registry
+        if registry is not None and registry._child:
+            registry.maybe_flush()
+
+    def _shard(self) -> dict:
+        """Get (or create) the calling thread's shard"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            self._shards.append(shard)
+        return shard
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        """Label values in declaration order"""
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def reset(self):
+        """Drop all recorded values (used after fork in child processes)"""
+        self._local = threading.local()
+        self._shards = []
+
+    @abstractmethod
+    def snapshot(self) -> Dict[Tuple[str, ...], object]:
+        """Merge all thread shards into one {label values: value} dict"""
+        pass
+
+
+class Counter(_Metric):
+    """Monotonic counter"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        """Increment counter for the given labels"""
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0.0) + amount
+        self._after_update()
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        merged: Dict[Tuple[str, ...], float] = {}
+        for shard in list(self._shards):
+            for key, value in shard.copy().items():
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram
+
+    Shard values are [count per bucket..., +Inf count, sum]; buckets are
+    non-cumulative internally and made cumulative when rendered.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        """Record one observation"""
+        shard = self._shard()
+        key = self._key(labels)
+        cells = shard.get(key)
+        if cells is None:
+            cells = [0] * (len(self.buckets) + 1) + [0.0]
+            shard[key] = cells
+        cells[bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+        self._after_update()
+
+    def time(self, **labels) -> '_Timer':
+        """Context manager observing elapsed seconds"""
+        return _Timer(self, labels)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], List[float]]:
+        merged: Dict[Tuple[str, ...], List[float]] = {}
+        for shard in list(self._shards):
+            for key, cells in shard.copy().items():
+                target = merged.setdefault(key, [0] * len(cells))
+                for i, value in enumerate(list(cells)):
+                    target[i] += value
+        return merged
+
+
+class _Timer:
+    """Observes wall time of a with-block into a histogram"""
+
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Gauge:
+    """Gauge computed on scrape by a callback
+
+    The callback returns either a number or {label values tuple: number}.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._callback: Optional[Callable] = None
+
+    def set_function(self, callback: Optional[Callable]):
+        """Register (or replace) the callback that computes this gauge"""
+        self._callback = callback
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        if self._callback is None:
+            return {}
+        try:
+            value = self._callback()
+        except Exception:
+            return {}
+        if isinstance(value, dict):
+            return {tuple(k) if isinstance(k, tuple) else (k,): v for k, v in value.items()}
+        return {(): value}
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in Prometheus text format"""
+
+    def __init__(self, multiprocess_dir: Optional[str] = None, flush_interval: float = 1.0):
+        self.metrics: Dict[str, object] = {}
+        self.multiprocess_dir = Path(multiprocess_dir) if multiprocess_dir else None
+        self.flush_interval = flush_interval
+        self._child = False
+        self._last_flush = 0.0
+        self._process_id = str(os.getpid())
+
+    def counter(self, name: str, help_text: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames=(),
+                  buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def gauge(self, name: str, help_text: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def _register(self, metric):
+        if isinstance(metric, _Metric):
+            metric._registry = self
+        self.metrics[metric.name] = metric
+        return metric
+
+    # === Multi-process support ===
+
+    def enable_child_mode(self):
+        """Mark this process as a worker whose metrics go to the shared dir
+
+        Called automatically after fork; spawn-based pools should call it
+        from their initializer. The final flush is a multiprocessing
+        finalizer rather than atexit: multiprocessing workers leave through
+        os._exit(), which skips atexit but runs these finalizers first.
+        The file name carries a start-time nonce so a process reusing a
+        dead worker's pid never overwrites that worker's counters.
+        """
+        for metric in self.metrics.values():
+            if isinstance(metric, _Metric):
+                metric.reset()
+        self._child = True
+        self._last_flush = 0.0
+        self._process_id = f"{os.getpid()}-{time.time_ns()}"
+        if self.multiprocess_dir:
+            mp_util.Finalize(self, self.flush, exitpriority=10)
+
+    def maybe_flush(self):
+        """Flush worker-process metrics at most once per flush_interval"""
+        if not self._child or not self.multiprocess_dir:
+            return
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write this process's metrics to METRICS_MULTIPROC_DIR"""
+        if not self.multiprocess_dir:
+            return
+        self._last_flush = time.monotonic()
+        payload = {
+            name: [[list(key), value] for key, value in metric.snapshot().items()]
+            for name, metric in self.metrics.items()
+            if isinstance(metric, _Metric)
+        }
+        self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+        target = self.multiprocess_dir / f"metrics-{self._process_id}.json"
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, target)
+
+    def clear_process_files(self):
+        """Remove metrics files left by earlier runs (serving process startup)"""
+        if not self.multiprocess_dir or not self.multiprocess_dir.exists():
+            return
+        for path in self.multiprocess_dir.glob("metrics-*"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _load_process_snapshots(self) -> Dict[str, List[dict]]:
+        """Read metrics written by other processes"""
+        if not self.multiprocess_dir or not self.multiprocess_dir.exists():
+            return {}
+        own = f"metrics-{self._process_id}.json"
+        loaded: Dict[str, List[dict]] = {}
+        for path in self.multiprocess_dir.glob("metrics-*.json"):
+            if path.name == own:
+                continue
+            try:
+                payload = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            for name, entries in payload.items():
+                loaded.setdefault(name, []).append(
+                    {tuple(key): value for key, value in entries}
+                )
+        return loaded
+
+    # === Exposition ===
+
+    def collect(self) -> Dict[str, Dict[Tuple[str, ...], object]]:
+        """Merged values per metric across threads and worker processes"""
+        external = self._load_process_snapshots()
+        collected = {}
+        for name, metric in self.metrics.items():
+            values = dict(metric.snapshot())
+            for snapshot in external.get(name, []):
+                _merge_into(values, snapshot)
+            collected[name] = values
+        return collected
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format 0.0.4"""
+        lines = []
+        collected = self.collect()
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(collected[name].items()):
+                labels = list(zip(metric.labelnames, key))
+                if isinstance(metric, Histogram):
+                    lines.extend(_render_histogram(name, metric.buckets, labels, value))
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge_into(values: dict, snapshot: dict):
+    """Add snapshot values (numbers or histogram cell lists) into values"""
+    for key, value in snapshot.items():
+        if isinstance(value, list):
+            target = values.setdefault(key, [0] * len(value))
+            for i, cell in enumerate(value):
+                target[i] += cell
+        else:
+            values[key] = values.get(key, 0.0) + value
+
+
+def _render_histogram(name: str, buckets, labels, cells) -> List[str]:
+    """Render cumulative bucket, sum and count lines"""
+    lines = []
+    cumulative = 0
+    for bound, count in zip(list(buckets) + [float("inf")], cells[:-1]):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else _format_value(bound)
+        lines.append(f"{name}_bucket{_format_labels(labels + [('le', le)])} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(cells[-1])}")
+    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return lines
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value) -> str:
+    """Escape a label value per the exposition format"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _rss_bytes() -> float:
+    """Resident set size of this process in bytes"""
+    try:
+        import psutil
+        return float(psutil.Process(os.getpid()).memory_info().rss)
+    except ImportError:
+        try:
+            with open('/proc/self/statm') as f:
+                return float(int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE'))
+        except Exception:
+            return 0.0
+
+
+# Default registry
+metrics = MetricsRegistry(multiprocess_dir=os.getenv("METRICS_MULTIPROC_DIR") or None)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=metrics.enable_child_mode)
+
+
+# === Metric catalog ===
+
+STAGE_DURATION = metrics.histogram(
+    "ragkb_stage_duration_seconds",
+    "Time spent processing one document per pipeline stage",
+    ("stage",)
+)
+STAGE_CHUNKS = metrics.counter(
+    "ragkb_stage_chunks_total",
+    "Chunks completed per pipeline stage (rate() gives chunks/sec)",
+    ("stage",)
+)
+STAGE_BYTES = metrics.counter(
+    "ragkb_stage_bytes_total",
+    "Source file bytes completed per pipeline stage (rate() gives bytes/sec)",
+    ("stage",)
+)
+QUEUE_DEPTH = metrics.gauge(
+    "ragkb_queue_depth",
+    "Items waiting in each pipeline queue",
+    ("queue",)
+)
+QUEUE_WAIT = metrics.histogram(
+    "ragkb_queue_wait_seconds",
+    "Time items spend waiting in each pipeline queue",
+    ("queue",)
+)
+EMBED_BATCH_SIZE = metrics.histogram(
+    "ragkb_embed_batch_size",
+    "Texts per embedding model forward pass",
+    buckets=BATCH_SIZE_BUCKETS
+)
+EMBED_FORWARD_DURATION = metrics.histogram(
+    "ragkb_embed_forward_seconds",
+    "Embedding model forward pass latency"
+)
+DB_COMMIT_DURATION = metrics.histogram(
+    "ragkb_db_commit_seconds",
+    "Database commit latency",
+    ("operation",)
+)
+CACHE_REQUESTS = metrics.counter(
+    "ragkb_cache_requests_total",
+    "Cache lookups by cache and result (hit or miss)",
+    ("cache", "result")
+)
+RESIDENT_MEMORY = metrics.gauge(
+    "process_resident_memory_bytes",
+    "Resident memory size in bytes"
+)
+RESIDENT_MEMORY.set_function(_rss_bytes)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """Count one cache lookup"""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
@@ -152,39 +152,3 @@ class IndexOrchestrator:
         print(f"Found {len(all_files)} files to process")
         print(self._group_files_for_display(all_files))
 
-    def _persist_obsidian_graph(self):
-        """Persist Obsidian knowledge graph to database"""
-        try:
-            graph_export = self._get_graph_export()
-            if self._has_graph_content(graph_export):
-                self._save_graph(graph_export)
-        except Exception as e:
-            print(f"Warning: Failed to persist graph: {e}")
-
-    def _get_graph_export(self):
-        """Get graph export from processor"""
-        obsidian_graph = self.indexer.get_obsidian_graph()
-        return obsidian_graph.export_graph()
-
-    def _has_graph_content(self, graph_export):
-        """Check if graph has content worth persisting"""
-        return graph_export['stats']['total_nodes'] > 0
-
-    def _save_graph(self, graph_export):
-        """Save graph to database"""
-        from ingestion.database_factory import DatabaseFactory
-        from ingestion.postgres_repositories import PostgresGraphRepository
-
-        db = DatabaseFactory.create_connection()
-        conn = db.connect()
-        graph_repo = PostgresGraphRepository(conn)
-        graph_repo.persist_graph(graph_export)
-        graph_repo.commit()
-        db.close()
-        self._print_graph_stats(graph_export)
-
-    def _print_graph_stats(self, graph_export):
-        """Print graph persistence statistics"""
-        print(f"Graph persisted: {graph_export['stats']['total_nodes']} nodes, "
-              f"{graph_export['stats']['total_edges']} edges")
-
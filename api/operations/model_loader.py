@@ -1,6 +1,17 @@
 import os
 import time
-from sentence_transformers import SentenceTransformer
+
+# sentence_transformers pulls in torch/transformers (seconds of import time).
+# Imported on first load; module attribute kept so tests can patch it.
+SentenceTransformer = None
+
+
+def _model_class():
+    """Import SentenceTransformer on first use"""
+    global SentenceTransformer
+    if SentenceTransformer is None:
+        from sentence_transformers import SentenceTransformer
+    return SentenceTransformer
 
 
 def _get_memory_mb() -> float:
@@ -31,7 +42,7 @@ class ModelLoader:
     BASE_DELAY = 5  # seconds
 
     @staticmethod
-    def load(model_name: str, max_retries: int = 3) -> SentenceTransformer:
+    def load(model_name: str, max_retries: int = 3) -> 'SentenceTransformer':
         """Load embedding model with retry on network errors"""
         last_error = None
 
@@ -41,7 +52,7 @@ class ModelLoader:
                 mem_mb = _get_memory_mb()
                 mem_info = f" [Memory: {mem_mb:.0f}MB]" if mem_mb > 0 else ""
                 print(f"Loading model: {model_name}" + (f" (attempt {attempt + 1})" if attempt > 0 else "") + mem_info)
-                return SentenceTransformer(model_name)
+                return _model_class()(model_name)
             except Exception as e:
                 last_error = e
                 # Log memory on failure for OOM diagnosis
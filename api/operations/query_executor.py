@@ -3,6 +3,9 @@ import re
 from typing import List, Optional, Tuple
 from models import QueryRequest, QueryResponse, SearchResult, DecompositionInfo
 
+# Expansions left running past their budget (the loop only keeps weak references)
+_background_expansions = set()
+
 
 class QueryExecutor:
     """Executes semantic search queries with optional reranking and query expansion"""
@@ -22,6 +25,8 @@ class QueryExecutor:
 
         v3 Query Expansion: If Ollama is available and enabled, expands the query
         into multiple variants using LLM, then searches all variants and merges.
+        The original query is searched while the expansion runs; variants are
+        only merged if they arrive within the expander's latency budget.
         """
         self._validate(request.text)
 
@@ -37,15 +42,7 @@ class QueryExecutor:
 
         # v3: Expand query using LLM if enabled
         if self.query_expander and self.query_expander.is_enabled:
-            expanded_queries = await asyncio.to_thread(
-                self.query_expander.expand, request.text
-            )
-            if len(expanded_queries) > 1:
-                # Search all expanded queries and merge results
-                results = await self._search_expanded(expanded_queries, request)
-            else:
-                embedding = await asyncio.to_thread(self._gen_embedding, request.text)
-                results = await self._search(embedding, request)
+            results = await self._search_speculative(request)
         # v2: Execute sub-queries if compound query detected
         elif decomposition.applied and len(decomposition.sub_queries) >= 2:
             results = await self._search_decomposed(decomposition.sub_queries, request)
@@ -70,56 +67,58 @@ class QueryExecutor:
         """Generate query embedding"""
         return self.model.encode(text, show_progress_bar=False)
 
+    def _fetch_k(self, request) -> int:
+        """Candidates to fetch per query (more when reranking)"""
+        if self.reranker and self.reranker.is_enabled:
+            # Fetch more candidates for reranking (ensures enough for larger top_k)
+            return max(request.top_k * 2, 40)
+        return request.top_k
+
     async def _search(self, embedding, request):
         """Search vector store with optional reranking.
 
         If reranker is enabled, fetches more candidates (top_n) and reranks
         to final top_k. This improves retrieval quality by ~20-30%.
         """
-        # Determine how many candidates to fetch
-        fetch_k = request.top_k
-        if self.reranker and self.reranker.is_enabled:
-            # Fetch more candidates for reranking (ensures enough for larger top_k)
-            fetch_k = max(request.top_k * 2, 40)
+        results = await self._fetch(embedding, request.text, request)
+        return self._rerank(results, request)
 
-        # Search vector store
-        results = await self.store.search(
+    async def _fetch(self, embedding, query: str, request) -> List:
+        """Hybrid search for one query, without reranking"""
+        return await self.store.search(
             query_embedding=embedding.tolist(),
-            top_k=fetch_k,
+            top_k=self._fetch_k(request),
             threshold=request.threshold,
-            query_text=request.text,
+            query_text=query,
             use_hybrid=True
         )
 
-        # Rerank if enabled
+    async def _fetch_text(self, query: str, request) -> List:
+        """Embed and search one query"""
+        embedding = await asyncio.to_thread(self._gen_embedding, query)
+        return await self._fetch(embedding, query, request)
+
+    def _rerank(self, results: List, request) -> List:
+        """Rerank against the original query if enabled"""
         if self.reranker and self.reranker.is_enabled and results:
             results = self.reranker.rerank(request.text, results, request.top_k)
-
         return results
 
     async def _search_multi_query(self, queries: List[str], request) -> List:
         """Search multiple queries and merge deduplicated results.
 
-        Common logic for both v2 decomposition and v3 query expansion.
-        Searches each query, deduplicates by (source, content_prefix),
-        sorts by score, and optionally reranks against original query.
+        Used by v2 decomposition; searches the sub-queries concurrently.
+        """
+        result_lists = await asyncio.gather(*(self._fetch_text(q, request) for q in queries))
+        return self._merge(result_lists, request)
+
+    def _merge(self, result_lists: List[List], request) -> List:
+        """Deduplicate by (source, content_prefix), sort by score, and
+        optionally rerank against the original query.
         """
         all_results = []
         seen_chunks = set()
-
-        fetch_k = request.top_k
-        if self.reranker and self.reranker.is_enabled:
-            fetch_k = max(request.top_k * 2, 40)
-
-        for query in queries:
-            embedding = await asyncio.to_thread(self._gen_embedding, query)
-            results = await self.store.search(
-                query_embedding=embedding.tolist(),
-                top_k=fetch_k,
-                threshold=request.threshold,
-                query_text=query,
-                use_hybrid=True
-            )
+        for results in result_lists:
             for r in results:
                 chunk_key = (r['source'], r['content'][:100])
                 if chunk_key not in seen_chunks:
@@ -130,21 +129,58 @@ class QueryExecutor:
 
         if self.reranker and self.reranker.is_enabled and all_results:
             all_results = self.reranker.rerank(
-                request.text, all_results[:fetch_k], request.top_k
+                request.text, all_results[:self._fetch_k(request)], request.top_k
             )
         else:
             all_results = all_results[:request.top_k]
 
         return all_results
 
+    async def _search_speculative(self, request) -> List:
+        """Search the original query while the expansion runs (v3).
+
+        Once the original results are in, waits at most the expander's
+        budget for the expansion and the variant searches. If they miss
+        it, the original results are used alone; the expansion keeps
+        running in the background so its cache entry serves the next query.
+        """
+        expansion = asyncio.ensure_future(self.query_expander.expand(request.text))
+        _background_expansions.add(expansion)
+        expansion.add_done_callback(_background_expansions.discard)
+        original = await self._fetch_text(request.text, request)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.query_expander.budget
+
+        expanded_queries = await self._await_until(expansion, deadline, cancel=False)
+        if expanded_queries and len(expanded_queries) > 1:
+            variants = asyncio.gather(
+                *(self._fetch_text(q, request) for q in expanded_queries[1:])
+            )
+            variant_results = await self._await_until(variants, deadline, cancel=True)
+            if variant_results is not None:
+                return self._merge([original] + list(variant_results), request)
+
+        return self._rerank(original, request)
+
+    @staticmethod
+    async def _await_until(future, deadline: float, cancel: bool):
+        """Result of future, or None if it is not done by deadline.
+
+        On timeout the future is cancelled if cancel, else left running.
+        """
+        timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if cancel:
+                future.cancel()
+            return None
+
     async def _search_decomposed(self, sub_queries: List[str], request) -> List:
         """Search each sub-query separately and merge results (v2 decomposition)."""
         return await self._search_multi_query(sub_queries, request)
 
-    async def _search_expanded(self, expanded_queries: List[str], request) -> List:
-        """Search each expanded query and merge results (v3 query expansion)."""
-        return await self._search_multi_query(expanded_queries, request)
-
     @staticmethod
     def _format(results: List, query: str, decomposition: DecompositionInfo = None) -> QueryResponse:
         """Format response"""
@@ -13,6 +13,8 @@ import math
 import time
 from typing import List, Callable, Optional
 
+from metrics import EMBED_BATCH_SIZE, EMBED_FORWARD_DURATION
+
 
 class BatchEncoder:
     """Encodes texts in batches for efficient embedding generation.
@@ -83,8 +85,10 @@ class BatchEncoder:
             show_progress_bar=False,
             convert_to_numpy=True
         )
+        elapsed = time.perf_counter() - start_time
+        EMBED_BATCH_SIZE.observe(len(texts))
+        EMBED_FORWARD_DURATION.observe(elapsed)
         if self.enable_timing:
-            elapsed = time.perf_counter() - start_time
             texts_per_sec = len(texts) / elapsed if elapsed > 0 else 0
             print(f"    [BatchEncoder] {len(texts)} texts in {elapsed:.3f}s ({texts_per_sec:.1f} texts/sec)")
         return [emb.tolist() for emb in embeddings]
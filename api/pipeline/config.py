@@ -15,6 +15,11 @@ from typing import Optional
 import yaml
 
 
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    """Parse optional integer env var (unset/empty = None)"""
+    return int(value) if value else None
+
+
 @dataclass
 class ExtractionConfig:
     """Configuration for document extraction."""
@@ -42,6 +47,13 @@ class RerankingConfig:
     enabled: bool = True  # ON by default
     model: str = "BAAI/bge-reranker-large"
     top_n: int = 20  # Retrieve this many, rerank to top_k
+    mode: str = "default"  # default | cpu (ONNX int8, truncation, batching, time budget)
+    # Overrides for the mode's defaults (None = use mode default)
+    max_length: Optional[int] = None  # Tokens per query+passage pair
+    batch_tokens: Optional[int] = None  # Token budget per predict() batch
+    time_budget_ms: Optional[int] = None  # Stop scoring after this long (0 = no limit)
+    quantization: str = "avx512_vnni"  # ONNX int8 target: arm64|avx2|avx512|avx512_vnni
+    cache_size: int = 10000  # Cached (query, chunk) scores, 0 = disabled
 
 
 @dataclass
@@ -95,7 +107,13 @@ class PipelineConfig:
         reranking = RerankingConfig(
             enabled=os.getenv("RERANKING_ENABLED", "true").lower() == "true",
             model=os.getenv("RERANKING_MODEL", "BAAI/bge-reranker-large"),
-            top_n=int(os.getenv("RERANKING_TOP_N", "20"))
+            top_n=int(os.getenv("RERANKING_TOP_N", "20")),
+            mode=os.getenv("RERANKING_MODE", "default"),
+            max_length=_optional_int(os.getenv("RERANKING_MAX_LENGTH")),
+            batch_tokens=_optional_int(os.getenv("RERANKING_BATCH_TOKENS")),
+            time_budget_ms=_optional_int(os.getenv("RERANKING_TIME_BUDGET_MS")),
+            quantization=os.getenv("RERANKING_QUANTIZATION", "avx512_vnni"),
+            cache_size=int(os.getenv("RERANKING_CACHE_SIZE", "10000"))
         )
 
         return cls(
@@ -156,6 +174,12 @@ class PipelineConfig:
             reranking=RerankingConfig(
                 enabled=reranking_data.get("enabled", True),
                 model=reranking_data.get("model", "BAAI/bge-reranker-large"),
-                top_n=reranking_data.get("top_n", 20)
+                top_n=reranking_data.get("top_n", 20),
+                mode=reranking_data.get("mode", "default"),
+                max_length=reranking_data.get("max_length"),
+                batch_tokens=reranking_data.get("batch_tokens"),
+                time_budget_ms=reranking_data.get("time_budget_ms"),
+                quantization=reranking_data.get("quantization", "avx512_vnni"),
+                cache_size=reranking_data.get("cache_size", 10000)
             )
         )
@@ -176,7 +176,13 @@ class PipelineFactory:
         from pipeline.rerankers.bge_reranker import BGEReranker
         return BGEReranker(
             model_name=rerank_config.model,
-            enable_timing=True
+            enable_timing=True,
+            mode=rerank_config.mode,
+            max_length=rerank_config.max_length,
+            batch_tokens=rerank_config.batch_tokens,
+            time_budget_ms=rerank_config.time_budget_ms,
+            quantization=rerank_config.quantization,
+            cache_size=rerank_config.cache_size
         )
 
     def create_embedder(self, model) -> EmbedderInterface:
@@ -40,6 +40,8 @@ class IndexingQueue:
     - Methods < 5 lines (mostly)
     """
 
+    recovered_work = 0  # Nothing survives a restart (see PostgresIndexingQueue)
+
     def __init__(self):
         self.queue = PriorityQueue()
         self.paused = False
@@ -135,3 +137,7 @@ class IndexingQueue:
 
         with self.lock:
             self.queued_files.clear()
+
+    def close(self):
+        """Release resources (nothing to release for the in-memory queue)"""
+        pass
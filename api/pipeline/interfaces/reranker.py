@@ -47,6 +47,10 @@ class RerankerInterface(ABC):
         """Whether reranking is enabled (default True)."""
         return True
 
+    def warmup(self) -> None:
+        """Load model weights ahead of the first query (default no-op)."""
+        pass
+
 
 class NoopReranker(RerankerInterface):
     """Pass-through reranker that returns candidates unchanged.
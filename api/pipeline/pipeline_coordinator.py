@@ -16,10 +16,18 @@ from pipeline.pipeline_queues import (
     EmbeddedDocument
 )
 from pipeline.pipeline_workers import StageWorker, EmbedWorkerPool
+from pipeline.worker_autoscaler import (
+    AutoscalerConfig,
+    ThreadBudget,
+    WorkerAutoscaler,
+    available_cores
+)
 from pipeline.indexing_queue import QueueItem
 from pipeline.progress_logger import ProgressLogger
 from pipeline.skip_batcher import SkipBatcher
+from config import default_config
 from domain_models import DocumentFile
+from metrics import QUEUE_DEPTH, STAGE_BYTES, STAGE_CHUNKS, record_cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +38,9 @@ class PipelineCoordinator:
     Architecture:
     - ChunkWorker: Reads files, extracts text, and chunks (combined stage)
     - EmbedWorkerPool: Embeds chunks in parallel (2-4 workers)
-    - StoreWorker: Stores embedded chunks in database
+    - StoreWorker: Stores embedded chunks in database, then writes the
+      graph nodes/edges of Obsidian notes changed since its last write
+    - WorkerAutoscaler: Optionally resizes chunk/embed pools (AUTOSCALE_ENABLED)
     """
 
     def __init__(self, processor, indexer, embedding_service, indexing_queue=None):
@@ -53,21 +63,56 @@ class PipelineCoordinator:
             num_workers=num_chunk_workers,
             input_queue=self.queues.chunk_queue,
             output_queue=self.queues.embed_queue,
-            embed_fn=self._chunk_stage
+            embed_fn=self._chunk_stage,
+            name_prefix="ChunkWorker",
+            stage="chunk"
         )
 
         self.embed_pool = EmbedWorkerPool(
             num_workers=num_embed_workers,
             input_queue=self.queues.embed_queue,
             output_queue=self.queues.store_queue,
-            embed_fn=self._embed_stage
+            embed_fn=self._embed_stage,
+            stage="embed"
         )
 
         self.store_worker = StageWorker(
             name="StoreWorker",
             input_queue=self.queues.store_queue,
             output_queue=None,  # Final stage
-            process_fn=self._store_stage
+            process_fn=self._store_stage,
+            stage="store"
+        )
+
+        self.thread_budget = None
+        self.autoscaler = self._create_autoscaler(AutoscalerConfig.from_env())
+        QUEUE_DEPTH.set_function(self._queue_depths)
+
+    def _queue_depths(self) -> dict:
+        """Queue depths for the /metrics gauge (input + pipeline queues)"""
+        depths = dict(self.queues.get_stats())
+        if self.indexing_queue:
+            depths['input'] = self.indexing_queue.size()
+        return depths
+
+    def _create_autoscaler(self, config: AutoscalerConfig) -> Optional[WorkerAutoscaler]:
+        """Create autoscaler for chunk/embed pools if enabled"""
+        if not config.enabled:
+            return None
+        cores = available_cores()
+        self.thread_budget = ThreadBudget(
+            cores,
+            embed_workers=len(self.embed_pool.workers),
+            chunk_workers=len(self.chunk_pool.workers)
+        )
+        return WorkerAutoscaler(
+            config,
+            pools={
+                'chunk': (self.chunk_pool, self.queues.chunk_queue),
+                'embed': (self.embed_pool, self.queues.embed_queue),
+            },
+            thread_budget=self.thread_budget,
+            cores=cores
         )
 
     def start(self):
@@ -77,9 +122,13 @@ class PipelineCoordinator:
         self.chunk_pool.start()
         self.embed_pool.start()
         self.store_worker.start()
+        if self.autoscaler:
+            self.autoscaler.start()
 
     def stop(self):
         """Stop all pipeline workers"""
+        if self.autoscaler:
+            self.autoscaler.stop()
         self.chunk_pool.stop()
         self.embed_pool.stop()
         self.store_worker.stop()
@@ -89,13 +138,13 @@ class PipelineCoordinator:
         """Add file to processing queue (with pre-queue validation)
 
         Validation order:
-        1. EPUB detection - route to conversion handler
+        1. EPUB detection - route to conversion handler (EPUB_CONVERT_TO_PDF only)
         2. Security validation - reject dangerous files BEFORE queue
         3. Already indexed check - skip duplicates
         4. Add to chunk queue
         """
         # Handle EPUB conversion outside pipeline (no chunking needed)
-        if item.path.suffix.lower() == '.epub':
+        if self._is_epub_conversion(item.path):
             self._handle_epub_conversion(item)
             return
 
@@ -109,6 +158,12 @@ class PipelineCoordinator:
             return
         self.queues.chunk_queue.put(item)
 
+    @staticmethod
+    def _is_epub_conversion(path: Path) -> bool:
+        """EPUBs bypass chunking only when converted to PDF; by default they
+        are extracted chapter by chapter like any other document"""
+        return path.suffix.lower() == '.epub' and default_config.docling.epub_convert_to_pdf
+
     def _should_reject_before_queue(self, item: QueueItem) -> bool:
         """Pre-queue security validation with remediation - reject dangerous files early
 
@@ -204,7 +259,9 @@ class PipelineCoordinator:
 
         try:
             doc_file = DocumentFile.from_path(item.path)
-            if self.embedding_service.store.is_document_indexed(str(item.path), doc_file.hash):
+            indexed = self.embedding_service.store.is_document_indexed(str(item.path), doc_file.hash)
+            record_cache_lookup("indexed_document", indexed)
+            if indexed:
                 self.skip_batcher.record_skip(item.path.name, "already indexed")
                 return True
         except Exception as e:
@@ -230,13 +287,19 @@ class PipelineCoordinator:
             }
         }
 
+    def get_autoscaler_status(self) -> dict:
+        """Get autoscaler state and recent scaling decisions"""
+        if not self.autoscaler:
+            return {'enabled': False}
+        return self.autoscaler.get_status()
+
     # Stage processing functions
 
     def _chunk_stage(self, item: QueueItem) -> Optional[ChunkedDocument]:
         """Process file: extract text and chunk it
 
-        Note: EPUBs are handled separately in _handle_epub_conversion()
-        and never reach this method.
+        Note: with EPUB_CONVERT_TO_PDF, EPUBs are handled separately in
+        _handle_epub_conversion() and never reach this method.
         """
         import time
         import gc
@@ -264,6 +327,7 @@ class PipelineCoordinator:
                 return None
 
             self.progress_logger.log_complete("Chunk", item.path.name, len(chunks), start_time)
+            self._record_throughput("chunk", len(chunks), item.path)
             result = self._create_chunked_document(item, doc_file, chunks)
 
             # Release memory after chunking - critical for Mac Docker memory limits
@@ -278,6 +342,15 @@ class PipelineCoordinator:
             gc.collect()  # Clean up on error too
             return None
 
+    def _record_throughput(self, stage: str, chunk_count: int, path: Optional[Path] = None):
+        """Count chunks (and source bytes) completed by a stage"""
+        STAGE_CHUNKS.inc(chunk_count, stage=stage)
+        if path is not None:
+            try:
+                STAGE_BYTES.inc(path.stat().st_size, stage=stage)
+            except OSError:
+                pass
+
     def _handle_epub_conversion(self, item: QueueItem):
         """Handle EPUB conversion outside the chunking pipeline
 
@@ -329,6 +402,8 @@ class PipelineCoordinator:
     def _embed_stage(self, doc: ChunkedDocument) -> Optional[EmbeddedDocument]:
         """Embed chunks"""
         try:
+            if self.thread_budget:
+                self.thread_budget.apply()
             self.progress_logger.log_start("Embed", doc.path.name)
 
             # Use the existing embedding service
@@ -339,6 +414,7 @@ class PipelineCoordinator:
             )
 
             self.progress_logger.log_complete("Embed", doc.path.name, len(doc.chunks))
+            self._record_throughput("embed", len(doc.chunks))
 
             return EmbeddedDocument(
                 priority=doc.priority,
@@ -366,6 +442,8 @@ class PipelineCoordinator:
             )
 
             self.progress_logger.log_complete("Store", doc.path.name, len(doc.chunks))
+            self._record_throughput("store", len(doc.chunks))
+            self._sync_graph()
             self._mark_file_complete(doc.path)
 
             # Free memory after document completion to prevent OOM during long runs
@@ -374,3 +452,23 @@ class PipelineCoordinator:
         except Exception as e:
             print(f"[Store] Error storing {doc.path}: {e}")
             self._mark_file_complete(doc.path)  # Mark complete on error too
+
+    def _sync_graph(self):
+        """Persist the graph of notes (re)extracted since the last sync
+
+        Notes are batched: everything chunk workers extracted while this
+        document was embedded is written in one diff against stored edges.
+        """
+        store = self.embedding_service.store
+        if not hasattr(store, 'sync_graph'):
+            return
+        graph = self.processor.get_obsidian_graph()
+        notes = graph.take_dirty_notes()
+        if not notes:
+            return
+        try:
+            counts = store.sync_graph(graph.export_notes(notes))
+            logger.debug("Graph synced for %d notes: %s", len(notes), counts)
+        except Exception as e:
+            graph.mark_dirty(notes)  # Retried with the next document
+            print(f"[Graph] Failed to sync {len(notes)} notes: {e}")
@@ -6,11 +6,14 @@ Principles:
 - Few instance variables: < 4
 """
 
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from pathlib import Path
 from queue import PriorityQueue
 
+from metrics import QUEUE_WAIT
+
 @dataclass(order=True)
 class ExtractedDocument:
     """Document after extraction stage"""
@@ -38,6 +41,29 @@ class EmbeddedDocument:
     embeddings: List = field(compare=False)
     hash_val: str = field(compare=False)
 
+class TimedPriorityQueue(PriorityQueue):
+    """PriorityQueue that records how long each item waited
+
+    Enqueue times are tracked by item identity inside the queue's own
+    mutex (_put/_get), so timing adds no extra locking.
+    """
+
+    def __init__(self, name: str, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.name = name
+        self._enqueued_at: Dict[int, float] = {}
+
+    def _put(self, item):
+        self._enqueued_at[id(item)] = time.monotonic()
+        super()._put(item)
+
+    def _get(self):
+        item = super()._get()
+        enqueued_at = self._enqueued_at.pop(id(item), None)
+        if enqueued_at is not None:
+            QUEUE_WAIT.observe(time.monotonic() - enqueued_at, queue=self.name)
+        return item
+
 class PipelineQueues:
     """Manages all queues for concurrent pipeline stages
 
@@ -48,9 +74,9 @@ class PipelineQueues:
     """
 
     def __init__(self):
-        self.chunk_queue = PriorityQueue()  # Extract+chunk combined
-        self.embed_queue = PriorityQueue()
-        self.store_queue = PriorityQueue()
+        self.chunk_queue = TimedPriorityQueue("chunk")  # Extract+chunk combined
+        self.embed_queue = TimedPriorityQueue("embed")
+        self.store_queue = TimedPriorityQueue("store")
 
     def get_stats(self) -> dict:
         """Get queue sizes for monitoring"""
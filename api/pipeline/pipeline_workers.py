@@ -8,11 +8,12 @@ Principles:
 
 import threading
 import time
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 from queue import Empty
 from pathlib import Path
 
 from pipeline.pipeline_queues import ExtractedDocument, ChunkedDocument, EmbeddedDocument
+from metrics import STAGE_DURATION
 
 class StageWorker:
     """Generic worker for a pipeline stage
@@ -20,8 +21,10 @@ class StageWorker:
     Processes items from input queue and puts results in output queue.
     """
 
-    def __init__(self, name: str, input_queue, output_queue, process_fn: Callable):
+    def __init__(self, name: str, input_queue, output_queue, process_fn: Callable,
+                 stage: Optional[str] = None):
         self.name = name
+        self.stage = stage  # Metrics label (chunk/embed/store)
         self.input_queue = input_queue
         self.output_queue = output_queue
         self.process_fn = process_fn
@@ -30,6 +33,8 @@ class StageWorker:
         self._lock = threading.Lock()
         self._current_item: Optional[str] = None
         self._processing = False  # Track if actively processing
+        self._items_done = 0
+        self._busy_seconds = 0.0
 
     def start(self):
         """Start worker thread"""
@@ -42,11 +47,15 @@ class StageWorker:
 
     def stop(self):
         """Stop worker thread"""
-        with self._lock:
-            self.running = False
+        self.request_stop()
         if self._thread:
             self._thread.join(timeout=5.0)
 
+    def request_stop(self):
+        """Ask worker to exit after its current item (non-blocking)"""
+        with self._lock:
+            self.running = False
+
     def _work_loop(self):
         """Main work loop with exception guard"""
         try:
@@ -70,10 +79,20 @@ class StageWorker:
     def _process_item(self, item):
         """Process a single work item"""
         self._set_processing_state(item, True)
+        started = time.perf_counter()
         result = self.process_fn(item)
+        self._record_service_time(time.perf_counter() - started)
         self._send_result_if_exists(result)
         self._set_processing_complete()
 
+    def _record_service_time(self, seconds: float):
+        """Accumulate busy time for utilization and service time metrics"""
+        with self._lock:
+            self._items_done += 1
+            self._busy_seconds += seconds
+        if self.stage:
+            STAGE_DURATION.observe(seconds, stage=self.stage)
+
     def _set_processing_state(self, item, processing: bool):
         """Update processing state with lock"""
         with self._lock:
@@ -113,33 +132,116 @@ class StageWorker:
         with self._lock:
             return self.running
 
+    def is_alive(self) -> bool:
+        """Check if the worker thread is still executing"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_service_stats(self) -> Tuple[int, float]:
+        """Get cumulative (items processed, busy seconds)"""
+        with self._lock:
+            return self._items_done, self._busy_seconds
+
 class EmbedWorkerPool:
     """Pool of embedding workers (the bottleneck)
 
     Runs multiple workers in parallel to maximize CPU utilization.
+    The pool can be resized at runtime (see WorkerAutoscaler).
     """
 
-    def __init__(self, num_workers: int, input_queue, output_queue, embed_fn):
-        self.workers = [
-            StageWorker(
-                name=f"EmbedWorker-{i}",
-                input_queue=input_queue,
-                output_queue=output_queue,
-                process_fn=embed_fn
-            )
-            for i in range(num_workers)
-        ]
+    def __init__(self, num_workers: int, input_queue, output_queue, embed_fn,
+                 name_prefix: str = "EmbedWorker", stage: Optional[str] = None):
+        self.stage = stage
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.embed_fn = embed_fn
+        self.name_prefix = name_prefix
+        self._started = False
+        self._next_index = 0
+        self._retired: List[StageWorker] = []  # Stopping workers, still counted
+        self._retired_items = 0
+        self._retired_busy = 0.0
+        self._resize_lock = threading.Lock()
+        self.workers = [self._create_worker() for _ in range(num_workers)]
+
+    def _create_worker(self) -> StageWorker:
+        """Create a worker with a unique, stable name"""
+        worker = StageWorker(
+            name=f"{self.name_prefix}-{self._next_index}",
+            input_queue=self.input_queue,
+            output_queue=self.output_queue,
+            process_fn=self.embed_fn,
+            stage=self.stage
+        )
+        self._next_index += 1
+        return worker
 
     def start(self):
         """Start all workers"""
+        self._started = True
         for worker in self.workers:
             worker.start()
 
     def stop(self):
         """Stop all workers"""
+        self._started = False
         for worker in self.workers:
             worker.stop()
 
+    def size(self) -> int:
+        """Get current number of workers"""
+        return len(self.workers)
+
+    def resize(self, num_workers: int) -> int:
+        """Grow or shrink the pool to num_workers (minimum 1)
+
+        New workers start immediately if the pool is running. Removed
+        workers finish their current item and then exit, so no work is lost.
+
+        Returns:
+            The new pool size
+        """
+        num_workers = max(1, num_workers)
+        with self._resize_lock:
+            while len(self.workers) < num_workers:
+                worker = self._create_worker()
+                self.workers = self.workers + [worker]
+                if self._started:
+                    worker.start()
+            while len(self.workers) > num_workers:
+                worker = self.workers[-1]
+                self.workers = self.workers[:-1]
+                self._retire(worker)
+            return len(self.workers)
+
+    def _retire(self, worker: StageWorker):
+        """Stop a removed worker and keep its counters in the pool totals"""
+        worker.request_stop()
+        self._retired.append(worker)
+
+    def _fold_retired(self):
+        """Move counters of exited workers into the pool totals"""
+        still_running = []
+        for worker in self._retired:
+            if worker.is_alive():
+                still_running.append(worker)
+                continue
+            items, busy = worker.get_service_stats()
+            self._retired_items += items
+            self._retired_busy += busy
+        self._retired = still_running
+
+    def get_service_stats(self) -> Tuple[int, float]:
+        """Get cumulative (items processed, busy seconds) across all workers"""
+        with self._resize_lock:
+            self._fold_retired()
+            counted = self.workers + self._retired
+            items, busy = self._retired_items, self._retired_busy
+        for worker in counted:
+            worker_items, worker_busy = worker.get_service_stats()
+            items += worker_items
+            busy += worker_busy
+        return items, busy
+
     def get_active_jobs(self) -> List[str]:
         """Get list of files currently being embedded"""
         return [
@@ -0,0 +1,267 @@
+"""Durable indexing queue backed by a PostgreSQL table.
+
+Drop-in replacement for IndexingQueue that survives restarts:
+- Pending work is persisted in the indexing_queue table
+- Claims use SELECT ... FOR UPDATE SKIP LOCKED so several ingest
+  processes can share one queue without double-processing
+- Claimed rows carry a lease; leases held by crashed workers expire
+  and the rows become claimable again
+- A row whose lease has expired max_attempts times is marked 'failed'
+  instead of being re-leased, so a file that kills its worker cannot
+  crash-loop the pipeline
+- Duplicate paths are rejected by the UNIQUE(path) constraint
+
+Principles:
+- Same API as IndexingQueue (add, add_many, get, mark_complete, pause/resume)
+- Dependency Injection: config and lease timing injected
+- Pause state stays per-process (it is an operator control, not queue data)
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from config import default_config
+from ingestion.database_factory import DatabaseFactory
+from pipeline.indexing_queue import Priority, QueueItem
+
+logger = logging.getLogger(__name__)
+
+
+CLAIM_SQL = """
+    WITH exhausted AS (
+        UPDATE indexing_queue
+        SET status = 'failed', lease_owner = NULL, lease_expires_at = NULL
+        WHERE status = 'leased' AND lease_expires_at < NOW() AND attempts >= %(max_attempts)s
+    )
+    UPDATE indexing_queue
+    SET status = 'leased',
+        lease_owner = %(owner)s,
+        lease_expires_at = NOW() + %(lease_seconds)s * INTERVAL '1 second',
+        attempts = attempts + 1
+    WHERE id = (
+        SELECT id FROM indexing_queue
+        WHERE (status = 'pending'
+               OR (status = 'leased' AND lease_expires_at < NOW()))
+          AND attempts < %(max_attempts)s
+        ORDER BY priority, id
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING path, priority, force
+"""
+
+# Re-adding a failed path only retries it when reindexing is forced
+INSERT_SQL = """
+    INSERT INTO indexing_queue (path, priority, force) VALUES %s
+    ON CONFLICT (path) DO UPDATE
+    SET status = 'pending', attempts = 0, priority = EXCLUDED.priority, force = TRUE
+    WHERE indexing_queue.status = 'failed' AND EXCLUDED.force
+"""
+
+CLAIMABLE = ("(status = 'pending' OR (status = 'leased' AND lease_expires_at < NOW())) "
+             "AND attempts < %s")
+
+
+class PostgresIndexingQueue:
+    """Priority queue for document indexing persisted in PostgreSQL
+
+    Rows move pending -> leased -> deleted (on mark_complete), or to
+    failed after max_attempts expired leases. A lease is renewed by a
+    heartbeat thread while this process is alive, so only work held by
+    dead processes is reclaimed.
+    """
+
+    def __init__(self, config=default_config.database,
+                 lease_seconds: float = None, poll_interval: float = None,
+                 max_attempts: int = None):
+        self.lease_seconds = lease_seconds or float(os.getenv('QUEUE_LEASE_SECONDS', '300'))
+        self.poll_interval = poll_interval or float(os.getenv('QUEUE_POLL_INTERVAL', '0.5'))
+        self.max_attempts = max_attempts or int(os.getenv('QUEUE_MAX_ATTEMPTS', '3'))
+        self.recovered_work = 0  # Claimable rows found at startup
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.paused = False
+        self.lock = threading.Lock()
+        self._added = threading.Event()
+        self._stop = threading.Event()
+        self.db_conn = DatabaseFactory.create_connection(config)
+        self.conn = self.db_conn.connect()
+        self._log_recovered_work()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop, daemon=True, name="QueueLeaseHeartbeat"
+        )
+        self._heartbeat.start()
+
+    # ============ Queue API ============
+
+    def add(self, path: Path, priority: Priority = Priority.NORMAL, force: bool = False):
+        """Add file to queue with priority (skip if already queued)"""
+        self.add_many([path], priority, force=force)
+
+    def add_many(self, paths: List[Path], priority: Priority = Priority.NORMAL, force: bool = False):
+        """Add multiple files in one statement (duplicates skipped by UNIQUE(path))
+
+        A failed path is reset to pending only when force is set.
+        """
+        if not paths:
+            return
+        rows = [(str(path), priority.value, force) for path in paths]
+        with self.lock:
+            self._execute_values(INSERT_SQL, rows)
+        self._added.set()
+
+    def get(self, timeout: float = 1.0) -> Optional[QueueItem]:
+        """Claim next item (respects pause state)
+
+        Returns None if paused or nothing claimable within timeout.
+        The row stays leased until mark_complete() is called.
+        """
+        with self.lock:
+            if self.paused:
+                return None
+
+        item = self._claim()
+        if item is None and timeout:
+            self._added.clear()
+            self._added.wait(min(timeout, self.poll_interval))
+            item = self._claim()
+        return item
+
+    def mark_complete(self, path: Path):
+        """Remove completed file from the queue table"""
+        with self.lock:
+            self._execute("DELETE FROM indexing_queue WHERE path = %s", (str(path),))
+
+    def pause(self):
+        """Pause queue processing"""
+        with self.lock:
+            self.paused = True
+
+    def resume(self):
+        """Resume queue processing"""
+        with self.lock:
+            self.paused = False
+
+    def is_paused(self) -> bool:
+        """Check if queue is paused"""
+        with self.lock:
+            return self.paused
+
+    def size(self) -> int:
+        """Get number of files waiting to be claimed"""
+        with self.lock:
+            row = self._fetchone(
+                f"SELECT COUNT(*) FROM indexing_queue WHERE {CLAIMABLE}", (self.max_attempts,)
+            )
+        return row[0] if row else 0
+
+    def failed_count(self) -> int:
+        """Get number of files given up on after max_attempts"""
+        with self.lock:
+            row = self._fetchone("SELECT COUNT(*) FROM indexing_queue WHERE status = 'failed'")
+        return row[0] if row else 0
+
+    def is_empty(self) -> bool:
+        """Check if queue is empty"""
+        return self.size() == 0
+
+    def clear(self):
+        """Clear all items from queue"""
+        with self.lock:
+            self._execute("DELETE FROM indexing_queue")
+
+    def close(self):
+        """Stop lease heartbeat and close connection"""
+        self._stop.set()
+        self._heartbeat.join(timeout=5.0)
+        self.db_conn.close()
+
+    # ============ Leases ============
+
+    def _claim(self) -> Optional[QueueItem]:
+        """Atomically lease the highest-priority claimable row"""
+        with self.lock:
+            row = self._fetchone(CLAIM_SQL, {
+                'owner': self.owner,
+                'lease_seconds': self.lease_seconds,
+                'max_attempts': self.max_attempts,
+            })
+        if not row:
+            return None
+        path, priority, force = row
+        return QueueItem(priority=priority, path=Path(path), force=force)
+
+    def renew_leases(self) -> int:
+        """Extend leases held by this process; returns rows renewed"""
+        with self.lock:
+            return self._execute(
+                "UPDATE indexing_queue "
+                "SET lease_expires_at = NOW() + %s * INTERVAL '1 second' "
+                "WHERE status = 'leased' AND lease_owner = %s",
+                (self.lease_seconds, self.owner)
+            )
+
+    def _heartbeat_loop(self):
+        """Renew leases at a third of the lease period"""
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                self.renew_leases()
+            except Exception as e:
+                logger.warning(f"[IndexingQueue] Lease renewal failed: {e}")
+
+    def _log_recovered_work(self):
+        """Report rows left by earlier runs (sets recovered_work)"""
+        with self.lock:
+            row = self._fetchone(
+                "SELECT COUNT(*) FILTER (WHERE status = 'pending'), "
+                "COUNT(*) FILTER (WHERE status = 'leased' AND lease_expires_at < NOW() "
+                "AND attempts < %s), "
+                "COUNT(*) FILTER (WHERE status = 'failed') "
+                "FROM indexing_queue",
+                (self.max_attempts,)
+            )
+        pending, expired, failed = row if row else (0, 0, 0)
+        self.recovered_work = pending + expired
+        if pending or expired:
+            print(f"[IndexingQueue] Recovered {pending} pending, {expired} expired-lease files")
+        if failed:
+            print(f"[IndexingQueue] {failed} files failed after {self.max_attempts} attempts "
+                  "(re-queue with force to retry)")
+
+    # ============ SQL helpers (caller holds self.lock) ============
+
+    def _execute(self, sql: str, params=None) -> int:
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(sql, params)
+                count = cur.rowcount
+            self.conn.commit()
+            return count
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def _execute_values(self, sql: str, rows):
+        from psycopg2.extras import execute_values
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, sql, rows)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def _fetchone(self, sql: str, params=None):
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(sql, params)
+                row = cur.fetchone()
+            self.conn.commit()
+            return row
+        except Exception:
+            self.conn.rollback()
+            raise
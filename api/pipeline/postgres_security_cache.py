@@ -2,15 +2,32 @@
 
 Caches ClamAV/YARA/hash blacklist scan results by file hash to avoid
 re-scanning unchanged files.
+
+Performance:
+- All current-version entries are loaded into an in-memory map in one
+  SELECT (on first use, or explicitly via prefetch() at scan start);
+  lookups never touch the database
+- Writes update the map immediately (every thread sees them) and are
+  buffered, then flushed as one batched upsert per FLUSH_SIZE entries
+  or FLUSH_INTERVAL seconds, at scan end, and at exit
+- Database I/O never holds the map lock: a flush swaps the buffer out
+  under it and writes outside, so lookups don't wait on the upsert
+- Stats are computed from the map (per-version counts from the table)
 """
+import atexit
 import json
-from typing import Optional
+import logging
+import threading
+import time
+from typing import Dict, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
 from config import default_config
 from ingestion.database_factory import DatabaseFactory
 
+logger = logging.getLogger(__name__)
+
 
 # Scanner version - bump this to invalidate all cached results
 SCANNER_VERSION = "1.0.0"
@@ -30,11 +47,25 @@ class CachedScanResult:
 
 
 class PostgresSecurityScanCache:
-    """Cache for security scan results using PostgreSQL."""
+    """Cache for security scan results using PostgreSQL.
+
+    Thread-safe: scanner workers share one in-memory view.
+    """
+
+    # Buffered writes per batched upsert
+    FLUSH_SIZE = 500
+    # Max seconds a buffered write waits for a flush
+    FLUSH_INTERVAL = 5.0
 
     def __init__(self, config=default_config.database):
         self.config = config
         self.db_conn = None
+        self._lock = threading.Lock()  # Guards the in-memory map and buffer
+        self._db_lock = threading.Lock()  # Serializes use of the connection
+        self._entries: Optional[Dict[str, CachedScanResult]] = None
+        self._pending: Dict[str, CachedScanResult] = {}
+        self._written: Optional[Dict[str, CachedScanResult]] = None  # Set during a load
+        self._last_flush = time.monotonic()
 
     def _get_connection(self):
         """Get database connection"""
@@ -48,21 +79,70 @@ class PostgresSecurityScanCache:
             self.db_conn.close()
             self.db_conn = None
 
-    def get(self, file_hash: str) -> Optional[CachedScanResult]:
-        """Get cached scan result for file hash"""
-        conn = self._get_connection()
+    @staticmethod
+    def _rollback(conn):
+        """Roll back after a failed statement (connection may be gone)"""
         try:
+            if conn is not None:
+                conn.rollback()
+        except Exception:
+            pass
+
+    def prefetch(self) -> int:
+        """(Re)load all current-version entries in one query
+
+        Call at scan start to pick up entries written by other processes.
+
+        Returns:
+            Number of entries loaded
+        """
+        self.flush()
+        with self._db_lock:
+            return self._load()
+
+    def _load(self) -> int:
+        """SELECT current-version entries into the map (caller holds _db_lock)
+
+        Entries set while the query runs are kept (they may not be in its result).
+        """
+        with self._lock:
+            self._written = {}
+        entries = {}
+        conn = None
+        try:
+            conn = self._get_connection()
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT file_hash, is_valid, severity, reason, validation_check,
                            matches_json, scanned_at, scanner_version
                     FROM security_scan_cache
-                    WHERE file_hash = %s AND scanner_version = %s
-                """, (file_hash, SCANNER_VERSION))
-                row = cur.fetchone()
-                return self._row_to_result(row) if row else None
-        except Exception:
-            return None
+                    WHERE scanner_version = %s
+                """, (SCANNER_VERSION,))
+                for row in cur.fetchall():
+                    entries[row[0]] = self._row_to_result(row)
+            conn.commit()
+        except Exception as e:
+            self._rollback(conn)
+            logger.debug("Security cache prefetch failed: %s", e)
+        with self._lock:
+            entries.update(self._written)
+            self._written = None
+            self._entries = entries
+        return len(entries)
+
+    def _loaded(self) -> Dict[str, CachedScanResult]:
+        """In-memory entries, loading them on first use"""
+        if self._entries is None:
+            with self._db_lock:
+                if self._entries is None:
+                    self._load()
+        return self._entries
+
+    def get(self, file_hash: str) -> Optional[CachedScanResult]:
+        """Get cached scan result for file hash"""
+        entries = self._loaded()
+        with self._lock:
+            return entries.get(file_hash)
 
     def _row_to_result(self, row) -> CachedScanResult:
         """Convert database row to CachedScanResult"""
@@ -81,73 +161,147 @@ class PostgresSecurityScanCache:
 
     def set(self, file_hash: str, is_valid: bool, severity: Optional[str],
             reason: str, validation_check: str, matches: list = None):
-        """Cache scan result for file hash"""
-        conn = self._get_connection()
-        now = datetime.utcnow().isoformat()
-        matches_json = json.dumps(matches or [])
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO security_scan_cache
-                (file_hash, is_valid, severity, reason, validation_check,
-                 matches_json, scanned_at, scanner_version)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (file_hash) DO UPDATE SET
-                    is_valid = EXCLUDED.is_valid,
-                    severity = EXCLUDED.severity,
-                    reason = EXCLUDED.reason,
-                    validation_check = EXCLUDED.validation_check,
-                    matches_json = EXCLUDED.matches_json,
-                    scanned_at = EXCLUDED.scanned_at,
-                    scanner_version = EXCLUDED.scanner_version
-            """, (file_hash, is_valid, severity, reason, validation_check,
-                  matches_json, now, SCANNER_VERSION))
-        conn.commit()
-
-    def clear(self):
-        """Clear all cached results"""
-        conn = self._get_connection()
-        with conn.cursor() as cur:
-            cur.execute("DELETE FROM security_scan_cache")
-        conn.commit()
+        """Cache scan result for file hash (buffered write)"""
+        result = CachedScanResult(
+            file_hash=file_hash,
+            is_valid=is_valid,
+            severity=severity,
+            reason=reason,
+            validation_check=validation_check,
+            matches=matches or [],
+            scanned_at=datetime.utcnow().isoformat(),
+            scanner_version=SCANNER_VERSION
+        )
+        self._loaded()
+        with self._lock:
+            self._entries[file_hash] = result
+            if self._written is not None:
+                self._written[file_hash] = result
+            self._pending[file_hash] = result
+            overdue = time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+            due = len(self._pending) >= self.FLUSH_SIZE or overdue
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered results in one batched upsert
+
+        The buffer is swapped out under the map lock and written outside
+        it, so lookups and new writes don't wait on the database.
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        rows = [
+            (r.file_hash, r.is_valid, r.severity, r.reason, r.validation_check,
+             json.dumps(r.matches), r.scanned_at, r.scanner_version)
+            for r in pending.values()
+        ]
+        # Dropped on failure: a lost entry only costs a re-scan
+        with self._db_lock:
+            conn = None
+            try:
+                from psycopg2.extras import execute_values
+                conn = self._get_connection()
+                with conn.cursor() as cur:
+                    execute_values(cur, """
+                        INSERT INTO security_scan_cache
+                        (file_hash, is_valid, severity, reason, validation_check,
+                         matches_json, scanned_at, scanner_version)
+                        VALUES %s
+                        ON CONFLICT (file_hash) DO UPDATE SET
+                            is_valid = EXCLUDED.is_valid,
+                            severity = EXCLUDED.severity,
+                            reason = EXCLUDED.reason,
+                            validation_check = EXCLUDED.validation_check,
+                            matches_json = EXCLUDED.matches_json,
+                            scanned_at = EXCLUDED.scanned_at,
+                            scanner_version = EXCLUDED.scanner_version
+                    """, rows, page_size=self.FLUSH_SIZE)
+                conn.commit()
+            except Exception as e:
+                self._rollback(conn)
+                logger.warning("Security cache flush failed (%d entries): %s", len(rows), e)
+                return 0
+            return len(rows)
+
+    def clear(self) -> int:
+        """Clear all cached results
+
+        Returns:
+            Number of entries cleared
+        """
+        with self._lock:
+            self._pending.clear()
+            self._entries = {}
+        with self._db_lock:
+            conn = self._get_connection()
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM security_scan_cache")
+                count = cur.rowcount
+            conn.commit()
+            return count
 
     def clear_outdated(self):
         """Clear results from old scanner versions"""
-        conn = self._get_connection()
-        with conn.cursor() as cur:
-            cur.execute(
-                "DELETE FROM security_scan_cache WHERE scanner_version != %s",
-                (SCANNER_VERSION,)
-            )
-            count = cur.rowcount
-        conn.commit()
-        return count
+        with self._db_lock:
+            conn = self._get_connection()
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM security_scan_cache WHERE scanner_version != %s",
+                    (SCANNER_VERSION,)
+                )
+                count = cur.rowcount
+            conn.commit()
+            return count
+
+    def stats(self) -> dict:
+        """Cache statistics for the current scanner version (from memory)
+
+        Returns:
+            Dict with total_entries, valid_count, invalid_count, oldest/newest entry
+        """
+        loaded = self._loaded()
+        with self._lock:
+            entries = list(loaded.values())
+        valid = sum(1 for e in entries if e.is_valid)
+        scanned = [e.scanned_at for e in entries]
+        return {
+            'total_entries': len(entries),
+            'valid_count': valid,
+            'invalid_count': len(entries) - valid,
+            'oldest_entry': min(scanned) if scanned else None,
+            'newest_entry': max(scanned) if scanned else None,
+            'scanner_version': SCANNER_VERSION
+        }
 
     def get_stats(self) -> dict:
-        """Get cache statistics"""
-        conn = self._get_connection()
-        with conn.cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM security_scan_cache")
-            total = cur.fetchone()[0]
-
-            cur.execute("""
-                SELECT is_valid, COUNT(*)
-                FROM security_scan_cache
-                GROUP BY is_valid
-            """)
-            by_validity = dict(cur.fetchall())
-
-            cur.execute("""
-                SELECT scanner_version, COUNT(*)
-                FROM security_scan_cache
-                GROUP BY scanner_version
-            """)
-            by_version = dict(cur.fetchall())
+        """Get cache statistics
 
+        Counts are for the current scanner version (from memory); by_version
+        counts every version still in the table (one GROUP BY query).
+        """
+        stats = self.stats()
+        self.flush()
+        with self._db_lock:
+            conn = self._get_connection()
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT scanner_version, COUNT(*)
+                    FROM security_scan_cache
+                    GROUP BY scanner_version
+                """)
+                by_version = dict(cur.fetchall())
+            conn.commit()
         return {
-            'total_entries': total,
-            'valid_files': by_validity.get(True, 0),
-            'invalid_files': by_validity.get(False, 0),
+            'total_entries': stats['total_entries'],
+            'valid_files': stats['valid_count'],
+            'invalid_files': stats['invalid_count'],
             'current_version': SCANNER_VERSION,
             'by_version': by_version
         }
@@ -158,11 +312,14 @@ SecurityScanCache = PostgresSecurityScanCache
 
 # Singleton instance
 _cache = None
+_cache_lock = threading.Lock()
 
 
 def get_security_cache() -> PostgresSecurityScanCache:
     """Get global security scan cache instance"""
     global _cache
-    if _cache is None:
-        _cache = PostgresSecurityScanCache()
+    with _cache_lock:
+        if _cache is None:
+            _cache = PostgresSecurityScanCache()
+            atexit.register(_cache.flush)
     return _cache
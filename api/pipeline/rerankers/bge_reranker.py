@@ -2,16 +2,64 @@
 
 Uses BAAI/bge-reranker-large (560MB) for CPU-viable reranking.
 Expected improvement: +20-30% retrieval quality.
+
+CPU mode (mode="cpu") makes cross-encoder reranking usable without a GPU:
+- ONNX Runtime backend with a dynamically int8-quantized model
+- Passages truncated to a window around query-term hits (max_length)
+- Length-sorted batches capped by a token budget (less padding)
+- Wall-clock budget: candidates not scored in time keep their fused rank
 """
 
 import logging
+import os
+import re
+import threading
 import time
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from pipeline.interfaces.reranker import RerankerInterface
+from pipeline.rerankers.score_cache import RerankScoreCache
 
 logger = logging.getLogger(__name__)
 
+# Rough chars-per-token ratio for English text with BERT-style tokenizers
+CHARS_PER_TOKEN = 4
+
+_WORD = re.compile(r"\w{3,}")
+
+
+def focus_passage(text: str, query: str, max_chars: int) -> str:
+    """Cut text to max_chars around the densest cluster of query-term hits.
+
+    Cross-encoders truncate from the end, which drops the matching part of
+    long chunks; centring the window on the hits keeps it.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    terms = {word.lower() for word in _WORD.findall(query)}
+    lowered = text.lower()
+    hits = [m.start() for m in _WORD.finditer(lowered) if m.group() in terms]
+    if not hits:
+        return text[:max_chars]
+
+    # Window starting a little before each hit; keep the one covering most hits
+    lead = max_chars // 4
+    best_start, best_count = 0, -1
+    for hit in hits:
+        start = min(max(0, hit - lead), len(text) - max_chars)
+        count = sum(1 for h in hits if start <= h < start + max_chars)
+        if count > best_count:
+            best_start, best_count = start, count
+
+    # Snap to a word boundary so the window does not open mid-word
+    if best_start > 0:
+        space = text.find(" ", best_start, best_start + 32)
+        if space != -1:
+            best_start = space + 1
+    return text[best_start:best_start + max_chars]
+
 
 class BGEReranker(RerankerInterface):
     """BGE CrossEncoder reranker for search result reranking.
@@ -22,27 +70,110 @@ class BGEReranker(RerankerInterface):
 
     DEFAULT_MODEL = "BAAI/bge-reranker-large"
 
-    def __init__(self, model_name: Optional[str] = None, enable_timing: bool = False):
+    # Per-mode defaults; None means "model default / unlimited"
+    MODE_DEFAULTS: Dict[str, Dict[str, Optional[int]]] = {
+        "default": {"max_length": None, "batch_tokens": None, "time_budget_ms": None},
+        "cpu": {"max_length": 256, "batch_tokens": 4096, "time_budget_ms": 800},
+    }
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        enable_timing: bool = False,
+        mode: str = "default",
+        max_length: Optional[int] = None,
+        batch_tokens: Optional[int] = None,
+        time_budget_ms: Optional[int] = None,
+        quantization: str = "avx512_vnni",
+        onnx_dir: Optional[str] = None,
+        cache_size: int = 10000,
+    ):
         """Initialize BGE reranker.
 
         Args:
             model_name: CrossEncoder model name (default: bge-reranker-large)
             enable_timing: If True, log reranking timing diagnostics
+            mode: "default" (PyTorch, full passages) or "cpu" (ONNX int8)
+            max_length: Tokens per query+passage pair (overrides mode default)
+            batch_tokens: Token budget per predict() batch (overrides mode default)
+            time_budget_ms: Scoring deadline, 0 = none (overrides mode default)
+            quantization: ONNX dynamic quantization target for cpu mode
+            onnx_dir: Where quantized models are exported (RERANKING_ONNX_DIR)
+            cache_size: Cached (query, chunk) scores, 0 disables the cache
         """
+        if mode not in self.MODE_DEFAULTS:
+            raise ValueError(f"Unknown reranking mode: {mode}")
+        defaults = self.MODE_DEFAULTS[mode]
+
         self._model_name = model_name or self.DEFAULT_MODEL
         self._model = None
         self._enable_timing = enable_timing
+        self._load_lock = threading.Lock()
+        self._mode = mode
+        self._max_length = max_length if max_length is not None else defaults["max_length"]
+        self._batch_tokens = batch_tokens if batch_tokens is not None else defaults["batch_tokens"]
+        budget = time_budget_ms if time_budget_ms is not None else defaults["time_budget_ms"]
+        self._time_budget = budget / 1000 if budget else None
+        self._quantization = quantization
+        self._onnx_dir = Path(onnx_dir or os.getenv("RERANKING_ONNX_DIR", "/app/data/reranker_onnx"))
+        # Scores depend on model, precision and truncation, so all are in the key
+        namespace = f"{self._model_name}:{mode}:{self._max_length}"
+        self._cache = RerankScoreCache(namespace, cache_size) if cache_size > 0 else None
 
     def _load_model(self):
-        """Lazy-load the CrossEncoder model."""
-        if self._model is None:
-            from sentence_transformers import CrossEncoder
+        """Lazy-load the CrossEncoder model (once, even if warmup is in flight)."""
+        if self._model is not None:
+            return
+        with self._load_lock:
+            if self._model is None:
+                logger.info(f"Loading reranker model: {self._model_name} (mode: {self._mode})")
+                start = time.perf_counter()
+                if self._mode == "cpu":
+                    self._model = self._load_quantized()
+                else:
+                    self._model = self._cross_encoder_class()(
+                        self._model_name, max_length=self._max_length
+                    )
+                elapsed = time.perf_counter() - start
+                logger.info(f"Reranker model loaded in {elapsed:.2f}s")
 
-            logger.info(f"Loading reranker model: {self._model_name}")
-            start = time.perf_counter()
-            self._model = CrossEncoder(self._model_name)
-            elapsed = time.perf_counter() - start
-            logger.info(f"Reranker model loaded in {elapsed:.2f}s")
+    @staticmethod
+    def _cross_encoder_class():
+        from sentence_transformers import CrossEncoder
+        return CrossEncoder
+
+    def _load_quantized(self):
+        """Load int8 ONNX model, exporting it on first use.
+
+        Falls back to the PyTorch model if ONNX export is unavailable
+        (needs sentence-transformers[onnx]).
+        """
+        cross_encoder = self._cross_encoder_class()
+        local_dir = self._onnx_dir / self._model_name.replace("/", "--")
+        file_name = f"onnx/model_qint8_{self._quantization}.onnx"
+        try:
+            if not (local_dir / file_name).exists():
+                self._export_quantized(cross_encoder, local_dir)
+            return cross_encoder(
+                str(local_dir), backend="onnx", max_length=self._max_length,
+                model_kwargs={"file_name": file_name}
+            )
+        except Exception as e:
+            logger.warning(f"ONNX int8 reranker unavailable ({e}), using PyTorch backend")
+            return cross_encoder(self._model_name, max_length=self._max_length)
+
+    def _export_quantized(self, cross_encoder, local_dir: Path):
+        """Export model to ONNX and quantize weights to int8 (one-off)"""
+        from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+
+        logger.info(f"Exporting {self._model_name} to ONNX int8 ({self._quantization})")
+        model = cross_encoder(self._model_name, backend="onnx", max_length=self._max_length)
+        model.save_pretrained(str(local_dir))
+        export_dynamic_quantized_onnx_model(model, self._quantization, str(local_dir))
+
+    def warmup(self) -> None:
+        """Load the CrossEncoder now so the first query doesn't pay for it."""
+        self._load_model()
 
     def rerank(
         self,
@@ -58,7 +189,9 @@ class BGEReranker(RerankerInterface):
             top_k: Maximum number of results to return
 
         Returns:
-            Top-k candidates sorted by reranker score (best first)
+            Top-k candidates sorted by reranker score (best first). If the
+            time budget runs out, unscored candidates keep their original
+            (fused) positions and get rerank_score None.
         """
         if not candidates:
             return []
@@ -70,31 +203,104 @@ class BGEReranker(RerankerInterface):
 
         start = time.perf_counter()
 
-        # Build query-document pairs for scoring
-        pairs = [(query, c.get("content", "")) for c in candidates]
+        # Only pairs without a cached score go to the model
+        if self._cache is not None:
+            scores = self._cache.lookup(query, candidates)
+        else:
+            scores = [None] * len(candidates)
+        pending = [i for i, score in enumerate(scores) if score is None]
 
-        # Score all pairs
-        scores = self._model.predict(pairs, show_progress_bar=False)
+        if pending and self._is_batched():
+            self._score_batched(query, candidates, pending, scores, start)
+        elif pending:
+            # Build query-document pairs and score them in one call
+            pairs = [(query, candidates[i].get("content", "")) for i in pending]
+            for i, score in zip(pending, self._model.predict(pairs, show_progress_bar=False)):
+                scores[i] = float(score)
 
-        # Attach scores and sort
-        scored = list(zip(candidates, scores))
-        scored.sort(key=lambda x: x[1], reverse=True)
+        if self._cache is not None and pending:
+            self._cache.store(query, candidates, pending, scores)
 
         # Take top_k and add rerank_score to each result
         results = []
-        for candidate, score in scored[:top_k]:
-            result = dict(candidate)
-            result["rerank_score"] = float(score)
+        for index in self._rank(scores)[:top_k]:
+            result = dict(candidates[index])
+            result["rerank_score"] = scores[index]
             results.append(result)
 
         if self._enable_timing:
             elapsed = time.perf_counter() - start
+            scored = sum(1 for s in scores if s is not None)
+            cached = len(candidates) - len(pending)
             logger.info(
-                f"Reranked {len(candidates)} candidates to top {top_k} in {elapsed:.3f}s"
+                f"Reranked {scored}/{len(candidates)} candidates ({cached} cached) "
+                f"to top {top_k} in {elapsed:.3f}s"
             )
 
         return results
 
+    def _is_batched(self) -> bool:
+        return bool(self._max_length or self._batch_tokens or self._time_budget)
+
+    def _score_batched(self, query: str, candidates: List[dict], pending: List[int],
+                       scores: List[Optional[float]], start: float):
+        """Score focused passages of pending candidates in token-budgeted batches
+
+        Fills scores in place; stops at the time budget.
+        """
+        max_chars = (self._max_length or 512) * CHARS_PER_TOKEN - len(query)
+        passages = {
+            i: focus_passage(candidates[i].get("content", ""), query, max(max_chars, CHARS_PER_TOKEN))
+            for i in pending
+        }
+
+        for batch in self._batches(query, passages, pending):
+            if self._time_budget and time.perf_counter() - start >= self._time_budget:
+                break
+            pairs = [(query, passages[i]) for i in batch]
+            batch_scores = self._model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+            for i, score in zip(batch, batch_scores):
+                scores[i] = float(score)
+
+    def _batches(self, query: str, passages, indices: Optional[List[int]] = None) -> List[List[int]]:
+        """Group candidate indices into length-sorted, token-budgeted batches.
+
+        Candidates are taken in windows of fused rank so the best fused
+        candidates are scored first when a time budget is set; within a
+        window they are sorted by length so each batch pads to similar sizes.
+        """
+        if indices is None:
+            indices = list(range(len(passages)))
+        max_length = self._max_length or 512
+        budget = self._batch_tokens or max_length * len(indices)
+
+        def tokens(i: int) -> int:
+            return min(max_length, (len(query) + len(passages[i])) // CHARS_PER_TOKEN + 3)
+
+        window = max(1, budget // max_length) * 4
+        batches = []
+        for offset in range(0, len(indices), window):
+            batch: List[int] = []
+            for i in sorted(indices[offset:offset + window], key=tokens):
+                # Sorted ascending, so the new item is the longest in the batch
+                if batch and (len(batch) + 1) * tokens(i) > budget:
+                    batches.append(batch)
+                    batch = []
+                batch.append(i)
+            if batch:
+                batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _rank(scores: List[Optional[float]]) -> List[int]:
+        """Order candidate indices: scored ones by score, unscored keep their slot"""
+        scored = sorted(
+            (i for i, s in enumerate(scores) if s is not None),
+            key=lambda i: scores[i], reverse=True
+        )
+        by_score = iter(scored)
+        return [next(by_score) if s is not None else i for i, s in enumerate(scores)]
+
     @property
     def model_name(self) -> str:
         return self._model_name
@@ -0,0 +1,89 @@
+"""Cross-encoder score cache.
+
+Interactive clients (IDE integrations, MCP query_kb) re-issue the same or
+overlapping queries with different top_k; each pair's cross-encoder score
+only depends on the model, the query and the chunk, so it is cached.
+
+Principles:
+- Keyed by (model namespace, normalized query, chunk_id)
+- Each entry stores a fingerprint of the content it scored: a chunk that
+  was deleted and re-indexed (or whose id was reused) no longer matches
+  and is re-scored. This also holds when another process (ingest worker,
+  RAG_MODE=query replica) changed the database.
+- Bounded LRU, thread-safe (queries run concurrently)
+"""
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from metrics import record_cache_lookup
+
+CacheKey = Tuple[str, str, object]
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive query form"""
+    return " ".join(query.lower().split())
+
+
+class RerankScoreCache:
+    """LRU cache of cross-encoder scores for (query, chunk) pairs"""
+
+    def __init__(self, namespace: str, max_size: int = 10000):
+        self.namespace = namespace
+        self.max_size = max_size
+        self._entries: "OrderedDict[CacheKey, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, query: str, candidates: List[dict]) -> List[Optional[float]]:
+        """Get cached score per candidate (None = not cached)"""
+        normalized = normalize_query(query)
+        scores: List[Optional[float]] = []
+        with self._lock:
+            for candidate in candidates:
+                scores.append(self._get(normalized, candidate))
+        return scores
+
+    def store(self, query: str, candidates: List[dict], indices: Iterable[int],
+              scores: List[Optional[float]]):
+        """Cache scores of candidates[i] for i in indices (unscored skipped)"""
+        if self.max_size <= 0:
+            return
+        normalized = normalize_query(query)
+        with self._lock:
+            for i in indices:
+                chunk_id = candidates[i].get("chunk_id")
+                if chunk_id is None or scores[i] is None:
+                    continue
+                key = (self.namespace, normalized, chunk_id)
+                self._entries[key] = (_fingerprint(candidates[i]), scores[i])
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, normalized: str, candidate: dict) -> Optional[float]:
+        """Look up one candidate (caller holds lock)"""
+        chunk_id = candidate.get("chunk_id")
+        if chunk_id is None:
+            return None
+        key = (self.namespace, normalized, chunk_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != _fingerprint(candidate):
+            record_cache_lookup("rerank", False)
+            return None
+        self._entries.move_to_end(key)
+        record_cache_lookup("rerank", True)
+        return entry[1]
+
+
+def _fingerprint(candidate: dict) -> int:
+    """Identify the content a score was computed for"""
+    return hash(candidate.get("content", ""))
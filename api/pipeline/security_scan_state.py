@@ -0,0 +1,114 @@
+"""Incremental security scan state for PostgreSQL
+
+Records the stat signature (size, mtime_ns, inode) of every file whose
+last scan was clean. A repeat scan skips files whose signature still
+matches, so an unchanged knowledge base is neither read nor hashed.
+
+Signatures are stored per ruleset: when the scanner version, hash
+blacklist, allowlist or YARA rules change, all files are scanned again.
+Files with findings are never recorded, so they are re-reported on
+every scan.
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from config import default_config
+from ingestion.database_factory import DatabaseFactory
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[int, int, int]
+
+
+def stat_signature(path: Path) -> Optional[Signature]:
+    """(size, mtime_ns, inode) of a file, None if it cannot be stat'ed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class ScanStateStore:
+    """Stat signatures of files whose last scan was clean"""
+
+    def __init__(self, config=default_config.database):
+        self.config = config
+        self.db_conn = None
+
+    def _get_connection(self):
+        """Get database connection"""
+        if self.db_conn is None:
+            self.db_conn = DatabaseFactory.create_connection(self.config)
+        return self.db_conn.connect()
+
+    def load(self, ruleset: str) -> Dict[str, Signature]:
+        """Signatures recorded under ruleset (empty if unavailable)"""
+        conn = None
+        try:
+            conn = self._get_connection()
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT path, size, mtime_ns, inode FROM security_scan_files "
+                    "WHERE ruleset = %s",
+                    (ruleset,)
+                )
+                rows = cur.fetchall()
+            conn.commit()
+            return {row[0]: (row[1], row[2], row[3]) for row in rows}
+        except Exception as e:
+            self._rollback(conn)
+            logger.debug("Scan state unavailable, scanning all files: %s", e)
+            return {}
+
+    def record(self, ruleset: str, clean: Dict[str, Signature], dirty: Iterable[str] = ()):
+        """Store clean files' signatures and forget files with findings"""
+        dirty = list(dirty)
+        if not clean and not dirty:
+            return
+        conn = None
+        try:
+            from psycopg2.extras import execute_values
+            conn = self._get_connection()
+            with conn.cursor() as cur:
+                if clean:
+                    execute_values(cur, """
+                        INSERT INTO security_scan_files (path, size, mtime_ns, inode, ruleset)
+                        VALUES %s
+                        ON CONFLICT (path) DO UPDATE SET
+                            size = EXCLUDED.size,
+                            mtime_ns = EXCLUDED.mtime_ns,
+                            inode = EXCLUDED.inode,
+                            ruleset = EXCLUDED.ruleset,
+                            scanned_at = CURRENT_TIMESTAMP
+                    """, [(path, *sig, ruleset) for path, sig in clean.items()], page_size=1000)
+                if dirty:
+                    cur.execute(
+                        "DELETE FROM security_scan_files WHERE path = ANY(%s)", (dirty,)
+                    )
+            conn.commit()
+        except Exception as e:
+            self._rollback(conn)
+            logger.warning("Failed to record security scan state: %s", e)
+
+    def clear(self):
+        """Forget all signatures (next scan is a full scan)"""
+        conn = None
+        try:
+            conn = self._get_connection()
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM security_scan_files")
+            conn.commit()
+        except Exception as e:
+            self._rollback(conn)
+            logger.warning("Failed to clear security scan state: %s", e)
+
+    @staticmethod
+    def _rollback(conn):
+        try:
+            if conn is not None:
+                conn.rollback()
+        except Exception:
+            pass
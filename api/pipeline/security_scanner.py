@@ -2,21 +2,40 @@
 
 Extracted from routes/security.py to follow Single Responsibility Principle.
 Each method is focused and under 20 lines for maintainability.
+
+Incremental, process-parallel scans:
+- Files whose (size, mtime_ns, inode) matches their last clean scan are
+  skipped without being read (ScanStateStore)
+- Changed files are validated on a process pool sized to the cores
+  (YARA matching and archive inspection are CPU-bound); small batches
+  are scanned in-process on threads
+- Results stream into a ScanProgress as they complete
 """
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import hashlib
+import multiprocessing
+import multiprocessing.util
+import os
 import threading
-import sqlite3
 
+from config import default_config
+from ingestion.clamd_client import ClamdPool
 from ingestion.file_type_validator import FileTypeValidator
 from ingestion.validation_result import SecuritySeverity
 from ingestion.helpers import FileHasher
+from metrics import metrics
 from pipeline.quarantine_manager import QuarantineManager, QUARANTINE_CHECKS
+from pipeline.security_scan_state import ScanStateStore, stat_signature
 
 
-SCAN_WORKERS = 8
+SCAN_WORKERS = int(os.getenv('SECURITY_SCAN_WORKERS', '0')) or os.cpu_count() or 1
+# Fewer changed files than this are scanned in-process (pool start-up costs more)
+PROCESS_POOL_MIN_FILES = 64
+# Files per task sent to a scan process
+SCAN_BATCH_SIZE = 32
 SUPPORTED_EXTENSIONS = [
     '.pdf', '.md', '.markdown', '.docx', '.epub', '.py', '.java',
     '.ts', '.tsx', '.js', '.jsx', '.cs', '.go', '.ipynb'
@@ -33,6 +52,7 @@ class ScanResult:
     validation_check: str
     matches: List[Any] = field(default_factory=list)
     file_hash: Optional[str] = None
+    complete: bool = True  # False if ClamAV or YARA was skipped
 
 
 @dataclass
@@ -43,6 +63,7 @@ class ScanProgress:
     clean: int = 0
     critical: int = 0
     warnings: int = 0
+    unchanged: int = 0  # Skipped: unchanged since last clean scan
 
 
 @dataclass
@@ -108,7 +129,8 @@ class FileScannerWorker:
                 reason=result.reason,
                 validation_check=result.validation_check,
                 matches=result.matches,
-                file_hash=file_hash
+                file_hash=file_hash,
+                complete=result.complete
             )
         except Exception as e:
             return self._error_result(file_path, e)
@@ -130,6 +152,26 @@ class FileScannerWorker:
         )
 
 
+# Scanner of the current scan process (see _init_scan_process)
+_process_worker: Optional[FileScannerWorker] = None
+
+
+def _init_scan_process():
+    """Create this process's scanner; flush its scan cache when it exits"""
+    global _process_worker
+    metrics.enable_child_mode()  # Spawned: the at-fork hook does not run
+    _process_worker = FileScannerWorker()
+    cache = SecurityScanner._scan_cache()
+    if cache:
+        # Pool workers exit without running atexit handlers
+        multiprocessing.util.Finalize(cache, cache.flush, exitpriority=10)
+
+
+def _scan_batch(files: List[Path]) -> List[ScanResult]:
+    """Scan a batch of files in a scan process"""
+    return [_process_worker.scan(file_path) for file_path in files]
+
+
 class ResultClassifier:
     """Classifies scan results into clean/critical/warning"""
 
@@ -155,64 +197,74 @@ class ResultClassifier:
 
 
 class QuarantineHandler:
-    """Handles quarantine operations for critical findings"""
+    """Handles quarantine operations for critical findings
 
-    def __init__(self, kb_path: Path, db_path: str):
+    Files are moved to quarantine one by one; their documents are then
+    removed from the index in one set-based transaction through the
+    configured backend, and search caches are invalidated once.
+    """
+
+    def __init__(self, kb_path: Path, vector_store=None, query_cache=None):
+        """
+        Args:
+            kb_path: Knowledge base root
+            vector_store: Running VectorStore (opened on demand if None)
+            query_cache: QueryCache to clear after documents are removed
+        """
         self.quarantine = QuarantineManager(kb_path)
-        self.db_path = db_path
+        self.vector_store = vector_store
+        self.query_cache = query_cache
         self.hasher = FileHasher()
 
-    def quarantine_file(self, result: ScanResult) -> Optional[str]:
-        """Quarantine file and clean DB, return action description"""
+    def quarantine_files(self, results: List[ScanResult]) -> Dict[Path, str]:
+        """Quarantine files and remove their documents, return action per file"""
+        quarantined = [r.file_path for r in results if self._move(r)]
+        removed = self._delete_from_db(quarantined)
+        actions = {}
+        for file_path in quarantined:
+            chunks = removed.get(str(file_path), 0)
+            actions[file_path] = f"quarantined, {chunks} chunks removed" if chunks else "quarantined"
+        return actions
+
+    def _move(self, result: ScanResult) -> bool:
+        """Move one file to quarantine"""
         file_hash = result.file_hash or self.hasher.hash_file(result.file_path)
-
-        quarantined = self.quarantine.quarantine_file(
+        return self.quarantine.quarantine_file(
             result.file_path,
             result.reason,
             result.validation_check,
             file_hash
         )
 
-        if not quarantined:
-            return None
-
-        deleted = self._delete_from_db(result.file_path)
-        if deleted > 0:
-            return f"quarantined, {deleted} chunks removed"
-        return "quarantined"
+    def _delete_from_db(self, file_paths: List[Path]) -> Dict[str, int]:
+        """Delete documents (and derived rows) in one transaction
 
-    def _delete_from_db(self, file_path: Path) -> int:
-        """Delete document and chunks from database"""
-        conn = sqlite3.connect(self.db_path)
+        Returns:
+            {path: chunks removed}
+        """
+        if not file_paths:
+            return {}
+        store = self.vector_store
         try:
-            doc_id = self._find_document(conn, file_path)
-            if not doc_id:
-                return 0
-            return self._delete_document(conn, doc_id)
-        except Exception:
-            return 0
+            if store is None:
+                from ingestion.database_factory import DatabaseFactory
+                store = DatabaseFactory.create_vector_store()
+            removed = store.delete_documents([str(p) for p in file_paths])
+            if removed:
+                self._invalidate(store)
+            return removed
+        except Exception as e:
+            print(f"[Security] Failed to remove quarantined files from index: {e}")
+            return {}
         finally:
-            conn.close()
-
-    def _find_document(self, conn, file_path: Path) -> Optional[int]:
-        """Find document ID by file path"""
-        cursor = conn.execute(
-            'SELECT id FROM documents WHERE file_path LIKE ?',
-            (f'%{file_path.name}',)
-        )
-        row = cursor.fetchone()
-        return row[0] if row else None
+            if store is not None and store is not self.vector_store:
+                store.close()
 
-    def _delete_document(self, conn, doc_id: int) -> int:
-        """Delete document and return chunk count"""
-        cursor = conn.execute(
-            'SELECT COUNT(*) FROM chunks WHERE document_id = ?', (doc_id,)
-        )
-        chunk_count = cursor.fetchone()[0]
-        conn.execute('DELETE FROM chunks WHERE document_id = ?', (doc_id,))
-        conn.execute('DELETE FROM documents WHERE id = ?', (doc_id,))
-        conn.commit()
-        return chunk_count
+    def _invalidate(self, store):
+        """Refresh keyword index and drop cached query results, once per batch"""
+        store.refresh_keyword_index()
+        if self.query_cache is not None:
+            self.query_cache.clear()
 
 
 class FindingBuilder:
@@ -281,76 +333,222 @@ class SecurityScanner:
     quarantine handling, and logging. Each component follows SRP.
     """
 
-    def __init__(self, kb_path: Path, db_path: str):
+    def __init__(self, kb_path: Path, vector_store=None, query_cache=None,
+                 state_store: ScanStateStore = None):
         self.collector = FileCollector(kb_path)
         self.worker = FileScannerWorker()
         self.classifier = ResultClassifier()
-        self.quarantine_handler = QuarantineHandler(kb_path, db_path)
+        self.quarantine_handler = QuarantineHandler(kb_path, vector_store, query_cache)
         self.finding_builder = FindingBuilder()
         self.logger = ScanLogger()
+        self.state = state_store or ScanStateStore()
+        self._progress_lock = threading.Lock()
 
     def scan(self, job_id: str, auto_quarantine: bool,
-             progress_callback=None) -> ScanSummary:
-        """Execute full security scan"""
+             progress_callback=None, incremental: bool = True,
+             progress: Optional[ScanProgress] = None) -> ScanSummary:
+        """Execute security scan
+
+        Args:
+            job_id: Job identifier for logging
+            auto_quarantine: Quarantine CRITICAL findings
+            progress_callback: Called with the number of files done so far
+            incremental: Skip files unchanged since their last clean scan
+            progress: Updated live as results arrive (job status)
+        """
         self.logger.log_start(job_id)
+        progress = progress if progress is not None else ScanProgress()
 
         files = self.collector.collect()
+        progress.total_files = len(files)
         if not files:
             return self._empty_summary(auto_quarantine)
 
-        results = self._scan_files_parallel(files, progress_callback)
-        summary = self._process_results(results, auto_quarantine)
+        ruleset = self._ruleset()
+        known = self.state.load(ruleset) if incremental else {}
+        changed, signatures = self._partition(files, known)
+
+        unchanged = len(files) - len(changed)
+        progress.unchanged = progress.clean = progress.scanned = unchanged
+        if progress_callback:
+            progress_callback(progress.scanned)
 
+        results = self._scan_changed(changed, progress, progress_callback)
+        self._record_state(ruleset, results, signatures)
+
+        summary = self._process_results(results, auto_quarantine, unchanged)
         self.logger.log_completion(summary)
         return summary
 
-    def _scan_files_parallel(self, files: List[Path],
-                              progress_callback=None) -> List[ScanResult]:
-        """Scan files in parallel using thread pool"""
-        progress_lock = threading.Lock()
-        scanned = [0]  # Mutable container for closure
+    @staticmethod
+    def _ruleset() -> str:
+        """Identify scanner version, rule files and ClamAV signatures
+
+        A new ruleset means a full rescan, including after freshclam loads
+        new signatures into clamd.
+        """
+        from pipeline.postgres_security_cache import SCANNER_VERSION
+
+        config = default_config.malware_detection
+        parts = [SCANNER_VERSION, str(config.clamav_enabled),
+                 str(config.hash_blacklist_enabled), str(config.yara_enabled)]
+        for rules_path in (config.hash_blacklist_path, config.yara_rules_path,
+                           config.allowlist_path):
+            parts.append(str(stat_signature(Path(rules_path))))
+        if config.clamav_enabled and config.clamav_socket:
+            pool = ClamdPool.for_address(config.clamav_socket, config.clamav_timeout,
+                                         config.clamav_max_concurrency)
+            parts.append(str(pool.version()))
+        return hashlib.sha256('|'.join(parts).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _partition(files: List[Path], known: Dict[str, Tuple]) -> Tuple[List[Path], Dict[str, Tuple]]:
+        """Split out files that changed since their last clean scan
+
+        Returns:
+            (changed files, signature of each changed file taken before scanning)
+        """
+        changed = []
+        signatures = {}
+        for file_path in files:
+            signature = stat_signature(file_path)
+            if signature is not None and known.get(str(file_path)) == tuple(signature):
+                continue
+            changed.append(file_path)
+            signatures[str(file_path)] = signature
+        return changed, signatures
+
+    def _record_state(self, ruleset: str, results: List[ScanResult],
+                      signatures: Dict[str, Tuple]):
+        """Remember clean files; forget files with findings or skipped scanners
+
+        A file that passed only because ClamAV or YARA was skipped must be
+        scanned again by the next incremental scan.
+        """
+        clean, dirty = {}, []
+        for result in results:
+            path = str(result.file_path)
+            if self.classifier.is_clean(result) and result.complete and signatures.get(path):
+                clean[path] = signatures[path]
+            else:
+                dirty.append(path)
+        self.state.record(ruleset, clean, dirty)
+
+    def _scan_changed(self, files: List[Path], progress: ScanProgress,
+                      progress_callback=None) -> List[ScanResult]:
+        """Scan changed files on processes, or in-process for small batches"""
+        if not files:
+            return []
 
-        def scan_with_progress(file_path: Path) -> ScanResult:
-            result = self.worker.scan(file_path)
+        def on_result(result: ScanResult):
+            self._track(result, progress)
             if progress_callback:
-                with progress_lock:
-                    scanned[0] += 1
-                    progress_callback(scanned[0])
+                progress_callback(progress.scanned)
+
+        if len(files) < PROCESS_POOL_MIN_FILES or SCAN_WORKERS <= 1:
+            return self._scan_files_parallel(files, on_result)
+        return self._scan_files_processes(files, on_result)
+
+    def _track(self, result: ScanResult, progress: ScanProgress):
+        """Count a completed result into the live progress"""
+        with self._progress_lock:
+            progress.scanned += 1
+            if self.classifier.is_clean(result):
+                progress.clean += 1
+            elif self.classifier.is_critical(result):
+                progress.critical += 1
+            elif self.classifier.is_warning(result):
+                progress.warnings += 1
+
+    @staticmethod
+    def _scan_cache():
+        """Shared scan result cache, None if unavailable"""
+        try:
+            from pipeline.postgres_security_cache import get_security_cache
+            return get_security_cache()
+        except Exception:
+            return None
+
+    def _scan_files_parallel(self, files: List[Path], on_result=None) -> List[ScanResult]:
+        """Scan files in parallel using thread pool"""
+        def scan_one(file_path: Path) -> ScanResult:
+            result = self.worker.scan(file_path)
+            if on_result:
+                on_result(result)
             return result
 
-        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
-            return list(executor.map(scan_with_progress, files))
+        cache = self._scan_cache()
+        if cache:
+            cache.prefetch()  # One bulk load instead of a SELECT per file
+        try:
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                return list(executor.map(scan_one, files))
+        finally:
+            if cache:
+                cache.flush()
+
+    def _scan_files_processes(self, files: List[Path], on_result=None) -> List[ScanResult]:
+        """Scan files on a process pool, yielding results as batches complete
+
+        Uses spawn: forking the multi-threaded API process is unsafe.
+        """
+        batches = [files[i:i + SCAN_BATCH_SIZE] for i in range(0, len(files), SCAN_BATCH_SIZE)]
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=SCAN_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_scan_process
+        ) as executor:
+            futures = {executor.submit(_scan_batch, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    batch_results = [self.worker._error_result(f, e) for f in futures[future]]
+                for result in batch_results:
+                    if on_result:
+                        on_result(result)
+                    results.append(result)
+        return results
 
     def _process_results(self, results: List[ScanResult],
-                         auto_quarantine: bool) -> ScanSummary:
-        """Classify results and handle quarantine"""
-        clean_count = 0
-        critical_findings = []
+                         auto_quarantine: bool, unchanged: int = 0) -> ScanSummary:
+        """Classify results and handle quarantine
+
+        unchanged files were clean at their last scan and are counted as clean.
+        Critical files are quarantined together (one DB transaction).
+        """
+        clean_count = unchanged
+        critical_results = []
         warning_findings = []
 
         for result in results:
             if self.classifier.is_clean(result):
                 clean_count += 1
             elif self.classifier.is_critical(result):
-                finding = self._handle_critical(result, auto_quarantine)
-                critical_findings.append(finding)
+                critical_results.append(result)
             elif self.classifier.is_warning(result):
                 finding = self.finding_builder.build(result, "WARNING")
                 warning_findings.append(finding)
 
+        critical_findings = self._handle_critical(critical_results, auto_quarantine)
+
         return self._build_summary(
-            len(results), clean_count,
+            len(results) + unchanged, clean_count,
             critical_findings, warning_findings,
             auto_quarantine
         )
 
-    def _handle_critical(self, result: ScanResult,
-                         auto_quarantine: bool) -> SecurityFinding:
-        """Handle critical finding with optional quarantine"""
-        action_taken = None
-        if auto_quarantine:
-            action_taken = self.quarantine_handler.quarantine_file(result)
-        return self.finding_builder.build(result, "CRITICAL", action_taken)
+    def _handle_critical(self, results: List[ScanResult],
+                         auto_quarantine: bool) -> List[SecurityFinding]:
+        """Build critical findings, quarantining them first if enabled"""
+        actions = {}
+        if auto_quarantine and results:
+            actions = self.quarantine_handler.quarantine_files(results)
+        return [
+            self.finding_builder.build(result, "CRITICAL", actions.get(result.file_path))
+            for result in results
+        ]
 
     def _build_summary(self, total: int, clean: int,
                        critical: List[SecurityFinding],
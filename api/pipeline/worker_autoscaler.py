@@ -0,0 +1,346 @@
+"""Adaptive worker autoscaling for the chunk and embed pools.
+
+Watches queue depths, per-stage service times and process CPU utilization,
+then grows or shrinks the EmbedWorkerPool instances within configured bounds.
+Chunk and embed workers together never exceed the available cores, and the
+process-wide torch intra-op thread count is sized so that chunk workers plus
+embed workers x threads stays within them.
+
+Principles:
+- Single Responsibility: Scaling decisions only (pools do the resizing)
+- Pure decision function: decide() has no side effects, easy to test
+- Dependency injection: time and CPU sources injectable for testing
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+
+def available_cores() -> int:
+    """Number of cores this process may run on (respects CPU affinity)"""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+@dataclass
+class AutoscalerConfig:
+    """Bounds and thresholds for worker autoscaling"""
+    enabled: bool = False
+    interval: float = 5.0  # Seconds between scaling decisions
+    chunk_min: int = 1
+    chunk_max: int = 4
+    embed_min: int = 1
+    embed_max: int = 4
+    backlog_per_worker: int = 2  # Queue items per worker before growing
+    busy_high: float = 0.8  # Worker utilization that counts as saturated
+    busy_low: float = 0.3  # Worker utilization that counts as idle
+    cpu_high: float = 0.9  # Process CPU share above which we never grow
+
+    @classmethod
+    def from_env(cls) -> 'AutoscalerConfig':
+        """Load autoscaler configuration from environment variables
+
+        Bounds default to the fixed CHUNK_WORKERS / EMBEDDING_WORKERS values
+        as the minimum, so enabling autoscaling never starts below them.
+        """
+        chunk_workers = int(os.getenv('CHUNK_WORKERS', '1'))
+        embed_workers = int(os.getenv('EMBEDDING_WORKERS', '2'))
+        cores = available_cores()
+        return cls(
+            enabled=os.getenv('AUTOSCALE_ENABLED', 'false').lower() == 'true',
+            interval=float(os.getenv('AUTOSCALE_INTERVAL', '5.0')),
+            chunk_min=int(os.getenv('CHUNK_WORKERS_MIN', str(chunk_workers))),
+            chunk_max=int(os.getenv('CHUNK_WORKERS_MAX', str(max(chunk_workers, min(4, cores))))),
+            embed_min=int(os.getenv('EMBEDDING_WORKERS_MIN', str(embed_workers))),
+            embed_max=int(os.getenv('EMBEDDING_WORKERS_MAX', str(max(embed_workers, min(4, cores))))),
+        )
+
+
+@dataclass
+class StageSample:
+    """Observed load for one pipeline stage over one interval"""
+    workers: int
+    queue_depth: int
+    utilization: float  # Busy fraction of worker time, 0..1
+    service_time: Optional[float]  # Mean seconds per item, None if idle
+
+
+@dataclass
+class ScalingDecision:
+    """One resize applied by the autoscaler"""
+    timestamp: float
+    stage: str
+    from_workers: int
+    to_workers: int
+    reason: str
+
+
+def decide(samples: Dict[str, StageSample], cpu_utilization: float,
+           bounds: Dict[str, tuple], config: AutoscalerConfig,
+           cores: Optional[int] = None) -> Dict[str, tuple]:
+    """Compute target worker counts for each stage
+
+    At most one stage grows per call, and only while CPU has headroom and
+    the total worker count is below cores: the stage with the largest
+    backlog per worker wins. Idle stages shrink
+    towards their minimum. When CPU is saturated, the least loaded stage
+    above its minimum gives up a worker.
+
+    Args:
+        samples: Stage name -> StageSample
+        cpu_utilization: Process CPU time / (wall time x cores), 0..1
+        bounds: Stage name -> (min_workers, max_workers)
+        config: Thresholds
+        cores: Cap on workers across all stages (None for no cap)
+
+    Returns:
+        Stage name -> (target_workers, reason) for stages that should change
+    """
+    changes = {}
+
+    for stage, sample in samples.items():
+        low, _ = bounds[stage]
+        idle = sample.queue_depth == 0 and sample.utilization < config.busy_low
+        if idle and sample.workers > low:
+            changes[stage] = (sample.workers - 1, "idle")
+
+    if cpu_utilization >= config.cpu_high:
+        shrinkable = [
+            stage for stage, sample in samples.items()
+            if stage not in changes and sample.workers > bounds[stage][0]
+        ]
+        if shrinkable:
+            stage = min(shrinkable, key=lambda s: _backlog_per_worker(samples[s]))
+            changes[stage] = (samples[stage].workers - 1, "cpu saturated")
+        return changes
+
+    if cores is not None and sum(s.workers for s in samples.values()) >= cores:
+        return changes
+
+    growable = [
+        stage for stage, sample in samples.items()
+        if stage not in changes
+        and sample.workers < bounds[stage][1]
+        and sample.queue_depth >= sample.workers * config.backlog_per_worker
+        and sample.utilization >= config.busy_high
+    ]
+    if growable:
+        stage = max(growable, key=lambda s: _backlog_per_worker(samples[s]))
+        changes[stage] = (samples[stage].workers + 1, "backlog")
+
+    return changes
+
+
+def _backlog_per_worker(sample: StageSample) -> float:
+    """Queue depth normalized by worker count"""
+    return sample.queue_depth / max(1, sample.workers)
+
+
+class ThreadBudget:
+    """Sizes torch's intra-op thread count from the chunk and embed pools
+
+    torch.set_num_threads() is process-global, so there is one setting
+    shared by every embed worker rather than a per-worker share. Each chunk
+    worker is counted as one core and the concurrent embed workers split
+    the rest: chunk + embed x threads <= cores. Embed workers call apply()
+    before embedding; torch is only reconfigured when the count has moved.
+    """
+
+    def __init__(self, cores: int, embed_workers: int, chunk_workers: int = 0,
+                 set_threads_fn: Callable = None):
+        self.cores = cores
+        self._workers = {'chunk': chunk_workers, 'embed': embed_workers}
+        self._threads = self._compute_threads()
+        self._set_threads_fn = set_threads_fn
+        self._applied: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _compute_threads(self) -> int:
+        """Threads per embed worker within the cores left by chunk workers"""
+        free = self.cores - self._workers['chunk']
+        return max(1, free // max(1, self._workers['embed']))
+
+    def rebalance(self, stage: str, workers: int):
+        """Recompute the thread count after a pool resize"""
+        self._workers[stage] = workers
+        self._threads = self._compute_threads()
+
+    @property
+    def threads_per_worker(self) -> int:
+        return self._threads
+
+    def apply(self):
+        """Apply the current thread count process-wide (cheap if unchanged)"""
+        threads = self._threads
+        if self._applied == threads:
+            return
+        with self._lock:
+            if self._applied == threads:
+                return
+            setter = self._set_threads_fn or _torch_set_num_threads
+            setter(threads)
+            self._applied = threads
+
+
+def _torch_set_num_threads(count: int):
+    """Set torch intra-op threads if torch is installed"""
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(count)
+
+
+class WorkerAutoscaler:
+    """Background thread that resizes pipeline worker pools
+
+    Usage:
+        scaler = WorkerAutoscaler(config, pools={'chunk': (pool, queue), ...})
+        scaler.start()
+        scaler.get_status()  # For /indexing/status
+        scaler.stop()
+    """
+
+    def __init__(self, config: AutoscalerConfig, pools: Dict[str, tuple],
+                 thread_budget: Optional[ThreadBudget] = None,
+                 time_source=None, cpu_time_source=None, cores: Optional[int] = None):
+        """Initialize autoscaler
+
+        Args:
+            config: Bounds and thresholds
+            pools: Stage name -> (EmbedWorkerPool, input queue)
+            thread_budget: Rebalanced whenever a pool is resized
+            time_source: Injectable wall clock for testing
+            cpu_time_source: Injectable process CPU clock for testing
+            cores: Override core count (defaults to CPU affinity)
+        """
+        self.config = config
+        self.pools = pools
+        self.thread_budget = thread_budget
+        self.time_source = time_source or time.monotonic
+        self.cpu_time_source = cpu_time_source or time.process_time
+        self.cores = cores or available_cores()
+        self.bounds = {
+            'chunk': (config.chunk_min, config.chunk_max),
+            'embed': (config.embed_min, min(config.embed_max, self.cores)),
+        }
+        self.decisions: deque = deque(maxlen=20)
+        self._last_samples: Dict[str, StageSample] = {}
+        self._last_cpu_utilization = 0.0
+        self._previous = self._snapshot()
+        self._stop_flag = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the periodic scaling thread"""
+        self._stop_flag.clear()
+        self._previous = self._snapshot()
+        self._thread = threading.Thread(target=self._scaling_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the scaling thread"""
+        self._stop_flag.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _scaling_loop(self):
+        """Evaluate and apply scaling decisions until stopped"""
+        while not self._stop_flag.wait(self.config.interval):
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"[Autoscale] Error evaluating pools: {e}")
+
+    def tick(self) -> List[ScalingDecision]:
+        """Sample load, decide and apply one round of resizes"""
+        current = self._snapshot()
+        samples, cpu_utilization = self._sample(self._previous, current)
+        self._previous = current
+        self._last_samples = samples
+        self._last_cpu_utilization = cpu_utilization
+
+        changes = decide(samples, cpu_utilization, self.bounds, self.config, self.cores)
+        return [self._apply(stage, target, reason) for stage, (target, reason) in changes.items()]
+
+    def _snapshot(self) -> dict:
+        """Capture cumulative counters for later deltas"""
+        return {
+            'wall': self.time_source(),
+            'cpu': self.cpu_time_source(),
+            'stages': {
+                stage: pool.get_service_stats()
+                for stage, (pool, _) in self.pools.items()
+            }
+        }
+
+    def _sample(self, previous: dict, current: dict):
+        """Turn two snapshots into per-stage samples and CPU utilization"""
+        elapsed = max(1e-6, current['wall'] - previous['wall'])
+        cpu_utilization = (current['cpu'] - previous['cpu']) / (elapsed * self.cores)
+
+        samples = {}
+        for stage, (pool, input_queue) in self.pools.items():
+            items_before, busy_before = previous['stages'].get(stage, (0, 0.0))
+            items_now, busy_now = current['stages'][stage]
+            items = items_now - items_before
+            busy = busy_now - busy_before
+            workers = pool.size()
+            samples[stage] = StageSample(
+                workers=workers,
+                queue_depth=input_queue.qsize(),
+                utilization=min(1.0, busy / (elapsed * workers)),
+                service_time=busy / items if items > 0 else None
+            )
+        return samples, min(1.0, max(0.0, cpu_utilization))
+
+    def _apply(self, stage: str, target: int, reason: str) -> ScalingDecision:
+        """Resize a pool and record the decision"""
+        pool, input_queue = self.pools[stage]
+        before = pool.size()
+        after = pool.resize(target)
+        if self.thread_budget:
+            self.thread_budget.rebalance(stage, after)
+
+        decision = ScalingDecision(
+            timestamp=time.time(),
+            stage=stage,
+            from_workers=before,
+            to_workers=after,
+            reason=reason
+        )
+        self.decisions.append(decision)
+        print(f"[Autoscale] {stage} workers {before} -> {after} ({reason}, "
+              f"queue={input_queue.qsize()}, cpu={self._last_cpu_utilization:.0%})")
+        return decision
+
+    def get_status(self) -> dict:
+        """Get current pool sizes, last observed load and recent decisions"""
+        return {
+            'enabled': True,
+            'cores': self.cores,
+            'interval_seconds': self.config.interval,
+            'workers': {stage: pool.size() for stage, (pool, _) in self.pools.items()},
+            'bounds': {stage: list(bound) for stage, bound in self.bounds.items()},
+            'embed_threads_per_worker': (
+                self.thread_budget.threads_per_worker if self.thread_budget else None
+            ),
+            'cpu_utilization': round(self._last_cpu_utilization, 3),
+            'stages': {
+                stage: {
+                    'queue_depth': sample.queue_depth,
+                    'utilization': round(sample.utilization, 3),
+                    'service_time_seconds': (
+                        round(sample.service_time, 3) if sample.service_time is not None else None
+                    )
+                }
+                for stage, sample in self._last_samples.items()
+            },
+            'recent_decisions': [asdict(d) for d in self.decisions]
+        }
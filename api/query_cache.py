@@ -6,6 +6,8 @@ from functools import lru_cache
 import hashlib
 import json
 
+from metrics import record_cache_lookup
+
 class QueryCache:
     """LRU cache for query results"""
 
@@ -20,8 +22,10 @@ class QueryCache:
         """Get cached results if available"""
         key = self._make_key(query, top_k, threshold, decompose)
         if key in self.cache:
+            record_cache_lookup("query", True)
             self._update_access(key)
             return self.cache[key]
+        record_cache_lookup("query", False)
         return None
 
     def put(
@@ -0,0 +1,98 @@
+"""Startup readiness tracking.
+
+Startup phases run concurrently and some continue after the API is
+serving, so readiness is reported per capability instead of a single
+"up" flag: queries can be served before sanitization or the initial
+scan have finished.
+
+Principles:
+- Components are marked ready/failed by the phase that owns them
+- Capabilities are derived from the components they need
+- Thread-safe: phases run on worker threads
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+PENDING = 'pending'
+READY = 'ready'
+FAILED = 'failed'
+DISABLED = 'disabled'  # Not started in this serving mode (RAG_MODE=query)
+
+COMPONENTS = (
+    'model',           # Embedding model loaded
+    'database',        # Vector store, progress tracker, processor
+    'reranker',        # Reranker constructed (and warmed up if enabled)
+    'query_expander',  # Query expander configured
+    'pipeline',        # Indexing queue, worker and concurrent pipeline
+    'sanitization',    # Resume/orphan repair/self-healing finished
+    'initial_scan',    # Startup scan of the knowledge base finished
+)
+
+CAPABILITIES = {
+    'query': ('model', 'database'),
+    'rerank': ('reranker',),
+    'query_expansion': ('query_expander',),
+    'indexing': ('model', 'database', 'pipeline'),
+    'sanitized': ('sanitization',),
+    'initial_scan': ('initial_scan',),
+}
+
+
+class Readiness:
+    """Tracks which startup components and capabilities are available"""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._status: Dict[str, str] = {name: PENDING for name in COMPONENTS}
+        self._seconds: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+
+    def mark_ready(self, component: str):
+        """Mark component as available"""
+        self._set(component, READY)
+
+    def mark_failed(self, component: str, error: Exception):
+        """Mark component as failed (capabilities needing it stay unavailable)"""
+        self._set(component, FAILED, str(error))
+
+    def mark_disabled(self, component: str):
+        """Mark component as intentionally not started"""
+        self._set(component, DISABLED)
+
+    def _set(self, component: str, status: str, error: Optional[str] = None):
+        with self._lock:
+            self._status[component] = status
+            self._seconds[component] = round(self._clock() - self._started, 3)
+            if error:
+                self._errors[component] = error
+
+    def is_ready(self, capability: str) -> bool:
+        """Check if all components a capability needs are ready"""
+        needs = CAPABILITIES.get(capability, (capability,))
+        with self._lock:
+            return all(self._status.get(name) == READY for name in needs)
+
+    def snapshot(self) -> Dict:
+        """Get readiness report for the /ready endpoint"""
+        with self._lock:
+            components = {
+                name: self._describe(name) for name in self._status
+            }
+        capabilities = {name: self.is_ready(name) for name in CAPABILITIES}
+        return {
+            'ready': capabilities['query'],
+            'capabilities': capabilities,
+            'components': components,
+        }
+
+    def _describe(self, name: str) -> Dict:
+        """Describe one component (caller holds lock)"""
+        info = {'status': self._status[name]}
+        if name in self._seconds:
+            info['seconds'] = self._seconds[name]
+        if name in self._errors:
+            info['error'] = self._errors[name]
+        return info
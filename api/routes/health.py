@@ -1,7 +1,7 @@
 """Health and info routes."""
 import os
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 from models import HealthResponse
 from config import default_config
 from routes.deps import get_app_state
@@ -28,7 +28,8 @@ async def root():
     return {
         "message": "RAG Knowledge Base API",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "ready": "/ready"
     }
 
 
@@ -50,3 +51,18 @@ async def health(request: Request):
         indexing_in_progress=app_state.is_indexing_in_progress(),
         memory_mb=round(_get_memory_mb(), 1)
     )
+
+
+@router.get("/ready")
+async def ready(request: Request, response: Response):
+    """
+    Readiness check endpoint
+
+    Reports which capabilities are available while background startup
+    work (sanitization, initial scan) continues. Returns 503 until
+    queries can be served.
+    """
+    report = get_app_state(request).get_readiness()
+    if not report['ready']:
+        response.status_code = 503
+    return report
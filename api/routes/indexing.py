@@ -166,7 +166,8 @@ async def add_priority_file(file_path: str, request: Request, force: bool = Fals
 async def get_indexing_status(request: Request):
     """Get current indexing queue status
 
-    Returns information about the indexing queue and worker state.
+    Returns information about the indexing queue and worker state,
+    including worker autoscaler decisions when AUTOSCALE_ENABLED=true.
     """
     try:
         app_state = get_app_state(request)
@@ -177,7 +178,8 @@ async def get_indexing_status(request: Request):
             "queue_size": app_state.queue_size(),
             "paused": app_state.is_queue_paused(),
             "worker_running": app_state.is_worker_running(),
-            "indexing_in_progress": app_state.is_indexing_in_progress()
+            "indexing_in_progress": app_state.is_indexing_in_progress(),
+            "autoscaler": app_state.get_autoscaler_status()
         }
     except HTTPException:
         raise
@@ -136,6 +136,11 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any], request: Reques
 
     try:
         if name == "query_kb":
+            if not app_state.is_ready('query'):
+                return ToolCallResult(
+                    content=[{"type": "text", "text": "Error: Knowledge base is still starting up, retry shortly"}],
+                    isError=True,
+                )
             query = arguments.get("query")
             if not query:
                 return ToolCallResult(
@@ -0,0 +1,20 @@
+"""Prometheus metrics route."""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from metrics import metrics
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Prometheus scrape endpoint
+
+    Per-stage latency histograms, chunk/byte throughput counters, queue
+    depths and wait times, embedding batch sizes, DB commit latency,
+    cache hit/miss counters and process RSS.
+    """
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -19,8 +19,10 @@ async def query(request_data: QueryRequest, request: Request):
     Returns:
         QueryResponse with search results
     """
+    app_state = get_app_state(request)
+    if not app_state.is_ready('query'):
+        raise HTTPException(status_code=503, detail="Starting up: queries not ready yet (see GET /ready)")
     try:
-        app_state = get_app_state(request)
         executor = QueryExecutor(
             app_state.get_model(),
             app_state.get_async_vector_store(),
@@ -14,7 +14,7 @@ def _get_active_security_scan() -> Optional[dict]:
         Dict with scan status if running, None otherwise
     """
     try:
-        from routes.security import _scan_jobs
+        from routes.security import _scan_jobs, _job_progress
 
         # Find most recent running or pending scan
         for job_id, job in sorted(
@@ -23,8 +23,7 @@ def _get_active_security_scan() -> Optional[dict]:
             reverse=True
         ):
             if job['status'] in ('pending', 'running'):
-                progress = job.get('progress', 0)
-                total = job.get('total_files', 0)
+                progress, total, _ = _job_progress(job)
                 pct = int(100 * progress / total) if total > 0 else 0
                 return {
                     'job_id': job_id,
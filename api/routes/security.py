@@ -2,7 +2,7 @@
 
 Endpoints for managing rejected files, quarantine, and security scanning.
 """
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -13,8 +13,9 @@ from concurrent.futures import ThreadPoolExecutor
 from ingestion.database_factory import DatabaseFactory
 from pipeline.quarantine_manager import QuarantineManager
 from pipeline.postgres_security_cache import get_security_cache
-from pipeline.security_scanner import SecurityScanner
+from pipeline.security_scanner import SecurityScanner, ScanProgress
 from config import default_config
+from routes.deps import get_app_state
 
 router = APIRouter(prefix="/api/security", tags=["security"])
 
@@ -67,6 +68,7 @@ class ScanRequest(BaseModel):
     """Request model for security scan"""
     auto_quarantine: bool = True  # Auto-quarantine CRITICAL files
     verbose: bool = False  # Include clean files in response
+    incremental: bool = True  # Skip files unchanged since their last clean scan
 
 
 class SecurityFinding(BaseModel):
@@ -106,6 +108,7 @@ class ScanStatusResponse(BaseModel):
     status: str  # "pending", "running", "completed", "failed"
     progress: Optional[int] = None  # Files scanned so far
     total_files: Optional[int] = None
+    counts: Optional[Dict[str, int]] = None  # Live clean/critical/warnings/unchanged
     result: Optional[ScanResponse] = None  # Present when completed
     error: Optional[str] = None  # Present when failed
     message: str
@@ -220,6 +223,20 @@ def _build_status_message(status: str, progress: int, total: int, error: Optiona
     return f"Unknown status: {status}"
 
 
+def _job_progress(job: Dict[str, Any]):
+    """(scanned, total, counts) of a scan job from its live ScanProgress"""
+    scan_progress = job.get('scan_progress')
+    if scan_progress is None:
+        return job.get('progress', 0), job.get('total_files', 0), None
+    counts = {
+        'clean': scan_progress.clean,
+        'critical': scan_progress.critical,
+        'warnings': scan_progress.warnings,
+        'unchanged': scan_progress.unchanged,
+    }
+    return scan_progress.scanned, scan_progress.total_files, counts
+
+
 def _build_scan_response(summary) -> "ScanResponse":
     """Build ScanResponse from scanner summary"""
     return ScanResponse(
@@ -393,28 +410,27 @@ async def purge_old_quarantined_files(request: PurgeRequest):
 # ============================================================================
 
 
-def _run_scan_job(job_id: str, auto_quarantine: bool, verbose: bool):
+def _run_scan_job(job_id: str, auto_quarantine: bool, verbose: bool,
+                  incremental: bool = True, app_state=None):
     """Background worker function for security scanning
 
     Delegates to SecurityScanner class which handles all scanning logic.
-    Updates _scan_jobs dict with progress and results.
+    The job's ScanProgress is updated by the scanner as results arrive.
+    Quarantined files are removed through the running vector store, which
+    then refreshes its keyword index; the query cache is cleared.
     """
     try:
         _scan_jobs[job_id]['status'] = 'running'
 
         kb_path = Path(default_config.paths.knowledge_base)
-        db_path = default_config.database.path
-        scanner = SecurityScanner(kb_path, db_path)
-
-        def update_progress(count: int):
-            _scan_jobs[job_id]['progress'] = count
-
-        # Count files first for progress tracking
-        files = scanner.collector.collect()
-        _scan_jobs[job_id]['total_files'] = len(files)
-        _scan_jobs[job_id]['progress'] = 0
+        vector_store = app_state.get_vector_store() if app_state else None
+        query_cache = app_state.get_query_cache() if app_state else None
+        scanner = SecurityScanner(kb_path, vector_store, query_cache)
 
-        summary = scanner.scan(job_id, auto_quarantine, update_progress)
+        summary = scanner.scan(
+            job_id, auto_quarantine,
+            incremental=incremental, progress=_scan_jobs[job_id]['scan_progress']
+        )
 
         _scan_jobs[job_id]['status'] = 'completed'
         _scan_jobs[job_id]['result'] = _build_scan_response(summary)
@@ -425,7 +441,7 @@ def _run_scan_job(job_id: str, auto_quarantine: bool, verbose: bool):
 
 
 @router.post("/scan", response_model=ScanJobResponse)
-async def scan_existing_files(request: ScanRequest = None):
+async def scan_existing_files(http_request: Request, request: ScanRequest = None):
     """Start a security scan of existing files in knowledge base
 
     **NON-BLOCKING**: This endpoint immediately returns a job ID. The scan
@@ -447,6 +463,8 @@ async def scan_existing_files(request: ScanRequest = None):
     Args:
         auto_quarantine: If true (default), auto-quarantine CRITICAL files
         verbose: If true, return more detailed info
+        incremental: If true (default), skip files unchanged since their last
+            clean scan; false rescans every file
 
     Returns:
         Job ID to track scan progress
@@ -489,8 +507,7 @@ async def scan_existing_files(request: ScanRequest = None):
     # Initialize job status
     _scan_jobs[job_id] = {
         'status': 'pending',
-        'progress': 0,
-        'total_files': 0,
+        'scan_progress': ScanProgress(),
         'result': None,
         'error': None,
         'auto_quarantine': request.auto_quarantine,
@@ -498,7 +515,10 @@ async def scan_existing_files(request: ScanRequest = None):
     }
 
     # Submit to thread pool (non-blocking)
-    _scan_executor.submit(_run_scan_job, job_id, request.auto_quarantine, request.verbose)
+    _scan_executor.submit(
+        _run_scan_job, job_id, request.auto_quarantine, request.verbose, request.incremental,
+        get_app_state(http_request)
+    )
 
     return ScanJobResponse(
         job_id=job_id,
@@ -526,6 +546,7 @@ async def get_scan_status(job_id: str):
             "status": "running",
             "progress": 1500,
             "total_files": 2871,
+            "counts": {"clean": 1498, "critical": 0, "warnings": 2, "unchanged": 1200},
             "result": null,
             "error": null,
             "message": "Scanning: 1500/2871 files (52%)"
@@ -552,8 +573,7 @@ async def get_scan_status(job_id: str):
 
     job = _scan_jobs[job_id]
     status = job['status']
-    progress = job.get('progress', 0)
-    total = job.get('total_files', 0)
+    progress, total, counts = _job_progress(job)
     error = job.get('error')
 
     return ScanStatusResponse(
@@ -561,6 +581,7 @@ async def get_scan_status(job_id: str):
         status=status,
         progress=progress,
         total_files=total,
+        counts=counts,
         result=job.get('result'),
         error=error,
         message=_build_status_message(status, progress, total, error)
@@ -594,16 +615,17 @@ async def list_scan_jobs():
             }
         ]
     """
-    return [
-        {
+    jobs = []
+    for job_id, job in _scan_jobs.items():
+        progress, total, _ = _job_progress(job)
+        jobs.append({
             "job_id": job_id,
             "status": job['status'],
-            "progress": job.get('progress', 0),
-            "total_files": job.get('total_files', 0),
+            "progress": progress,
+            "total_files": total,
             "started_at": job.get('started_at')
-        }
-        for job_id, job in _scan_jobs.items()
-    ]
+        })
+    return jobs
 
 
 # ============================================================================
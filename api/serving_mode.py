@@ -0,0 +1,27 @@
+"""Serving mode selection.
+
+RAG_MODE=query runs a query-only API process: the embedding model,
+vector store, cache, reranker and query expander are started, but the
+ingestion stack (extractors, chunkers, document processor, indexing
+queue/pipeline, file watcher) is never imported. Use it for read
+replicas next to a separate ingest process sharing the same database.
+
+Principles:
+- Read once per call from the environment (tests can monkeypatch)
+- Unknown values fall back to full mode
+"""
+import os
+
+FULL = 'full'
+QUERY = 'query'
+
+
+def get_serving_mode() -> str:
+    """Get serving mode from RAG_MODE (full|query, default full)"""
+    mode = os.getenv('RAG_MODE', FULL).strip().lower()
+    return mode if mode in (FULL, QUERY) else FULL
+
+
+def is_query_only() -> bool:
+    """Check if this process serves queries only (no ingestion)"""
+    return get_serving_mode() == QUERY
@@ -4,6 +4,7 @@ Refactored from God Object (26 methods) to facade over focused phase classes.
 Phase classes are available in startup.phases for direct use if needed.
 """
 import os
+import asyncio
 import time
 from pathlib import Path
 from contextlib import asynccontextmanager
@@ -11,14 +12,12 @@ from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 import threading
 
-from sentence_transformers import SentenceTransformer
 from config import default_config
-from ingestion import DocumentProcessor
 from ingestion.database_factory import DatabaseFactory, get_backend
-from watcher import FileWatcherService
 from query_cache import QueryCache
 from value_objects import IndexingStats
 from app_state import AppState
+from serving_mode import is_query_only
 from operations.model_loader import ModelLoader
 from operations.file_walker import FileWalker
 from operations.document_indexer import DocumentIndexer
@@ -58,20 +57,53 @@ class StartupManager:
         self._indexing_phase = IndexingPhase(app_state, self._sanitization_phase)
 
     async def initialize(self):
-        """Initialize all components (async for AsyncVectorStore)"""
+        """Initialize components needed to serve queries.
+
+        Runs as a background task while the API already accepts
+        connections (see main.lifespan); each phase marks its component in
+        GET /ready as it finishes. Independent phases (model load,
+        database, query expander) run concurrently on worker threads, so
+        startup takes as long as the slowest phase rather than their sum.
+        Reranker warmup, sanitization, self-healing and indexing continue
+        in background threads after this returns.
+        """
         print("Initializing RAG system...")
+        started = time.perf_counter()
+        query_only = is_query_only()
         self._validate_config()
-        self._load_model()
-        await self._init_store()  # Now async
-        self._init_progress_tracker()
-        self._init_processor()
+        await asyncio.gather(
+            self._run_phase('model', self._load_model),
+            self._run_phase('database', self._init_store if query_only else self._init_database),
+            self._run_phase('query_expander', self._init_query_expander),
+            asyncio.to_thread(self._init_reranker),
+        )
         self._init_cache()
-        self._init_reranker()
-        self._init_query_expander()
-        self._init_queue_and_worker()
-        print("RAG system ready! Starting sanitization and indexing...")
+        self._start_graph_rank()
+        if query_only:
+            self._disable_ingestion()
+            print(f"RAG system ready in {time.perf_counter() - started:.1f}s (query-only mode)")
+            return
+        await self._run_phase('pipeline', self._init_queue_and_worker)
+        print(f"RAG system ready in {time.perf_counter() - started:.1f}s! "
+              "Starting sanitization and indexing...")
         self._start_background_indexing()
 
+    async def _run_phase(self, component: str, phase):
+        """Run a blocking startup phase off the event loop and record readiness"""
+        readiness = self.state.runtime.readiness
+        try:
+            await asyncio.to_thread(phase)
+        except Exception as e:
+            readiness.mark_failed(component, e)
+            raise
+        readiness.mark_ready(component)
+
+    def _disable_ingestion(self):
+        """Query-only mode: ingestion components are never started"""
+        readiness = self.state.runtime.readiness
+        for component in ('pipeline', 'sanitization', 'initial_scan'):
+            readiness.mark_disabled(component)
+
     # ============ Configuration Phase ============
 
     def _validate_config(self):
@@ -88,7 +120,13 @@ class StartupManager:
         model_name = default_config.model.name
         self.state.core.model = loader.load(model_name)
 
-    async def _init_store(self):
+    def _init_database(self):
+        """Initialize store, progress tracker and processor (in dependency order)"""
+        self._init_store()
+        self._init_progress_tracker()
+        self._init_processor()
+
+    def _init_store(self):
         """Initialize vector store with unified architecture.
 
         Unified Architecture (v2.2.3+):
@@ -121,7 +159,8 @@ class StartupManager:
             print(f"Resumable processing enabled (backend: {get_backend()})")
 
     def _init_processor(self):
-        """Initialize processor"""
+        """Initialize processor (imports the extraction stack)"""
+        from ingestion.processing import DocumentProcessor
         self.state.core.processor = DocumentProcessor(self.state.core.progress_tracker)
 
     def _init_cache(self):
@@ -132,6 +171,21 @@ class StartupManager:
         else:
             print("Query cache disabled")
 
+    def _start_graph_rank(self):
+        """Start periodic PageRank refresh when the graph boost is enabled"""
+        import os
+        from hybrid_search import GraphBoost
+        from ingestion.graph_rank import GraphRankJob
+
+        hybrid = getattr(self.state.core.vector_store, 'hybrid', None)
+        boost = getattr(hybrid, 'graph_boost', None)
+        if not isinstance(boost, GraphBoost):
+            return  # Disabled, or SQLite backend (no graph tables)
+        interval = float(os.getenv("GRAPH_RANK_INTERVAL", "900"))
+        self.state.query.graph_rank_job = GraphRankJob(boost, interval=interval)
+        self.state.query.graph_rank_job.start()
+        print(f"Graph boost enabled (PageRank refresh every {interval:.0f}s)")
+
     def _init_reranker(self):
         """Initialize search result reranker from pipeline config"""
         from pipeline.factory import PipelineFactory
@@ -139,20 +193,43 @@ class StartupManager:
         factory = PipelineFactory.default()
         self.state.query.reranker = factory.create_reranker()
 
+        if factory.reranking_enabled:
+            self._start_reranker_warmup(self.state.query.reranker)
+        else:
+            self.state.runtime.readiness.mark_ready('reranker')
+
         if factory.reranking_enabled:
             print(f"Reranker enabled: {factory.config.reranking.model} (top_n={factory.reranking_top_n})")
         else:
             print("Reranker disabled")
 
+    def _start_reranker_warmup(self, reranker):
+        """Load reranker weights in the background (queries wait on the same load)"""
+        import threading
+
+        def warmup():
+            readiness = self.state.runtime.readiness
+            try:
+                reranker.warmup()
+                readiness.mark_ready('reranker')
+            except Exception as e:
+                print(f"Reranker warmup failed: {e}")
+                readiness.mark_failed('reranker', e)
+
+        threading.Thread(target=warmup, daemon=True, name="RerankerWarmup").start()
+
     def _init_query_expander(self):
         """Initialize LLM-based query expander using Ollama"""
         import os
         from pipeline.query_expander import QueryExpander
 
         enabled = os.getenv("QUERY_EXPANSION_ENABLED", "false").lower() == "true"
-        self.state.query.query_expander = QueryExpander(enabled=enabled)
+        expander = QueryExpander(enabled=enabled)
+        self.state.query.query_expander = expander
 
         if enabled:
+            # Probe Ollama in the background; expansion kicks in once it answers
+            expander.start_probe()
             model = os.getenv("QUERY_EXPANSION_MODEL", "qwen2.5:0.5b")
             ollama_url = os.getenv("OLLAMA_URL", "http://ollama:11434")
             print(f"Query expansion enabled: {model} via {ollama_url}")
@@ -163,8 +240,8 @@ class StartupManager:
 
     def _init_queue_and_worker(self):
         """Initialize indexing queue and worker"""
-        from pipeline import IndexingQueue, IndexingWorker
-        self.state.indexing.queue = IndexingQueue()
+        from pipeline import IndexingWorker
+        self.state.indexing.queue = self._pipeline_phase.create_queue()
         indexer = self._create_indexer()
 
         # Initialize concurrent pipeline first
@@ -298,12 +375,17 @@ class StartupManager:
         try:
             self._run_indexing()
         except Exception as e:
-            print("Indexing error occurred")
+            print(f"Indexing error occurred: {e}")
+            raise
 
     def _run_indexing(self):
-        """Run indexing process"""
+        """Run indexing process (also resumes work recovered by the durable queue)"""
+        queue = self.state.indexing.queue
+        if queue and queue.recovered_work:
+            print(f"Resuming {queue.recovered_work} files from the durable queue")
         orchestrator = self._create_orchestrator()
-        files, chunks = orchestrator.index_all(queue=self.state.indexing.queue)
+        # Not forced: the queue skips paths it already holds, so recovered rows aren't duplicated
+        files, chunks = orchestrator.index_all(queue=queue, force=False)
         self.state.runtime.stats = IndexingStats(files=files, chunks=chunks)
         if files > 0:
             print(f"Indexed {files} docs, {chunks} chunks")
@@ -355,16 +437,31 @@ class StartupManager:
         3. Index new files
         4. Post-indexing orphan check: catch orphans created during indexing
         """
+        readiness = self.state.runtime.readiness
+
         # Start watcher first so system is responsive immediately
-        self._start_watcher()
+        try:
+            self._start_watcher()
+        except Exception as e:
+            print(f"File watcher failed to start: {e}")
 
         # Sanitization stage: repair before new indexing
-        self._sanitize_before_indexing()
+        try:
+            self._sanitize_before_indexing()
+        except Exception as e:
+            print(f"Sanitization failed: {e}")
+            readiness.mark_failed('sanitization', e)
+        else:
+            readiness.mark_ready('sanitization')
 
         # Then do indexing in background
         self.state.runtime.indexing_in_progress = True
         try:
             self._index_docs()
+        except Exception as e:
+            readiness.mark_failed('initial_scan', e)
+        else:
+            readiness.mark_ready('initial_scan')
         finally:
             self.state.runtime.indexing_in_progress = False
 
@@ -400,11 +497,15 @@ class StartupManager:
             print("File watcher disabled")
             return
 
+        from watcher import FileWatcherService
         self.state.runtime.watcher = FileWatcherService(
             watch_path=default_config.paths.knowledge_base,
             queue=self.state.indexing.queue,
             debounce_seconds=default_config.watcher.debounce_seconds,
-            batch_size=default_config.watcher.batch_size
+            batch_size=default_config.watcher.batch_size,
+            vector_store=self.state.core.vector_store,
+            progress_tracker=self.state.core.progress_tracker,
+            max_enqueue_rate=default_config.watcher.max_enqueue_rate
         )
         self.state.start_watcher()
 
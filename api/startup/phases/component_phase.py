@@ -3,7 +3,6 @@
 Initializes core components: model, stores, processor, cache, reranker.
 """
 from config import default_config
-from ingestion import DocumentProcessor
 from ingestion.database_factory import DatabaseFactory, get_backend
 from query_cache import QueryCache
 from operations.model_loader import ModelLoader
@@ -59,6 +58,7 @@ class ComponentPhase:
 
     def init_processor(self):
         """Initialize document processor."""
+        from ingestion.processing import DocumentProcessor
         self.state.core.processor = DocumentProcessor(self.state.core.progress_tracker)
 
     def init_cache(self):
@@ -87,9 +87,12 @@ class ComponentPhase:
         from pipeline.query_expander import QueryExpander
 
         enabled = os.getenv("QUERY_EXPANSION_ENABLED", "false").lower() == "true"
-        self.state.query.query_expander = QueryExpander(enabled=enabled)
+        expander = QueryExpander(enabled=enabled)
+        self.state.query.query_expander = expander
 
         if enabled:
+            # Probe Ollama in the background; expansion kicks in once it answers
+            expander.start_probe()
             model = os.getenv("QUERY_EXPANSION_MODEL", "qwen2.5:0.5b")
             ollama_url = os.getenv("OLLAMA_URL", "http://ollama:11434")
             print(f"Query expansion enabled: {model} via {ollama_url}")
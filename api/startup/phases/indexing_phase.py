@@ -7,7 +7,6 @@ import threading
 
 from config import default_config
 from value_objects import IndexingStats
-from watcher import FileWatcherService
 
 
 class IndexingPhase:
@@ -44,18 +43,29 @@ class IndexingPhase:
         3. Index new files
         4. Post-indexing orphan check: catch orphans created during indexing
         """
+        readiness = self.state.runtime.readiness
         try:
             # Start watcher first so system is responsive immediately
             self.start_watcher()
 
             # Sanitization stage: repair before new indexing
-            if self.sanitization_phase:
-                self.sanitization_phase.execute()
+            try:
+                if self.sanitization_phase:
+                    self.sanitization_phase.execute()
+            except Exception as e:
+                print(f"[IndexingPhase] Sanitization failed: {e}")
+                readiness.mark_failed('sanitization', e)
+            else:
+                readiness.mark_ready('sanitization')
 
             # Then do indexing in background
             self.state.runtime.indexing_in_progress = True
             try:
                 self.index_docs()
+            except Exception as e:
+                readiness.mark_failed('initial_scan', e)
+            else:
+                readiness.mark_ready('initial_scan')
             finally:
                 self.state.runtime.indexing_in_progress = False
 
@@ -72,12 +82,17 @@ class IndexingPhase:
         try:
             self.run_indexing()
         except Exception as e:
-            print("Indexing error occurred")
+            print(f"Indexing error occurred: {e}")
+            raise
 
     def run_indexing(self):
-        """Run indexing process."""
+        """Run indexing process (also resumes work recovered by the durable queue)."""
+        queue = self.state.indexing.queue
+        if queue and queue.recovered_work:
+            print(f"Resuming {queue.recovered_work} files from the durable queue")
         orchestrator = self.create_orchestrator()
-        files, chunks = orchestrator.index_all(queue=self.state.indexing.queue)
+        # Not forced: the queue skips paths it already holds, so recovered rows aren't duplicated
+        files, chunks = orchestrator.index_all(queue=queue, force=False)
         self.state.runtime.stats = IndexingStats(files=files, chunks=chunks)
         if files > 0:
             print(f"Indexed {files} docs, {chunks} chunks")
@@ -159,11 +174,15 @@ class IndexingPhase:
             print("File watcher disabled")
             return
 
+        from watcher import FileWatcherService
         self.state.runtime.watcher = FileWatcherService(
             watch_path=default_config.paths.knowledge_base,
             queue=self.state.indexing.queue,
             debounce_seconds=default_config.watcher.debounce_seconds,
-            batch_size=default_config.watcher.batch_size
+            batch_size=default_config.watcher.batch_size,
+            vector_store=self.state.core.vector_store,
+            progress_tracker=self.state.core.progress_tracker,
+            max_enqueue_rate=default_config.watcher.max_enqueue_rate
         )
         self.state.start_watcher()
 
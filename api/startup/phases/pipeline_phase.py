@@ -23,9 +23,9 @@ class PipelinePhase:
 
     def init_queue_and_worker(self):
         """Initialize indexing queue and worker."""
-        from pipeline import IndexingQueue, IndexingWorker
+        from pipeline import IndexingWorker
 
-        self.state.indexing.queue = IndexingQueue()
+        self.state.indexing.queue = self.create_queue()
         indexer = self.create_indexer()
 
         # Initialize concurrent pipeline first
@@ -40,6 +40,18 @@ class PipelinePhase:
         self.state.start_worker()
         print("Indexing queue and worker started")
 
+    def create_queue(self):
+        """Create durable Postgres queue if enabled, else in-memory queue."""
+        from pipeline import IndexingQueue
+        from ingestion.database_factory import get_backend
+
+        durable = os.getenv('DURABLE_QUEUE_ENABLED', 'false').lower() == 'true'
+        if durable and get_backend() == 'postgresql':
+            from pipeline.postgres_indexing_queue import PostgresIndexingQueue
+            print("Durable indexing queue enabled (PostgreSQL)")
+            return PostgresIndexingQueue()
+        return IndexingQueue()
+
     def init_concurrent_pipeline(self):
         """Initialize concurrent pipeline for parallel processing."""
         if not self.is_pipeline_enabled():
@@ -1,32 +1,62 @@
 """
 File system watcher for automatic document indexing
+
+Events are coalesced per path (create/modify/delete/move) and a path is
+only acted on once it has been quiet for the debounce period, so large
+bulk copies are ingested in full while files are still arriving.
+Deletions and moves are applied to the store directly; only new or
+modified content goes through the indexing queue. A directory deleted or
+moved out of the tree arrives as a single event, so directory events are
+expanded to the documents indexed below them.
 """
 import threading
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Set, Callable, Optional
+from typing import Dict, List, Set, Callable, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from ingestion.obsidian_detector import get_obsidian_detector
+
 class DebounceTimer:
-    """Manages debounce timing for file events"""
+    """Manages debounce timing for file events
+
+    With max_delay set, a continuous stream of triggers cannot postpone
+    the callback more than max_delay after the first trigger.
+    """
 
-    def __init__(self, delay: float, callback: Callable):
+    def __init__(self, delay: float, callback: Callable, max_delay: Optional[float] = None):
         self.delay = delay
+        self.max_delay = max_delay
         self.callback = callback
         self.timer: Optional[threading.Timer] = None
         self.lock = threading.Lock()
+        self._first_trigger: Optional[float] = None
 
     def trigger(self):
         """Trigger or reset the timer"""
         with self.lock:
             if self.timer:
                 self.timer.cancel()
-            self.timer = threading.Timer(self.delay, self._execute)
+            now = time.monotonic()
+            if self._first_trigger is None:
+                self._first_trigger = now
+            self.timer = threading.Timer(self._next_delay(now), self._execute)
+            self.timer.daemon = True
             self.timer.start()
 
+    def _next_delay(self, now: float) -> float:
+        """Debounce delay, capped so the callback runs by max_delay"""
+        if self.max_delay is None:
+            return self.delay
+        remaining = self._first_trigger + self.max_delay - now
+        return max(0.0, min(self.delay, remaining))
+
     def _execute(self):
         """Execute callback after delay"""
+        with self.lock:
+            self._first_trigger = None
         self.callback()
 
     def cancel(self):
@@ -35,30 +65,119 @@ class DebounceTimer:
             if self.timer:
                 self.timer.cancel()
                 self.timer = None
+            self._first_trigger = None
+
+CHANGED = 'changed'
+DELETED = 'deleted'
+
+
+@dataclass
+class ChangeSet:
+    """Coalesced file events ready to apply"""
+    changed: Set[Path] = field(default_factory=set)
+    deleted: Set[Path] = field(default_factory=set)
+    moved: Dict[Path, Path] = field(default_factory=dict)  # source -> destination
+    deleted_dirs: Set[Path] = field(default_factory=set)
+    moved_dirs: Dict[Path, Path] = field(default_factory=dict)  # source -> destination
+
+    def __len__(self) -> int:
+        return (len(self.changed) + len(self.deleted) + len(self.moved)
+                + len(self.deleted_dirs) + len(self.moved_dirs))
+
 
 class FileChangeCollector:
-    """Collects and deduplicates file change events"""
+    """Collects and coalesces file change events per path
 
-    def __init__(self):
-        self.changed_files: Set[Path] = set()
+    Keeps the latest event per path plus pending moves keyed by
+    destination, so a -> b -> c collapses into a single a -> c move and
+    deleting a move destination becomes a delete of the original path.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.events: Dict[Path, Tuple[str, float]] = {}
+        self.moves: Dict[Path, Tuple[Path, float]] = {}  # destination -> (source, time)
+        self.directories: Dict[Path, Tuple[Optional[Path], float]] = {}  # source -> (destination or None if deleted, time)
         self.lock = threading.Lock()
+        self.clock = clock
 
     def add(self, file_path: Path):
-        """Add a changed file"""
+        """Add a created or modified file"""
+        with self.lock:
+            self.events[file_path] = (CHANGED, self.clock())
+
+    def add_deleted(self, file_path: Path):
+        """Add a deleted file"""
         with self.lock:
-            self.changed_files.add(file_path)
+            now = self.clock()
+            move = self.moves.pop(file_path, None)
+            if move:
+                self.events.pop(file_path, None)
+                file_path = move[0]
+            self.events[file_path] = (DELETED, now)
+
+    def add_moved(self, src: Path, dest: Path):
+        """Add a file moved within the watched tree"""
+        with self.lock:
+            now = self.clock()
+            origin = self.moves.pop(src, (src, now))[0]
+            prior = self.events.pop(src, None)
+            if origin != dest:
+                self.moves[dest] = (origin, now)
+            if prior and prior[0] == CHANGED:
+                self.events[dest] = (CHANGED, now)
+            else:
+                self.events.pop(dest, None)
+
+    def add_deleted_dir(self, directory: Path):
+        """Add a directory deleted or moved out of the watched tree
+
+        Pending changes below it are dropped: those files no longer exist.
+        """
+        with self.lock:
+            for path, (kind, _) in list(self.events.items()):
+                if kind == CHANGED and directory in path.parents:
+                    del self.events[path]
+            self.directories[directory] = (None, self.clock())
+
+    def add_moved_dir(self, src: Path, dest: Path):
+        """Add a directory moved within the watched tree"""
+        with self.lock:
+            self.directories[src] = (dest, self.clock())
+
+    def drain(self, quiet_seconds: float = 0.0) -> ChangeSet:
+        """Remove and return events that have been quiet for quiet_seconds"""
+        changes = ChangeSet()
+        with self.lock:
+            cutoff = self.clock() - quiet_seconds
+            for path, (kind, ts) in list(self.events.items()):
+                if ts <= cutoff:
+                    del self.events[path]
+                    (changes.changed if kind == CHANGED else changes.deleted).add(path)
+            for dest, (src, ts) in list(self.moves.items()):
+                if ts <= cutoff:
+                    del self.moves[dest]
+                    changes.moved[src] = dest
+            for src, (dest, ts) in list(self.directories.items()):
+                if ts <= cutoff:
+                    del self.directories[src]
+                    if dest is None:
+                        changes.deleted_dirs.add(src)
+                    else:
+                        changes.moved_dirs[src] = dest
+        return changes
 
     def get_and_clear(self) -> Set[Path]:
-        """Get all changes and clear collection"""
+        """Get all created/modified files and clear them from the collection"""
         with self.lock:
-            files = self.changed_files.copy()
-            self.changed_files.clear()
+            files = {p for p, (kind, _) in self.events.items() if kind == CHANGED}
+            for path in files:
+                del self.events[path]
             return files
 
     def count(self) -> int:
         """Get count of pending changes"""
         with self.lock:
-            return len(self.changed_files)
+            return len(self.events) + len(self.moves) + len(self.directories)
 
 class DocumentEventHandler(FileSystemEventHandler):
     """Handles file system events for documents"""
@@ -79,7 +198,9 @@ class DocumentEventHandler(FileSystemEventHandler):
 
     def on_created(self, event: FileSystemEvent):
         """Handle file creation"""
-        if not event.is_directory:
+        if event.is_directory:
+            self._handle_directory(Path(event.src_path))
+        else:
             self._handle_change(event.src_path)
 
     def on_modified(self, event: FileSystemEvent):
@@ -88,25 +209,66 @@ class DocumentEventHandler(FileSystemEventHandler):
             self._handle_change(event.src_path)
 
     def on_moved(self, event: FileSystemEvent):
-        """Handle file move/rename"""
-        if not event.is_directory:
-            # When files are moved INTO the watched directory,
-            # treat them as new files and queue for processing
-            self._handle_change(event.dest_path)
+        """Handle file move/rename
+
+        Tracked -> tracked is a move (store path updated, no re-embed).
+        Untracked -> tracked is a new file; renaming to an unsupported type
+        is a delete. Moves into excluded folders (quarantine) are ignored.
+        """
+        src, dest = Path(event.src_path), Path(event.dest_path)
+        if event.is_directory:
+            self._handle_directory(src, moved_or_deleted=True)
+            self._handle_directory(dest)
+            if not self._is_excluded(src) and not self._is_excluded(dest):
+                self.collector.add_moved_dir(src, dest)
+                self.timer.trigger()
+            return
+        src_tracked, dest_tracked = self._is_tracked(src), self._is_tracked(dest)
+        if src_tracked and dest_tracked:
+            self.collector.add_moved(src, dest)
+        elif dest_tracked:
+            self.collector.add(dest)
+        elif src_tracked and not self._is_excluded(dest):
+            self.collector.add_deleted(src)
+        else:
+            return
+        self.timer.trigger()
 
     def on_deleted(self, event: FileSystemEvent):
-        """Handle file deletion"""
-        # For deletions, we might want to remove from DB
-        # For now, just skip - change detection will handle it
-        pass
+        """Handle file deletion (a directory moved out of the tree arrives here too)"""
+        if event.is_directory:
+            self._handle_directory(Path(event.src_path), moved_or_deleted=True)
+            if not self._is_excluded(Path(event.src_path)):
+                self.collector.add_deleted_dir(Path(event.src_path))
+                self.timer.trigger()
+        elif self._is_tracked(Path(event.src_path)):
+            self.collector.add_deleted(Path(event.src_path))
+            self.timer.trigger()
+
+    @staticmethod
+    def _handle_directory(path: Path, moved_or_deleted: bool = False):
+        """Keep memoized Obsidian vault roots in step with the folder tree
+
+        A .obsidian folder appearing or disappearing changes the vault of
+        everything below its parent; a folder moved away or deleted takes
+        its memoized entries with it.
+        """
+        if path.name == '.obsidian':
+            get_obsidian_detector().invalidate(path.parent)
+        elif moved_or_deleted:
+            get_obsidian_detector().invalidate(path)
 
     def _handle_change(self, file_path: str):
         """Process file change event"""
         path = Path(file_path)
-        if self._is_supported(path) and not self._is_excluded(path):
+        if self._is_tracked(path):
             self.collector.add(path)
             self.timer.trigger()
 
+    def _is_tracked(self, path: Path) -> bool:
+        """Check if path is a supported, non-excluded document"""
+        return self._is_supported(path) and not self._is_excluded(path)
+
     def _is_supported(self, path: Path) -> bool:
         """Check if file type is supported"""
         return path.suffix.lower() in self.SUPPORTED_EXTENSIONS
@@ -124,57 +286,177 @@ class DocumentEventHandler(FileSystemEventHandler):
 class IndexingCoordinator:
     """Coordinates the indexing process via queue
 
-    Routes all file changes through IndexingQueue for concurrent pipeline processing.
+    Routes new/modified files through IndexingQueue (in add_many batches of
+    batch_size, paced to max_rate files/second) and applies deletions and
+    moves to the vector store without re-hashing or re-embedding.
     """
 
-    def __init__(self, queue, collector: FileChangeCollector, batch_size: int):
+    def __init__(self, queue, collector: FileChangeCollector, batch_size: int,
+                 vector_store=None, progress_tracker=None,
+                 quiet_seconds: float = 0.0, max_rate: Optional[float] = None,
+                 sleep: Callable[[float], None] = time.sleep):
         self.queue = queue
         self.collector = collector
-        self.batch_size = batch_size
+        self.batch_size = max(1, batch_size)
+        self.vector_store = vector_store
+        self.progress_tracker = progress_tracker
+        self.quiet_seconds = quiet_seconds
+        self.max_rate = max_rate
+        self.sleep = sleep
+        self._lock = threading.Lock()
 
     def process_changes(self):
-        """Add all collected file changes to queue for processing"""
-        files = self.collector.get_and_clear()
-        if not files:
-            return
+        """Apply settled deletes/moves and queue settled file changes"""
+        with self._lock:
+            changes = self.collector.drain(self.quiet_seconds)
+            if not changes:
+                return
+
+            self._expand_directories(changes)
+            moved = self._apply_moves(changes)
+            deleted = self._apply_deletes(changes.deleted)
+            if moved or deleted:
+                self._refresh_keyword_index()
+            if changes.changed:
+                print(f"Queueing {len(changes.changed)} changed file(s) for processing")
+                self._queue_files(changes.changed)
+
+    def _expand_directories(self, changes: ChangeSet):
+        """Turn directory moves/deletes into moves/deletes of the documents below them"""
+        for src, dest in changes.moved_dirs.items():
+            for path in self._documents_under(src):
+                changes.moved.setdefault(path, dest / path.relative_to(src))
+        for directory in changes.deleted_dirs:
+            changes.deleted.update(self._documents_under(directory))
+
+    def _documents_under(self, directory: Path) -> List[Path]:
+        """Indexed documents below directory; empty if no store"""
+        if self.vector_store is None:
+            return []
+        try:
+            return [Path(p) for p in self.vector_store.document_paths_under(str(directory))]
+        except Exception as e:
+            print(f"  ✗ Failed to list documents under {directory.name}: {e}")
+            return []
+
+    def _apply_moves(self, changes: ChangeSet) -> int:
+        """Rename moved documents in the store; unknown sources are indexed as new
+
+        Returns:
+            Number of documents moved in the store
+        """
+        moved = 0
+        for src, dest in changes.moved.items():
+            if self._move_in_store(src, dest):
+                print(f"  Moved: {src.name} -> {dest.name}")
+                moved += 1
+            else:
+                changes.changed.add(dest)
+        return moved
+
+    def _move_in_store(self, src: Path, dest: Path) -> bool:
+        """Move document record; False if not indexed or no store"""
+        if self.vector_store is None:
+            return False
+        try:
+            return self.vector_store.move_document(str(src), str(dest))
+        except Exception as e:
+            print(f"  ✗ Failed to move {src.name}: {e}")
+            return False
+
+    def _apply_deletes(self, deleted: Set[Path]) -> int:
+        """Remove deleted documents from the store and progress tracker
+
+        Returns:
+            Number of documents that were indexed and are now removed
+        """
+        if self.vector_store is None:
+            return 0
+        removed = 0
+        for path in deleted:
+            try:
+                result = self.vector_store.delete_document(str(path))
+                if self.progress_tracker:
+                    self.progress_tracker.delete_document(str(path))
+                if result.get('found'):
+                    print(f"  Deleted: {path.name} ({result.get('chunks_deleted', 0)} chunks)")
+                    removed += 1
+            except Exception as e:
+                print(f"  ✗ Failed to delete {path.name}: {e}")
+        return removed
 
-        print(f"Queueing {len(files)} changed file(s) for processing")
-        self._queue_files(files)
+    def _refresh_keyword_index(self):
+        """Rebuild BM25 once per batch so removed or renamed documents stop matching"""
+        try:
+            self.vector_store.refresh_keyword_index()
+        except Exception as e:
+            print(f"  ✗ Failed to refresh keyword index: {e}")
 
     def _queue_files(self, files: Set[Path]):
-        """Add files to indexing queue"""
+        """Add all files to indexing queue in rate-limited batches"""
+        files_list = sorted(files)
+        queued_count = 0
+        for start in range(0, len(files_list), self.batch_size):
+            began = time.monotonic()
+            batch = files_list[start:start + self.batch_size]
+            queued_count += self._queue_batch(batch)
+            self._pace(len(batch), time.monotonic() - began)
+
+        print(f"Queued {queued_count} file(s) for concurrent pipeline processing")
+
+    def _queue_batch(self, batch) -> int:
+        """Queue one batch; falls back to per-file adds to isolate failures"""
         from pipeline import Priority
 
-        files_list = list(files)[:self.batch_size]
+        try:
+            self.queue.add_many(batch, priority=Priority.NORMAL, force=False)
+            return len(batch)
+        except Exception:
+            pass
 
-        queued_count = 0
-        for file_path in files_list:
+        queued = 0
+        for file_path in batch:
             try:
                 self.queue.add(file_path, priority=Priority.NORMAL, force=False)
-                queued_count += 1
-                print(f"  Queued: {file_path.name}")
+                queued += 1
             except Exception as e:
                 print(f"  ✗ Failed to queue {file_path.name}: {e}")
+        return queued
 
-        print(f"Queued {queued_count} file(s) for concurrent pipeline processing")
+    def _pace(self, count: int, elapsed: float):
+        """Sleep so enqueueing does not exceed max_rate files/second"""
+        if self.max_rate:
+            delay = count / self.max_rate - elapsed
+            if delay > 0:
+                self.sleep(delay)
 
 class FileWatcherService:
     """Main file watcher service - routes files to queue"""
 
-    def __init__(self, watch_path: Path, queue, debounce_seconds: float, batch_size: int):
+    def __init__(self, watch_path: Path, queue, debounce_seconds: float, batch_size: int,
+                 vector_store=None, progress_tracker=None,
+                 max_enqueue_rate: Optional[float] = None):
         self.watch_path = watch_path
         self.collector = FileChangeCollector()
-        self.coordinator = IndexingCoordinator(queue, self.collector, batch_size)
-        self.timer = DebounceTimer(debounce_seconds, self._on_debounce)
+        self.coordinator = IndexingCoordinator(
+            queue, self.collector, batch_size,
+            vector_store=vector_store,
+            progress_tracker=progress_tracker,
+            quiet_seconds=debounce_seconds,
+            max_rate=max_enqueue_rate
+        )
+        self.timer = DebounceTimer(debounce_seconds, self._on_debounce, max_delay=debounce_seconds)
         self.handler = DocumentEventHandler(self.collector, self.timer)
         self.observer: Optional[Observer] = None
 
     def _on_debounce(self):
-        """Called after debounce period"""
+        """Called after debounce period; re-arms while paths are still settling"""
         try:
             self.coordinator.process_changes()
         except Exception as e:
             print("Error during indexing")
+        if self.collector.count():
+            self.timer.trigger()
 
     def start(self):
         """Start watching for file changes"""
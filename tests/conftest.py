@@ -6,7 +6,13 @@ Per Kent Beck TDD: Good fixtures reduce test setup duplication.
 """
 import os
 import pytest
+import shutil
+import socket
+import struct
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock
 
@@ -419,3 +425,124 @@ def temp_db_minimal():
 
     os.close(fd)
     os.unlink(path)
+
+
+# =============================================================================
+# ClamAV Fixtures
+# =============================================================================
+
+class FakeClamd:
+    """Minimal clamd on a Unix socket: IDSESSION, INSTREAM, PING, STATS, VERSION
+
+    Streams containing a signature byte string are reported as infected.
+    Records connections, streamed bytes and peak concurrent scans.
+    """
+
+    SIGNATURES = {b'EICAR-TEST': 'Eicar-Test-Signature'}
+
+    def __init__(self, max_threads=10, delay=0.0, stream_max=25 * 1024 * 1024):
+        self.max_threads = max_threads
+        self.delay = delay
+        self.stream_max = stream_max
+        self.error = None  # Set to make every INSTREAM answer '<error> ERROR'
+        self.version = 'ClamAV 1.0.5/27301/Tue Jun  4 08:35:41 2024'
+        self.connections = 0
+        self.scans = 0
+        self.streamed_bytes = 0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+        self._dir = tempfile.mkdtemp(prefix='clamd')
+        self.address = os.path.join(self._dir, 'clamd.sock')
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.address)
+        self._server.listen(64)
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        reader = conn.makefile('rb')
+        session, request_id = False, 0
+        try:
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                command = line.strip().lstrip(b'nz')
+                if command == b'IDSESSION':
+                    session = True
+                    continue
+                if command == b'END':
+                    return
+                request_id += 1
+                reply = self._handle(command, reader)
+                prefix = f'{request_id}: ' if session else ''
+                conn.sendall(f'{prefix}{reply}\n'.encode())
+                if not session:
+                    return
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def _handle(self, command, reader):
+        if command == b'PING':
+            return 'PONG'
+        if command == b'VERSION':
+            return self.version
+        if command == b'STATS':
+            return f'POOLS: 1\n\nTHREADS: live 1  idle 0 max {self.max_threads}\nEND'
+        if command == b'INSTREAM':
+            data = bytearray()
+            while True:
+                size = struct.unpack('!L', reader.read(4))[0]
+                if not size:
+                    break
+                data += reader.read(size)
+            with self._lock:
+                self.scans += 1
+                self.streamed_bytes += len(data)
+                self.active += 1
+                self.peak_active = max(self.peak_active, self.active)
+            try:
+                time.sleep(self.delay)
+                if self.error:
+                    return f'{self.error} ERROR'
+                if len(data) > self.stream_max:
+                    return 'INSTREAM size limit exceeded. ERROR'
+                for signature, name in self.SIGNATURES.items():
+                    if signature in data:
+                        return f'stream: {name} FOUND'
+                return 'stream: OK'
+            finally:
+                with self._lock:
+                    self.active -= 1
+        return 'UNKNOWN COMMAND'
+
+    def stop(self):
+        self._server.close()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+@pytest.fixture
+def fake_clamd():
+    """A running FakeClamd; ClamAV connection pools are reset around the test"""
+    from ingestion.clamd_client import ClamdPool
+
+    ClamdPool._registry.clear()
+    clamd = FakeClamd()
+    yield clamd
+    for pool in ClamdPool._registry.values():
+        pool.close()
+    ClamdPool._registry.clear()
+    clamd.stop()
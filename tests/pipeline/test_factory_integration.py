@@ -39,9 +39,29 @@ class TestPipelineFactoryReranker:
             factory.create_reranker()
             mock_bge.assert_called_once_with(
                 model_name="BAAI/bge-reranker-large",
-                enable_timing=True
+                enable_timing=True,
+                mode="default",
+                max_length=None,
+                batch_tokens=None,
+                time_budget_ms=None,
+                quantization="avx512_vnni",
+                cache_size=10000
             )
 
+    def test_factory_passes_cpu_mode_settings(self):
+        """Factory must pass CPU reranking settings through to BGEReranker."""
+        config = PipelineConfig(
+            reranking=RerankingConfig(enabled=True, mode="cpu", time_budget_ms=500)
+        )
+        factory = PipelineFactory(config)
+
+        with patch('pipeline.rerankers.bge_reranker.BGEReranker') as mock_bge:
+            factory.create_reranker()
+
+        kwargs = mock_bge.call_args.kwargs
+        assert kwargs["mode"] == "cpu"
+        assert kwargs["time_budget_ms"] == 500
+
     def test_factory_reranking_top_n_property(self):
         """Factory.reranking_top_n must return config value."""
         config = PipelineConfig(
@@ -361,3 +381,18 @@ reranking:
         assert isinstance(factory, PipelineFactory)
         # Should have default config values
         assert factory.config.chunking.strategy == 'hybrid'
+
+    def test_default_mode(self):
+        """RerankingConfig.mode defaults to full-precision default mode."""
+        config = RerankingConfig()
+        assert config.mode == "default"
+        assert config.time_budget_ms is None
+
+    def test_cpu_mode_from_env(self):
+        """RERANKING_* env vars configure CPU mode."""
+        env = {"RERANKING_MODE": "cpu", "RERANKING_TIME_BUDGET_MS": "400"}
+        with patch.dict(os.environ, env):
+            config = PipelineConfig.from_env()
+        assert config.reranking.mode == "cpu"
+        assert config.reranking.time_budget_ms == 400
+        assert config.reranking.max_length is None
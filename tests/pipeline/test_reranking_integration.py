@@ -106,6 +106,161 @@ class TestBGERerankerBehavior:
         assert reranker.is_enabled is True
 
 
+class TestCpuRerankMode:
+    """Test CPU mode: focused passages, token-budgeted batches, time budget."""
+
+    def test_focus_passage_keeps_query_term_hits(self):
+        """Long passages are cut around the query terms, not from the start."""
+        from pipeline.rerankers.bge_reranker import focus_passage
+
+        text = "filler " * 200 + "the quarantine manager restores files " + "filler " * 200
+
+        window = focus_passage(text, "how does quarantine restore work", 120)
+
+        assert len(window) <= 120
+        assert "quarantine" in window
+
+    def test_focus_passage_keeps_short_text(self):
+        """Passages within budget are returned unchanged."""
+        from pipeline.rerankers.bge_reranker import focus_passage
+
+        assert focus_passage("short text", "query", 100) == "short text"
+
+    def test_batches_are_length_sorted_within_token_budget(self):
+        """Each predict() call gets similar-length pairs within the token budget."""
+        reranker = BGEReranker(mode="cpu", max_length=64, batch_tokens=128)
+        passages = ["x" * 200, "y" * 8, "z" * 200, "w" * 8]
+
+        batches = reranker._batches("q", passages)
+
+        assert batches[0] == [1, 3]
+        assert sorted(i for batch in batches for i in batch) == [0, 1, 2, 3]
+        assert all(len(batch) * 64 <= 128 for batch in batches)
+
+    def test_batched_scores_map_back_to_candidates(self):
+        """Scores from reordered batches are attached to the right candidate."""
+        with patch.object(BGEReranker, '_load_model'):
+            reranker = BGEReranker(mode="cpu", time_budget_ms=0)
+            reranker._model = MagicMock()
+            reranker._model.predict.side_effect = lambda pairs, **kw: [
+                0.9 if p.startswith("best") else 0.1 for _, p in pairs
+            ]
+
+            candidates = [{"content": "worse " * 50}, {"content": "best"}]
+            result = reranker.rerank("query", candidates, top_k=2)
+
+            assert result[0]["content"] == "best"
+            assert result[0]["rerank_score"] == 0.9
+
+    def test_time_budget_keeps_fused_order_for_unscored(self):
+        """Candidates not scored before the deadline keep their fused position."""
+        with patch.object(BGEReranker, '_load_model'), \
+             patch('pipeline.rerankers.bge_reranker.time.perf_counter',
+                   side_effect=[0.0, 0.0, 5.0, 5.0]):
+            reranker = BGEReranker(mode="cpu", max_length=64, batch_tokens=64,
+                                   time_budget_ms=100)
+            reranker._model = MagicMock()
+            reranker._model.predict.return_value = [0.5]
+
+            candidates = [{"content": "a"}, {"content": "b"}, {"content": "c"}]
+            result = reranker.rerank("query", candidates, top_k=3)
+
+            assert reranker._model.predict.call_count == 1
+            assert [r["content"] for r in result] == ["a", "b", "c"]
+            assert result[0]["rerank_score"] == 0.5
+            assert result[1]["rerank_score"] is None
+
+    def test_cpu_mode_loads_int8_onnx_model(self, tmp_path):
+        """CPU mode loads the quantized ONNX file once it has been exported."""
+        reranker = BGEReranker(model_name="org/model", mode="cpu", onnx_dir=str(tmp_path))
+        onnx_file = tmp_path / "org--model" / "onnx" / "model_qint8_avx512_vnni.onnx"
+        onnx_file.parent.mkdir(parents=True)
+        onnx_file.touch()
+        cross_encoder = MagicMock()
+
+        with patch.object(BGEReranker, '_cross_encoder_class', return_value=cross_encoder):
+            reranker.warmup()
+
+        cross_encoder.assert_called_once_with(
+            str(tmp_path / "org--model"), backend="onnx", max_length=256,
+            model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"}
+        )
+
+    def test_unknown_mode_rejected(self):
+        """Typos in reranking.mode fail fast."""
+        with pytest.raises(ValueError):
+            BGEReranker(mode="gpu-fast")
+
+
+class TestRerankScoreCache:
+    """Test reuse of cross-encoder scores across repeated queries."""
+
+    @staticmethod
+    def scoring_reranker(**kwargs):
+        reranker = BGEReranker(**kwargs)
+        reranker._model = MagicMock()
+        reranker._model.predict.side_effect = lambda pairs, **kw: [
+            float(len(p)) for _, p in pairs
+        ]
+        return reranker
+
+    def test_repeated_query_only_scores_unseen_chunks(self):
+        """Overlapping candidates are served from cache, new ones scored."""
+        reranker = self.scoring_reranker()
+        first = [{"chunk_id": 1, "content": "a"}, {"chunk_id": 2, "content": "bb"}]
+        second = first + [{"chunk_id": 3, "content": "ccc"}]
+
+        reranker.rerank("Query ", first, top_k=1)
+        result = reranker.rerank("  query", second, top_k=3)
+
+        scored = reranker._model.predict.call_args_list[-1].args[0]
+        assert scored == [("  query", "ccc")]
+        assert [r["chunk_id"] for r in result] == [3, 2, 1]
+
+    def test_reindexed_chunk_is_rescored(self):
+        """A chunk id whose content changed does not reuse the old score."""
+        reranker = self.scoring_reranker()
+        reranker.rerank("q", [{"chunk_id": 1, "content": "old"}, {"chunk_id": 2, "content": "x"}], 2)
+
+        result = reranker.rerank(
+            "q", [{"chunk_id": 1, "content": "new text"}, {"chunk_id": 2, "content": "x"}], 2
+        )
+
+        assert reranker._model.predict.call_args.args[0] == [("q", "new text")]
+        assert result[0]["rerank_score"] == 8.0
+
+    def test_candidates_without_chunk_id_are_not_cached(self):
+        """Results without a chunk id are always scored."""
+        reranker = self.scoring_reranker()
+        candidates = [{"content": "a"}, {"content": "bb"}]
+
+        reranker.rerank("q", candidates, 2)
+        reranker.rerank("q", candidates, 2)
+
+        assert reranker._model.predict.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """Least recently used entries are evicted beyond cache_size."""
+        from pipeline.rerankers.score_cache import RerankScoreCache
+
+        cache = RerankScoreCache("model", max_size=2)
+        candidates = [{"chunk_id": i, "content": str(i)} for i in range(3)]
+        cache.store("q", candidates, [0, 1, 2], [0.1, 0.2, 0.3])
+
+        assert len(cache) == 2
+        assert cache.lookup("q", candidates) == [None, 0.2, 0.3]
+
+    def test_cache_disabled_with_zero_size(self):
+        """cache_size=0 scores every pair."""
+        reranker = self.scoring_reranker(cache_size=0)
+        candidates = [{"chunk_id": 1, "content": "a"}, {"chunk_id": 2, "content": "bb"}]
+
+        reranker.rerank("q", candidates, 2)
+        reranker.rerank("q", candidates, 2)
+
+        assert reranker._model.predict.call_count == 2
+
+
 class TestNoopRerankerBehavior:
     """Test NoopReranker passthrough behavior."""
 
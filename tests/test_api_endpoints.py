@@ -520,6 +520,7 @@ class TestIndexingStatusEndpoint:
 
         state.indexing.worker = Mock()
         state.indexing.worker.is_running.return_value = True
+        state.indexing.pipeline_coordinator = None
 
         # Try to call status endpoint
         response = client.get("/indexing/status")
@@ -0,0 +1,236 @@
+"""
+Tests for the pooled clamd client
+
+Runs against FakeClamd (tests/conftest.py), a local Unix socket server
+speaking clamd's IDSESSION/INSTREAM protocol.
+"""
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config import MalwareDetectionConfig
+from ingestion.clamd_client import CircuitBreaker, ClamdError, ClamdPool
+from ingestion.file_probe import FileProbe
+from ingestion.malware_detection import (
+    AdvancedMalwareDetector, ClamAVStrategy, CLAMAV_OVER_LIMIT, CLAMAV_SKIPPED
+)
+
+
+class TestClamdPool:
+    """Connections are pooled and content is streamed"""
+
+    def test_connections_are_reused(self, fake_clamd):
+        pool = ClamdPool(fake_clamd.address, max_concurrency=2)
+
+        for _ in range(5):
+            assert pool.instream(b'clean content') is None
+
+        assert fake_clamd.scans == 5
+        assert fake_clamd.connections == 1
+
+    def test_large_content_streamed_in_chunks(self, fake_clamd):
+        pool = ClamdPool(fake_clamd.address, max_concurrency=1)
+        pool.CHUNK_SIZE = 1024
+        data = b'x' * 10_000 + b'EICAR-TEST'
+
+        assert pool.instream(data) == 'Eicar-Test-Signature'
+        assert fake_clamd.streamed_bytes == len(data)
+
+    def test_streams_shared_probe_buffer(self, fake_clamd, tmp_path):
+        """The probe content is streamed; the probe can still close"""
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4 ' + b'a' * 5000)
+        pool = ClamdPool(fake_clamd.address, max_concurrency=1)
+
+        with FileProbe(path) as probe:
+            assert pool.instream(probe.content) is None
+            assert probe.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_concurrency_bounded_by_clamd_threads(self, fake_clamd):
+        fake_clamd.max_threads = 2
+        fake_clamd.delay = 0.05
+        pool = ClamdPool(fake_clamd.address)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(pool.instream, [b'data'] * 12))
+
+        assert fake_clamd.scans == 12
+        assert fake_clamd.peak_active <= 2
+
+    def test_size_limit_raises_clamd_error(self, fake_clamd):
+        fake_clamd.stream_max = 100
+        pool = ClamdPool(fake_clamd.address, max_concurrency=1)
+
+        with pytest.raises(ClamdError):
+            pool.instream(b'y' * 1000)
+
+        assert pool._idle == []  # Session discarded, not returned to the pool
+        assert pool.instream(b'small') is None
+        assert fake_clamd.connections == 2
+
+    def test_recovers_from_closed_idle_session(self, fake_clamd):
+        pool = ClamdPool(fake_clamd.address, max_concurrency=1)
+        pool.instream(b'first')
+        pool._idle[0].sock.close()  # clamd IdleTimeout
+
+        assert pool.instream(b'second') is None
+        assert fake_clamd.connections == 2
+
+    def test_version(self, fake_clamd):
+        assert ClamdPool(fake_clamd.address).version() == fake_clamd.version
+
+    def test_version_none_when_unreachable(self, tmp_path):
+        assert ClamdPool(str(tmp_path / 'missing.sock')).version() is None
+
+    def test_tcp_address(self):
+        pool = ClamdPool('clamav:3310')
+        assert pool.address == 'clamav:3310'
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+        for _ in range(3):
+            assert breaker.allow()
+            breaker.record_failure()
+
+        assert breaker.state == 'open'
+        assert breaker.allow() is False
+
+    def test_success_resets_count(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == 'closed'
+
+    def test_half_open_allows_one_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # Trial in flight
+        breaker.record_success()
+        assert breaker.state == 'closed'
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.allow() is False
+
+
+class TestSlowClamd:
+    """A slow clamd trips the breaker; files fall back to the hash blacklist"""
+
+    def test_timeouts_open_breaker_and_skip_quickly(self, fake_clamd, tmp_path):
+        fake_clamd.delay = 0.5
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4')
+        strategy = ClamAVStrategy(fake_clamd.address, timeout=0.05, max_concurrency=4)
+
+        results = [strategy.validate(path, 'pdf') for _ in range(3)]
+        assert all(r.reason == CLAMAV_SKIPPED for r in results)
+        assert strategy.pool.breaker.state == 'open'
+
+        start = time.perf_counter()
+        assert strategy.validate(path, 'pdf').reason == CLAMAV_SKIPPED
+        assert time.perf_counter() - start < 0.01
+
+    def test_blacklist_fallback_when_clamav_skipped(self, fake_clamd, tmp_path):
+        path = tmp_path / 'known_bad.pdf'
+        path.write_bytes(b'%PDF-1.4 known bad')
+        blacklist = tmp_path / 'hashes.txt'
+        blacklist.write_text(hashlib.sha256(path.read_bytes()).hexdigest() + '\n')
+        detector = AdvancedMalwareDetector(MalwareDetectionConfig(
+            clamav_enabled=True,
+            clamav_socket=fake_clamd.address,
+            hash_blacklist_enabled=False,
+            hash_blacklist_path=str(blacklist),
+            yara_enabled=False,
+            allowlist_path=str(tmp_path / 'none.txt')
+        ))
+        detector.clamav.pool.breaker._opened_at = time.monotonic()  # clamd slow
+
+        result = detector.validate(path, 'pdf')
+
+        assert result.is_valid is False
+        assert result.validation_check == 'HashBlacklistStrategy'
+
+    def test_over_limit_file_not_streamed_and_cached(self, fake_clamd, tmp_path):
+        path = tmp_path / 'big.pdf'
+        path.write_bytes(b'%PDF-1.4 ' + b'z' * 2000)
+        detector = AdvancedMalwareDetector(MalwareDetectionConfig(
+            clamav_enabled=True,
+            clamav_socket=fake_clamd.address,
+            clamav_stream_max_bytes=1000,
+            hash_blacklist_enabled=False,
+            yara_enabled=False,
+            allowlist_path=str(tmp_path / 'none.txt')
+        ))
+        cached = []
+        detector._get_cached_result = lambda *args: None
+        detector._cache_result = lambda file_hash, result: cached.append(result)
+
+        assert detector.clamav.validate(path, 'pdf').reason == CLAMAV_OVER_LIMIT
+        result = detector.validate(path, 'pdf')
+
+        assert result.is_valid is True
+        assert fake_clamd.scans == 0
+        assert len(cached) == 1
+
+    def test_refused_by_clamd_is_cached(self, fake_clamd, tmp_path):
+        """clamd's own limit is lower than the configured one"""
+        fake_clamd.stream_max = 100
+        path = tmp_path / 'big.pdf'
+        path.write_bytes(b'%PDF-1.4 ' + b'z' * 2000)
+        strategy = ClamAVStrategy(fake_clamd.address, max_concurrency=1)
+
+        result = strategy.validate(path, 'pdf')
+
+        assert result.reason == CLAMAV_OVER_LIMIT
+        assert strategy.pool.breaker.state == 'closed'
+
+    def test_other_clamd_error_is_skipped(self, fake_clamd, tmp_path):
+        """Only the size-limit reply is final; other ERRORs count as failures"""
+        fake_clamd.error = "Can't allocate memory."
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4 content')
+        strategy = ClamAVStrategy(fake_clamd.address, max_concurrency=1)
+        strategy.pool.breaker.failure_threshold = 1
+
+        result = strategy.validate(path, 'pdf')
+
+        assert result.reason == CLAMAV_SKIPPED
+        assert result.is_valid is True
+        assert strategy.pool.breaker.state == 'open'
+
+    def test_skipped_results_are_not_cached(self, fake_clamd, tmp_path):
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4 content')
+        detector = AdvancedMalwareDetector(MalwareDetectionConfig(
+            clamav_enabled=True,
+            clamav_socket=fake_clamd.address,
+            hash_blacklist_enabled=False,
+            yara_enabled=False,
+            allowlist_path=str(tmp_path / 'none.txt')
+        ))
+        detector.clamav.pool.breaker._opened_at = time.monotonic()
+        cached = []
+        detector._get_cached_result = lambda *args: None
+        detector._cache_result = lambda file_hash, result: cached.append(result)
+
+        detector.validate(path, 'pdf')
+        assert cached == []
+
+        detector.clamav.pool.breaker.record_success()
+        detector.validate(path, 'pdf')
+        assert len(cached) == 1
@@ -410,6 +410,20 @@ class TestVectorStore:
 
         store.close()
 
+    def test_document_paths_under_matches_directory_prefix(self, tmp_path):
+        """Only documents below the directory, not siblings sharing a prefix"""
+        config = DatabaseConfig(path=str(tmp_path / "test.db"), embedding_dim=1024,
+                                require_vec_extension=True)
+        store = VectorStore(config)
+        chunk = [{"content": "Chunk", "chunk_index": 0, "page": 1}]
+        for path in ("/kb/notes/a.md", "/kb/notes/deep/b.md", "/kb/notes2/c.md", "/kb/NOTES/d.md"):
+            store.add_document(path, path, chunk, [np.random.rand(1024).tolist()])
+
+        paths = store.document_paths_under("/kb/notes")
+
+        assert sorted(paths) == ["/kb/notes/a.md", "/kb/notes/deep/b.md"]
+        store.close()
+
     def test_delete_nonexistent_document_returns_not_found(self, tmp_path):
         """Deleting non-existent document should return not found"""
         db_path = tmp_path / "test.db"
@@ -0,0 +1,171 @@
+"""
+Tests for the converted DoclingDocument cache
+
+Converted documents are cached on disk keyed by file hash, Docling versions
+and pipeline options, so re-chunking skips conversion; entries are evicted
+by age and total size.
+"""
+import os
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from config import DoclingConfig
+from ingestion.docling_cache import DoclingDocumentCache
+from ingestion.extractors.docling_extractor import DoclingExtractor
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DoclingDocumentCache(tmp_path / 'cache', max_bytes=10_000, max_age_seconds=3600)
+    with patch.object(DoclingDocumentCache, '_dump', side_effect=lambda doc: doc.encode()), \
+         patch.object(DoclingDocumentCache, '_load', side_effect=lambda data: data.decode()):
+        yield cache
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'book.pdf'
+    path.write_bytes(b'%PDF-1.4 original')
+    return path
+
+
+def age(path: Path, seconds: float):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+class TestCacheKey:
+
+    def test_key_follows_content_and_options(self, cache, source):
+        key = cache.key(source, {'method': 'docling'})
+
+        assert key == cache.key(source, {'method': 'docling'})
+        assert key != cache.key(source, {'method': 'docling_text'})
+        assert key != cache.key(source, {'method': 'docling'}, page_range=(3, 4))
+
+        source.write_bytes(b'%PDF-1.4 edited')
+        assert key != cache.key(source, {'method': 'docling'})
+
+    def test_key_follows_docling_version(self, cache, source):
+        key = cache.key(source, {})
+        cache._versions = {'docling': 'next'}
+
+        assert key != cache.key(source, {})
+
+    def test_disabled_by_config(self):
+        assert DoclingDocumentCache.from_config(DoclingConfig(cache_enabled=False)) is None
+
+
+class TestCacheEntries:
+
+    def test_round_trip(self, cache):
+        assert cache.get('k') is None
+
+        cache.put('k', 'document')
+
+        assert cache.get('k') == 'document'
+
+    def test_hit_refreshes_age(self, cache):
+        cache.put('k', 'document')
+        entry = cache._entry('k')
+        age(entry, 600)
+
+        cache.get('k')
+
+        assert time.time() - entry.stat().st_mtime < 60
+
+    def test_corrupt_entry_dropped(self, cache):
+        cache.directory.mkdir()
+        cache._entry('k').write_bytes(b'not gzip')
+
+        assert cache.get('k') is None
+        assert not cache._entry('k').exists()
+
+    def test_put_failure_not_raised(self, cache):
+        with patch.object(DoclingDocumentCache, '_dump', side_effect=ValueError('bad')):
+            cache.put('k', 'document')
+
+        assert cache.get('k') is None
+
+
+class TestEviction:
+
+    def test_expired_entries_removed(self, cache):
+        cache.put('old', 'a')
+        cache.put('new', 'b')
+        age(cache._entry('old'), 7200)
+
+        assert cache.evict() == 1
+        assert cache.get('old') is None
+        assert cache.get('new') == 'b'
+
+    def test_oldest_removed_beyond_size(self, cache):
+        for i, name in enumerate(['first', 'second', 'third']):
+            cache.put(name, os.urandom(3000).hex())
+            age(cache._entry(name), 300 - i * 100)
+
+        cache.put('fourth', os.urandom(3000).hex())  # Over 10 kB: evicts oldest
+
+        remaining = sorted(p.name.split('.')[0] for p in cache.directory.iterdir())
+        assert 'first' not in remaining
+        assert 'fourth' in remaining
+        assert sum(p.stat().st_size for p in cache.directory.iterdir()) <= cache.max_bytes
+
+
+class TestExtractorUsesCache:
+    """A second conversion of an unchanged file is served from the cache"""
+
+    @pytest.fixture
+    def extractor_cache(self, cache):
+        with patch('ingestion.docling_cache.get_docling_cache', return_value=cache), \
+             patch.object(DoclingExtractor, '_check_for_conversion_failure'), \
+             patch.object(DoclingExtractor, '_extract_hybrid_chunks',
+                          side_effect=lambda document: [(document, 0)]):
+            yield cache
+
+    def test_second_conversion_skips_converter(self, extractor_cache, source):
+        converter = Mock()
+        converter.convert.return_value.document = 'converted text'
+
+        first = DoclingExtractor._convert(source, converter, 'docling')
+        second = DoclingExtractor._convert(source, converter, 'docling')
+
+        converter.convert.assert_called_once()
+        assert first.pages == second.pages == [('converted text', 0)]
+
+    def test_text_pipeline_cached_separately(self, extractor_cache, source):
+        converter = Mock()
+        converter.convert.return_value.document = 'converted text'
+
+        DoclingExtractor._convert(source, converter, 'docling')
+        DoclingExtractor._convert(source, converter, 'docling_text')
+
+        assert converter.convert.call_count == 2
+
+    def test_missing_file_converts_uncached(self, extractor_cache, tmp_path):
+        converter = Mock()
+        converter.convert.return_value.document = 'converted text'
+
+        DoclingExtractor._convert(tmp_path / 'gone.pdf', converter, 'docling')
+
+        converter.convert.assert_called_once()
+
+
+class TestDoclingDocumentRoundTrip:
+    """Real serialization with docling-core"""
+
+    def test_document_survives_cache(self, tmp_path):
+        pytest.importorskip('docling_core')
+        from docling_core.types.doc import DoclingDocument, DocItemLabel
+
+        document = DoclingDocument(name='book')
+        document.add_heading('Chapter 1')
+        document.add_text(label=DocItemLabel.TEXT, text='Body text')
+        cache = DoclingDocumentCache(tmp_path, max_bytes=10**7, max_age_seconds=3600)
+
+        cache.put('k', document)
+
+        assert cache.get('k').export_to_markdown() == document.export_to_markdown()
@@ -1,7 +1,7 @@
 """
 Tests for EPUB extractor functionality
 
-Verifies the EPUB→PDF conversion pipeline:
+Verifies the EPUB→PDF conversion pipeline (EPUB_CONVERT_TO_PDF=true):
 1. EPUB files are converted to PDF (not extracted)
 2. Resulting PDFs are left in knowledge_base/ for later processing
 3. Original EPUB files are moved to original/ subdirectory
@@ -13,10 +13,17 @@ being extracted during conversion instead of just being converted.
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+from config import default_config
 from ingestion.extractors import EpubExtractor
 from domain_models import ExtractionResult
 
 
+@pytest.fixture(autouse=True)
+def convert_to_pdf(monkeypatch):
+    """Pandoc conversion is opt-in; native chapter extraction is tested in test_epub_native.py"""
+    monkeypatch.setattr(default_config.docling, 'epub_convert_to_pdf', True)
+
+
 class TestEpubConversionOnly:
     """Test that EPUB conversion returns empty result (no extraction)"""
 
@@ -0,0 +1,172 @@
+"""
+Tests for native EPUB extraction
+
+EPUB chapters are read from the zip in spine order and chunked with Docling's
+HTML backend; chunk page numbers are chapter numbers. Pandoc conversion to
+PDF is opt-in (EPUB_CONVERT_TO_PDF).
+"""
+import zipfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from config import default_config
+from ingestion.epub_spine import iter_spine
+from ingestion.extractors.docling_extractor import DoclingExtractor
+from ingestion.extractors.epub_extractor import EpubExtractor
+from pipeline.indexing_queue import Priority, QueueItem
+from pipeline.pipeline_coordinator import PipelineCoordinator
+
+CONTAINER = '''<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>'''
+
+PACKAGE = '''<?xml version="1.0"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+  <manifest>
+    <item id="c2" href="text/chapter%202.xhtml" media-type="application/xhtml+xml"/>
+    <item id="c1" href="text/chapter1.xhtml" media-type="application/xhtml+xml"/>
+    <item id="css" href="style.css" media-type="text/css"/>
+    <item id="gone" href="text/missing.xhtml" media-type="application/xhtml+xml"/>
+  </manifest>
+  <spine>
+    <itemref idref="c1"/>
+    <itemref idref="css"/>
+    <itemref idref="gone"/>
+    <itemref idref="c2"/>
+  </spine>
+</package>'''
+
+
+def chapter(title, body):
+    return (f'<?xml version="1.0" encoding="utf-8"?><html xmlns="http://www.w3.org/1999/xhtml">'
+            f'<body><h1>{title}</h1><p>{body}</p></body></html>')
+
+
+@pytest.fixture
+def epub(tmp_path):
+    path = tmp_path / 'book.epub'
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr('mimetype', 'application/epub+zip')
+        z.writestr('META-INF/container.xml', CONTAINER)
+        z.writestr('OEBPS/content.opf', PACKAGE)
+        z.writestr('OEBPS/text/chapter1.xhtml', chapter('Beginnings', 'First chapter text.'))
+        z.writestr('OEBPS/text/chapter 2.xhtml', chapter('Endings', 'Second chapter text.'))
+        z.writestr('OEBPS/style.css', 'p {}')
+    return path
+
+
+class TestSpine:
+
+    def test_reading_order_and_chapter_numbers(self, epub):
+        documents = list(iter_spine(epub))
+
+        assert [(d.chapter, d.name) for d in documents] == [
+            (1, 'OEBPS/text/chapter1.xhtml'),
+            (3, 'OEBPS/text/chapter 2.xhtml'),  # Missing entry keeps its number
+        ]
+        assert b'Beginnings' in documents[0].content
+
+    def test_missing_container(self, tmp_path):
+        path = tmp_path / 'bad.epub'
+        with zipfile.ZipFile(path, 'w') as z:
+            z.writestr('mimetype', 'application/epub+zip')
+
+        with pytest.raises(ValueError, match='container'):
+            iter_spine(path)
+
+
+class TestEpubExtractor:
+
+    @pytest.fixture
+    def chunk_html(self):
+        def chunks(html, name):
+            return [(f'{name}: {len(html)}', 0)]
+
+        with patch('ingestion.extractors.epub_extractor.DOCLING_AVAILABLE', True), \
+             patch('ingestion.extractors.epub_extractor.DOCLING_CHUNKING_AVAILABLE', True), \
+             patch.object(DoclingExtractor, 'chunk_html', side_effect=chunks) as chunk:
+            yield chunk
+
+    def test_chapters_chunked_without_conversion(self, epub, chunk_html):
+        with patch('subprocess.run', side_effect=AssertionError('pandoc run')):
+            result = EpubExtractor().extract(epub)
+
+        assert result.method == 'epub_docling'
+        assert [page for _, page in result.pages] == [1, 3]
+        assert [c.args[1] for c in chunk_html.call_args_list] == ['chapter1.xhtml', 'chapter 2.xhtml']
+        assert epub.exists()
+        assert not epub.with_suffix('.pdf').exists()
+        assert EpubExtractor().name == 'epub_docling'
+
+    def test_malformed_package_is_invalid_epub(self, tmp_path, chunk_html):
+        path = tmp_path / 'bad.epub'
+        with zipfile.ZipFile(path, 'w') as z:
+            z.writestr('mimetype', 'application/epub+zip')
+            z.writestr('META-INF/container.xml', '<container')
+
+        with pytest.raises(ValueError, match='Invalid EPUB file'):
+            EpubExtractor().extract(path)
+
+    def test_requires_docling(self, epub):
+        with patch('ingestion.extractors.epub_extractor.DOCLING_AVAILABLE', False):
+            with pytest.raises(RuntimeError, match='EPUB_CONVERT_TO_PDF'):
+                EpubExtractor().extract(epub)
+
+    def test_pandoc_opt_in(self, epub, monkeypatch):
+        monkeypatch.setattr(default_config.docling, 'epub_convert_to_pdf', True)
+
+        with patch.object(EpubExtractor, '_convert_to_pdf') as convert:
+            EpubExtractor().extract(epub)
+
+        convert.assert_called_once_with(epub)
+        assert EpubExtractor().name == 'epub_pandoc'
+
+
+class TestPipelineRouting:
+
+    @pytest.fixture
+    def coordinator(self):
+        services = Mock(), Mock(), Mock()
+        coordinator = PipelineCoordinator(*services)
+        coordinator.queues = Mock()
+        with patch.object(PipelineCoordinator, '_should_reject_before_queue', return_value=False), \
+             patch.object(PipelineCoordinator, '_should_skip_before_queue', return_value=False), \
+             patch.object(PipelineCoordinator, '_handle_epub_conversion') as convert:
+            yield coordinator, convert
+
+    def test_epub_queued_for_chunking(self, coordinator):
+        coordinator, convert = coordinator
+        item = QueueItem(priority=Priority.NORMAL, path=Path('/kb/book.epub'))
+
+        coordinator.add_file(item)
+
+        convert.assert_not_called()
+        coordinator.queues.chunk_queue.put.assert_called_once_with(item)
+
+    def test_epub_converted_when_opted_in(self, coordinator, monkeypatch):
+        coordinator, convert = coordinator
+        monkeypatch.setattr(default_config.docling, 'epub_convert_to_pdf', True)
+
+        coordinator.add_file(QueueItem(priority=Priority.NORMAL, path=Path('/kb/book.epub')))
+
+        convert.assert_called_once()
+        coordinator.queues.chunk_queue.put.assert_not_called()
+
+
+class TestDoclingHtml:
+    """Real parsing with Docling's HTML backend"""
+
+    def test_chapter_parsed(self):
+        pytest.importorskip('docling')
+
+        document = DoclingExtractor.convert_html(
+            chapter('Beginnings', 'First chapter text.').encode(), 'chapter1.xhtml')
+
+        markdown = document.export_to_markdown()
+        assert '# Beginnings' in markdown
+        assert 'First chapter text.' in markdown
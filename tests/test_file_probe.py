@@ -0,0 +1,128 @@
+"""
+Tests for FileProbe - single-read file access shared by validation strategies
+"""
+import hashlib
+import os
+
+import pytest
+
+from ingestion.file_probe import FileChangedError, FileProbe
+from ingestion.file_type_validator import FileTypeValidator
+
+
+class TestFileProbe:
+    """Stat, header, hash and content from one open"""
+
+    def test_header_and_hash_from_content(self, tmp_path):
+        path = tmp_path / 'doc.pdf'
+        data = b'%PDF-1.4\n' + os.urandom(4096)
+        path.write_bytes(data)
+
+        with FileProbe(path) as probe:
+            assert probe.header == data[:FileProbe.HEADER_SIZE]
+            assert probe.sha256 == hashlib.sha256(data).hexdigest()
+            assert bytes(probe.content) == data
+            assert probe.size == len(data)
+
+    def test_header_and_hash_without_content(self, tmp_path):
+        """Header is a bounded read and the hash is streamed; content stays unloaded"""
+        path = tmp_path / 'doc.pdf'
+        data = b'%PDF-1.4\n' + os.urandom(8192)
+        path.write_bytes(data)
+
+        probe = FileProbe(path)
+
+        assert probe.header == data[:FileProbe.HEADER_SIZE]
+        assert probe.sha256 == hashlib.sha256(data).hexdigest()
+        assert probe._content is None
+
+    def test_missing_file(self, tmp_path):
+        probe = FileProbe(tmp_path / 'missing.pdf')
+
+        assert probe.exists is False
+        assert probe.fingerprint is None
+        with pytest.raises(FileNotFoundError):
+            probe.size
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / '__init__.py'
+        path.touch()
+
+        with FileProbe(path) as probe:
+            assert probe.header == b''
+            assert probe.sha256 == hashlib.sha256(b'').hexdigest()
+
+    def test_fingerprint_changes_with_mode(self, tmp_path):
+        path = tmp_path / 'doc.md'
+        path.write_text('# Title')
+        before = FileProbe(path).fingerprint
+
+        os.chmod(path, 0o755)
+
+        assert FileProbe(path).fingerprint != before
+
+    def test_of_reuses_probe(self, tmp_path):
+        path = tmp_path / 'doc.md'
+        path.write_text('# Title')
+        probe = FileProbe(path)
+
+        assert FileProbe.of(probe) is probe
+        assert FileProbe.of(path).path == path
+
+    def test_truncated_after_stat_raises(self, tmp_path):
+        """A file truncated mid-write is reported, not mapped (SIGBUS) or half-read"""
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4\n' + b'x' * 8192)
+        probe = FileProbe(path)
+
+        with open(path, 'r+b') as f:
+            f.truncate(100)
+
+        with pytest.raises(FileChangedError):
+            probe.content
+        assert probe.changed is True
+        with pytest.raises(FileChangedError):
+            probe.sha256
+
+    def test_truncated_before_header_raises(self, tmp_path):
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4\n' + b'x' * 8192)
+        probe = FileProbe(path)
+
+        with open(path, 'r+b') as f:
+            f.truncate(100)
+
+        with pytest.raises(FileChangedError):
+            probe.header
+
+    def test_rewritten_after_stat_raises(self, tmp_path):
+        path = tmp_path / 'doc.md'
+        path.write_text('# Old title')
+        probe = FileProbe(path)
+
+        os.replace(_write(tmp_path / 'new.md', '# New title'), path)
+
+        with pytest.raises(FileChangedError):
+            probe.content
+
+
+class TestChangedDuringValidation:
+    """FileTypeValidator rejects, without memoizing, a file that changed mid-scan"""
+
+    def test_changed_file_rejected_and_not_memoized(self, tmp_path):
+        path = _write(tmp_path / 'notes.md', '# Notes\n' * 100)
+        validator = FileTypeValidator()
+        probe = FileProbe(path)
+        with open(path, 'r+b') as f:
+            f.truncate(10)
+
+        result = validator.validate(probe)
+
+        assert result.is_valid is False
+        assert 'changed during validation' in result.reason
+        assert validator._memo == {}
+
+
+def _write(path, text):
+    path.write_text(text)
+    return path
@@ -196,3 +196,86 @@ class TestValidationResult:
         )
         assert not result.is_valid
         assert result.reason != ''
+
+
+class TestSingleReadValidation:
+    """Strategies share one FileProbe; results are memoized per file version"""
+
+    @pytest.fixture
+    def pdf_file(self, tmp_path):
+        path = tmp_path / 'doc.pdf'
+        path.write_bytes(b'%PDF-1.4\n' + b'x' * 2048)
+        return path
+
+    def test_file_not_buffered_without_content_scanners(self, pdf_file, monkeypatch):
+        """Strategies share one header read and one streamed hash; nothing loads the file"""
+        import builtins
+        from ingestion.file_probe import FileProbe
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            if str(file) == str(pdf_file):
+                opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        def no_read(probe):
+            raise AssertionError('whole file read')
+
+        monkeypatch.setattr(builtins, 'open', counting_open)
+        monkeypatch.setattr(FileProbe, '_read', no_read)
+        validator = FileTypeValidator()
+        validator.malware_detector.clamav = None
+        validator.malware_detector.yara = None
+
+        result = validator.validate(pdf_file)
+
+        assert result.is_valid
+        assert len(opened) <= 2
+
+    def test_unchanged_file_result_memoized(self, pdf_file):
+        """Second validation (pre-queue, then DocumentProcessor) skips strategies"""
+        from unittest.mock import patch
+        from ingestion.validation_result import ValidationResult
+        validator = FileTypeValidator()
+        scanned = ValidationResult(is_valid=True, file_type='pdf')  # No clamd here to skip
+        with patch.object(validator.malware_detector, 'validate', return_value=scanned):
+            first = validator.validate(pdf_file)
+
+        with patch.object(validator, '_validate') as strategies:
+            second = validator.validate(pdf_file)
+
+        strategies.assert_not_called()
+        assert second is first
+
+    def test_incomplete_result_not_memoized(self, pdf_file):
+        """A pass with ClamAV or YARA skipped is validated again next time"""
+        from unittest.mock import patch
+        from ingestion.validation_result import ValidationResult
+        validator = FileTypeValidator()
+        skipped = ValidationResult(is_valid=True, file_type='pdf', complete=False)
+
+        with patch.object(validator.malware_detector, 'validate', return_value=skipped):
+            first = validator.validate(pdf_file)
+
+        assert first.is_valid is True
+        assert first.complete is False
+        assert validator._memo == {}
+
+    def test_modified_file_revalidated(self, pdf_file):
+        """A new file version (content, size or mode) is validated again"""
+        validator = FileTypeValidator()
+        assert validator.validate(pdf_file).is_valid
+
+        pdf_file.write_bytes(b'MZ\x90\x00' + b'x' * 100)
+        assert not validator.validate(pdf_file).is_valid
+
+    def test_chmod_remediation_revalidated(self, pdf_file):
+        """Removing +x changes the fingerprint, so re-validation sees the fix"""
+        import os
+        validator = FileTypeValidator()
+        os.chmod(pdf_file, 0o755)
+        assert not validator.validate(pdf_file).is_valid
+
+        os.chmod(pdf_file, 0o644)
+        assert validator.validate(pdf_file).is_valid
@@ -0,0 +1,272 @@
+"""
+Tests for bulk and incremental graph persistence
+
+The Obsidian graph builder tracks notes changed since the last write and
+exports only what they contribute; PostgresGraphRepository loads full
+exports with COPY and writes per-note diffs against stored edges.
+"""
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from ingestion.obsidian_graph import ObsidianGraphBuilder
+from ingestion.postgres_repositories import PostgresGraphRepository, _edge_row
+from pipeline.pipeline_coordinator import PipelineCoordinator
+
+NOTE_A = 'note:/vault/A.md'
+
+
+def edges_of(export):
+    return sorted((e['source'], e['target'], e['type']) for e in export['edges'])
+
+
+class TestIncrementalGraphBuilder:
+    """Changed notes are tracked and exported on their own"""
+
+    @pytest.fixture
+    def builder(self):
+        builder = ObsidianGraphBuilder()
+        builder.add_note(Path('/vault/A.md'), 'A', '# Intro\n## Detail\nSee [[B]] #python')
+        builder.add_note(Path('/vault/B.md'), 'B', 'Back to [[A]] #python')
+        return builder
+
+    def test_dirty_notes_taken_once(self, builder):
+        assert builder.take_dirty_notes() == {NOTE_A, 'note:/vault/B.md'}
+        assert builder.take_dirty_notes() == set()
+
+    def test_export_notes_contains_owned_edges(self, builder):
+        export = builder.export_notes([NOTE_A])
+
+        assert export['notes'] == [NOTE_A]
+        assert edges_of(export) == [
+            (NOTE_A, 'note:/vault/A.md:h0', 'header_child'),
+            (NOTE_A, 'note_ref:B', 'wikilink'),
+            (NOTE_A, 'tag:python', 'tag'),
+            ('note:/vault/A.md:h0', 'note:/vault/A.md:h1', 'header_child'),
+            ('note_ref:B', NOTE_A, 'backlink'),
+        ]
+        assert 'note:/vault/B.md' not in {n['id'] for n in export['nodes']}
+
+    def test_readded_note_replaces_its_edges(self, builder):
+        builder.add_note(Path('/vault/A.md'), 'A', 'Rewritten #rust')
+
+        export = builder.export_notes([NOTE_A])
+
+        assert edges_of(export) == [(NOTE_A, 'tag:rust', 'tag')]
+        assert 'note:/vault/A.md:h0' not in builder.graph
+        # B's edges are untouched
+        assert builder.graph.has_edge('note:/vault/B.md', 'note_ref:A')
+
+
+class CopyCapture:
+    """Records COPY statements and their rows"""
+
+    def __init__(self, cursor):
+        self.copies = []
+        cursor.copy_expert.side_effect = self._copy
+
+    def _copy(self, sql, buf):
+        rows = [line.split('\t') for line in buf.read().splitlines()]
+        self.copies.append((sql, rows))
+
+    def rows(self, table):
+        return [rows for sql, rows in self.copies if f'COPY {table} ' in sql]
+
+
+@pytest.fixture
+def conn():
+    return MagicMock()
+
+
+@pytest.fixture
+def cursor(conn):
+    return conn.cursor.return_value.__enter__.return_value
+
+
+class TestBulkPersistGraph:
+    """Full exports are loaded with COPY instead of per-row INSERTs"""
+
+    def test_nodes_and_edges_copied(self, conn, cursor):
+        copies = CopyCapture(cursor)
+        builder = ObsidianGraphBuilder()
+        builder.add_note(Path('/vault/A.md'), 'A', 'See [[B]] #python')
+        export = builder.export_graph()
+
+        PostgresGraphRepository(conn).persist_graph(export)
+
+        assert len(copies.rows('graph_nodes_stage')[0]) == 3
+        assert len(copies.rows('graph_edges')[0]) == 3
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert not any('VALUES (%s' in s for s in statements)
+        assert any('DELETE FROM graph_edges WHERE source_id = ANY(%s)' in s for s in statements)
+        assert any('ON CONFLICT (node_id) DO UPDATE' in s for s in statements)
+
+    def test_copy_escapes_text(self, conn, cursor):
+        copies = CopyCapture(cursor)
+        export = {'nodes': [{'id': 'note:/v/x.md', 'node_type': 'note',
+                             'title': 'Tab\there', 'content': 'line1\nline2'}],
+                  'edges': []}
+
+        PostgresGraphRepository(conn).persist_graph(export)
+
+        row = copies.rows('graph_nodes_stage')[0][0]
+        assert row[:4] == ['note:/v/x.md', 'note', 'Tab\\there', 'line1\\nline2']
+        assert row[4] == '\\N'
+
+
+class TestSyncNotes:
+    """Only edges that changed are written"""
+
+    @pytest.fixture
+    def export(self):
+        builder = ObsidianGraphBuilder()
+        builder.add_note(Path('/vault/A.md'), 'A', 'See [[B]] #python')
+        return builder.export_notes([NOTE_A])
+
+    def test_unchanged_note_writes_no_edges(self, conn, cursor, export):
+        copies = CopyCapture(cursor)
+        stored = [_edge_row(e) for e in export['edges']]
+        cursor.fetchall.return_value = [(i, *row) for i, row in enumerate(stored)]
+
+        counts = PostgresGraphRepository(conn).sync_notes(export)
+
+        assert counts['edges_added'] == 0
+        assert counts['edges_removed'] == 0
+        assert copies.rows('graph_edges') == []
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert not any('WHERE id = ANY(%s)' in s for s in statements)
+
+    def test_diff_against_stored_edges(self, conn, cursor, export):
+        copies = CopyCapture(cursor)
+        cursor.fetchall.return_value = [
+            (1, NOTE_A, 'tag:python', 'tag', None),        # Still present
+            (2, NOTE_A, 'tag:old', 'tag', None),           # Removed from note
+        ]
+
+        counts = PostgresGraphRepository(conn).sync_notes(export)
+
+        assert counts == {'nodes': 3, 'edges_added': 2, 'edges_removed': 1}
+        added = copies.rows('graph_edges')[0]
+        assert sorted(r[2] for r in added) == ['backlink', 'wikilink']
+        delete = [c for c in cursor.execute.call_args_list
+                  if 'DELETE FROM graph_edges WHERE id = ANY(%s)' in c.args[0]]
+        assert delete[0].args[1] == ([2],)
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert any("node_type = 'tag'" in s for s in statements)  # Orphan cleanup
+        conn.commit.assert_not_called()
+
+    def test_stored_edges_selected_for_notes_and_headers(self, conn, cursor):
+        builder = ObsidianGraphBuilder()
+        builder.add_note(Path('/vault/A.md'), 'A', '# Intro\nText')
+        cursor.fetchall.return_value = []
+        CopyCapture(cursor)
+
+        PostgresGraphRepository(conn).sync_notes(builder.export_notes([NOTE_A]))
+
+        select = [c for c in cursor.execute.call_args_list
+                  if 'SELECT id, source_id' in c.args[0]][0]
+        assert select.args[1] == ([NOTE_A, 'note:/vault/A.md:h0'], [NOTE_A])
+        header_delete = [c for c in cursor.execute.call_args_list
+                         if "node_type = 'header'" in c.args[0]][0]
+        assert header_delete.args[1] == ([NOTE_A], ['note:/vault/A.md:h0'])
+
+    def test_nothing_to_sync(self, conn, cursor):
+        counts = PostgresGraphRepository(conn).sync_notes({'notes': []})
+
+        assert counts['nodes'] == 0
+        cursor.execute.assert_not_called()
+
+
+class TestSqliteSyncGraph:
+    """SQLite replaces a note's edges and reports how many it removed"""
+
+    @pytest.fixture
+    def store(self):
+        import sqlite3
+        import threading
+        from ingestion.database import SchemaManager, VectorStore
+
+        store = VectorStore.__new__(VectorStore)  # Graph tables only, no vector index
+        store.conn = sqlite3.connect(':memory:')
+        store._lock = threading.RLock()
+        schema = SchemaManager.__new__(SchemaManager)
+        schema.conn = store.conn
+        schema._create_graph_tables()
+        return store
+
+    def test_resync_replaces_edges(self, store):
+        builder = ObsidianGraphBuilder()
+        builder.add_note(Path('/vault/A.md'), 'A', '# Intro\nSee [[B]] #python')
+        first = builder.export_notes([NOTE_A])
+        assert store.sync_graph(first)['edges_removed'] == 0
+
+        builder.add_note(Path('/vault/A.md'), 'A', 'Rewritten #rust')
+        stats = store.sync_graph(builder.export_notes([NOTE_A]))
+
+        stored = store.conn.execute(
+            "SELECT source_id, target_id, edge_type FROM graph_edges ORDER BY 1, 2"
+        ).fetchall()
+        assert stats['edges_removed'] == len(first['edges'])
+        assert stored == [(NOTE_A, 'tag:rust', 'tag')]
+
+    def test_header_edges_matched_literally(self, store):
+        """'_' in a path and case variants do not match other notes' headers"""
+        others = ['note:/vault/aXb.md:h0', 'note:/vault/A_B.md:h0']
+        store.conn.executemany(
+            "INSERT INTO graph_edges (source_id, target_id, edge_type) VALUES (?, 'tag:x', 'tag')",
+            [(source,) for source in others + ['note:/vault/a_b.md:h0']]
+        )
+        builder = ObsidianGraphBuilder()
+        builder.add_note(Path('/vault/a_b.md'), 'a_b', 'Body')
+
+        stats = store.sync_graph(builder.export_notes(['note:/vault/a_b.md']))
+
+        stored = store.conn.execute(
+            "SELECT source_id FROM graph_edges WHERE target_id = 'tag:x' ORDER BY 1"
+        ).fetchall()
+        assert stats['edges_removed'] == 1
+        assert stored == [(source,) for source in sorted(others)]
+
+
+class TestNoteNodeIds:
+    """Note nodes are addressed by full path, as the graph builder names them"""
+
+    def test_delete_uses_full_path(self, conn, cursor):
+        PostgresGraphRepository(conn).delete_note_nodes_many(['/vault/sub/A.md'])
+
+        params = cursor.execute.call_args_list[0].args[1]
+        assert params == (['note:/vault/sub/A.md'],)
+
+
+class TestStoreStageGraphSync:
+    """The store stage writes changed notes' graph after each document"""
+
+    @pytest.fixture
+    def coordinator(self):
+        coordinator = PipelineCoordinator.__new__(PipelineCoordinator)
+        coordinator.embedding_service = Mock()
+        coordinator.processor = Mock()
+        return coordinator
+
+    def test_dirty_notes_synced(self, coordinator):
+        graph = ObsidianGraphBuilder()
+        graph.add_note(Path('/vault/A.md'), 'A', '#python')
+        coordinator.processor.get_obsidian_graph.return_value = graph
+
+        coordinator._sync_graph()
+
+        export = coordinator.embedding_service.store.sync_graph.call_args.args[0]
+        assert export['notes'] == [NOTE_A]
+        coordinator._sync_graph()
+        coordinator.embedding_service.store.sync_graph.assert_called_once()
+
+    def test_failed_sync_is_retried(self, coordinator):
+        graph = ObsidianGraphBuilder()
+        graph.add_note(Path('/vault/A.md'), 'A', '#python')
+        coordinator.processor.get_obsidian_graph.return_value = graph
+        coordinator.embedding_service.store.sync_graph.side_effect = RuntimeError('db down')
+
+        coordinator._sync_graph()
+
+        assert graph.take_dirty_notes() == {NOTE_A}
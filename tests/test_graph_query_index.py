@@ -0,0 +1,115 @@
+"""
+Tests for indexed Obsidian graph queries
+
+Backlink and tag lookups read an EdgeTypeIndex kept in sync by the graph
+builder (or a node's in_edges), never the full edge list.
+"""
+from pathlib import Path
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
+
+from ingestion.obsidian.graph import GraphQuery
+from ingestion.obsidian.graph.edge_index import EdgeTypeIndex
+from ingestion.obsidian_graph import ObsidianGraphBuilder
+
+
+@pytest.fixture
+def builder():
+    builder = ObsidianGraphBuilder()
+    builder.add_note(Path('/vault/A.md'), 'A', 'Links [[Topic]] and [[Topic]] #python #ml')
+    builder.add_note(Path('/vault/B.md'), 'B', 'Also [[Topic]] #python')
+    builder.add_note(Path('/vault/C.md'), 'C', 'Unrelated #rust')
+    return builder
+
+
+def no_full_scan(graph):
+    """Fail if the whole edge list is iterated"""
+    return patch.object(graph, 'edges', side_effect=AssertionError('full edge scan'))
+
+
+class TestEdgeTypeIndex:
+
+    def test_counts_parallel_edges(self):
+        index = EdgeTypeIndex()
+        edges = [('a', 't', 0, {'edge_type': 'wikilink'}),
+                 ('a', 't', 1, {'edge_type': 'wikilink'}),
+                 ('b', 't', 0, {'edge_type': 'tag'})]
+        index.add(edges)
+
+        assert index.sources('t', 'wikilink') == ['a', 'a']
+        assert index.count('t', 'tag') == 1
+
+        index.remove(edges[:1])
+        assert index.sources('t', 'wikilink') == ['a']
+        index.remove(edges[1:])
+        assert index.sources('t', 'wikilink') == []
+        assert index._sources == {}
+
+
+class TestIndexedQueries:
+    """Lookups read only the queried node's edges"""
+
+    def test_notes_with_tag(self, builder):
+        with no_full_scan(builder.graph):
+            notes = builder.get_notes_with_tag('#python')
+
+        assert sorted(notes) == ['note:/vault/A.md', 'note:/vault/B.md']
+
+    def test_backlinks(self, builder):
+        with no_full_scan(builder.graph):
+            backlinks = builder.get_backlinks('note_ref:Topic')
+
+        assert sorted(backlinks) == ['note:/vault/A.md', 'note:/vault/A.md', 'note:/vault/B.md']
+
+    def test_index_follows_replaced_note(self, builder):
+        builder.add_note(Path('/vault/A.md'), 'A', 'Now only #rust')
+
+        assert builder.get_notes_with_tag('python') == ['note:/vault/B.md']
+        assert builder.get_backlinks('note_ref:Topic') == ['note:/vault/B.md']
+        assert sorted(builder.get_notes_with_tag('rust')) == [
+            'note:/vault/A.md', 'note:/vault/C.md'
+        ]
+
+    def test_index_rebuilt_on_import(self, builder):
+        imported = ObsidianGraphBuilder()
+        imported.import_graph(builder.export_graph())
+
+        assert sorted(imported.get_notes_with_tag('python')) == [
+            'note:/vault/A.md', 'note:/vault/B.md'
+        ]
+
+    def test_unindexed_query_uses_in_edges(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node('tag:x')
+        graph.add_edge('n1', 'tag:x', edge_type='tag')
+        graph.add_edge('n2', 'tag:x', edge_type='other')
+
+        with no_full_scan(graph):
+            assert GraphQuery().get_notes_with_tag(graph, 'x') == ['n1']
+
+
+class TestGraphMetadataMany:
+    """Metadata for many notes from one pass over their edges"""
+
+    def test_metadata_for_notes(self, builder):
+        ids = ['note:/vault/A.md', 'note:/vault/B.md', 'note:/missing.md']
+
+        with no_full_scan(builder.graph):
+            metadata = builder.get_graph_metadata_many(ids)
+
+        assert set(metadata) == {'note:/vault/A.md', 'note:/vault/B.md'}
+        a = metadata['note:/vault/A.md']
+        assert sorted(a['tags']) == ['#ml', '#python']
+        assert a['connected_notes'] == ['Topic']
+        assert a['connected_notes_count'] == 1
+        assert a['backlinks_count'] == 0
+
+    def test_matches_per_note_queries(self, builder):
+        node_id = 'note:/vault/B.md'
+        metadata = builder.get_graph_metadata_many([node_id])[node_id]
+
+        assert metadata['tags'] == builder.get_tags_for_note(node_id)
+        connected = builder.get_connected_nodes(node_id, edge_types=['wikilink', 'backlink'])
+        assert metadata['connected_notes_count'] == len(connected)
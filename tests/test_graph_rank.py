@@ -0,0 +1,222 @@
+"""
+Tests for precomputed graph centrality and the graph-aware search boost
+
+GraphRanker computes PageRank and degree over the stored graph, links
+chunks to their note nodes and loads a compact GraphRankIndex; GraphBoost
+re-scores fused hybrid results with array lookups into it.
+"""
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from hybrid_search import GraphBoost, PostgresHybridSearcher
+from ingestion.graph_rank import GraphRanker, GraphRankIndex, GraphRankJob, pagerank
+
+
+def dense_pagerank(edges, n, damping=0.85):
+    """Reference PageRank: principal eigenvector of the dense Google matrix"""
+    link = np.zeros((n, n))
+    for source, target in edges:
+        link[target, source] += 1
+    out = link.sum(axis=0)
+    link[:, out == 0] = 1.0       # Dangling nodes link everywhere
+    link /= link.sum(axis=0)
+    google = damping * link + (1 - damping) / n
+    values, vectors = np.linalg.eig(google)
+    vector = np.real(vectors[:, np.argmax(np.real(values))])
+    return vector / vector.sum()
+
+
+class TestPageRank:
+    """Power iteration matches the dense eigenvector solution on small graphs"""
+
+    @pytest.mark.parametrize('edges,n', [
+        ([(0, 1), (1, 2), (2, 0), (2, 1)], 3),
+        ([(0, 1), (0, 2), (3, 2)], 5),              # Dangling and isolated nodes
+        ([(0, 1), (0, 1), (1, 0)], 2),              # Parallel edges
+    ])
+    def test_matches_dense_solution(self, edges, n):
+        sources, targets = (np.array(col) for col in zip(*edges))
+        rank = pagerank(sources, targets, n, tol=1e-10)
+
+        assert rank.sum() == pytest.approx(1.0)
+        assert rank == pytest.approx(dense_pagerank(edges, n), abs=1e-6)
+
+    def test_no_edges(self):
+        rank = pagerank(np.array([], dtype=int), np.array([], dtype=int), 4)
+
+        assert rank == pytest.approx([0.25] * 4)
+        assert len(pagerank([], [], 0)) == 0
+
+
+def make_index():
+    """Notes 0-1-2 linked in a chain, note 3 isolated; chunks 10..40"""
+    return GraphRankIndex(
+        chunk_ids=np.array([10, 11, 20, 30, 40]),
+        chunk_nodes=np.array([0, 0, 1, 2, 3]),
+        scores=np.array([0.5, 1.0, 0.5, 0.1]),
+        neighbor_ptr=np.array([0, 1, 3, 4, 4]),
+        neighbors=np.array([1, 0, 2, 1]),
+    )
+
+
+class TestGraphRankIndex:
+
+    def test_nodes_of(self):
+        index = make_index()
+
+        assert list(index.nodes_of([11, 99, None, 40, 5])) == [0, -1, -1, 3, -1]
+        assert list(GraphRankIndex.empty().nodes_of([1, 2])) == [-1, -1]
+
+    def test_centrality_and_neighbors(self):
+        index = make_index()
+
+        assert list(index.centrality(np.array([1, -1]))) == [1.0, 0.0]
+        assert list(index.neighbors_of(np.array([0, 2, -1]))) == [1]
+        assert list(index.neighbors_of(np.array([3]))) == []
+
+
+def result(chunk_id, score):
+    return {'chunk_id': chunk_id, 'content': f'chunk {chunk_id}', 'source': 'x.md',
+            'page': None, 'score': score}
+
+
+class TestGraphBoost:
+    """Fused results are re-scored by centrality and neighbourhood"""
+
+    def test_central_and_neighbouring_chunks_promoted(self):
+        boost = GraphBoost(weight=0.5, neighbor_boost=0.5, seeds=2)
+        boost.index = make_index()
+        results = [result(40, 1.0), result(30, 0.9), result(99, 0.85), result(20, 0.8)]
+
+        ranked = boost.apply(results)
+
+        # 20's note is the most central and a neighbour of the second result's note
+        assert [r['chunk_id'] for r in ranked] == [20, 30, 40, 99]
+        assert ranked[0]['score'] == pytest.approx(0.8 * (1 + 0.5 * 1.0 + 0.5))
+        assert results[0]['score'] == 1.0  # Inputs not mutated
+
+    def test_no_index_passes_through(self):
+        results = [result(10, 1.0), result(20, 0.5)]
+
+        assert GraphBoost().apply(results) is results
+
+    def test_unlinked_results_pass_through(self):
+        boost = GraphBoost()
+        boost.index = make_index()
+        results = [result(98, 1.0), result(99, 0.5)]
+
+        assert boost.apply(results) is results
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv('GRAPH_BOOST_ENABLED', raising=False)
+        assert GraphBoost.from_env() is None
+
+        monkeypatch.setenv('GRAPH_BOOST_ENABLED', 'true')
+        monkeypatch.setenv('GRAPH_BOOST_WEIGHT', '0.7')
+        assert GraphBoost.from_env().weight == 0.7
+
+
+class TestHybridSearchStage:
+    """The boost runs on the whole fused pool, before the top_k cut"""
+
+    @pytest.fixture
+    def searcher(self):
+        with patch('hybrid_search.PostgresBM25Searcher'):
+            searcher = PostgresHybridSearcher(MagicMock())
+        searcher.keyword.search.return_value = []
+        return searcher
+
+    def test_neighbour_enters_top_k(self, searcher):
+        searcher.graph_boost = GraphBoost(weight=0.0, neighbor_boost=1.0, seeds=1)
+        searcher.graph_boost.index = make_index()
+        vector_results = [result(10, 0.9), result(40, 0.8), result(30, 0.7), result(20, 0.6)]
+
+        top = searcher.search('query', vector_results, top_k=2)
+
+        assert [r['chunk_id'] for r in top] == [20, 10]
+
+    def test_disabled_keeps_fusion_order(self, searcher):
+        searcher.graph_boost = None
+        vector_results = [result(10, 0.9), result(40, 0.8), result(20, 0.6)]
+
+        top = searcher.search('query', vector_results, top_k=2)
+
+        assert [r['chunk_id'] for r in top] == [10, 40]
+
+
+class TestGraphRanker:
+    """Centrality is computed, stored and loaded in one pass over the tables"""
+
+    NODES = [
+        ('note:/vault/A.md', 'note', 'A'),
+        ('note:/vault/B.md', 'note', 'B'),
+        ('note_ref:B', 'note_ref', 'B'),
+        ('note_ref:Missing', 'note_ref', 'Missing'),
+        ('tag:python', 'tag', 'python'),
+    ]
+    EDGES = [
+        ('note:/vault/A.md', 'note_ref:B', 'wikilink'),
+        ('note:/vault/A.md', 'note_ref:Missing', 'wikilink'),
+        ('note:/vault/A.md', 'tag:python', 'tag'),
+        ('note:/vault/B.md', 'tag:python', 'tag'),
+    ]
+    LINKS = [(1, 'note:/vault/A.md'), (2, 'note:/vault/A.md'), (3, 'note:/vault/B.md')]
+
+    @pytest.fixture
+    def cursor(self):
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = [self.NODES, self.EDGES, self.LINKS]
+        return cursor
+
+    def test_refresh(self, cursor):
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            index = GraphRanker()._refresh(cursor)
+
+        rows = {r[0]: r for r in execute_values.call_args.args[2]}
+        # note_ref:B resolves to note B; unresolved placeholders are ranked
+        assert set(rows) == {'note:/vault/A.md', 'note:/vault/B.md',
+                             'note_ref:Missing', 'tag:python'}
+        assert rows['note:/vault/B.md'][2:] == (1, 1)      # in_degree, out_degree
+        assert rows['tag:python'][2] == 2
+        assert max(index.scores) == 1.0
+
+        note_a, note_b = index.nodes_of([1, 3])
+        assert note_b in index.neighbors_of(np.array([note_a]))  # Through note_ref:B
+        assert list(index.neighbors_of(np.array([note_b]))) == [note_a]
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert any('INSERT INTO chunk_graph_links' in s and 'NOT EXISTS' in s
+                   for s in statements)
+
+    def test_refresh_commits_on_own_connection(self, cursor):
+        db_conn = MagicMock()
+        conn = db_conn.connect.return_value
+        conn.cursor.return_value.__enter__.return_value = cursor
+
+        with patch('ingestion.graph_rank.DatabaseFactory.create_connection',
+                   return_value=db_conn), \
+             patch('psycopg2.extras.execute_values'):
+            GraphRanker().refresh()
+
+        conn.commit.assert_called_once()
+        db_conn.close.assert_called_once()
+
+
+class TestGraphRankJob:
+
+    def test_refresh_swaps_index(self):
+        boost = GraphBoost()
+        index = make_index()
+        job = GraphRankJob(boost, ranker=Mock(refresh=Mock(return_value=index)))
+
+        assert job.run_once()
+        assert boost.index is index
+
+    def test_failed_refresh_keeps_index(self):
+        boost = GraphBoost()
+        boost.index = previous = make_index()
+        job = GraphRankJob(boost, ranker=Mock(refresh=Mock(side_effect=RuntimeError('db'))))
+
+        assert not job.run_once()
+        assert boost.index is previous
@@ -0,0 +1,98 @@
+"""
+Import-time budget tests
+
+Runs `python -X importtime` in a fresh interpreter so heavy dependencies
+(Docling, transformers, torch, sentence-transformers) imported at module
+level by accident show up as failures instead of slow process starts.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+API_DIR = Path(__file__).parent.parent / "api"
+
+# Generous: a cold `import main` is ~1s without the ML stack loaded
+IMPORT_BUDGET_SECONDS = 5.0
+
+HEAVY_PACKAGES = (
+    'docling', 'docling_core', 'transformers', 'torch',
+    'sentence_transformers', 'docx', 'markdown', 'ebooklib', 'tree_sitter',
+)
+
+INGESTION_MODULES = (
+    'ingestion.processing', 'ingestion.extractors', 'ingestion.async_postgres',
+    'watcher', 'watchdog',
+)
+
+
+def run_import(statement: str, **env):
+    """Run statement under -X importtime in a fresh interpreter
+
+    Returns ({module: cumulative import seconds}, set of loaded modules).
+    Loaded modules come from sys.modules since importtime does not trace
+    importlib.import_module() calls.
+    """
+    run_env = {**os.environ, **env}
+    run_env.setdefault('DATABASE_URL', 'postgresql://u:p@localhost/db')
+    script = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=API_DIR, env=run_env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if not line.startswith('import time:') or len(parts) != 3 or 'cumulative' in line:
+            continue
+        times[parts[2].strip()] = int(parts[1]) / 1_000_000
+    return times, set(result.stdout.split())
+
+
+def loaded(modules: set, packages) -> list:
+    """Packages (or their submodules) present in sys.modules"""
+    return sorted(name for name in modules
+                  if name in packages or name.startswith(tuple(p + '.' for p in packages)))
+
+
+class TestLazyImports:
+    """Heavy dependencies are imported at first use, not at import time"""
+
+    @pytest.mark.parametrize('module', ['ingestion', 'app_state', 'operations.model_loader'])
+    def test_module_does_not_import_heavy_packages(self, module):
+        _, modules = run_import(f'import {module}')
+
+        assert loaded(modules, HEAVY_PACKAGES) == []
+
+    def test_ingestion_package_resolves_exports_lazily(self):
+        _, modules = run_import('from ingestion import DatabaseFactory')
+
+        assert 'ingestion.database_factory' in modules
+        assert loaded(modules, INGESTION_MODULES) == []
+
+
+class TestQueryOnlyMode:
+    """RAG_MODE=query never imports the ingestion stack"""
+
+    def test_api_import_skips_ingestion_stack(self):
+        _, modules = run_import('import main', RAG_MODE='query')
+
+        assert loaded(modules, HEAVY_PACKAGES + INGESTION_MODULES) == []
+
+    def test_api_import_within_budget(self):
+        times, _ = run_import('import main', RAG_MODE='query')
+
+        assert times['main'] < IMPORT_BUDGET_SECONDS
+
+    def test_ingestion_routes_not_registered(self):
+        run_import(
+            'import main\n'
+            'paths = set(main.app.openapi()["paths"])\n'
+            'assert "/query" in paths, paths\n'
+            'assert "/index" not in paths, paths',
+            RAG_MODE='query'
+        )
@@ -0,0 +1,138 @@
+"""
+Tests for pooled tree-sitter parsers and incremental code re-chunking
+
+Parsers are created once per thread and language. The last parse of each
+file is cached so an edited file is re-parsed incrementally and only the
+top-level nodes that changed are re-chunked.
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from config import default_config
+from ingestion.parser_pool import ParseTreeCache, ParsedFile, source_edit, thread_parser
+from ingestion.tree_sitter_chunker import TreeSitterChunker
+
+
+class TestSourceEdit:
+
+    def test_single_change(self):
+        old = b'function a() {}\nfunction b() { return 1 }\n'
+        new = b'function a() {}\nfunction b() { return 42 }\n'
+
+        edit = source_edit(old, new)
+
+        assert old[:edit['start_byte']] == new[:edit['start_byte']]
+        assert old[edit['old_end_byte']:] == new[edit['new_end_byte']:]
+        assert edit['new_end_byte'] - edit['old_end_byte'] == 1
+        assert edit['start_point'] == (1, 22)
+
+    def test_inserted_lines(self):
+        edit = source_edit(b'a\nb\n', b'a\nx\ny\nb\n')
+
+        assert (edit['start_byte'], edit['old_end_byte'], edit['new_end_byte']) == (2, 2, 6)
+        assert edit['old_end_point'] == (1, 0)
+        assert edit['new_end_point'] == (3, 0)
+
+    def test_unchanged(self):
+        assert source_edit(b'same', b'same') is None
+
+
+class TestParserPool:
+
+    def test_parser_per_thread_and_language(self):
+        created = []
+
+        def create():
+            created.append(object())
+            return created[-1]
+
+        main = thread_parser('test-lang', create)
+        assert thread_parser('test-lang', create) is main
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(thread_parser('test-lang', create)))
+        worker.start()
+        worker.join()
+
+        assert other[0] is not main
+        assert len(created) == 2
+
+    def test_tree_cache_lru(self):
+        cache = ParseTreeCache(max_entries=2)
+        for name in ('a', 'b', 'c'):
+            cache.put(name, ParsedFile('javascript', b'', None))
+
+        assert cache.take('a') is None
+        assert cache.take('b') is not None
+        assert cache.take('b') is None  # Taken while re-parsing
+        assert len(cache) == 1
+
+
+def functions(count, changed=None):
+    body = []
+    for i in range(count):
+        value = 'changed' if i == changed else i
+        body.append(f'function f{i}(x) {{\n  const y = x + 1;\n  return "{value}" + y;\n}}\n')
+    return '\n'.join(body)
+
+
+class TestIncrementalChunking:
+    """Real parses with the JavaScript grammar"""
+
+    @pytest.fixture
+    def chunker(self, monkeypatch):
+        chunker = TreeSitterChunker('javascript', max_chunk_size=120)
+        try:
+            chunker._get_parser()
+        except (ImportError, ValueError) as e:
+            pytest.skip(f"JavaScript grammar unavailable: {e}")
+        monkeypatch.setattr('ingestion.parser_pool._cache', ParseTreeCache(8))
+        return chunker
+
+    def full_parse(self, code):
+        return TreeSitterChunker('javascript', max_chunk_size=120).chunkify(code)
+
+    def without_filepath(self, chunks):
+        for chunk in chunks:
+            chunk['metadata'].pop('filepath', None)
+        return chunks
+
+    def test_edited_function_matches_full_parse(self, chunker):
+        chunker.chunkify(functions(50), filepath='app.js')
+        edited = functions(50, changed=30)
+
+        chunks = chunker.chunkify(edited, filepath='app.js')
+
+        assert self.without_filepath(chunks) == self.full_parse(edited)
+
+    def test_only_changed_node_rechunked(self, chunker):
+        chunker.chunkify(functions(50), filepath='app.js')
+
+        with patch.object(TreeSitterChunker, '_walk_tree', autospec=True,
+                          side_effect=TreeSitterChunker._walk_tree) as walk:
+            chunker.chunkify(functions(50, changed=30), filepath='app.js')
+
+        assert walk.call_count == 1
+        assert walk.call_args.args[1].start_point[0] == 30 * 5
+
+    def test_inserted_lines_shift_reused_chunks(self, chunker):
+        chunker.chunkify(functions(10), filepath='app.js')
+        edited = '// header\n// comment\n' + functions(10)
+
+        chunks = chunker.chunkify(edited, filepath='app.js')
+
+        assert self.without_filepath(chunks) == self.full_parse(edited)
+
+    def test_cache_disabled(self, chunker, monkeypatch):
+        monkeypatch.setattr(default_config.chunks, 'code_parse_cache_size', 0)
+        monkeypatch.setattr('ingestion.parser_pool._cache', None)
+
+        chunker.chunkify(functions(3), filepath='app.js')
+
+        with patch.object(TreeSitterChunker, '_walk_tree', autospec=True,
+                          side_effect=TreeSitterChunker._walk_tree) as walk:
+            chunker.chunkify(functions(3), filepath='app.js')
+
+        assert walk.call_count == 3
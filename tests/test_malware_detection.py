@@ -5,11 +5,14 @@ import tempfile
 import shutil
 from unittest.mock import Mock, patch, MagicMock
 
+from ingestion import malware_detection
 from ingestion.malware_detection import (
     ClamAVStrategy,
     HashBlacklistStrategy,
     YARAStrategy,
-    AdvancedMalwareDetector
+    AdvancedMalwareDetector,
+    CLAMAV_SKIPPED,
+    YARA_SKIPPED
 )
 from config import MalwareDetectionConfig
 
@@ -114,79 +117,43 @@ F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4F4
 
 
 class TestClamAVStrategy:
-    """Test ClamAV virus scanning"""
+    """Test ClamAV virus scanning (against a fake clamd socket)"""
 
-    def test_clamav_rejects_infected_file(self):
+    def test_clamav_rejects_infected_file(self, fake_clamd, tmp_path):
         """Test ClamAV rejects virus-infected files"""
-        with patch('builtins.__import__') as mock_import:
-            # Mock clamd module
-            mock_clamd = MagicMock()
-            mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_client.scan.return_value = {
-                '/test/virus.pdf': ('FOUND', 'Win.Test.EICAR_HDB-1')
-            }
-            mock_clamd.ClamdUnixSocket.return_value = mock_client
-
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'clamd':
-                    return mock_clamd
-                return __import__(name, *args, **kwargs)
+        test_file = tmp_path / 'virus.pdf'
+        test_file.write_bytes(b'%PDF-1.4 EICAR-TEST payload')
 
-            mock_import.side_effect = import_side_effect
-
-            strategy = ClamAVStrategy('/var/run/clamav/clamd.ctl')
-            result = strategy.validate(Path('/test/virus.pdf'), 'pdf')
+        strategy = ClamAVStrategy(fake_clamd.address)
+        result = strategy.validate(test_file, 'pdf')
 
-            assert result.is_valid is False
-            assert result.validation_check == 'ClamAVStrategy'
-            assert 'Virus detected: Win.Test.EICAR_HDB-1' in result.reason
-            assert result.file_type == 'malware'
+        assert result.is_valid is False
+        assert result.validation_check == 'ClamAVStrategy'
+        assert 'Virus detected: Eicar-Test-Signature' in result.reason
+        assert result.file_type == 'malware'
 
-    def test_clamav_allows_clean_file(self):
+    def test_clamav_allows_clean_file(self, fake_clamd, tmp_path):
         """Test ClamAV allows clean files"""
-        with patch('builtins.__import__') as mock_import:
-            mock_clamd = MagicMock()
-            mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_client.scan.return_value = {
-                '/test/clean.pdf': ('OK', None)
-            }
-            mock_clamd.ClamdUnixSocket.return_value = mock_client
-
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'clamd':
-                    return mock_clamd
-                return __import__(name, *args, **kwargs)
+        test_file = tmp_path / 'clean.pdf'
+        test_file.write_bytes(b'%PDF-1.4 clean')
 
-            mock_import.side_effect = import_side_effect
-
-            strategy = ClamAVStrategy('/var/run/clamav/clamd.ctl')
-            result = strategy.validate(Path('/test/clean.pdf'), 'pdf')
+        strategy = ClamAVStrategy(fake_clamd.address)
+        result = strategy.validate(test_file, 'pdf')
 
-            assert result.is_valid is True
-            assert result.file_type == 'pdf'
+        assert result.is_valid is True
+        assert result.file_type == 'pdf'
 
-    def test_clamav_handles_connection_error(self):
+    def test_clamav_handles_connection_error(self, tmp_path):
         """Test ClamAV handles connection errors gracefully"""
-        with patch('builtins.__import__') as mock_import:
-            mock_clamd = MagicMock()
-            mock_client = MagicMock()
-            mock_client.ping.side_effect = ConnectionRefusedError("ClamAV not running")
-            mock_clamd.ClamdUnixSocket.return_value = mock_client
-
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'clamd':
-                    return mock_clamd
-                return __import__(name, *args, **kwargs)
-
-            mock_import.side_effect = import_side_effect
+        test_file = tmp_path / 'file.pdf'
+        test_file.write_bytes(b'%PDF-1.4')
 
-            strategy = ClamAVStrategy('/var/run/clamav/clamd.ctl')
-            result = strategy.validate(Path('/test/file.pdf'), 'pdf')
+        strategy = ClamAVStrategy(str(tmp_path / 'missing.sock'))
+        result = strategy.validate(test_file, 'pdf')
 
-            # Should pass validation when ClamAV unavailable (fail open)
-            assert result.is_valid is True
+        # Should pass validation when ClamAV unavailable (fail open)
+        assert result.is_valid is True
+        assert result.reason == CLAMAV_SKIPPED
 
     def test_clamav_disabled_when_socket_none(self):
         """Test ClamAV disabled when socket is None"""
@@ -195,31 +162,28 @@ class TestClamAVStrategy:
 
         assert result.is_valid is True
 
-    def test_clamav_empty_scan_result(self):
-        """Test ClamAV handles empty scan results"""
-        with patch('builtins.__import__') as mock_import:
-            mock_clamd = MagicMock()
-            mock_client = MagicMock()
-            mock_client.ping.return_value = True
-            mock_client.scan.return_value = None  # Empty result
-            mock_clamd.ClamdUnixSocket.return_value = mock_client
-
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'clamd':
-                    return mock_clamd
-                return __import__(name, *args, **kwargs)
+    def test_clamav_empty_file(self, fake_clamd, tmp_path):
+        """Test ClamAV handles empty files"""
+        test_file = tmp_path / 'empty.pdf'
+        test_file.touch()
 
-            mock_import.side_effect = import_side_effect
-
-            strategy = ClamAVStrategy('/var/run/clamav/clamd.ctl')
-            result = strategy.validate(Path('/test/file.pdf'), 'pdf')
+        strategy = ClamAVStrategy(fake_clamd.address)
+        result = strategy.validate(test_file, 'pdf')
 
-            assert result.is_valid is True
+        assert result.is_valid is True
+        assert result.reason == ''
 
 
 class TestYARAStrategy:
     """Test YARA pattern matching"""
 
+    @pytest.fixture(autouse=True)
+    def clear_compiled_rules(self):
+        """Compiled rules are cached per process; keep mocked rules per test"""
+        malware_detection._compiled.clear()
+        yield
+        malware_detection._compiled.clear()
+
     @pytest.fixture
     def temp_dir(self):
         """Create temporary directory"""
@@ -504,6 +468,36 @@ class TestAdvancedMalwareDetector:
         detector.hash_blacklist.validate.assert_called_once()
         detector.yara.validate.assert_called_once()
 
+    def test_yara_skipped_result_not_cached(self, temp_dir):
+        """A YARA timeout fails open but is matched again on the next check"""
+        from ingestion.validation_result import ValidationResult
+        detector = AdvancedMalwareDetector(MalwareDetectionConfig(
+            clamav_enabled=False,
+            hash_blacklist_enabled=False,
+            yara_enabled=False,
+            allowlist_path=str(temp_dir / "none.txt")
+        ))
+        test_file = temp_dir / "slow.pdf"
+        test_file.write_bytes(b'%PDF-1.4 pathological')
+        detector.yara = Mock()
+        detector.yara.validate.return_value = ValidationResult(
+            is_valid=True, file_type='pdf', reason=YARA_SKIPPED
+        )
+        cached = []
+        detector._get_cached_result = lambda *args: None
+        detector._cache_result = lambda file_hash, result: cached.append(result)
+
+        result = detector.validate(test_file, 'pdf')
+
+        assert result.is_valid is True
+        assert cached == []
+
+        detector.yara.validate.return_value = ValidationResult(
+            is_valid=True, file_type='pdf', reason=''
+        )
+        detector.validate(test_file, 'pdf')
+        assert len(cached) == 1
+
     def test_detector_passes_when_all_disabled(self):
         """Test detector passes validation when all strategies disabled"""
         config = MalwareDetectionConfig(
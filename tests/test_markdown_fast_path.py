@@ -0,0 +1,104 @@
+"""
+Tests for in-memory markdown chunking
+
+Markdown notes, Obsidian notes and notebooks are parsed from in-memory text
+with Docling's markdown backend instead of a DocumentConverter run over a
+(temp) file; chunks must match the converter path exactly.
+"""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tests import requires_huggingface
+from ingestion.extractors.docling_extractor import DoclingExtractor
+from ingestion.extractors.markdown_extractor import MarkdownExtractor
+from ingestion.jupyter_extractor import JupyterExtractor
+from ingestion.obsidian_extractor import ObsidianExtractor
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+NOTEBOOK = FIXTURES / 'sample_python.ipynb'
+
+
+@pytest.fixture
+def chunk_markdown():
+    with patch.object(DoclingExtractor, 'chunk_markdown',
+                      return_value=[('chunk one', 0), ('  ', 0), ('chunk two', 0)]) as chunk, \
+         patch.object(DoclingExtractor, 'get_converter',
+                      side_effect=AssertionError('converter used')):
+        yield chunk
+
+
+class TestInMemoryChunking:
+    """Extractors hand text to chunk_markdown; nothing is converted from disk"""
+
+    def test_notebook_markdown_not_written_to_disk(self, chunk_markdown):
+        with patch('tempfile.NamedTemporaryFile', side_effect=AssertionError('temp file')):
+            result = JupyterExtractor().extract(NOTEBOOK)
+
+        markdown = chunk_markdown.call_args.args[0]
+        assert '```python' in markdown
+        assert [text for text, _ in result.pages] == ['chunk one', 'chunk two']
+
+    def test_obsidian_note_chunked_from_read_text(self, chunk_markdown):
+        note = FIXTURES / 'obsidian_vault' / 'Note1.md'
+        text = note.read_text()
+
+        with patch.object(ObsidianExtractor, '_read_file',
+                          side_effect=AssertionError('file reread')):
+            ObsidianExtractor.extract(note, content=text)
+
+        chunk_markdown.assert_called_once_with(text, 'Note1.md')
+
+    def test_markdown_extractor(self, chunk_markdown, tmp_path):
+        note = tmp_path / 'readme.md'
+        note.write_text('# Title\n\nBody')
+
+        with patch('ingestion.extractors.markdown_extractor.DOCLING_AVAILABLE', True), \
+             patch('ingestion.extractors.markdown_extractor.DOCLING_CHUNKING_AVAILABLE', True):
+            result = MarkdownExtractor().extract(note)
+
+        chunk_markdown.assert_called_once_with('# Title\n\nBody', 'readme.md')
+        assert result.method == 'docling_markdown'
+
+    def test_markdown_extractor_uses_given_text(self, chunk_markdown, tmp_path):
+        note = tmp_path / 'readme.md'
+        note.write_text('# Title')
+
+        with patch('ingestion.extractors.markdown_extractor.DOCLING_AVAILABLE', True), \
+             patch('ingestion.extractors.markdown_extractor.DOCLING_CHUNKING_AVAILABLE', True), \
+             patch.object(Path, 'read_text', side_effect=AssertionError('file reread')):
+            MarkdownExtractor().extract(note, content='# Title')
+
+        chunk_markdown.assert_called_once_with('# Title', 'readme.md')
+
+
+def converter_chunks(path: Path):
+    """Chunks from the full DocumentConverter run (previous behaviour)"""
+    document = DoclingExtractor.get_converter().convert(str(path)).document
+    return DoclingExtractor._extract_hybrid_chunks(document)
+
+
+@requires_huggingface
+class TestChunkParity:
+    """In-memory parsing yields the converter's chunks"""
+
+    @pytest.fixture(autouse=True)
+    def docling(self):
+        pytest.importorskip('docling')
+        pytest.importorskip('transformers')
+
+    @pytest.mark.parametrize('name', ['Note1.md', 'Note2.md'])
+    def test_obsidian_notes(self, name):
+        path = FIXTURES / 'obsidian_vault' / name
+
+        chunks = DoclingExtractor.chunk_markdown(path.read_text(), path.name)
+
+        assert chunks == converter_chunks(path)
+
+    def test_notebook_markdown(self, tmp_path):
+        _, markdown = JupyterExtractor()._notebook_to_markdown(NOTEBOOK)
+        path = tmp_path / 'notebook.md'
+        path.write_text(markdown, encoding='utf-8')
+
+        assert DoclingExtractor.chunk_markdown(markdown, path.name) == converter_chunks(path)
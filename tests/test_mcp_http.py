@@ -8,11 +8,16 @@ from unittest.mock import AsyncMock, Mock, patch
 import json
 
 from main import app
+from readiness import Readiness
 
 
 @pytest.fixture
-def client():
-    """FastAPI test client."""
+def client(monkeypatch):
+    """FastAPI test client (with model and database marked ready)."""
+    readiness = Readiness()
+    readiness.mark_ready('model')
+    readiness.mark_ready('database')
+    monkeypatch.setattr(app.state.app_state.runtime, 'readiness', readiness)
     return TestClient(app)
 
 
@@ -599,3 +604,19 @@ class TestMCPProtocolCompliance:
         assert "result" not in data  # Per spec: error MUST NOT contain result
         assert "code" in data["error"]
         assert "message" in data["error"]
+
+
+class TestMCPStartup:
+    """Test tool calls made before startup has finished."""
+
+    def test_query_kb_before_ready_returns_error(self, client, monkeypatch):
+        monkeypatch.setattr(app.state.app_state.runtime, 'readiness', Readiness())
+
+        response = client.post("/mcp", json={
+            "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "query_kb", "arguments": {"query": "test"}}
+        })
+
+        result = response.json()["result"]
+        assert result["isError"] is True
+        assert "starting up" in result["content"][0]["text"]
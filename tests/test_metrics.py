@@ -0,0 +1,195 @@
+"""
+Tests for Prometheus metrics registry and /metrics endpoint
+
+Covers exposition format, thread-sharded counters, multi-process
+aggregation and the pipeline/cache instrumentation points.
+"""
+import multiprocessing
+import threading
+
+import pytest
+
+from metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return MetricsRegistry(multiprocess_dir=str(tmp_path / "metrics"))
+
+
+class TestExposition:
+    """Test Prometheus text rendering"""
+
+    def test_counter_renders_with_labels(self, registry):
+        counter = registry.counter("ragkb_test_total", "Test counter", ("cache", "result"))
+        counter.inc(cache="query", result="hit")
+        counter.inc(2, cache="query", result="hit")
+
+        text = registry.render()
+
+        assert "# TYPE ragkb_test_total counter" in text
+        assert 'ragkb_test_total{cache="query",result="hit"} 3' in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        histogram = registry.histogram("ragkb_test_seconds", "Test", ("stage",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, stage="embed")
+        histogram.observe(0.5, stage="embed")
+        histogram.observe(5.0, stage="embed")
+
+        text = registry.render()
+
+        assert 'ragkb_test_seconds_bucket{stage="embed",le="0.1"} 1' in text
+        assert 'ragkb_test_seconds_bucket{stage="embed",le="1"} 2' in text
+        assert 'ragkb_test_seconds_bucket{stage="embed",le="+Inf"} 3' in text
+        assert 'ragkb_test_seconds_count{stage="embed"} 3' in text
+        assert 'ragkb_test_seconds_sum{stage="embed"} 5.55' in text
+
+    def test_gauge_uses_callback(self, registry):
+        gauge = registry.gauge("ragkb_test_depth", "Test", ("queue",))
+        gauge.set_function(lambda: {"chunk": 4, "embed": 1})
+
+        text = registry.render()
+
+        assert 'ragkb_test_depth{queue="chunk"} 4' in text
+        assert 'ragkb_test_depth{queue="embed"} 1' in text
+
+    def test_label_values_are_escaped(self, registry):
+        counter = registry.counter("ragkb_test_total", "Test", ("name",))
+        counter.inc(name='a"b')
+
+        assert 'name="a\\"b"' in registry.render()
+
+
+class TestSharding:
+    """Test lock-free per-thread counters"""
+
+    def test_concurrent_increments_are_not_lost(self, registry):
+        counter = registry.counter("ragkb_test_total", "Test")
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert counter.snapshot()[()] == 8000
+
+
+def _child_observe(registry):
+    registry.enable_child_mode()
+    registry.metrics["ragkb_test_total"].inc(5, stage="chunk")
+    registry.flush()
+
+
+def _child_observe_without_flush(registry):
+    registry.enable_child_mode()
+    counter = registry.metrics["ragkb_test_total"]
+    counter.inc(5, stage="chunk")  # Periodic flush
+    counter.inc(2, stage="chunk")  # Only written by the exit finalizer
+
+
+class TestMultiProcess:
+    """Test aggregation of worker process metrics"""
+
+    def test_child_process_metrics_are_merged(self, registry):
+        counter = registry.counter("ragkb_test_total", "Test", ("stage",))
+        counter.inc(stage="chunk")
+
+        ctx = multiprocessing.get_context("fork")
+        proc = ctx.Process(target=_child_observe, args=(registry,))
+        proc.start()
+        proc.join(timeout=10)
+
+        assert proc.exitcode == 0
+        assert 'ragkb_test_total{stage="chunk"} 6' in registry.render()
+
+    def test_final_samples_flushed_on_worker_exit(self, registry):
+        """multiprocessing workers exit via os._exit, which skips atexit"""
+        registry.flush_interval = 3600
+        registry.counter("ragkb_test_total", "Test", ("stage",))
+
+        ctx = multiprocessing.get_context("fork")
+        proc = ctx.Process(target=_child_observe_without_flush, args=(registry,))
+        proc.start()
+        proc.join(timeout=10)
+
+        assert proc.exitcode == 0
+        assert 'ragkb_test_total{stage="chunk"} 7' in registry.render()
+
+    def test_reused_pid_does_not_overwrite_and_startup_clears(self, registry):
+        counter = registry.counter("ragkb_test_total", "Test")
+        for amount in (5, 2):  # Two worker lifetimes with the same pid
+            registry.enable_child_mode()
+            counter.inc(amount)
+            registry.flush()
+        registry._child, registry._process_id = False, "server"
+        counter.reset()
+
+        assert len(list(registry.multiprocess_dir.glob("metrics-*.json"))) == 2
+        assert "ragkb_test_total 7" in registry.render()
+
+        registry.clear_process_files()
+
+        assert "ragkb_test_total 7" not in registry.render()
+        assert not list(registry.multiprocess_dir.glob("metrics-*"))
+
+    def test_child_mode_discards_inherited_values(self, registry):
+        counter = registry.counter("ragkb_test_total", "Test")
+        counter.inc(3)
+
+        registry.enable_child_mode()
+
+        assert counter.snapshot() == {}
+
+
+class TestInstrumentation:
+    """Test instrumentation points in pipeline and caches"""
+
+    def test_timed_queue_records_wait(self):
+        from metrics import QUEUE_WAIT
+        from pipeline.pipeline_queues import TimedPriorityQueue
+
+        def observations():
+            cells = QUEUE_WAIT.snapshot().get(("embed",))
+            return sum(cells[:-1]) if cells else 0
+
+        before = observations()
+        queue = TimedPriorityQueue("embed")
+        queue.put(1)
+        assert queue.get() == 1
+
+        assert observations() == before + 1
+
+    def test_query_cache_counts_hits_and_misses(self):
+        from metrics import CACHE_REQUESTS
+        from query_cache import QueryCache
+
+        def count(result):
+            return CACHE_REQUESTS.snapshot().get(("query", result), 0)
+
+        hits, misses = count("hit"), count("miss")
+        cache = QueryCache(max_size=10)
+        cache.get("q", 5, None)
+        cache.put("q", 5, None, [{"content": "x"}])
+        cache.get("q", 5, None)
+
+        assert count("hit") == hits + 1
+        assert count("miss") == misses + 1
+
+    def test_metrics_endpoint_serves_prometheus_text(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from routes.metrics import router
+
+        app = FastAPI()
+        app.include_router(router)
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE ragkb_stage_duration_seconds histogram" in response.text
+        assert "process_resident_memory_bytes" in response.text
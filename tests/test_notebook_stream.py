@@ -0,0 +1,138 @@
+"""
+Tests for streaming notebook parsing
+
+Notebooks are read as a JSON event stream: cell sources and small text
+outputs are kept, images, HTML and oversized outputs are dropped (and
+counted) without holding the whole notebook in memory.
+"""
+import json
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from config import default_config
+from ingestion.jupyter.notebook_stream import read_notebook
+from ingestion.jupyter_extractor import JupyterExtractor
+
+PNG = 'iVBORw0KGgo' * 1000
+
+
+def notebook(cells, language='python'):
+    return {
+        'cells': cells,
+        'metadata': {'kernelspec': {'name': 'python3', 'language': language}},
+        'nbformat': 4,
+        'nbformat_minor': 5,
+    }
+
+
+def code(source, *outputs):
+    return {'cell_type': 'code', 'source': source, 'metadata': {},
+            'outputs': list(outputs), 'execution_count': 1}
+
+
+PLOT = {'output_type': 'display_data', 'metadata': {},
+        'data': {'image/png': PNG, 'text/plain': ['<Figure size 640x480 with 1 Axes>']}}
+FRAME = {'output_type': 'execute_result', 'execution_count': 1, 'metadata': {},
+         'data': {'text/html': '<table>' + '<tr><td>1</td></tr>' * 500 + '</table>',
+                  'text/plain': '   a\n0  1'}}
+STDOUT = {'output_type': 'stream', 'name': 'stdout', 'text': ['loss 0.25\n', 'done\n']}
+ERROR = {'output_type': 'error', 'ename': 'KeyError', 'evalue': "'x'",
+         'traceback': ['\x1b[0;31m---------\x1b[0m'] * 20}
+IMAGE_ONLY = {'output_type': 'display_data', 'metadata': {}, 'data': {'image/png': PNG}}
+
+
+@pytest.fixture
+def write_notebook(tmp_path):
+    def write(nb, name='analysis.ipynb'):
+        path = tmp_path / name
+        path.write_text(json.dumps(nb))
+        return path
+    return write
+
+
+class TestReadNotebook:
+
+    def test_heavy_outputs_dropped(self, write_notebook):
+        path = write_notebook(notebook([
+            {'cell_type': 'markdown', 'source': ['# Title\n', 'Intro'], 'metadata': {},
+             'attachments': {'plot.png': {'image/png': PNG}}},
+            code('plot()', PLOT, IMAGE_ONLY),
+            code(['df', '.head()'], FRAME, STDOUT, ERROR),
+        ], language='python'))
+
+        nb = read_notebook(path, max_output_bytes=1000)
+
+        assert [(c.cell_type, c.source) for c in nb.cells] == [
+            ('markdown', '# Title\nIntro'), ('code', 'plot()'), ('code', 'df.head()')]
+        assert nb.cells[1].outputs == ['<Figure size 640x480 with 1 Axes>']
+        assert nb.cells[2].outputs == ['   a\n0  1', 'loss 0.25\ndone\n', "KeyError: 'x'"]
+        assert nb.skipped_outputs == 1  # Image-only display
+        assert nb.skipped_bytes > 3 * len(PNG)
+        assert (nb.kernel, nb.language) == ('python3', 'python')
+
+    def test_oversized_text_output_dropped(self, write_notebook):
+        big = {'output_type': 'stream', 'name': 'stdout', 'text': ['row\n'] * 1000}
+        path = write_notebook(notebook([code('print(rows)', big, STDOUT)]))
+
+        nb = read_notebook(path, max_output_bytes=1000)
+
+        assert nb.cells[0].outputs == ['loss 0.25\ndone\n']
+        assert nb.skipped_outputs == 1
+        assert nb.skipped_bytes == 4000
+
+    def test_zero_threshold_drops_all_outputs(self, write_notebook):
+        path = write_notebook(notebook([code('x', STDOUT, FRAME)]))
+
+        nb = read_notebook(path, max_output_bytes=0)
+
+        assert nb.cells[0].outputs == []
+        assert nb.skipped_outputs == 2
+
+    def test_ijson_matches_json_fallback(self, write_notebook):
+        pytest.importorskip('ijson')
+        path = write_notebook(notebook([code('plot()', PLOT), code('df', FRAME, ERROR)]))
+
+        streamed = read_notebook(path)
+        with patch.dict('sys.modules', {'ijson': None}):
+            loaded = read_notebook(path)
+
+        assert streamed == loaded
+
+    def test_memory_follows_retained_text(self, write_notebook):
+        pytest.importorskip('ijson')
+        image = {'output_type': 'display_data', 'metadata': {}, 'data': {'image/png': PNG * 50}}
+        path = write_notebook(notebook([code(f'plot({i})', image) for i in range(40)]))
+        size = path.stat().st_size
+
+        tracemalloc.start()
+        try:
+            nb = read_notebook(path)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert len(nb.cells) == 40
+        assert size > 20_000_000
+        assert peak < size / 5
+
+
+class TestExtractorMarkdown:
+
+    def test_outputs_follow_code_blocks(self, write_notebook):
+        path = write_notebook(notebook([code('print(loss)', STDOUT, PLOT)]))
+
+        _, markdown = JupyterExtractor()._notebook_to_markdown(path)
+
+        assert markdown == ('```python\n\nprint(loss)\n\n```\n\n```text\n\nloss 0.25\ndone\n\n```'
+                            '\n\n```text\n\n<Figure size 640x480 with 1 Axes>\n\n```')
+        assert 'iVBOR' not in markdown
+
+    def test_outputs_disabled(self, write_notebook, monkeypatch):
+        monkeypatch.setattr(default_config.chunks, 'notebook_output_max_bytes', 0)
+        path = write_notebook(notebook([code('print(loss)', STDOUT)]))
+
+        _, markdown = JupyterExtractor()._notebook_to_markdown(path)
+
+        assert markdown == '```python\n\nprint(loss)\n\n```'
@@ -0,0 +1,169 @@
+"""
+Tests for memoized Obsidian vault detection
+
+Vault roots are memoized per directory and invalidated by the watcher when
+.obsidian folders come and go; content checks reuse text the router read.
+"""
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ingestion.extractors.extraction_router import ExtractionRouter
+from ingestion.obsidian_detector import ObsidianDetector
+from watcher import DocumentEventHandler, FileChangeCollector
+
+
+@pytest.fixture
+def vault(tmp_path):
+    (tmp_path / 'vault' / '.obsidian').mkdir(parents=True)
+    (tmp_path / 'vault' / 'notes' / 'deep').mkdir(parents=True)
+    (tmp_path / 'plain').mkdir()
+    return tmp_path
+
+
+def count_is_dir():
+    """Count .obsidian stats made through Path.is_dir"""
+    return patch.object(Path, 'is_dir', autospec=True, side_effect=Path.is_dir)
+
+
+class TestVaultRootMemo:
+
+    def test_vault_root_found(self, vault):
+        detector = ObsidianDetector()
+
+        assert detector.vault_root(vault / 'vault' / 'notes' / 'deep' / 'a.md') == vault / 'vault'
+        assert detector.is_obsidian_vault(vault / 'vault' / 'b.md')
+        assert not detector.is_obsidian_vault(vault / 'plain' / 'c.md')
+
+    def test_sibling_notes_not_restatted(self, vault):
+        detector = ObsidianDetector()
+        detector.is_obsidian_vault(vault / 'vault' / 'notes' / 'deep' / 'a.md')
+
+        with count_is_dir() as is_dir:
+            for name in ('b.md', 'c.md', 'd.markdown'):
+                assert detector.is_obsidian_vault(vault / 'vault' / 'notes' / 'deep' / name)
+            assert detector.is_obsidian_vault(vault / 'vault' / 'notes' / 'e.md')
+
+        is_dir.assert_not_called()
+
+    def test_outside_vault_memoized(self, vault):
+        detector = ObsidianDetector()
+        detector.is_obsidian_vault(vault / 'plain' / 'a.md')
+
+        with count_is_dir() as is_dir:
+            assert not detector.is_obsidian_vault(vault / 'plain' / 'b.md')
+
+        is_dir.assert_not_called()
+
+    def test_invalidate_on_new_vault(self, vault):
+        detector = ObsidianDetector()
+        note = vault / 'plain' / 'a.md'
+        assert not detector.is_obsidian_vault(note)
+
+        (vault / 'plain' / '.obsidian').mkdir()
+        assert not detector.is_obsidian_vault(note)  # Memoized until invalidated
+        detector.invalidate(vault / 'plain')
+
+        assert detector.vault_root(note) == vault / 'plain'
+
+    def test_invalidate_drops_only_subtree(self, vault):
+        detector = ObsidianDetector()
+        detector.is_obsidian_vault(vault / 'vault' / 'notes' / 'deep' / 'a.md')
+        detector.is_obsidian_vault(vault / 'plain' / 'a.md')
+
+        detector.invalidate(vault / 'vault')
+
+        assert vault / 'plain' in detector._vault_roots
+        assert not any(vault / 'vault' in (d, *d.parents) for d in detector._vault_roots)
+
+    def test_stale_walk_not_memoized(self, vault):
+        detector = ObsidianDetector()
+        real_is_dir = Path.is_dir
+
+        def invalidating_is_dir(path):
+            detector.invalidate(vault)  # Watcher event during the walk
+            return real_is_dir(path)
+
+        with patch.object(Path, 'is_dir', autospec=True, side_effect=invalidating_is_dir):
+            detector.is_obsidian_vault(vault / 'plain' / 'a.md')
+
+        assert detector._vault_roots == {}
+
+
+class TestContentFeatures:
+
+    @pytest.mark.parametrize('text,expected', [
+        ('See [[Other note]]', True),
+        ('#one and #two', True),
+        ('---\ntitle: x\n---\nBody', True),
+        ('# Heading\nPlain text with one #tag', False),
+    ])
+    def test_features(self, text, expected):
+        assert ObsidianDetector().has_obsidian_features(text) is expected
+
+    def test_content_not_reread(self, vault):
+        note = vault / 'plain' / 'a.md'
+        note.write_text('See [[Other]]')
+
+        with patch('builtins.open', side_effect=AssertionError('file reopened')):
+            assert ObsidianDetector().is_obsidian_note(note, 'See [[Other]]')
+
+
+class TestRouterReadsOnce:
+
+    def test_obsidian_extractor_gets_router_text(self, vault):
+        note = vault / 'plain' / 'a.md'
+        note.write_text('Links [[Other]]')
+        router = ExtractionRouter(factory=Mock())
+        router.obsidian_detector = ObsidianDetector()
+
+        with patch('ingestion.extractors.extraction_router.ObsidianExtractor') as extractor, \
+             patch.object(ObsidianDetector, '_has_obsidian_features') as reread:
+            router._extract_markdown_intelligently(note)
+
+        reread.assert_not_called()
+        assert extractor.extract.call_args.args == (note, router.obsidian_graph, 'Links [[Other]]')
+        assert router.get_last_method() == 'obsidian_graph_rag'
+
+    def test_markdown_extractor_gets_router_text(self, vault):
+        note = vault / 'plain' / 'a.md'
+        note.write_text('# Plain note')
+        factory = Mock()
+        router = ExtractionRouter(factory=factory)
+        router.obsidian_detector = ObsidianDetector()
+
+        router._extract_markdown_intelligently(note)
+
+        extractor = factory.create_extractor.return_value
+        extractor.extract.assert_called_once_with(note, content='# Plain note')
+
+
+class TestWatcherInvalidation:
+
+    @pytest.fixture
+    def handler(self):
+        return DocumentEventHandler(FileChangeCollector(), Mock())
+
+    def directory_event(self, src, dest=None):
+        return Mock(is_directory=True, src_path=str(src), dest_path=str(dest))
+
+    def test_obsidian_folder_created(self, handler):
+        with patch('watcher.get_obsidian_detector') as detector:
+            handler.on_created(self.directory_event('/kb/vault/.obsidian'))
+
+        detector.return_value.invalidate.assert_called_once_with(Path('/kb/vault'))
+
+    def test_folder_deleted_or_moved(self, handler):
+        with patch('watcher.get_obsidian_detector') as detector:
+            handler.on_deleted(self.directory_event('/kb/old'))
+            handler.on_moved(self.directory_event('/kb/a', '/kb/b'))
+
+        invalidated = [c.args[0] for c in detector.return_value.invalidate.call_args_list]
+        assert invalidated == [Path('/kb/old'), Path('/kb/a')]
+
+    def test_plain_folder_created_keeps_memo(self, handler):
+        with patch('watcher.get_obsidian_detector') as detector:
+            handler.on_created(self.directory_event('/kb/new'))
+
+        detector.return_value.invalidate.assert_not_called()
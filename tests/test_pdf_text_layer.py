@@ -0,0 +1,184 @@
+"""
+Tests for the born-digital PDF fast path
+
+PDFs are classified by sampling their text layer with pypdfium2: text-native
+PDFs skip OCR and page images, and only their image-only pages are OCR'd.
+"""
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from config import default_config
+from ingestion.extractors.docling_extractor import DoclingExtractor
+from ingestion.pdf_text_layer import TextLayerProfile, classify_pdf, sample_indices
+
+
+class TestTextLayerProfile:
+
+    def test_coverage_threshold(self):
+        profile = TextLayerProfile(page_count=100, sampled=8, sampled_with_text=7)
+
+        assert profile.coverage == 0.875
+        assert profile.is_text_native(0.85)
+        assert not profile.is_text_native(0.9)
+        assert not TextLayerProfile(0, 0, 0).is_text_native(0.0)
+
+    def test_image_only_runs(self):
+        profile = TextLayerProfile(10, 8, 8, image_only_pages=[2, 3, 4, 7, 9, 10])
+
+        assert profile.image_only_runs() == [(2, 4), (7, 7), (9, 10)]
+
+    def test_sample_indices_spread(self):
+        assert sample_indices(3, 8) == [0, 1, 2]
+        indices = sample_indices(400, 8)
+        assert len(indices) == 8
+        assert indices[0] < 50 and indices[-1] > 350
+
+
+def minimal_pdf(pages):
+    """PDF with one page per entry: text drawn with Helvetica, or blank for None"""
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+               '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for text in pages:
+        stream = f'BT /F1 12 Tf 72 700 Td ({text}) Tj ET' if text else ''
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+        kids.append(len(objects) + 1)
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+    objects[1] = (f'<< /Type /Pages /Kids [{" ".join(f"{k} 0 R" for k in kids)}] '
+                  f'/Count {len(kids)} >>')
+
+    body, offsets = b'%PDF-1.4\n', []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(body))
+        body += f'{number} 0 obj\n{obj}\nendobj\n'.encode()
+    xref = len(body)
+    body += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    body += ''.join(f'{o:010d} 00000 n \n' for o in offsets).encode()
+    body += (f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+             f'startxref\n{xref}\n%%EOF\n').encode()
+    return body
+
+
+class TestClassifyPdf:
+    """Real text-layer reads with pypdfium2"""
+
+    TEXT = 'Born digital text layer with plenty of characters on it'
+
+    @pytest.fixture(autouse=True)
+    def pdfium(self):
+        pytest.importorskip('pypdfium2')
+
+    def test_text_native_with_image_only_page(self, tmp_path):
+        path = tmp_path / 'book.pdf'
+        path.write_bytes(minimal_pdf([self.TEXT, self.TEXT, None, self.TEXT]))
+
+        profile = classify_pdf(path, samples=2, min_coverage=0.9)
+
+        assert profile.page_count == 4
+        assert profile.is_text_native(0.9)
+        assert profile.image_only_pages == [3]
+
+    def test_scanned_pdf(self, tmp_path):
+        path = tmp_path / 'scan.pdf'
+        path.write_bytes(minimal_pdf([None, None, 'p. 3']))
+
+        profile = classify_pdf(path)
+
+        assert profile.coverage == 0.0
+        assert profile.image_only_pages == []  # Not enumerated for scanned PDFs
+
+    def test_unreadable_pdf(self, tmp_path):
+        path = tmp_path / 'broken.pdf'
+        path.write_bytes(b'not a pdf')
+
+        assert classify_pdf(path) is None
+
+
+class TestDoclingRouting:
+    """The text-layer profile picks the converter"""
+
+    @pytest.fixture
+    def converters(self):
+        full, text = Mock(name='full'), Mock(name='text')
+        chunks = {id(full): [('ocr chunk', 0)], id(text): [('text chunk', 0)]}
+
+        def hybrid_chunks(document):
+            return list(chunks[document.converter])
+
+        full.convert.return_value.document.converter = id(full)
+        text.convert.return_value.document.converter = id(text)
+        with patch.object(DoclingExtractor, 'get_converter', return_value=full), \
+             patch.object(DoclingExtractor, 'get_text_converter', return_value=text), \
+             patch.object(DoclingExtractor, '_check_for_conversion_failure'), \
+             patch.object(DoclingExtractor, '_extract_hybrid_chunks', side_effect=hybrid_chunks):
+            yield full, text
+
+    def classify_as(self, profile):
+        return patch('ingestion.pdf_text_layer.classify_pdf', return_value=profile)
+
+    def test_text_native_skips_ocr(self, converters):
+        full, text = converters
+
+        with self.classify_as(TextLayerProfile(100, 8, 8)):
+            result = DoclingExtractor._convert_with_docling(Path('/kb/book.pdf'))
+
+        assert result.method == 'docling_text'
+        assert result.pages == [('text chunk', 0)]
+        full.convert.assert_not_called()
+
+    def test_image_only_pages_ocrd_by_range(self, converters):
+        full, text = converters
+        profile = TextLayerProfile(100, 8, 8, image_only_pages=[5, 6, 40])
+
+        with self.classify_as(profile):
+            result = DoclingExtractor._convert_with_docling(Path('/kb/book.pdf'))
+
+        assert result.method == 'docling_text_ocr'
+        assert result.pages == [('text chunk', 0), ('ocr chunk', 0), ('ocr chunk', 0)]
+        ranges = [c.kwargs['page_range'] for c in full.convert.call_args_list]
+        assert ranges == [(5, 6), (40, 40)]
+
+    def test_ocr_pages_merged_in_page_order(self, converters):
+        full, text = converters
+        profile = TextLayerProfile(100, 8, 8, image_only_pages=[5, 6, 40])
+        ocr_runs = iter([[('p5', 5), ('p6', 6)], [('p40', 40)]])
+
+        def hybrid_chunks(document):
+            if document.converter == id(text):
+                return [('p1', 1), ('p4', 4), ('p7', 7), ('p41', 41), ('p42', 42)]
+            return next(ocr_runs)
+
+        with self.classify_as(profile), \
+                patch.object(DoclingExtractor, '_extract_hybrid_chunks', side_effect=hybrid_chunks):
+            result = DoclingExtractor._convert_with_docling(Path('/kb/book.pdf'))
+
+        assert [page for _, page in result.pages] == [1, 4, 5, 6, 7, 40, 41, 42]
+
+    def test_scanned_uses_full_pipeline(self, converters):
+        full, text = converters
+
+        with self.classify_as(TextLayerProfile(100, 8, 2)):
+            result = DoclingExtractor._convert_with_docling(Path('/kb/scan.pdf'))
+
+        assert result.method == 'docling'
+        text.convert.assert_not_called()
+
+    def test_force_full_pipeline(self, converters, monkeypatch):
+        full, text = converters
+        monkeypatch.setattr(default_config.docling, 'force_full_pipeline', True)
+
+        with patch('ingestion.pdf_text_layer.classify_pdf') as classify:
+            DoclingExtractor._convert_with_docling(Path('/kb/book.pdf'))
+
+        classify.assert_not_called()
+        text.convert.assert_not_called()
+
+    def test_docx_not_classified(self, converters):
+        with patch('ingestion.pdf_text_layer.classify_pdf') as classify:
+            result = DoclingExtractor._convert_with_docling(Path('/kb/report.docx'))
+
+        classify.assert_not_called()
+        assert result.method == 'docling'
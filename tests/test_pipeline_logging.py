@@ -6,6 +6,7 @@ since they are skipped before the chunking stage actually happens.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
+from config import default_config
 from pipeline.pipeline_coordinator import PipelineCoordinator
 from pipeline.indexing_queue import QueueItem, Priority
 
@@ -136,7 +137,8 @@ class TestPipelineLogging:
         assert "already indexed" not in captured.out
 
     @patch('pipeline.pipeline_coordinator.DocumentFile')
-    def test_epub_conversion_logs_success_not_zero_chunks(self, mock_doc_class, mock_services, capsys):
+    def test_epub_conversion_logs_success_not_zero_chunks(self, mock_doc_class, mock_services,
+                                                          capsys, monkeypatch):
         """EPUB conversion should log success message, not '0 chunks extracted'
 
         Issue: EPUB files are converted to PDF, then the EPUB is moved to original/.
@@ -146,6 +148,7 @@ class TestPipelineLogging:
         Note: EPUBs are routed to _handle_epub_conversion() via add_file(),
         NOT through _chunk_stage(). This test verifies the correct code path.
         """
+        monkeypatch.setattr(default_config.docling, 'epub_convert_to_pdf', True)
         processor, indexer, embedding_service = mock_services
 
         # Create mock for EPUB file
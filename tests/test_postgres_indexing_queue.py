@@ -0,0 +1,314 @@
+"""
+Tests for PostgresIndexingQueue
+
+Statement-level checks run against a mocked psycopg2 connection. The
+behavioral tests (dedup, lease expiry, attempt limit) run against a real
+PostgreSQL server given by TEST_DATABASE_URL, in a throwaway schema, and
+are skipped without one.
+"""
+import os
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pipeline.indexing_queue import Priority, QueueItem
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = (0, 0, 0)
+    return conn
+
+
+@pytest.fixture
+def cursor(conn):
+    return conn.cursor.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def queue(conn):
+    from pipeline.postgres_indexing_queue import PostgresIndexingQueue
+
+    with patch('pipeline.postgres_indexing_queue.DatabaseFactory') as factory:
+        factory.create_connection.return_value.connect.return_value = conn
+        q = PostgresIndexingQueue(lease_seconds=60, poll_interval=0.01)
+    yield q
+    q._stop.set()
+
+
+def executed_sql(cursor):
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+class TestAdd:
+    """Test enqueueing"""
+
+    def test_add_many_uses_single_insert_with_conflict_skip(self, queue, conn):
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            queue.add_many([Path('/kb/a.md'), Path('/kb/b.md')], Priority.HIGH)
+
+        sql, rows = execute_values.call_args.args[1:]
+        assert 'ON CONFLICT (path) DO UPDATE' in sql
+        assert "status = 'failed' AND EXCLUDED.force" in sql
+        assert rows == [('/kb/a.md', 1, False), ('/kb/b.md', 1, False)]
+        conn.commit.assert_called()
+
+    def test_add_many_with_no_paths_is_noop(self, queue):
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            queue.add_many([])
+
+        execute_values.assert_not_called()
+
+
+class TestClaim:
+    """Test leasing items"""
+
+    def test_get_returns_claimed_item(self, queue, cursor):
+        cursor.fetchone.return_value = ('/kb/a.md', 1, True)
+
+        item = queue.get(timeout=0)
+
+        assert item == QueueItem(priority=1, path=Path('/kb/a.md'), force=True)
+        assert item.path == Path('/kb/a.md') and item.force is True
+
+    def test_claim_skips_locked_rows_and_reclaims_expired_leases(self, queue, cursor):
+        cursor.fetchone.return_value = None
+
+        assert queue.get(timeout=0) is None
+
+        claim = executed_sql(cursor)[-1]
+        assert 'FOR UPDATE SKIP LOCKED' in claim
+        assert 'lease_expires_at < NOW()' in claim
+        assert 'ORDER BY priority, id' in claim
+        assert 'attempts < %(max_attempts)s' in claim
+        assert cursor.execute.call_args.args[1] == {
+            'owner': queue.owner, 'lease_seconds': 60, 'max_attempts': 3}
+
+    def test_get_returns_none_when_paused(self, queue, cursor):
+        queue.pause()
+        calls = cursor.execute.call_count
+
+        assert queue.get(timeout=0) is None
+        assert cursor.execute.call_count == calls
+
+        queue.resume()
+        assert queue.is_paused() is False
+
+
+class TestLifecycle:
+    """Test completion and lease maintenance"""
+
+    def test_mark_complete_deletes_row(self, queue, cursor):
+        queue.mark_complete(Path('/kb/a.md'))
+
+        assert cursor.execute.call_args.args == (
+            "DELETE FROM indexing_queue WHERE path = %s", ('/kb/a.md',)
+        )
+
+    def test_renew_leases_only_touches_own_rows(self, queue, cursor):
+        cursor.rowcount = 2
+
+        assert queue.renew_leases() == 2
+        assert cursor.execute.call_args.args[1] == (60, queue.owner)
+
+    def test_failed_statement_rolls_back(self, queue, conn, cursor):
+        cursor.execute.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            queue.mark_complete(Path('/kb/a.md'))
+
+        conn.rollback.assert_called_once()
+
+
+class TestQueueSelection:
+    """Test startup selection of the queue backend"""
+
+    def test_in_memory_queue_by_default(self, monkeypatch):
+        from startup.phases.pipeline_phase import PipelinePhase
+        from pipeline.indexing_queue import IndexingQueue
+
+        monkeypatch.delenv('DURABLE_QUEUE_ENABLED', raising=False)
+
+        assert isinstance(PipelinePhase(MagicMock()).create_queue(), IndexingQueue)
+
+    def test_manager_uses_phase_factory(self):
+        from startup.manager import StartupManager
+
+        manager = StartupManager(MagicMock())
+        with patch.object(manager._pipeline_phase, 'create_queue') as create, \
+             patch.object(manager, '_create_indexer'), \
+             patch.object(manager, '_init_concurrent_pipeline'), \
+             patch('pipeline.IndexingWorker'):
+            manager._init_queue_and_worker()
+
+        create.assert_called_once_with()
+        assert manager.state.indexing.queue is create.return_value
+
+
+class TestStartupRecovery:
+    """Test restart behavior around the startup rescan"""
+
+    def test_rescan_runs_when_durable_queue_has_work(self):
+        """Files changed while the API was down are still found; recovered rows are kept"""
+        from startup.manager import StartupManager
+
+        manager = StartupManager(MagicMock())
+        queue = manager.state.indexing.queue
+        queue.recovered_work = 12
+
+        with patch.object(manager, '_create_orchestrator') as orchestrator:
+            orchestrator.return_value.index_all.return_value = (3, 0)
+            manager._run_indexing()
+
+        orchestrator.return_value.index_all.assert_called_once_with(queue=queue, force=False)
+
+    def test_rescan_runs_with_empty_queue(self):
+        from startup.manager import StartupManager
+        from pipeline.indexing_queue import IndexingQueue
+
+        manager = StartupManager(MagicMock())
+        manager.state.indexing.queue = IndexingQueue()
+
+        with patch.object(manager, '_create_orchestrator') as orchestrator:
+            orchestrator.return_value.index_all.return_value = (0, 0)
+            manager._run_indexing()
+
+        orchestrator.return_value.index_all.assert_called_once()
+
+    def test_queue_closed_at_shutdown(self):
+        import asyncio
+        from app_state import AppState
+
+        state = AppState()
+        state.indexing.queue = MagicMock()
+
+        asyncio.run(state.close_all_resources())
+
+        state.indexing.queue.close.assert_called_once_with()
+
+
+@pytest.fixture
+def pg_conn():
+    """Connection to TEST_DATABASE_URL with a throwaway search_path schema"""
+    url = os.getenv('TEST_DATABASE_URL')
+    if not url:
+        pytest.skip("TEST_DATABASE_URL not set")
+    psycopg2 = pytest.importorskip('psycopg2')
+    from ingestion.postgres_connection import PostgresSchemaManager
+
+    schema = f"queue_test_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(url)
+    with admin.cursor() as cur:
+        cur.execute(f"CREATE SCHEMA {schema}")
+        cur.execute(f"SET search_path TO {schema}")
+        PostgresSchemaManager(admin)._create_indexing_queue_table(cur)
+    admin.commit()
+    connections = []
+
+    def connect():
+        conn = psycopg2.connect(url, options=f"-c search_path={schema}")
+        connections.append(conn)
+        return conn
+
+    yield connect
+    for conn in connections:
+        conn.close()
+    with admin.cursor() as cur:
+        cur.execute(f"DROP SCHEMA {schema} CASCADE")
+    admin.commit()
+    admin.close()
+
+
+@pytest.fixture
+def make_queue(pg_conn):
+    """Build real queues, one connection (= one ingest process) each"""
+    from pipeline.postgres_indexing_queue import PostgresIndexingQueue
+
+    queues = []
+
+    def make(**kwargs):
+        with patch('pipeline.postgres_indexing_queue.DatabaseFactory') as factory:
+            factory.create_connection.return_value.connect.return_value = pg_conn()
+            q = PostgresIndexingQueue(poll_interval=0.01, **kwargs)
+        queues.append(q)
+        return q
+
+    yield make
+    for q in queues:
+        q._stop.set()
+
+
+def expire_leases(queue):
+    """Simulate the lease holder dying: push every lease into the past"""
+    with queue.lock:
+        queue._execute("UPDATE indexing_queue SET lease_expires_at = NOW() - INTERVAL '1 second' "
+                       "WHERE status = 'leased'")
+
+
+class TestAgainstPostgres:
+    """Behavior against a real server"""
+
+    def test_duplicate_paths_are_queued_once(self, make_queue):
+        queue = make_queue()
+
+        queue.add(Path('/kb/a.md'))
+        queue.add_many([Path('/kb/a.md'), Path('/kb/b.md'), Path('/kb/a.md')], Priority.HIGH)
+
+        assert queue.size() == 2
+        claimed = [queue.get(timeout=0), queue.get(timeout=0)]
+        assert [item.path for item in claimed] == [Path('/kb/b.md'), Path('/kb/a.md')]
+        queue.add(Path('/kb/a.md'))  # Re-added while leased
+        assert queue.get(timeout=0) is None
+
+    def test_live_lease_is_not_reclaimed(self, make_queue):
+        owner, other = make_queue(lease_seconds=60), make_queue(lease_seconds=60)
+        owner.add(Path('/kb/a.md'))
+
+        assert owner.get(timeout=0).path == Path('/kb/a.md')
+        assert other.get(timeout=0) is None
+        assert other.size() == 0
+
+    def test_expired_lease_is_reclaimed_by_another_process(self, make_queue):
+        crashed, survivor = make_queue(lease_seconds=60), make_queue(lease_seconds=60)
+        crashed.add(Path('/kb/a.md'))
+        crashed.get(timeout=0)
+
+        expire_leases(crashed)
+
+        assert survivor.size() == 1
+        assert survivor.get(timeout=0).path == Path('/kb/a.md')
+        assert crashed.renew_leases() == 0  # Lease now belongs to the survivor
+        survivor.mark_complete(Path('/kb/a.md'))
+        assert survivor.is_empty() and survivor.get(timeout=0) is None
+
+    def test_restart_reports_recovered_work(self, make_queue):
+        first = make_queue()
+        first.add_many([Path('/kb/a.md'), Path('/kb/b.md')])
+        first.get(timeout=0)
+        expire_leases(first)
+
+        assert make_queue().recovered_work == 2
+
+    def test_poison_file_fails_after_max_attempts(self, make_queue):
+        queue = make_queue(max_attempts=2)
+        queue.add(Path('/kb/poison.pdf'))
+
+        for _ in range(2):
+            assert queue.get(timeout=0).path == Path('/kb/poison.pdf')
+            expire_leases(queue)
+
+        assert queue.get(timeout=0) is None
+        assert queue.size() == 0
+        assert queue.failed_count() == 1
+
+        queue.add(Path('/kb/poison.pdf'))  # Watcher re-add does not retry
+        assert queue.get(timeout=0) is None
+
+        queue.add(Path('/kb/poison.pdf'), force=True)
+        item = queue.get(timeout=0)
+        assert item.path == Path('/kb/poison.pdf') and item.force is True
+        assert queue.failed_count() == 0
@@ -0,0 +1,177 @@
+"""
+Tests for PostgresSecurityScanCache
+
+Covers the bulk-prefetched in-memory view, buffered batched upserts and
+in-memory stats against a mocked psycopg2 connection.
+"""
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pipeline.postgres_security_cache import PostgresSecurityScanCache, SCANNER_VERSION
+
+
+def row(file_hash, is_valid=True, scanned_at=datetime(2025, 1, 1)):
+    return (file_hash, is_valid, None, '', '', '[]', scanned_at, SCANNER_VERSION)
+
+
+@pytest.fixture
+def conn():
+    return MagicMock()
+
+
+@pytest.fixture
+def cursor(conn):
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [
+        row('aaa'), row('bbb', is_valid=False, scanned_at=datetime(2025, 2, 1))
+    ]
+    return cursor
+
+
+@pytest.fixture
+def cache(conn, cursor):
+    with patch('pipeline.postgres_security_cache.DatabaseFactory') as factory:
+        factory.create_connection.return_value.connect.return_value = conn
+        yield PostgresSecurityScanCache()
+
+
+class TestPrefetch:
+    """All entries are loaded in one query, lookups hit memory"""
+
+    def test_first_lookup_loads_all_entries_once(self, cache, cursor):
+        assert cache.get('aaa').is_valid is True
+        assert cache.get('bbb').is_valid is False
+        assert cache.get('missing') is None
+
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args.args
+        assert 'WHERE scanner_version = %s' in sql
+        assert params == (SCANNER_VERSION,)
+
+    def test_prefetch_reloads(self, cache, cursor):
+        cache.get('aaa')
+        cursor.fetchall.return_value = [row('ccc')]
+
+        assert cache.prefetch() == 1
+        assert cache.get('aaa') is None
+        assert cache.get('ccc') is not None
+
+    def test_database_unavailable_behaves_as_empty(self, cache, conn):
+        conn.cursor.side_effect = RuntimeError('connection refused')
+
+        assert cache.get('aaa') is None
+
+
+class TestBufferedWrites:
+    """Writes are visible immediately and flushed in batches"""
+
+    def test_set_visible_before_flush(self, cache):
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            cache.set('new', True, None, '', '')
+
+            assert cache.get('new').is_valid is True
+            execute_values.assert_not_called()
+
+    def test_flush_writes_one_batched_upsert(self, cache, conn):
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            cache.set('one', True, None, '', '')
+            cache.set('two', False, 'critical', 'Virus', 'ClamAVStrategy')
+            written = cache.flush()
+
+        assert written == 2
+        assert execute_values.call_count == 1
+        sql, rows = execute_values.call_args.args[1:]
+        assert 'ON CONFLICT (file_hash) DO UPDATE' in sql
+        assert [r[0] for r in rows] == ['one', 'two']
+        conn.commit.assert_called()
+
+    def test_flush_when_buffer_full(self, cache):
+        cache.FLUSH_SIZE = 3
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            for i in range(7):
+                cache.set(f'hash{i}', True, None, '', '')
+
+        assert execute_values.call_count == 2
+
+    def test_concurrent_writers_share_one_view(self, cache):
+        with patch('psycopg2.extras.execute_values'):
+            threads = [
+                threading.Thread(target=cache.set, args=(f'h{i}', True, None, '', ''))
+                for i in range(50)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert all(cache.get(f'h{i}') is not None for i in range(50))
+
+    def test_lookups_not_blocked_by_flush(self, cache):
+        """The upsert runs outside the lock get() needs"""
+        writing = threading.Event()
+        release = threading.Event()
+
+        def slow_upsert(*args, **kwargs):
+            writing.set()
+            release.wait(5)
+
+        with patch('psycopg2.extras.execute_values', side_effect=slow_upsert):
+            cache.set('x', True, None, '', '')
+            flusher = threading.Thread(target=cache.flush)
+            flusher.start()
+            assert writing.wait(5)
+
+            lookup = threading.Thread(target=cache.get, args=('x',))
+            lookup.start()
+            lookup.join(1)
+            blocked = lookup.is_alive()
+            cache.set('y', True, None, '', '')  # Buffered for the next flush
+
+            release.set()
+            flusher.join()
+            lookup.join()
+
+        assert blocked is False
+        assert list(cache._pending) == ['y']
+
+    def test_failed_flush_does_not_raise(self, cache, conn):
+        with patch('psycopg2.extras.execute_values', side_effect=RuntimeError('db down')):
+            cache.set('x', True, None, '', '')
+            assert cache.flush() == 0
+
+        conn.rollback.assert_called()
+
+
+class TestStats:
+    """Stats come from memory; only per-version counts query the table"""
+
+    def test_stats_from_memory(self, cache, cursor):
+        stats = cache.stats()
+
+        assert stats['total_entries'] == 2
+        assert stats['valid_count'] == 1
+        assert stats['invalid_count'] == 1
+        assert stats['oldest_entry'].startswith('2025-01-01')
+        assert stats['newest_entry'].startswith('2025-02-01')
+        assert cursor.execute.call_count == 1  # The prefetch only
+
+    def test_get_stats_counts_every_version(self, cache, cursor):
+        cache.stats()
+        cursor.fetchall.return_value = [(SCANNER_VERSION, 2), ('0.9.0', 40)]
+
+        stats = cache.get_stats()
+
+        assert stats['total_entries'] == 2
+        assert stats['by_version'] == {SCANNER_VERSION: 2, '0.9.0': 40}
+        assert 'GROUP BY scanner_version' in cursor.execute.call_args.args[0]
+
+    def test_clear_empties_memory(self, cache, cursor):
+        cache.get('aaa')
+        cursor.rowcount = 2
+
+        assert cache.clear() == 2
+        assert cache.get('aaa') is None
+        assert cache.stats()['total_entries'] == 0
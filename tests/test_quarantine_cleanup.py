@@ -0,0 +1,128 @@
+"""
+Tests for set-based quarantine cleanup
+
+Critical findings of a scan job are quarantined together: their documents
+are removed from the index in one transaction through the vector store,
+and the keyword index and query cache are invalidated once.
+"""
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from ingestion.postgres_database import PostgresVectorRepository
+from ingestion.validation_result import SecuritySeverity
+from pipeline.security_scanner import QuarantineHandler, ScanResult, SecurityScanner
+
+
+def critical(path: Path) -> ScanResult:
+    return ScanResult(
+        file_path=path, is_valid=False, severity=SecuritySeverity.CRITICAL,
+        reason='Virus detected', validation_check='ClamAVStrategy', file_hash='abc'
+    )
+
+
+@pytest.fixture
+def kb(tmp_path):
+    for name in ('bad1.pdf', 'bad2.pdf', 'bad3.pdf', 'good.md'):
+        (tmp_path / name).write_bytes(b'content')
+    return tmp_path
+
+
+@pytest.fixture
+def store():
+    store = Mock()
+    store.delete_documents.side_effect = lambda paths: {
+        p: 7 for p in paths if not p.endswith('bad3.pdf')  # bad3 was never indexed
+    }
+    return store
+
+
+class TestQuarantineHandler:
+    """All critical files are removed from the index in one call"""
+
+    def test_one_delete_for_all_quarantined_files(self, kb, store):
+        query_cache = Mock()
+        handler = QuarantineHandler(kb, store, query_cache)
+        results = [critical(kb / f'bad{i}.pdf') for i in (1, 2, 3)]
+
+        actions = handler.quarantine_files(results)
+
+        store.delete_documents.assert_called_once_with(
+            [str(kb / 'bad1.pdf'), str(kb / 'bad2.pdf'), str(kb / 'bad3.pdf')]
+        )
+        store.refresh_keyword_index.assert_called_once()
+        query_cache.clear.assert_called_once()
+        assert actions[kb / 'bad1.pdf'] == 'quarantined, 7 chunks removed'
+        assert actions[kb / 'bad3.pdf'] == 'quarantined'
+        assert (kb / '.quarantine' / 'bad1.pdf.REJECTED').exists()
+
+    def test_failed_moves_are_not_deleted(self, kb, store):
+        handler = QuarantineHandler(kb, store)
+        missing = critical(kb / 'gone.pdf')
+
+        actions = handler.quarantine_files([critical(kb / 'bad1.pdf'), missing])
+
+        store.delete_documents.assert_called_once_with([str(kb / 'bad1.pdf')])
+        assert kb / 'gone.pdf' not in actions
+
+    def test_nothing_indexed_skips_invalidation(self, kb):
+        store = Mock()
+        store.delete_documents.return_value = {}
+        query_cache = Mock()
+
+        QuarantineHandler(kb, store, query_cache).quarantine_files([critical(kb / 'bad1.pdf')])
+
+        store.refresh_keyword_index.assert_not_called()
+        query_cache.clear.assert_not_called()
+
+    def test_database_error_keeps_quarantine(self, kb):
+        store = Mock()
+        store.delete_documents.side_effect = RuntimeError('db down')
+
+        actions = QuarantineHandler(kb, store).quarantine_files([critical(kb / 'bad1.pdf')])
+
+        assert actions[kb / 'bad1.pdf'] == 'quarantined'
+
+
+class TestScannerQuarantine:
+
+    def test_scan_quarantines_critical_findings_together(self, kb, store):
+        def validate(path):
+            bad = Path(path).name.startswith('bad')
+            return Mock(is_valid=not bad, severity=SecuritySeverity.CRITICAL if bad else None,
+                        matches=[], reason='Virus detected' if bad else '',
+                        validation_check='ClamAVStrategy' if bad else '')
+
+        with patch('pipeline.security_scanner.FileTypeValidator') as validator_cls, \
+             patch.object(SecurityScanner, '_scan_cache', return_value=None):
+            validator_cls.return_value.validate.side_effect = validate
+            scanner = SecurityScanner(kb, store, Mock(), state_store=Mock(load=Mock(return_value={})))
+            summary = scanner.scan('job', auto_quarantine=True, incremental=False)
+
+        assert len(summary.critical_findings) == 3
+        store.delete_documents.assert_called_once()
+        assert sorted(store.delete_documents.call_args.args[0]) == [
+            str(kb / 'bad1.pdf'), str(kb / 'bad2.pdf'), str(kb / 'bad3.pdf')
+        ]
+
+
+class TestPostgresBulkDelete:
+    """Documents are deleted with one set-based statement"""
+
+    def test_delete_many_uses_one_statement(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [('/kb/a.pdf', 3), ('/kb/b.pdf', 0)]
+        repo = PostgresVectorRepository(conn)
+
+        removed = repo.delete_many(['/kb/a.pdf', '/kb/b.pdf', '/kb/c.pdf'])
+
+        assert removed == {'/kb/a.pdf': 3, '/kb/b.pdf': 0}
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert 'DELETE FROM documents WHERE file_path = ANY(%s)' in statements[0]
+        assert any('DELETE FROM graph_nodes WHERE node_id = ANY(%s)' in s for s in statements)
+        assert any('processing_progress' in s for s in statements)
+        params = cursor.execute.call_args_list[0].args[1]
+        assert params == (['/kb/a.pdf', '/kb/b.pdf', '/kb/c.pdf'],)
+        conn.commit.assert_not_called()  # Caller commits the whole set
@@ -0,0 +1,285 @@
+"""
+Tests for asynchronous, speculative query expansion.
+
+A local stub HTTP server stands in for Ollama (/api/tags, /api/generate)
+so the pooled client, background probe and latency budget are exercised
+over real sockets.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from models import QueryRequest
+from operations import query_executor
+from operations.query_executor import QueryExecutor
+from pipeline.query_expander import QueryExpander
+
+
+class StubOllama:
+    """Minimal Ollama API: model list plus canned generate responses"""
+
+    def __init__(self, models=("qwen2.5:0.5b",), expansions=("variant one", "variant two"),
+                 delay=0.0):
+        self.models = list(models)
+        self.expansions = list(expansions)
+        self.delay = delay
+        self.generate_calls = 0
+        self.connections = set()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._send({"models": [{"name": m} for m in stub.models]})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                stub.generate_calls += 1
+                stub.connections.add(self.client_address)
+                time.sleep(stub.delay)
+                self._send({"response": json.dumps(stub.expansions)})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def ollama():
+    stub = StubOllama()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def make_expander(monkeypatch, tmp_path):
+    monkeypatch.setenv("QUERY_EXPANSION_ENABLED", "true")
+
+    def make(url, **kwargs):
+        kwargs.setdefault("cache_dir", str(tmp_path / "expansions"))
+        return QueryExpander(ollama_url=url, **kwargs)
+
+    return make
+
+
+def wait_probe(expander, timeout=5.0):
+    """Start the background probe and wait for it to finish"""
+    expander.start_probe()
+    deadline = time.monotonic() + timeout
+    while expander._probed_at is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestAvailabilityProbe:
+    """Ollama availability is checked in the background"""
+
+    def test_is_enabled_does_not_block_before_probe(self, make_expander):
+        """Unreachable Ollama must not add the probe timeout to a query"""
+        expander = make_expander("http://10.255.255.1:11434")
+
+        start = time.perf_counter()
+        enabled = expander.is_enabled
+
+        assert enabled is False
+        assert time.perf_counter() - start < 0.1
+
+    def test_probe_enables_expansion(self, ollama, make_expander):
+        expander = make_expander(ollama.url)
+
+        wait_probe(expander)
+
+        assert expander.is_enabled is True
+
+    def test_probe_detects_missing_model(self, ollama, make_expander):
+        ollama.models = ["llama3:8b"]
+        expander = make_expander(ollama.url)
+
+        wait_probe(expander)
+
+        assert expander.is_enabled is False
+
+    def test_probe_repeats_after_success(self, ollama, make_expander, monkeypatch):
+        """Removing the model after a successful probe is noticed"""
+        expander = make_expander(ollama.url)
+        wait_probe(expander)
+        assert expander.is_enabled is True
+
+        ollama.models = []
+        monkeypatch.setattr(QueryExpander, "PROBE_INTERVAL", 0)
+        probed_at = expander._probed_at
+        expander.is_enabled  # Stale: starts the background probe
+        deadline = time.monotonic() + 5.0
+        while expander._probed_at == probed_at and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert expander._available is False
+
+    def test_disabled_by_env(self, ollama, make_expander, monkeypatch):
+        monkeypatch.setenv("QUERY_EXPANSION_ENABLED", "false")
+        expander = make_expander(ollama.url)
+
+        assert expander.is_enabled is False
+
+
+class TestAsyncExpansion:
+    """Expansion over the pooled async client"""
+
+    @pytest.mark.asyncio
+    async def test_expand_returns_original_plus_variants(self, ollama, make_expander):
+        expander = make_expander(ollama.url)
+        wait_probe(expander)
+
+        expanded = await expander.expand("docker networking")
+        await expander.close()
+
+        assert expanded == ["docker networking", "variant one", "variant two"]
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, ollama, make_expander):
+        expander = make_expander(ollama.url, memory_cache_size=0)
+        wait_probe(expander)
+
+        for i in range(3):
+            await expander.expand(f"query {i}")
+        await expander.close()
+
+        assert ollama.generate_calls == 3
+        assert len(ollama.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_serves_repeat_queries(self, ollama, make_expander):
+        expander = make_expander(ollama.url)
+        wait_probe(expander)
+
+        first = await expander.expand("repeat me")
+        second = await expander.expand("repeat me")
+        await expander.close()
+
+        assert first == second
+        assert ollama.generate_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, ollama, make_expander):
+        expander = make_expander(ollama.url)
+        wait_probe(expander)
+        await expander.expand("persist me")
+        await expander.close()
+
+        # New instance (empty LRU), Ollama gone: disk cache still answers
+        restarted = make_expander("http://127.0.0.1:9")
+        expanded = await restarted.expand("persist me")
+
+        assert expanded == ["persist me", "variant one", "variant two"]
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_falls_back(self, ollama, make_expander):
+        ollama.expansions = "not a list"
+        expander = make_expander(ollama.url)
+        wait_probe(expander)
+
+        expanded = await expander.expand("odd reply")
+        await expander.close()
+
+        assert expanded == ["odd reply"]
+
+
+def make_executor(expander, search_results):
+    """QueryExecutor whose store returns results keyed by query text"""
+    model = Mock()
+    model.encode.return_value = np.array([0.1] * 384)
+
+    store = AsyncMock()
+
+    async def search(query_embedding, top_k, threshold, query_text, use_hybrid):
+        return search_results.get(query_text, [])
+
+    store.search.side_effect = search
+    return QueryExecutor(model, store, None, None, expander), store
+
+
+def result(source, score):
+    return {"content": f"content of {source}", "source": source, "page": None, "score": score}
+
+
+class TestSpeculativeSearch:
+    """Original query is searched while the expansion runs"""
+
+    SEARCH_RESULTS = {
+        "docker networking": [result("original.md", 0.9)],
+        "variant one": [result("variant1.md", 0.8)],
+        "variant two": [result("variant2.md", 0.7)],
+    }
+
+    @pytest.mark.asyncio
+    async def test_variants_merged_when_expansion_in_time(self, ollama, make_expander):
+        expander = make_expander(ollama.url, budget_ms=2000)
+        wait_probe(expander)
+        executor, _ = make_executor(expander, self.SEARCH_RESULTS)
+
+        response = await executor.execute(QueryRequest(text="docker networking", top_k=5))
+        await expander.close()
+
+        assert [r.source for r in response.results] == ["original.md", "variant1.md", "variant2.md"]
+
+    @pytest.mark.asyncio
+    async def test_slow_expansion_bounded_by_budget(self, ollama, make_expander):
+        """A slow LLM adds at most the budget, and original results are returned"""
+        ollama.delay = 1.0
+        expander = make_expander(ollama.url, budget_ms=100)
+        wait_probe(expander)
+        executor, store = make_executor(expander, self.SEARCH_RESULTS)
+
+        start = time.perf_counter()
+        response = await executor.execute(QueryRequest(text="docker networking", top_k=5))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+        assert [r.source for r in response.results] == ["original.md"]
+        assert store.search.await_count == 1
+        assert len(query_executor._background_expansions) == 1  # Not garbage collected
+
+        # Late expansion still completes and warms the cache
+        await asyncio.sleep(1.5)
+        assert await expander.expand("docker networking") == [
+            "docker networking", "variant one", "variant two"
+        ]
+        assert ollama.generate_calls == 1
+        assert not query_executor._background_expansions
+        await expander.close()
+
+    @pytest.mark.asyncio
+    async def test_expansion_failure_uses_original_results(self, make_expander):
+        expander = make_expander("http://127.0.0.1:9", budget_ms=500)
+        expander._available = True  # Probe passed, then Ollama went away
+        executor, _ = make_executor(expander, self.SEARCH_RESULTS)
+
+        response = await executor.execute(QueryRequest(text="docker networking", top_k=5))
+        await expander.close()
+
+        assert [r.source for r in response.results] == ["original.md"]
+        assert expander._available is False  # Re-probed before the next expansion
@@ -0,0 +1,142 @@
+"""
+Tests for startup readiness tracking and the /ready endpoint
+"""
+from unittest.mock import AsyncMock, Mock, patch
+
+from readiness import Readiness
+
+
+class TestReadiness:
+    """Test capability derivation from component status"""
+
+    def test_nothing_ready_initially(self):
+        readiness = Readiness()
+
+        report = readiness.snapshot()
+
+        assert report['ready'] is False
+        assert report['components']['model'] == {'status': 'pending'}
+
+    def test_query_ready_before_indexing(self):
+        readiness = Readiness()
+
+        readiness.mark_ready('model')
+        readiness.mark_ready('database')
+
+        assert readiness.is_ready('query') is True
+        assert readiness.is_ready('indexing') is False
+        assert readiness.snapshot()['ready'] is True
+
+    def test_failed_component_reports_error(self):
+        clock = Mock(side_effect=[0.0, 2.5])
+        readiness = Readiness(clock=clock)
+
+        readiness.mark_failed('reranker', RuntimeError("model download failed"))
+
+        component = readiness.snapshot()['components']['reranker']
+        assert component == {'status': 'failed', 'seconds': 2.5,
+                             'error': 'model download failed'}
+        assert readiness.is_ready('rerank') is False
+
+
+class TestReadyEndpoint:
+    """Test GET /ready"""
+
+    def _client(self, state):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from routes.health import router
+
+        app = FastAPI()
+        app.state.app_state = state
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_returns_503_until_query_ready(self):
+        from app_state import AppState
+
+        state = AppState()
+        client = self._client(state)
+
+        assert client.get("/ready").status_code == 503
+
+        state.runtime.readiness.mark_ready('model')
+        state.runtime.readiness.mark_ready('database')
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()['capabilities']['query'] is True
+        assert response.json()['capabilities']['initial_scan'] is False
+
+    def test_query_returns_503_until_query_ready(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app_state import AppState
+        from routes.query import router
+
+        app = FastAPI()
+        app.state.app_state = AppState()
+        app.include_router(router)
+
+        response = TestClient(app).post("/query", json={"text": "hello"})
+
+        assert response.status_code == 503
+
+
+class TestBackgroundStartup:
+    """Test that startup work reports failures instead of hanging pending"""
+
+    def _manager(self):
+        from app_state import AppState
+        from startup.manager import StartupManager
+
+        manager = StartupManager(AppState())
+        manager._start_watcher = Mock()
+        manager._check_post_indexing_orphans = Mock()
+        return manager
+
+    def test_sanitization_error_marks_failed(self):
+        manager = self._manager()
+        manager._sanitize_before_indexing = Mock(side_effect=RuntimeError("db gone"))
+        manager._index_docs = Mock()
+
+        manager._background_indexing_task()
+
+        components = manager.state.get_readiness()['components']
+        assert components['sanitization']['status'] == 'failed'
+        assert components['sanitization']['error'] == 'db gone'
+        assert components['initial_scan']['status'] == 'ready'
+
+    def test_indexing_error_marks_failed(self):
+        manager = self._manager()
+        manager._sanitize_before_indexing = Mock()
+        manager._index_docs = Mock(side_effect=RuntimeError("walk failed"))
+
+        manager._background_indexing_task()
+
+        components = manager.state.get_readiness()['components']
+        assert components['sanitization']['status'] == 'ready'
+        assert components['initial_scan']['status'] == 'failed'
+        assert manager.state.runtime.indexing_in_progress is False
+        manager._check_post_indexing_orphans.assert_called_once()
+
+    def test_lifespan_serves_while_initializing(self):
+        import asyncio
+        from fastapi.testclient import TestClient
+        import main
+
+        state = main.AppState()
+        release = asyncio.Event()
+
+        async def slow_initialize(self):
+            await release.wait()
+
+        with patch.object(main.StartupManager, 'initialize', slow_initialize), \
+                patch.object(main, '_cleanup', AsyncMock()), \
+                patch.object(main, 'state', state), \
+                patch.object(main.app.state, 'app_state', state):
+            with TestClient(main.app) as client:
+                response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()['components']['model'] == {'status': 'pending'}
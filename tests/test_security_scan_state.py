@@ -0,0 +1,262 @@
+"""
+Tests for incremental, process-parallel security scans
+
+Covers ScanStateStore against a mocked psycopg2 connection, and
+SecurityScanner skipping files whose (size, mtime_ns, inode) matches
+their last clean scan while streaming results into a ScanProgress.
+"""
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from config import default_config
+from ingestion.validation_result import SecuritySeverity
+from pipeline import security_scanner
+from pipeline.security_scan_state import ScanStateStore, stat_signature
+from pipeline.security_scanner import SecurityScanner, ScanProgress
+
+
+class MemoryStateStore:
+    """In-memory ScanStateStore"""
+
+    def __init__(self):
+        self.signatures = {}
+        self.rulesets = {}
+
+    def load(self, ruleset):
+        return {p: s for p, s in self.signatures.items() if self.rulesets[p] == ruleset}
+
+    def record(self, ruleset, clean, dirty=()):
+        for path, signature in clean.items():
+            self.signatures[path] = signature
+            self.rulesets[path] = ruleset
+        for path in dirty:
+            self.signatures.pop(path, None)
+
+
+def validation(is_valid=True, severity=None, check='', complete=True):
+    return Mock(is_valid=is_valid, severity=severity, matches=[], complete=complete,
+                reason='' if is_valid else 'Virus detected', validation_check=check)
+
+
+@pytest.fixture
+def kb(tmp_path):
+    for i in range(5):
+        (tmp_path / f'note{i}.md').write_text(f'# Note {i}')
+    return tmp_path
+
+
+@pytest.fixture
+def validator():
+    with patch('pipeline.security_scanner.FileTypeValidator') as validator_cls, \
+         patch('pipeline.security_scanner.FileHasher'), \
+         patch.object(SecurityScanner, '_scan_cache', return_value=None):
+        validator = validator_cls.return_value
+        validator.validate.return_value = validation()
+        yield validator
+
+
+@pytest.fixture
+def scanner(kb, validator):
+    return SecurityScanner(kb, state_store=MemoryStateStore())
+
+
+class TestStatSignature:
+
+    def test_signature_of_file(self, tmp_path):
+        path = tmp_path / 'a.md'
+        path.write_text('hello')
+        st = os.stat(path)
+
+        assert stat_signature(path) == (5, st.st_mtime_ns, st.st_ino)
+
+    def test_missing_file(self, tmp_path):
+        assert stat_signature(tmp_path / 'missing.md') is None
+
+
+class TestIncrementalScan:
+    """Unchanged files are skipped without being validated"""
+
+    def test_first_scan_validates_every_file(self, scanner, validator):
+        summary = scanner.scan('job', auto_quarantine=False)
+
+        assert validator.validate.call_count == 5
+        assert summary.total_files == 5
+        assert summary.clean_files == 5
+
+    def test_repeat_scan_skips_unchanged_files(self, scanner, validator):
+        scanner.scan('job', auto_quarantine=False)
+        validator.validate.reset_mock()
+
+        progress = ScanProgress()
+        summary = scanner.scan('job', auto_quarantine=False, progress=progress)
+
+        validator.validate.assert_not_called()
+        assert summary.total_files == 5
+        assert summary.clean_files == 5
+        assert progress.unchanged == 5
+        assert progress.scanned == 5
+
+    def test_skipped_scanner_not_recorded_clean(self, scanner, validator, kb):
+        """Files that passed while clamd was down are rescanned next time"""
+        skipped = kb / 'note3.md'
+        validator.validate.side_effect = lambda path: validation(complete=Path(path) != skipped)
+        summary = scanner.scan('job', auto_quarantine=False)
+        assert summary.clean_files == 5
+        validator.validate.reset_mock()
+
+        scanner.scan('job', auto_quarantine=False)
+
+        assert [c.args[0] for c in validator.validate.call_args_list] == [skipped]
+
+    def test_modified_file_is_rescanned(self, scanner, validator, kb):
+        scanner.scan('job', auto_quarantine=False)
+        validator.validate.reset_mock()
+
+        (kb / 'note2.md').write_text('# Note 2, edited')
+        scanner.scan('job', auto_quarantine=False)
+
+        assert [c.args[0].name for c in validator.validate.call_args_list] == ['note2.md']
+
+    def test_full_scan_when_not_incremental(self, scanner, validator):
+        scanner.scan('job', auto_quarantine=False)
+        validator.validate.reset_mock()
+
+        scanner.scan('job', auto_quarantine=False, incremental=False)
+
+        assert validator.validate.call_count == 5
+
+    def test_files_with_findings_are_rescanned(self, scanner, validator, kb):
+        bad = kb / 'note3.md'
+        validator.validate.side_effect = lambda path: (
+            validation(False, SecuritySeverity.CRITICAL, 'ClamAVStrategy')
+            if Path(path) == bad else validation()
+        )
+        summary = scanner.scan('job', auto_quarantine=False)
+        assert len(summary.critical_findings) == 1
+        validator.validate.reset_mock()
+
+        summary = scanner.scan('job', auto_quarantine=False)
+
+        assert [c.args[0] for c in validator.validate.call_args_list] == [bad]
+        assert len(summary.critical_findings) == 1
+        assert summary.clean_files == 4
+
+    def test_ruleset_change_forces_full_scan(self, scanner, validator):
+        scanner.scan('job', auto_quarantine=False)
+        validator.validate.reset_mock()
+
+        with patch.object(SecurityScanner, '_ruleset', return_value='new-rules'):
+            scanner.scan('job', auto_quarantine=False)
+
+        assert validator.validate.call_count == 5
+
+    def test_ruleset_includes_clamav_signatures(self, fake_clamd, monkeypatch):
+        config = default_config.malware_detection
+        monkeypatch.setattr(config, 'clamav_enabled', True)
+        monkeypatch.setattr(config, 'clamav_socket', fake_clamd.address)
+        before = SecurityScanner._ruleset()
+
+        fake_clamd.version = 'ClamAV 1.0.5/27302/Wed Jun  5 08:35:41 2024'  # freshclam
+
+        assert SecurityScanner._ruleset() != before
+
+
+class TestStreamingProgress:
+    """Results are counted into the job's ScanProgress as they complete"""
+
+    def test_progress_counts_each_result(self, scanner, validator, kb):
+        warn = kb / 'note1.md'
+        validator.validate.side_effect = lambda path: (
+            validation(False, SecuritySeverity.WARNING, 'YARAStrategy')
+            if Path(path) == warn else validation()
+        )
+        seen = []
+
+        progress = ScanProgress()
+        scanner.scan('job', auto_quarantine=False, progress=progress,
+                     progress_callback=seen.append)
+
+        assert progress.total_files == 5
+        assert progress.scanned == 5
+        assert progress.clean == 4
+        assert progress.warnings == 1
+        assert seen[-1] == 5
+
+
+class TestProcessPool:
+    """Large scans run on a process pool"""
+
+    def test_results_stream_from_scan_processes(self, kb):
+        for i in range(5, 40):
+            (kb / f'note{i}.md').write_text(f'# Note {i}')
+        scanner = SecurityScanner(kb, state_store=MemoryStateStore())
+
+        progress = ScanProgress()
+        with patch.object(security_scanner, 'PROCESS_POOL_MIN_FILES', 1), \
+             patch.object(security_scanner, 'SCAN_WORKERS', 2), \
+             patch.object(security_scanner, 'SCAN_BATCH_SIZE', 8), \
+             patch.object(SecurityScanner, '_scan_files_parallel') as in_process:
+            summary = scanner.scan('job', auto_quarantine=False, progress=progress)
+
+        in_process.assert_not_called()
+        assert summary.total_files == 40
+        assert progress.scanned == 40
+
+    def test_scan_process_reports_metrics_as_child(self):
+        with patch.object(security_scanner, 'FileScannerWorker'), \
+             patch.object(security_scanner, '_process_worker', None), \
+             patch.object(SecurityScanner, '_scan_cache', return_value=None), \
+             patch.object(security_scanner.metrics, 'enable_child_mode') as child_mode:
+            security_scanner._init_scan_process()
+
+        child_mode.assert_called_once_with()
+
+
+class TestScanStateStore:
+    """Signatures are read and written in bulk"""
+
+    @pytest.fixture
+    def conn(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def store(self, conn):
+        with patch('pipeline.security_scan_state.DatabaseFactory') as factory:
+            factory.create_connection.return_value.connect.return_value = conn
+            yield ScanStateStore()
+
+    def test_load_filters_by_ruleset(self, store, conn):
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [('/kb/a.md', 10, 123, 7)]
+
+        assert store.load('rules1') == {'/kb/a.md': (10, 123, 7)}
+        sql, params = cursor.execute.call_args.args
+        assert 'WHERE ruleset = %s' in sql
+        assert params == ('rules1',)
+
+    def test_load_when_unavailable_is_empty(self, store, conn):
+        conn.cursor.side_effect = RuntimeError('connection refused')
+
+        assert store.load('rules1') == {}
+
+    def test_record_upserts_clean_and_deletes_dirty(self, store, conn):
+        cursor = conn.cursor.return_value.__enter__.return_value
+        with patch('psycopg2.extras.execute_values') as execute_values:
+            store.record('rules1', {'/kb/a.md': (10, 123, 7)}, ['/kb/b.md'])
+
+        sql, rows = execute_values.call_args.args[1:]
+        assert 'ON CONFLICT (path) DO UPDATE' in sql
+        assert rows == [('/kb/a.md', 10, 123, 7, 'rules1')]
+        sql, params = cursor.execute.call_args.args
+        assert 'DELETE FROM security_scan_files' in sql
+        assert params == (['/kb/b.md'],)
+        conn.commit.assert_called_once()
+
+    def test_record_failure_does_not_raise(self, store, conn):
+        with patch('psycopg2.extras.execute_values', side_effect=RuntimeError('db down')):
+            store.record('rules1', {'/kb/a.md': (10, 123, 7)})
+
+        conn.rollback.assert_called()
@@ -46,7 +46,7 @@ class TestStartupManagerInitialize:
         with patch('startup.manager.ConfigValidator') as mock_validator, \
              patch('startup.manager.ModelLoader') as mock_model_loader, \
              patch('startup.manager.DatabaseFactory') as mock_db_factory, \
-             patch('startup.manager.DocumentProcessor') as mock_processor, \
+             patch('ingestion.processing.DocumentProcessor') as mock_processor, \
              patch('startup.manager.QueryCache') as mock_cache, \
              patch('pipeline.factory.PipelineFactory') as mock_pipeline_factory, \
              patch('startup.manager.default_config') as mock_config, \
@@ -217,6 +217,48 @@ class TestStartupManagerInitialize:
         # Observable state: start_worker was called
         mock_app_state.start_worker.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_initialize_loads_model_and_database_concurrently(
+        self, mock_app_state, mock_dependencies
+    ):
+        """Model load and store init should overlap, not run back to back"""
+        import threading
+        from startup.manager import StartupManager
+
+        both_running = threading.Barrier(2, timeout=5)
+
+        def load_model(name):
+            both_running.wait()
+            return Mock()
+
+        def create_store():
+            both_running.wait()
+            return Mock()
+
+        mock_dependencies['model_loader'].return_value.load.side_effect = load_model
+        mock_dependencies['db_factory'].create_vector_store.side_effect = create_store
+
+        manager = StartupManager(mock_app_state)
+        await manager.initialize()
+
+        assert mock_app_state.core.model is not None
+        assert mock_app_state.core.vector_store is not None
+
+    @pytest.mark.asyncio
+    async def test_query_only_mode_skips_ingestion(self, mock_app_state, mock_dependencies):
+        """RAG_MODE=query serves queries without processor, queue or worker"""
+        from startup.manager import StartupManager
+
+        with patch.dict('os.environ', {'RAG_MODE': 'query'}):
+            manager = StartupManager(mock_app_state)
+            await manager.initialize()
+
+        mock_dependencies['db_factory'].create_vector_store.assert_called_once()
+        mock_dependencies['db_factory'].create_progress_tracker.assert_not_called()
+        mock_dependencies['processor'].assert_not_called()
+        mock_app_state.start_worker.assert_not_called()
+        mock_app_state.runtime.readiness.mark_disabled.assert_any_call('pipeline')
+
     @pytest.mark.asyncio
     async def test_initialize_validates_config_first(self, mock_app_state, mock_dependencies):
         """initialize() should validate config before other operations"""
@@ -239,7 +281,7 @@ class TestStartupManagerPipeline:
         with patch('startup.manager.ConfigValidator'), \
              patch('startup.manager.ModelLoader') as mock_loader, \
              patch('startup.manager.DatabaseFactory') as mock_db, \
-             patch('startup.manager.DocumentProcessor'), \
+             patch('ingestion.processing.DocumentProcessor'), \
              patch('startup.manager.QueryCache'), \
              patch('pipeline.factory.PipelineFactory') as mock_pf, \
              patch('startup.manager.default_config') as mock_cfg, \
@@ -229,7 +229,7 @@ class TestDocumentEventHandler:
         coordinator.process_changes()
 
         # Verify file was queued (queue handles skip logic)
-        assert queue.add.call_count == 1
+        assert queue.add_many.call_count == 1
 
         # Verify force=False was used (allowing skip logic)
         # The queue.add call in _queue_files uses force=False
@@ -262,13 +262,13 @@ class TestIndexingCoordinator:
 
         coordinator.process_changes()
 
-        assert queue.add.call_count == 2
+        queue.add_many.assert_called_once()
+        assert set(queue.add_many.call_args.args[0]) == {file1, file2}
         assert collector.count() == 0
 
     def test_batch_size_limit(self):
-        """Test batch size is respected"""
+        """Test batch size bounds each add_many call but no file is dropped"""
         queue = Mock()
-        queue.add = Mock()
         collector = FileChangeCollector()
         coordinator = IndexingCoordinator(queue, collector, batch_size=2)
 
@@ -277,7 +277,9 @@ class TestIndexingCoordinator:
 
         coordinator.process_changes()
 
-        assert queue.add.call_count == 2
+        batches = [c.args[0] for c in queue.add_many.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert collector.count() == 0
 
     def test_shows_processing_before_result(self, capsys):
         """Test: Shows 'Queueing...' message when adding files to queue"""
@@ -301,6 +303,7 @@ class TestIndexingCoordinator:
     def test_shows_processing_before_error(self, capsys):
         """Test: Shows 'Queueing...' message even when queue.add fails"""
         queue = Mock()
+        queue.add_many = Mock(side_effect=Exception("Test error"))
         queue.add = Mock(side_effect=Exception("Test error"))
         collector = FileChangeCollector()
         coordinator = IndexingCoordinator(queue, collector, batch_size=50)
@@ -320,6 +323,7 @@ class TestIndexingCoordinator:
     def test_error_handling(self):
         """Test errors don't stop processing"""
         queue = Mock()
+        queue.add_many = Mock(side_effect=Exception("Error"))
         queue.add = Mock(side_effect=[Exception("Error"), None])
         collector = FileChangeCollector()
         coordinator = IndexingCoordinator(queue, collector, batch_size=50)
@@ -368,9 +372,10 @@ class TestFileWatcherService:
 
         file1 = Path("/test/file1.pdf")
         service.collector.add(file1)
+        time.sleep(0.15)  # Let the path settle for the debounce period
         service._on_debounce()
 
-        queue.add.assert_called_once()
+        queue.add_many.assert_called_once()
 
     def test_error_during_indexing_handled(self):
         """Test errors during queueing are caught"""
@@ -407,7 +412,7 @@ class TestIndexingCoordinatorWithTupleReturn:
 
         # Should show queuing message
         assert "Queued" in captured.out or "Queueing" in captured.out
-        assert queue.add.call_count == 1
+        assert queue.add_many.call_count == 1
 
     def test_index_file_returns_tuple_skipped(self, capsys):
         """Test coordinator queues all files (queue handles dedup)"""
@@ -423,7 +428,7 @@ class TestIndexingCoordinatorWithTupleReturn:
         captured = capsys.readouterr()
 
         # Should attempt to queue
-        assert queue.add.call_count == 1
+        assert queue.add_many.call_count == 1
 
     def test_index_file_returns_tuple_no_chunks(self, capsys):
         """Test coordinator queues files regardless of content"""
@@ -439,4 +444,200 @@ class TestIndexingCoordinatorWithTupleReturn:
         captured = capsys.readouterr()
 
         # Should attempt to queue
-        assert queue.add.call_count == 1
+        assert queue.add_many.call_count == 1
+
+
+class TestEventCoalescing:
+    """Test per-path coalescing of create/modify/delete/move events"""
+
+    def test_delete_after_change_becomes_delete(self):
+        collector = FileChangeCollector()
+        path = Path("/kb/a.md")
+
+        collector.add(path)
+        collector.add_deleted(path)
+        changes = collector.drain()
+
+        assert changes.deleted == {path}
+        assert changes.changed == set()
+
+    def test_chained_moves_collapse(self):
+        collector = FileChangeCollector()
+
+        collector.add_moved(Path("/kb/a.md"), Path("/kb/b.md"))
+        collector.add_moved(Path("/kb/b.md"), Path("/kb/c.md"))
+
+        assert collector.drain().moved == {Path("/kb/a.md"): Path("/kb/c.md")}
+
+    def test_deleting_move_destination_deletes_source(self):
+        collector = FileChangeCollector()
+
+        collector.add_moved(Path("/kb/a.md"), Path("/kb/b.md"))
+        collector.add_deleted(Path("/kb/b.md"))
+        changes = collector.drain()
+
+        assert changes.deleted == {Path("/kb/a.md")}
+        assert changes.moved == {}
+
+    def test_drain_keeps_unsettled_paths(self):
+        clock = {'now': 0.0}
+        collector = FileChangeCollector(clock=lambda: clock['now'])
+
+        collector.add(Path("/kb/old.md"))
+        clock['now'] = 8.0
+        collector.add(Path("/kb/new.md"))
+        clock['now'] = 10.0
+
+        assert collector.drain(quiet_seconds=5.0).changed == {Path("/kb/old.md")}
+        assert collector.count() == 1
+
+    def test_handler_records_deletes_and_moves(self):
+        collector = FileChangeCollector()
+        handler = DocumentEventHandler(collector, Mock())
+
+        handler.on_deleted(Mock(is_directory=False, src_path="/kb/gone.pdf"))
+        handler.on_moved(Mock(is_directory=False, src_path="/kb/a.md", dest_path="/kb/notes/a.md"))
+        handler.on_moved(Mock(is_directory=False, src_path="/kb/b.md", dest_path="/kb/b.txt"))
+        changes = collector.drain()
+
+        assert changes.deleted == {Path("/kb/gone.pdf"), Path("/kb/b.md")}
+        assert changes.moved == {Path("/kb/a.md"): Path("/kb/notes/a.md")}
+
+
+class TestDeleteAndMovePropagation:
+    """Test deletes and moves are applied to the store without re-indexing"""
+
+    def test_delete_removes_document_and_progress(self):
+        queue, store, tracker = Mock(), Mock(), Mock()
+        store.delete_document.return_value = {'found': True, 'chunks_deleted': 3}
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, 50, vector_store=store,
+                                          progress_tracker=tracker)
+
+        collector.add_deleted(Path("/kb/a.md"))
+        coordinator.process_changes()
+
+        store.delete_document.assert_called_once_with("/kb/a.md")
+        tracker.delete_document.assert_called_once_with("/kb/a.md")
+        queue.add_many.assert_not_called()
+
+    def test_move_updates_path_without_queueing(self):
+        queue, store = Mock(), Mock()
+        store.move_document.return_value = True
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, 50, vector_store=store)
+
+        collector.add_moved(Path("/kb/a.md"), Path("/kb/b.md"))
+        coordinator.process_changes()
+
+        store.move_document.assert_called_once_with("/kb/a.md", "/kb/b.md")
+        queue.add_many.assert_not_called()
+
+    def test_move_of_unindexed_file_is_queued(self):
+        queue, store = Mock(), Mock()
+        store.move_document.return_value = False
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, 50, vector_store=store)
+
+        collector.add_moved(Path("/kb/a.md"), Path("/kb/b.md"))
+        coordinator.process_changes()
+
+        queue.add_many.assert_called_once()
+        assert queue.add_many.call_args.args[0] == [Path("/kb/b.md")]
+        store.refresh_keyword_index.assert_not_called()
+
+    def test_keyword_index_refreshed_once_per_batch(self):
+        queue, store = Mock(), Mock()
+        store.delete_document.return_value = {'found': True, 'chunks_deleted': 1}
+        store.move_document.return_value = True
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, 50, vector_store=store)
+
+        collector.add_deleted(Path("/kb/a.md"))
+        collector.add_deleted(Path("/kb/b.md"))
+        collector.add_moved(Path("/kb/c.md"), Path("/kb/d.md"))
+        coordinator.process_changes()
+
+        store.refresh_keyword_index.assert_called_once_with()
+
+    def test_directory_moved_out_deletes_documents_below_it(self):
+        queue, store = Mock(), Mock()
+        store.document_paths_under.return_value = ["/kb/old/a.md", "/kb/old/sub/b.pdf"]
+        store.delete_document.return_value = {'found': True, 'chunks_deleted': 2}
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, 50, vector_store=store)
+        handler = DocumentEventHandler(collector, Mock())
+
+        handler.on_deleted(Mock(is_directory=True, src_path="/kb/old"))
+        coordinator.process_changes()
+
+        store.document_paths_under.assert_called_once_with("/kb/old")
+        assert sorted(c.args[0] for c in store.delete_document.call_args_list) == [
+            "/kb/old/a.md", "/kb/old/sub/b.pdf"]
+        store.refresh_keyword_index.assert_called_once_with()
+        queue.add_many.assert_not_called()
+
+    def test_directory_move_moves_documents_below_it(self):
+        queue, store = Mock(), Mock()
+        store.document_paths_under.return_value = ["/kb/old/a.md", "/kb/old/sub/b.pdf"]
+        store.move_document.return_value = True
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, 50, vector_store=store)
+        handler = DocumentEventHandler(collector, Mock())
+
+        handler.on_moved(Mock(is_directory=True, src_path="/kb/old", dest_path="/kb/new"))
+        coordinator.process_changes()
+
+        assert sorted(c.args for c in store.move_document.call_args_list) == [
+            ("/kb/old/a.md", "/kb/new/a.md"), ("/kb/old/sub/b.pdf", "/kb/new/sub/b.pdf")]
+        queue.add_many.assert_not_called()
+
+    def test_directory_events_into_excluded_folders_ignored(self):
+        collector = FileChangeCollector()
+        handler = DocumentEventHandler(collector, Mock())
+
+        handler.on_moved(Mock(is_directory=True, src_path="/kb/a", dest_path="/kb/problematic/a"))
+        handler.on_deleted(Mock(is_directory=True, src_path="/kb/original/x"))
+
+        assert collector.count() == 0
+
+    def test_deleted_directory_drops_pending_changes_below_it(self):
+        collector = FileChangeCollector()
+
+        collector.add(Path("/kb/old/new.md"))
+        collector.add(Path("/kb/keep.md"))
+        collector.add_deleted_dir(Path("/kb/old"))
+        changes = collector.drain()
+
+        assert changes.changed == {Path("/kb/keep.md")}
+        assert changes.deleted_dirs == {Path("/kb/old")}
+
+
+class TestBulkIngestion:
+    """Test large bulk copies are queued fully and rate-shaped"""
+
+    def test_bulk_copy_is_not_truncated(self):
+        queue, sleep = Mock(), Mock()
+        collector = FileChangeCollector()
+        coordinator = IndexingCoordinator(queue, collector, batch_size=50,
+                                          max_rate=100.0, sleep=sleep)
+
+        for i in range(2000):
+            collector.add(Path(f"/kb/export/{i}.md"))
+        coordinator.process_changes()
+
+        queued = sum(len(c.args[0]) for c in queue.add_many.call_args_list)
+        assert queued == 2000
+        assert queue.add_many.call_count == 40
+        assert sleep.call_count == 40
+        assert sleep.call_args.args[0] == pytest.approx(0.5, abs=0.05)
+
+    def test_max_delay_caps_debounce_resets(self):
+        callback = Mock()
+        timer = DebounceTimer(delay=0.1, callback=callback, max_delay=0.15)
+
+        for _ in range(6):
+            timer.trigger()
+            time.sleep(0.04)
+
+        callback.assert_called_once()
@@ -0,0 +1,247 @@
+"""
+Tests for WorkerAutoscaler and resizable worker pools
+
+Covers the pure scaling policy, pool resizing without losing work,
+and torch thread budgeting across embedding workers.
+"""
+import threading
+import time
+from queue import PriorityQueue
+from unittest.mock import Mock
+
+import pytest
+
+from pipeline.pipeline_workers import EmbedWorkerPool
+from pipeline.worker_autoscaler import (
+    AutoscalerConfig,
+    StageSample,
+    ThreadBudget,
+    WorkerAutoscaler,
+    decide
+)
+
+
+BOUNDS = {'chunk': (1, 4), 'embed': (1, 4)}
+
+
+def sample(workers, queue_depth, utilization):
+    return StageSample(workers=workers, queue_depth=queue_depth,
+                       utilization=utilization, service_time=1.0)
+
+
+class TestDecide:
+    """Test the scaling policy"""
+
+    def test_grows_saturated_stage_with_backlog(self):
+        """Busy stage with queued work should get one more worker"""
+        samples = {'chunk': sample(1, 0, 0.5), 'embed': sample(2, 10, 0.95)}
+
+        changes = decide(samples, 0.5, BOUNDS, AutoscalerConfig())
+
+        assert changes == {'embed': (3, 'backlog')}
+
+    def test_grows_only_the_most_backlogged_stage(self):
+        """Only one stage grows per tick"""
+        samples = {'chunk': sample(1, 3, 0.9), 'embed': sample(2, 20, 0.9)}
+
+        changes = decide(samples, 0.3, BOUNDS, AutoscalerConfig())
+
+        assert list(changes) == ['embed']
+
+    def test_never_grows_past_max(self):
+        """Stage at its upper bound should not grow"""
+        samples = {'chunk': sample(1, 0, 0.0), 'embed': sample(4, 50, 1.0)}
+
+        changes = decide(samples, 0.5, {'chunk': (1, 4), 'embed': (1, 4)}, AutoscalerConfig())
+
+        assert 'embed' not in changes
+
+    def test_does_not_grow_when_cpu_saturated(self):
+        """Saturated CPU should shrink the least loaded stage instead"""
+        samples = {'chunk': sample(2, 0, 0.9), 'embed': sample(3, 30, 1.0)}
+
+        changes = decide(samples, 0.95, BOUNDS, AutoscalerConfig())
+
+        assert changes == {'chunk': (1, 'cpu saturated')}
+
+    def test_shrinks_idle_stage(self):
+        """Idle stage above its minimum should shrink"""
+        samples = {'chunk': sample(3, 0, 0.05), 'embed': sample(2, 0, 0.5)}
+
+        changes = decide(samples, 0.2, BOUNDS, AutoscalerConfig())
+
+        assert changes == {'chunk': (2, 'idle')}
+
+    def test_never_shrinks_below_min(self):
+        """Idle stage at its minimum should keep its workers"""
+        samples = {'chunk': sample(1, 0, 0.0), 'embed': sample(1, 0, 0.0)}
+
+        assert decide(samples, 0.0, BOUNDS, AutoscalerConfig()) == {}
+
+    def test_total_workers_capped_by_cores(self):
+        """No stage grows once chunk + embed workers fill the cores"""
+        samples = {'chunk': sample(2, 0, 0.5), 'embed': sample(2, 10, 0.95)}
+
+        assert decide(samples, 0.5, BOUNDS, AutoscalerConfig(), cores=4) == {}
+        assert decide(samples, 0.5, BOUNDS, AutoscalerConfig(), cores=5) == {'embed': (3, 'backlog')}
+
+
+class TestPoolResize:
+    """Test EmbedWorkerPool resizing"""
+
+    def test_resize_grows_and_starts_workers(self):
+        """New workers should start when the pool is running"""
+        pool = EmbedWorkerPool(1, PriorityQueue(), None, lambda item: None)
+        pool.start()
+        try:
+            assert pool.resize(3) == 3
+            assert all(worker.is_running() for worker in pool.workers)
+            assert len({worker.name for worker in pool.workers}) == 3
+        finally:
+            pool.stop()
+
+    def test_resize_shrink_finishes_current_item(self):
+        """Removed worker should finish the item it is processing"""
+        started = threading.Event()
+        release = threading.Event()
+        done = []
+
+        def slow(item):
+            started.set()
+            release.wait(timeout=5)
+            done.append(item)
+
+        input_queue = PriorityQueue()
+        pool = EmbedWorkerPool(1, input_queue, None, slow)
+        pool.start()
+        input_queue.put(1)
+        assert started.wait(timeout=5)
+
+        pool.resize(2)
+        # Put the busy worker last so the shrink retires it mid-item
+        pool.workers = [pool.workers[1], pool.workers[0]]
+        pool.resize(1)
+        release.set()
+
+        deadline = time.time() + 5
+        while not done and time.time() < deadline:
+            time.sleep(0.01)
+        pool.stop()
+
+        assert done == [1]
+        assert pool.get_service_stats()[0] == 1
+
+    def test_resize_keeps_at_least_one_worker(self):
+        """Pool should never shrink to zero workers"""
+        pool = EmbedWorkerPool(2, PriorityQueue(), None, lambda item: None)
+
+        assert pool.resize(0) == 1
+
+
+class TestThreadBudget:
+    """Test torch thread rebalancing"""
+
+    def test_threads_never_oversubscribe_cores(self):
+        """chunk workers + embed workers x threads should stay within cores"""
+        budget = ThreadBudget(cores=16, embed_workers=3, chunk_workers=1, set_threads_fn=Mock())
+
+        assert budget.threads_per_worker == 5
+        budget.rebalance('embed', 4)
+        assert budget.threads_per_worker == 3
+        budget.rebalance('chunk', 4)
+        assert budget.threads_per_worker == 3
+        budget.rebalance('chunk', 16)
+        assert budget.threads_per_worker == 1
+
+    def test_apply_sets_threads_once_per_change(self):
+        """Thread count is process-wide: set once, not per worker thread"""
+        setter = Mock()
+        budget = ThreadBudget(cores=8, embed_workers=2, set_threads_fn=setter)
+
+        workers = [threading.Thread(target=budget.apply) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        budget.rebalance('embed', 4)
+        budget.apply()
+        budget.apply()
+
+        assert [c.args[0] for c in setter.call_args_list] == [4, 2]
+
+
+class TestWorkerAutoscaler:
+    """Test the autoscaler loop against stub pools"""
+
+    @pytest.fixture
+    def clock(self):
+        return {'wall': 0.0, 'cpu': 0.0}
+
+    def _pool(self, workers, stats):
+        pool = Mock()
+        pool.size.side_effect = lambda: workers['n']
+        pool.resize.side_effect = lambda n: workers.update(n=n) or n
+        pool.get_service_stats.side_effect = lambda: stats['value']
+        return pool
+
+    def test_tick_grows_embed_pool_and_rebalances_threads(self, clock):
+        """Saturated embed stage should grow and rebalance threads"""
+        embed_workers = {'n': 2}
+        embed_stats = {'value': (0, 0.0)}
+        chunk_queue, embed_queue = PriorityQueue(), PriorityQueue()
+        for i in range(10):
+            embed_queue.put(i)
+
+        budget = ThreadBudget(cores=8, embed_workers=2, chunk_workers=1, set_threads_fn=Mock())
+        scaler = WorkerAutoscaler(
+            AutoscalerConfig(enabled=True),
+            pools={
+                'chunk': (self._pool({'n': 1}, {'value': (0, 0.0)}), chunk_queue),
+                'embed': (self._pool(embed_workers, embed_stats), embed_queue),
+            },
+            thread_budget=budget,
+            time_source=lambda: clock['wall'],
+            cpu_time_source=lambda: clock['cpu'],
+            cores=8
+        )
+
+        clock['wall'], clock['cpu'] = 10.0, 20.0  # 25% of 8 cores
+        embed_stats['value'] = (4, 19.5)  # Both workers ~fully busy
+        decisions = scaler.tick()
+
+        assert [(d.stage, d.to_workers) for d in decisions] == [('embed', 3)]
+        assert budget.threads_per_worker == 2
+        status = scaler.get_status()
+        assert status['workers']['embed'] == 3
+        assert status['recent_decisions'][0]['reason'] == 'backlog'
+        assert status['stages']['embed']['service_time_seconds'] == pytest.approx(4.875, abs=1e-3)
+
+    def test_embed_max_capped_by_cores(self):
+        """Embed pool bound should never exceed available cores"""
+        scaler = WorkerAutoscaler(
+            AutoscalerConfig(enabled=True, embed_max=16),
+            pools={},
+            cores=4
+        )
+
+        assert scaler.bounds['embed'] == (1, 4)
+
+
+class TestAutoscalerConfig:
+    """Test environment configuration"""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv('AUTOSCALE_ENABLED', raising=False)
+
+        assert AutoscalerConfig.from_env().enabled is False
+
+    def test_minimums_default_to_fixed_worker_counts(self, monkeypatch):
+        monkeypatch.setenv('AUTOSCALE_ENABLED', 'true')
+        monkeypatch.setenv('EMBEDDING_WORKERS', '3')
+        monkeypatch.setenv('EMBEDDING_WORKERS_MAX', '6')
+
+        config = AutoscalerConfig.from_env()
+
+        assert config.enabled is True
+        assert config.embed_min == 3
+        assert config.embed_max == 6
@@ -0,0 +1,135 @@
+"""
+Tests for the compiled YARA rules cache and match-time limits
+
+Runs against yara-python: rules are compiled once per process and rules
+version, saved compiled to disk, and matched against a capped view of the
+shared FileProbe buffer with a per-file timeout.
+"""
+from unittest.mock import patch
+
+import pytest
+
+yara = pytest.importorskip('yara')
+
+from ingestion import malware_detection
+from ingestion.file_probe import FileProbe
+from ingestion.malware_detection import YARA_SKIPPED, YARAStrategy
+
+RULES = """
+rule Test_Malware {
+    strings:
+        $malicious = "MALICIOUS_PATTERN"
+    condition:
+        $malicious
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_rules():
+    malware_detection._compiled.clear()
+    yield
+    malware_detection._compiled.clear()
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / 'rules.yar'
+    path.write_text(RULES)
+    return path
+
+
+@pytest.fixture
+def malicious(tmp_path):
+    path = tmp_path / 'malware.pdf'
+    path.write_bytes(b'%PDF-1.4 MALICIOUS_PATTERN')
+    return path
+
+
+class TestCompiledRulesCache:
+    """Rules are compiled once per process and rules version"""
+
+    def test_compiled_once_across_strategies(self, rules_file, malicious):
+        with patch.object(yara, 'compile', wraps=yara.compile) as compile_:
+            for _ in range(3):
+                result = YARAStrategy(str(rules_file)).validate(malicious, 'pdf')
+                assert result.matches
+
+        assert compile_.call_count == 1
+
+    def test_saved_rules_loaded_by_new_process(self, rules_file, malicious, tmp_path):
+        compiled_dir = tmp_path / 'compiled'
+        YARAStrategy(str(rules_file), compiled_dir=str(compiled_dir)).validate(malicious, 'pdf')
+        assert len(list(compiled_dir.glob('*.yarc'))) == 1
+
+        malware_detection._compiled.clear()  # As in a fresh worker process
+        with patch.object(yara, 'compile') as compile_:
+            result = YARAStrategy(str(rules_file), compiled_dir=str(compiled_dir)) \
+                .validate(malicious, 'pdf')
+
+        compile_.assert_not_called()
+        assert result.matches[0].rule_name == 'Test_Malware'
+
+    def test_changed_rules_are_recompiled(self, rules_file, tmp_path):
+        sample = tmp_path / 'doc.pdf'
+        sample.write_bytes(b'%PDF-1.4 OTHER_PATTERN')
+        assert not YARAStrategy(str(rules_file)).validate(sample, 'pdf').matches
+
+        rules_file.write_text(RULES.replace('MALICIOUS_PATTERN', 'OTHER_PATTERN'))
+
+        assert YARAStrategy(str(rules_file)).validate(sample, 'pdf').matches
+
+    def test_unreadable_saved_rules_are_recompiled(self, rules_file, malicious, tmp_path):
+        compiled_dir = tmp_path / 'compiled'
+        YARAStrategy(str(rules_file), compiled_dir=str(compiled_dir)).validate(malicious, 'pdf')
+        next(compiled_dir.glob('*.yarc')).write_bytes(b'garbage')
+        malware_detection._compiled.clear()
+
+        result = YARAStrategy(str(rules_file), compiled_dir=str(compiled_dir)) \
+            .validate(malicious, 'pdf')
+
+        assert result.matches
+
+
+class TestMatchLimits:
+    """Matching is bounded in bytes and time"""
+
+    def test_pattern_beyond_byte_cap_not_matched(self, rules_file, tmp_path):
+        path = tmp_path / 'big.pdf'
+        path.write_bytes(b'%PDF-1.4 ' + b'a' * 4096 + b'MALICIOUS_PATTERN')
+
+        capped = YARAStrategy(str(rules_file), max_bytes=1024)
+        uncapped = YARAStrategy(str(rules_file), max_bytes=0)
+
+        assert not capped.validate(path, 'pdf').matches
+        assert uncapped.validate(path, 'pdf').matches
+
+    def test_matches_shared_probe_buffer(self, rules_file, malicious):
+        with FileProbe(malicious) as probe:
+            result = YARAStrategy(str(rules_file)).validate(probe, 'pdf')
+            assert probe.sha256  # Probe still usable after matching
+
+        assert result.matches
+
+    def test_timeout_fails_open(self, rules_file, malicious):
+        strategy = YARAStrategy(str(rules_file), timeout=1)
+        rules = _TimingOut()
+
+        with patch.object(strategy, '_load_rules', return_value=rules):
+            result = strategy.validate(malicious, 'pdf')
+
+        assert rules.timeouts == [1]
+        assert result.is_valid is True
+        assert result.reason == YARA_SKIPPED
+        assert not result.matches
+
+
+class _TimingOut:
+    """Rules whose match always times out"""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def match(self, data, timeout):
+        self.timeouts.append(timeout)
+        raise yara.TimeoutError('scan timed out')